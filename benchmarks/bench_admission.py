@@ -0,0 +1,89 @@
+# benchmarks/bench_admission.py
+
+"""
+Sends a burst of itinerary generations through OpenAIGateway with and without admission control.
+
+Runs offline against a local stub server that, like the real API, answers requests
+beyond its concurrency limit with 429. Without admission control the burst is sent
+all at once and most calls are rate limited; with it the calls queue for a slot and
+only those that cannot be admitted within the deadline fail fast (503 upstream).
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_admission.py [--burst 200] [--provider-limit 16]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from stub_openai_server import StubOpenAIServer  # noqa: E402
+from wanderwise.adapters.gateways.admission import AdmissionController  # noqa: E402
+from wanderwise.adapters.gateways.openai_gateway import OpenAIGateway  # noqa: E402
+from wanderwise.config import Settings  # noqa: E402
+from wanderwise.domain.models.itinerary import ItineraryRequest  # noqa: E402
+from wanderwise.domain.ports.llm_port import LLMUnavailableError  # noqa: E402
+
+REQUEST = ItineraryRequest(destination="Paris", duration_days=3, travel_style="Cultural", budget="Mid-range")
+
+
+async def run_burst(admission: AdmissionController, burst: int, provider_limit: int, latency: float) -> None:
+    async with StubOpenAIServer(latency_seconds=latency, max_in_flight=provider_limit) as server:
+        settings = Settings(
+            OPENAI_API_KEY="stub",
+            OPENAI_BASE_URL=server.base_url,
+            OPENAI_MAX_CONNECTIONS=burst,
+            LLM_RETRY_ATTEMPTS=1,  # count every 429 instead of retrying it
+        )
+        gateway = OpenAIGateway(settings, admission=admission)
+        outcomes = {"ok": 0, "failed": 0, "unavailable": 0}
+
+        async def one_call() -> None:
+            try:
+                itinerary = await gateway.generate_itinerary(REQUEST)
+                outcomes["ok" if itinerary is not None else "failed"] += 1
+            except LLMUnavailableError:
+                outcomes["unavailable"] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one_call() for _ in range(burst)))
+        elapsed = time.perf_counter() - start
+        await gateway.aclose()
+
+    stats = admission.stats()
+    print(
+        f"  succeeded={outcomes['ok']:<4} unavailable(503)={outcomes['unavailable']:<4} "
+        f"failed={outcomes['failed']:<4} provider_429s={server.rate_limited:<4} total={elapsed:6.2f}s"
+    )
+    print(
+        f"  admitted={stats['admitted']} rejected={stats['rejected']} timed_out={stats['timed_out']} "
+        f"wait_mean={stats['wait_mean_seconds'] * 1000:.0f}ms wait_p95={stats['wait_p95_seconds'] * 1000:.0f}ms "
+        f"wait_max={stats['wait_max_seconds'] * 1000:.0f}ms"
+    )
+
+
+async def main(burst: int, provider_limit: int, latency: float, max_wait: float) -> None:
+    print(f"burst of {burst} calls, provider allows {provider_limit} concurrent, {latency * 1000:.0f} ms per call")
+    print("without admission control:")
+    await run_burst(AdmissionController(max_concurrency=burst, max_queue=burst), burst, provider_limit, latency)
+    print(f"with admission control (concurrency {provider_limit}, max wait {max_wait:.1f}s):")
+    await run_burst(
+        AdmissionController(max_concurrency=provider_limit, max_queue=burst, max_wait_seconds=max_wait),
+        burst, provider_limit, latency,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--burst", type=int, default=200)
+    parser.add_argument("--provider-limit", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.1, help="Stub latency per call in seconds.")
+    parser.add_argument("--max-wait", type=float, default=1.0, help="Admission deadline in seconds.")
+    args = parser.parse_args()
+    asyncio.run(main(args.burst, args.provider_limit, args.latency, args.max_wait))
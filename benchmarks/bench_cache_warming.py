@@ -0,0 +1,103 @@
+# benchmarks/bench_cache_warming.py
+
+"""
+Shows how cache warming and stale-while-revalidate refreshes take LLM latency off user requests.
+
+Runs offline with a FakeLLMGateway behind a CachedLLMGateway whose entries expire
+after a few seconds. Users ask for a small set of popular destinations (Zipf-like)
+and a long tail. The baseline is the plain cache. The warmed run pre-generates the
+configured top destinations with a CacheWarmer before traffic starts, keeps them
+warm while it runs, and refreshes entries near expiry in the background. For each
+run it prints how many user requests had to wait for the LLM and the latency
+percentiles of popular-destination requests.
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_cache_warming.py [--seconds 6] [--rate 100]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from wanderwise.adapters.gateways.cache_warmer import CacheWarmer  # noqa: E402
+from wanderwise.adapters.gateways.cached_llm_gateway import CachedLLMGateway  # noqa: E402
+from wanderwise.adapters.gateways.fake_llm_gateway import FakeLLMGateway  # noqa: E402
+from wanderwise.domain.models.itinerary import ItineraryRequest  # noqa: E402
+
+POPULAR = ["Paris", "Tokyo", "New York", "Rome", "Barcelona", "London", "Lisbon", "Kyoto"]
+TTL_SECONDS = 3.0
+LLM_LATENCY_SECONDS = 0.1
+
+
+def request_for(destination: str) -> ItineraryRequest:
+    return ItineraryRequest(destination=destination, duration_days=3, travel_style="Cultural", budget="Mid-range")
+
+
+async def run(warm: bool, seconds: float, rate: float) -> None:
+    cache = CachedLLMGateway(
+        FakeLLMGateway(latency_median_seconds=LLM_LATENCY_SECONDS, latency_sigma=0.2, seed=1),
+        ttl_seconds=TTL_SECONDS,
+        refresh_ahead_seconds=TTL_SECONDS / 2 if warm else 0.0,
+    )
+    warmer = None
+    if warm:
+        warmer = CacheWarmer(
+            cache, requests=[request_for(d) for d in POPULAR], interval_seconds=TTL_SECONDS / 4, max_per_minute=60_000
+        )
+        await warmer.run_once()
+        warmer.start()
+
+    rng = random.Random(0)
+    weights = [1 / rank for rank in range(1, len(POPULAR) + 1)]
+    popular_latencies: List[float] = []
+    misses_before = cache.misses
+
+    async def user(destination: str, popular: bool) -> None:
+        started = time.perf_counter()
+        await cache.generate_itinerary(request_for(destination))
+        if popular:
+            popular_latencies.append(time.perf_counter() - started)
+
+    tasks = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        if rng.random() < 0.8:
+            tasks.append(asyncio.ensure_future(user(rng.choices(POPULAR, weights)[0], True)))
+        else:
+            tasks.append(asyncio.ensure_future(user(f"Town {rng.randrange(10_000)}", False)))
+        await asyncio.sleep(rng.expovariate(rate))
+    await asyncio.gather(*tasks)
+    if warmer is not None:
+        await warmer.stop()
+    await cache.aclose()
+
+    ordered = sorted(popular_latencies)
+    stats = cache.stats()["cache"]
+    print(
+        f"{'warmed + SWR' if warm else 'plain cache':<13} requests={len(tasks):5d} waited_for_llm={cache.misses - misses_before:4d} "
+        f"popular p50={ordered[len(ordered) // 2] * 1000:6.1f}ms p95={ordered[int(0.95 * len(ordered))] * 1000:6.1f}ms "
+        f"p99={ordered[int(0.99 * len(ordered))] * 1000:6.1f}ms background_refreshes={stats['refreshes']}"
+    )
+
+
+async def main(seconds: float, rate: float) -> None:
+    await run(False, seconds, rate)
+    await run(True, seconds, rate)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=6.0)
+    parser.add_argument("--rate", type=float, default=100.0, help="User requests per second.")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(args.seconds, args.rate))
@@ -0,0 +1,168 @@
+# benchmarks/bench_canonicalize.py
+
+"""
+Measures how request canonicalization lets near-identical requests share cached itineraries.
+
+Runs offline with a FakeLLMGateway behind a CachedLLMGateway. Users ask for a set
+of destinations, but spell them in different ways. They use aliases and
+"City, Country" forms, make typos, and describe styles and budgets in their own
+words ("cheap", "food"). Mixed in are distinct places with confusable names
+(Austria/Australia, Springfield IL/MA, Paris TX), and free-text styles and
+budgets that must not be bucketed ("not cheap"). The same request stream goes
+through the GenerateItineraryUseCase without and with a RequestCanonicalizer.
+For each run it prints the cache hit rate and the number of LLM calls. For the
+canonicalized run it also prints the match rate. It counts requests left as typed
+(missed matches) and requests mapped onto a different destination than the one
+meant (false matches). It ends with audit samples of matches to review.
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_canonicalize.py [--requests 2000] [--threshold 0.75]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from wanderwise.adapters.gateways.cached_llm_gateway import CachedLLMGateway  # noqa: E402
+from wanderwise.adapters.gateways.fake_llm_gateway import FakeLLMGateway  # noqa: E402
+from wanderwise.application.services.request_canonicalizer import RequestCanonicalizer  # noqa: E402
+from wanderwise.application.use_cases.generate_itinerary import GenerateItineraryUseCase  # noqa: E402
+from wanderwise.domain.models.itinerary import ItineraryRequest  # noqa: E402
+
+# Destination -> spellings users type for it (besides case and spacing variants).
+DESTINATIONS = {
+    "Paris": ["Paris, France", "paris france"],
+    "New York": ["NYC", "New York City", "new york, USA"],
+    "Rome": ["Roma", "Rome, Italy"],
+    "Barcelona": ["Barcelona, Spain"],
+    "Tokyo": ["Tokyo, Japan"],
+    "Lisbon": ["Lisboa", "Lisbon, Portugal"],
+    "Prague": ["Praha", "Prague, Czechia"],
+    "Copenhagen": ["Copenhagen, Denmark"],
+    "Kyoto": ["Kyoto, Japan"],
+    "Amsterdam": ["Amsterdam, Netherlands"],
+}
+# Distinct places whose names are easily confused with each other or the above.
+CONFUSABLE = [
+    "Austria", "Australia", "Springfield, IL", "Springfield, MA", "Paris, Texas", "Rome, Georgia",
+    "Portland", "Porto", "Granada", "Grenada", "Dublin", "Dubai", "Malta", "Malaga",
+]
+STYLES = {"Cultural": ["culture", "history & museums"], "Foodie": ["food", "culinary"], "Adventure": ["outdoors"]}
+BUDGETS = {"Budget-friendly": ["budget", "cheap"], "Mid-range": ["mid range", "moderate"], "Luxury": ["luxury", "premium"]}
+# Free-text styles and budgets that mention an option's keyword but must be kept as typed.
+FREE_TEXT_STYLES = ["Art and nightlife with kids", "no museums please", "food and hiking"]
+FREE_TEXT_BUDGETS = ["No budget limit", "not cheap", "cheap flights but luxury hotels"]
+
+
+def typo(rng: random.Random, word: str) -> str:
+    """Doubles, drops or swaps one letter after the first two."""
+    i = rng.randrange(2, len(word) - 1)
+    kind = rng.choice(("double", "drop", "swap"))
+    if kind == "double":
+        return word[:i] + word[i] + word[i:]
+    if kind == "drop":
+        return word[:i] + word[i + 1:]
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def spelling(rng: random.Random, destination: str) -> str:
+    roll = rng.random()
+    if roll < 0.3:
+        return destination
+    if roll < 0.5:
+        return rng.choice([destination.upper(), destination.lower(), f" {destination} "])
+    if roll < 0.8:
+        return rng.choice(DESTINATIONS[destination])
+    return typo(rng, destination)
+
+
+def request_stream(rng: random.Random, count: int) -> List[Tuple[ItineraryRequest, str]]:
+    """Requests with the destination each one really means."""
+    stream = []
+    for _ in range(count):
+        style = rng.choice(list(STYLES))
+        budget = rng.choice(list(BUDGETS))
+        if rng.random() < 0.15:
+            truth = destination = rng.choice(CONFUSABLE)
+        else:
+            truth = rng.choice(list(DESTINATIONS))
+            destination = spelling(rng, truth)
+        request = ItineraryRequest(
+            destination=destination,
+            duration_days=rng.choice((3, 5)),
+            travel_style=rng.choice([style, *STYLES[style]]),
+            budget=rng.choice([budget, *BUDGETS[budget]]),
+        )
+        stream.append((request, truth))
+    return stream
+
+
+async def run(stream: List[Tuple[ItineraryRequest, str]], canonicalizer: Optional[RequestCanonicalizer]) -> None:
+    cache = CachedLLMGateway(FakeLLMGateway(latency_median_seconds=0.0, latency_sigma=0.0, seed=1))
+    use_case = GenerateItineraryUseCase(cache, canonicalizer=canonicalizer)
+    left_as_typed, false_matches = 0, []
+    for request, truth in stream:
+        itinerary = await use_case.execute(request)
+        if canonicalizer is None or itinerary.destination == truth:
+            continue
+        if itinerary.destination == " ".join(request.destination.split()):
+            left_as_typed += 1
+        else:
+            false_matches.append((request.destination, itinerary.destination))
+    await cache.aclose()
+
+    label = "canonicalized" if canonicalizer is not None else "exact match"
+    print(
+        f"{label:<14} requests={len(stream):5d} cache_hit_rate={cache.hits / len(stream):6.1%} "
+        f"llm_calls={cache.misses:4d}"
+    )
+    if canonicalizer is None:
+        return
+    stats = canonicalizer.stats(include_audit=True)
+    print(
+        f"{'':<14} match_rate={stats['match_rate']:6.1%} alias_matches={stats['alias_matches']} "
+        f"similarity_matches={stats['similarity_matches']} bucket_matches={stats['bucket_matches']} "
+        f"left_as_typed={left_as_typed} false_matches={len(false_matches)}"
+    )
+    probe = RequestCanonicalizer(similarity_threshold=None)
+    bucketed = [
+        (style, budget)
+        for style, budget in zip(FREE_TEXT_STYLES, FREE_TEXT_BUDGETS)
+        for canonical in [probe.canonicalize(ItineraryRequest(
+            destination="Paris", duration_days=3, travel_style=style, budget=budget,
+        ))]
+        if (canonical.travel_style, canonical.budget) != (style, budget)
+    ]
+    print(f"{'':<14} free-text styles/budgets bucketed by mistake: {len(bucketed)}/{len(FREE_TEXT_STYLES)}")
+    for raw, matched in sorted(set(false_matches))[:10]:
+        print(f"{'':<16}false match: {raw!r} -> {matched!r}")
+    print(f"{'':<14} audit samples:")
+    samples = {(s["via"], s["input"], s["canonical"], s.get("score")) for s in stats["audit"]}
+    for via in ("alias", "similarity", "travel_style", "budget"):
+        for _, raw, canonical, score in sorted(sample for sample in samples if sample[0] == via)[:8]:
+            print(f"{'':<16}{via:<12} {raw!r} -> {canonical!r}" + (f" ({score})" if score is not None else ""))
+
+
+async def main(count: int, threshold: Optional[float]) -> None:
+    stream = request_stream(random.Random(0), count)
+    await run(stream, None)
+    await run(stream, RequestCanonicalizer(similarity_threshold=threshold))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument(
+        "--threshold", type=float, default=0.75, help="Similarity threshold; 0 disables similarity matching."
+    )
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(args.requests, args.threshold or None))
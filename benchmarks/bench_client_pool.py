@@ -0,0 +1,83 @@
+# benchmarks/bench_client_pool.py
+
+"""
+Compares a fresh AsyncOpenAI client per call against the pooled OpenAIGateway client.
+
+Runs entirely offline against a local stub server and reports wall-clock time per
+call and how many TCP connections each approach opened.
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_client_pool.py [--calls 200] [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from openai import AsyncOpenAI  # noqa: E402
+
+from stub_openai_server import StubOpenAIServer  # noqa: E402
+from wanderwise.adapters.gateways.openai_gateway import OpenAIGateway  # noqa: E402
+from wanderwise.config import Settings  # noqa: E402
+from wanderwise.domain.models.itinerary import ItineraryRequest  # noqa: E402
+
+REQUEST = ItineraryRequest(destination="Paris", duration_days=3, travel_style="Cultural", budget="Mid-range")
+
+
+async def run_fresh_clients(base_url: str, calls: int, concurrency: int) -> float:
+    """The old behaviour: build (and never close) a new client for each call."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_call() -> None:
+        async with semaphore:
+            client = AsyncOpenAI(api_key="stub", base_url=base_url)
+            await client.chat.completions.create(
+                model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+            )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_call() for _ in range(calls)))
+    return time.perf_counter() - start
+
+
+async def run_pooled_gateway(base_url: str, calls: int, concurrency: int) -> float:
+    """The new behaviour: one gateway with a shared, pooled client."""
+    settings = Settings(OPENAI_API_KEY="stub", OPENAI_BASE_URL=base_url)
+    gateway = OpenAIGateway(settings)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_call() -> None:
+        async with semaphore:
+            await gateway.generate_itinerary(REQUEST)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_call() for _ in range(calls)))
+    elapsed = time.perf_counter() - start
+    await gateway.aclose()
+    return elapsed
+
+
+async def main(calls: int, concurrency: int) -> None:
+    for name, runner in (("fresh client per call", run_fresh_clients), ("pooled gateway", run_pooled_gateway)):
+        async with StubOpenAIServer() as server:
+            elapsed = await runner(server.base_url, calls, concurrency)
+            print(
+                f"{name:<24} calls={calls:<5} total={elapsed * 1000:8.1f} ms  "
+                f"per_call={elapsed / calls * 1000:6.2f} ms  "
+                f"connections_opened={server.connections_opened}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.concurrency))
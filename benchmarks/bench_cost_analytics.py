@@ -0,0 +1,131 @@
+# benchmarks/bench_cost_analytics.py
+
+"""
+Measures the store-wide cost report against a per-object Python aggregation.
+
+Fills an in-memory store and a temporary SQLite database with synthetic
+itineraries (3 to 14 days, 3 to 6 activities a day, some unpriced). It then
+times two ways of building the same store-wide figures. The baseline scans
+Itinerary objects and sums them in Python loops, as a report written against
+`StoragePort.scan` would. The other is `CostAnalytics.report`, which reads
+`scan_costs` pages and aggregates them with numpy. Each report runs twice,
+since the in-memory store keeps the extracted cost fields between reports. It
+also prints the time to analyze one itinerary.
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_cost_analytics.py [--itineraries 5000]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from wanderwise.adapters.storage.in_memory_storage import InMemoryStorage  # noqa: E402
+from wanderwise.adapters.storage.sqlite_storage import SQLiteStorage  # noqa: E402
+from wanderwise.application.services.cost_analytics import CostAnalytics  # noqa: E402
+from wanderwise.domain.models.itinerary import Activity, DailyPlan, Itinerary  # noqa: E402
+from wanderwise.domain.ports.storage_port import StoragePort  # noqa: E402
+
+DESTINATIONS = ["Paris", "Rome", "Tokyo", "New York", "Lisbon", "Mexico City", "Bangkok", "Cape Town"]
+TIMES = ["08:00", "09:30", "Morning", "12:30", "2:00 PM", "Afternoon", "18:00", "7:30 PM", "Evening", "Late night"]
+
+
+def build_itinerary(rng: random.Random) -> Itinerary:
+    daily_plans = [
+        DailyPlan(
+            day=day,
+            theme="Highlights",
+            activities=[
+                Activity(
+                    time=rng.choice(TIMES),
+                    description="Something to do",
+                    estimated_cost_usd=None if rng.random() < 0.15 else round(rng.uniform(0, 120), 2),
+                )
+                for _ in range(rng.randint(3, 6))
+            ],
+        )
+        for day in range(1, rng.randint(3, 14) + 1)
+    ]
+    computed = sum(a.estimated_cost_usd or 0 for plan in daily_plans for a in plan.activities)
+    return Itinerary(
+        destination=rng.choice(DESTINATIONS),
+        trip_title="A trip",
+        # The LLM's own total: usually close, sometimes far off, sometimes missing.
+        total_estimated_cost_usd=None if rng.random() < 0.1 else round(computed * rng.choice([1, 1, 1.05, 0.6, 1.8]), 2),
+        daily_plans=daily_plans,
+    )
+
+
+async def python_report(storage: StoragePort) -> dict:
+    """The same headline figures, from Itinerary objects and Python loops."""
+    totals, day_totals, slots = [], [], {}
+    async for page in storage.scan(limit=500):
+        for itinerary in page:
+            trip = 0.0
+            for plan in itinerary.daily_plans:
+                day = 0.0
+                for activity in plan.activities:
+                    cost = activity.estimated_cost_usd or 0.0
+                    day += cost
+                    slots[activity.time] = slots.get(activity.time, 0.0) + cost
+                day_totals.append(day)
+                trip += day
+            totals.append(trip)
+    return {"itineraries": len(totals), "total_usd": round(sum(totals), 2)}
+
+
+async def time_report(name: str, storage: StoragePort, analytics: CostAnalytics) -> None:
+    started = time.perf_counter()
+    baseline = await python_report(storage)
+    baseline_elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    report = await analytics.report(storage)
+    elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    await analytics.report(storage)
+    repeat_elapsed = time.perf_counter() - started
+    assert report["itineraries"] == baseline["itineraries"]
+    assert abs(report["total_usd"] - baseline["total_usd"]) < 0.01 * baseline["itineraries"]
+    print(
+        f"{name:7s} itineraries={report['itineraries']} objects+loops={baseline_elapsed * 1000:7.1f}ms "
+        f"scan_costs+numpy={elapsed * 1000:7.1f}ms (repeated {repeat_elapsed * 1000:6.1f}ms) "
+        f"speedup={baseline_elapsed / elapsed:4.1f}x/{baseline_elapsed / repeat_elapsed:4.1f}x"
+    )
+
+
+async def main(count: int) -> None:
+    rng = random.Random(0)
+    itineraries = [build_itinerary(rng) for _ in range(count)]
+    analytics = CostAnalytics()
+
+    started = time.perf_counter()
+    for itinerary in itineraries[:1000]:
+        analytics.analyze(itinerary, "Mid-range")
+    print(f"analyze one itinerary: {(time.perf_counter() - started) / min(count, 1000) * 1e6:.0f}us")
+
+    memory = InMemoryStorage()
+    await memory.save_many(itineraries)
+    await time_report("memory", memory, analytics)
+
+    with tempfile.TemporaryDirectory() as directory:
+        sqlite = SQLiteStorage(Path(directory) / "bench.db")
+        await sqlite.save_many(itineraries)
+        await time_report("sqlite", sqlite, analytics)
+        await sqlite.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--itineraries", type=int, default=5000, help="Number of stored itineraries.")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(args.itineraries))
@@ -0,0 +1,144 @@
+# benchmarks/bench_fragment_cache.py
+
+"""
+Measures template compilation, itinerary rendering and the cached itinerary endpoint.
+
+First it times compiling every template into a fresh Jinja environment, once
+from source and once from a warm bytecode cache, as a new worker does at
+startup. Then it compares rendering `partials/itinerary_display.html` for a
+stored itinerary with a fragment cache hit. Finally it stores synthetic
+itineraries and times `GET /itinerary/{id}` end to end. Three cases are timed:
+with the fragment cache off, with it warm, and a browser revalidating an
+unchanged itinerary (304 Not Modified).
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_fragment_cache.py [--itineraries 200] [--requests 2000]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+import jinja2  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from wanderwise.domain.models.itinerary import Activity, DailyPlan, Itinerary  # noqa: E402
+from wanderwise.main import app  # noqa: E402
+from wanderwise.presentation.dependencies import get_fragment_cache, get_storage_port  # noqa: E402
+from wanderwise.presentation.templating import TEMPLATES_DIR, FragmentCache, render_itinerary  # noqa: E402
+
+THEMES = ["Historic Heart", "Culinary Adventure", "Art and Museums", "Parks and Views"]
+TIMES = ["09:00", "10:30", "12:30", "14:00", "16:00", "18:30", "20:00"]
+WORDS = "visit explore the old town market museum gallery walk river lunch dinner local guided tour view park".split()
+
+
+def build_itinerary(rng: random.Random) -> Itinerary:
+    return Itinerary(
+        destination="Lisbon",
+        trip_title="A week of discovery",
+        total_estimated_cost_usd=round(rng.uniform(200, 3000), 2),
+        daily_plans=[
+            DailyPlan(
+                day=day,
+                theme=rng.choice(THEMES),
+                activities=[
+                    Activity(
+                        time=time,
+                        description=" ".join(rng.choice(WORDS) for _ in range(rng.randint(15, 30))).capitalize() + ".",
+                        estimated_cost_usd=round(rng.uniform(0, 80), 2),
+                        latitude=38.72 + rng.uniform(-0.03, 0.03),
+                        longitude=-9.14 + rng.uniform(-0.03, 0.03),
+                    )
+                    for time in sorted(rng.sample(TIMES, 5))
+                ],
+            )
+            for day in range(1, 8)
+        ],
+    )
+
+
+def compile_all(bytecode_cache: jinja2.BytecodeCache) -> float:
+    """Seconds to load every template into a new environment, as a new worker does."""
+    environment = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_DIR), autoescape=True, bytecode_cache=bytecode_cache
+    )
+    started = time.perf_counter()
+    for name in environment.list_templates(extensions=["html"]):
+        environment.get_template(name)
+    return time.perf_counter() - started
+
+
+def time_requests(client: TestClient, ids, count: int, headers=None) -> float:
+    """Average microseconds per GET of a random stored itinerary's fragment."""
+    rng = random.Random(1)
+    started = time.perf_counter()
+    for _ in range(count):
+        itinerary_id = rng.choice(ids)
+        response = client.get(f"/itinerary/{itinerary_id}", headers=(headers or {}).get(itinerary_id, {"HX-Request": "true"}))
+        assert response.status_code in (200, 304)
+    return (time.perf_counter() - started) / count * 1e6
+
+
+def main(count: int, requests: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        bytecode_cache = jinja2.FileSystemBytecodeCache(directory)
+        cold = compile_all(bytecode_cache)
+        warm = compile_all(bytecode_cache)
+    print(f"compile all templates: from source={cold * 1000:.1f}ms from bytecode cache={warm * 1000:.1f}ms")
+
+    rng = random.Random(0)
+    itineraries = [build_itinerary(rng) for _ in range(count)]
+    fragment_cache = FragmentCache()
+    render_itinerary(itineraries[0], fragment_cache)
+    started = time.perf_counter()
+    for itinerary in itineraries:
+        render_itinerary(itinerary)
+    rendered = (time.perf_counter() - started) / count
+    started = time.perf_counter()
+    for _ in range(count):
+        render_itinerary(itineraries[0], fragment_cache)
+    hit = (time.perf_counter() - started) / count
+    print(f"render itinerary_display.html={rendered * 1e6:.0f}us fragment cache hit={hit * 1e6:.2f}us")
+
+    with TestClient(app) as client:
+        ids = [itinerary.id for itinerary in itineraries]
+        client.portal.call(get_storage_port().save_many, itineraries)
+        cache = get_fragment_cache()
+        if cache is None:
+            print("FRAGMENT_CACHE_ENABLED is off; skipping the endpoint timings")
+            return
+        cache.max_entries = 0
+        uncached = time_requests(client, ids, requests)
+        cache.max_entries = count
+        time_requests(client, ids, count)
+        cached = time_requests(client, ids, requests)
+        etags = {
+            itinerary_id: {
+                "HX-Request": "true",
+                "If-None-Match": client.get(f"/itinerary/{itinerary_id}", headers={"HX-Request": "true"}).headers["etag"],
+            }
+            for itinerary_id in ids
+        }
+        revalidated = time_requests(client, ids, requests, etags)
+        print(
+            f"GET /itinerary/{{id}} itineraries={count}: uncached={uncached:.0f}us "
+            f"cached={cached:.0f}us ({uncached / cached:.1f}x) not modified={revalidated:.0f}us"
+        )
+        print(cache.stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--itineraries", type=int, default=200, help="Number of stored itineraries.")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per endpoint timing.")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    main(args.itineraries, args.requests)
@@ -0,0 +1,93 @@
+# benchmarks/bench_geocode.py
+
+"""
+Measures how long the offline gazetteer takes to locate a whole itinerary.
+
+Loads the bundled gazetteer once and builds itineraries for several destinations.
+Their activities mention well-known places ("Sunrise at the Eiffel Tower") or
+nothing locatable ("Dinner at a local bistro"). For each itinerary size it
+prints the time to locate the destination and every activity, and the share
+of activities located. No network calls are made.
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_geocode.py [--repeat 200]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from wanderwise.adapters.geocoding.gazetteer_geocoder import GazetteerGeocoder  # noqa: E402
+from wanderwise.domain.models.itinerary import Activity, DailyPlan, Itinerary  # noqa: E402
+
+PLACES = {
+    "Paris, France": ["the Eiffel Tower", "the Louvre", "Sacré-Cœur", "Le Marais", "Musée d'Orsay"],
+    "Rome": ["the Colosseum", "the Trevi Fountain", "St. Peter's Basilica", "Trastevere", "the Pantheon"],
+    "Tokyo": ["Senso-ji", "Shibuya Crossing", "the Meiji Shrine", "Tsukiji Outer Market", "Akihabara"],
+    "New York City": ["Central Park", "the Met", "the Brooklyn Bridge", "the High Line", "Times Square"],
+}
+TEMPLATES = [
+    "Start the morning with a guided walk around {place}, before the crowds arrive.",
+    "Spend the afternoon at {place} and stop for coffee nearby.",
+    "Dinner at a local bistro recommended by the hotel.",
+    "Free time to rest, shop or wander through the neighbourhood.",
+]
+
+
+def build_itinerary(rng: random.Random, destination: str, days: int, activities_per_day: int) -> Itinerary:
+    return Itinerary(
+        destination=destination,
+        trip_title=f"{days} days in {destination}",
+        daily_plans=[
+            DailyPlan(
+                day=day,
+                theme="Highlights",
+                activities=[
+                    Activity(
+                        time=f"{9 + 2 * slot:02d}:00",
+                        description=rng.choice(TEMPLATES).format(place=rng.choice(PLACES[destination])),
+                    )
+                    for slot in range(activities_per_day)
+                ],
+            )
+            for day in range(1, days + 1)
+        ],
+    )
+
+
+def main(repeat: int) -> None:
+    started = time.perf_counter()
+    geocoder = GazetteerGeocoder()
+    print(f"gazetteer loaded in {(time.perf_counter() - started) * 1000:.1f}ms ({geocoder.stats()['places']} rows)")
+
+    rng = random.Random(0)
+    for days, activities_per_day in ((3, 4), (7, 5), (14, 6), (30, 8)):
+        itineraries = [
+            build_itinerary(rng, destination, days, activities_per_day)
+            for destination in PLACES
+            for _ in range(repeat // len(PLACES))
+        ]
+        started = time.perf_counter()
+        located = sum(geocoder.annotate(itinerary) for itinerary in itineraries)
+        elapsed = time.perf_counter() - started
+        activities = len(itineraries) * days * activities_per_day
+        print(
+            f"days={days:2d} activities={days * activities_per_day:3d} "
+            f"per_itinerary={elapsed / len(itineraries) * 1e6:7.1f}us "
+            f"per_activity={elapsed / activities * 1e6:5.2f}us located={located / activities:5.1%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200, help="Itineraries per size.")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    main(args.repeat)
@@ -0,0 +1,115 @@
+# benchmarks/bench_parse.py
+
+"""
+Compares json.loads + model_validate against validating completions straight from JSON text.
+
+Runs offline over recorded-style itinerary responses of increasing size (more days
+and more activities per day). For each size it times the old path (decode to a dict,
+then validate it, with a uuid.uuid4() per activity) and the new path
+(Itinerary.model_validate_json with pooled IDs), and checks that a response cut off
+at 70% of its length still yields its complete days.
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_parse.py [--repeat 200]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import timeit
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from wanderwise.adapters.gateways.response_parser import parse_itinerary  # noqa: E402
+from wanderwise.domain.models.itinerary import Itinerary, new_id  # noqa: E402
+
+SIZES = [(1, 3), (3, 4), (7, 5), (14, 6), (30, 8)]  # (days, activities per day)
+
+PLACES = ["the Louvre", "Le Marais", "Montmartre", "the Seine", "Musée d'Orsay", "Saint-Germain", "the Latin Quarter"]
+VERBS = ["Visit", "Stroll through", "Have lunch near", "Take a guided tour of", "Watch the sunset over"]
+
+
+def recorded_response(days: int, activities: int, rng: random.Random) -> str:
+    """A completion as the model returns it: pretty-printed JSON with prose descriptions."""
+    document = {
+        "destination": "Paris",
+        "trip_title": f"{days} Days of Parisian Culture",
+        "total_estimated_cost_usd": round(rng.uniform(200, 5000), 2),
+        "daily_plans": [
+            {
+                "day": day,
+                "theme": f"Day {day}: {rng.choice(PLACES)} and beyond",
+                "activities": [
+                    {
+                        "time": f"{8 + 2 * slot:02d}:00",
+                        "description": (
+                            f"{rng.choice(VERBS)} {rng.choice(PLACES)}, then wander the nearby streets "
+                            f"and cafés. Book ahead in high season; allow about {rng.randint(1, 3)} hours."
+                        ),
+                        "estimated_cost_usd": round(rng.uniform(0, 80), 2),
+                    }
+                    for slot in range(activities)
+                ],
+            }
+            for day in range(1, days + 1)
+        ],
+    }
+    return json.dumps(document, indent=2, ensure_ascii=False)
+
+
+def old_path(text: str) -> Itinerary:
+    data = json.loads(text)
+    data["id"] = str(uuid.uuid4())
+    for day in data["daily_plans"]:
+        for activity in day["activities"]:
+            activity["id"] = str(uuid.uuid4())
+    return Itinerary.model_validate(data)
+
+
+def new_path(text: str) -> Itinerary:
+    return parse_itinerary(text)
+
+
+def main(repeat: int) -> None:
+    rng = random.Random(0)
+    print(f"{'days':>4} {'acts':>5} {'bytes':>7}  {'loads+validate':>15}  {'validate_json':>14}  speedup  salvaged")
+    for days, activities in SIZES:
+        text = recorded_response(days, activities, rng)
+        assert _without_ids(old_path(text)) == _without_ids(new_path(text))
+        old = min(timeit.repeat(lambda: old_path(text), number=repeat, repeat=3)) / repeat
+        new = min(timeit.repeat(lambda: new_path(text), number=repeat, repeat=3)) / repeat
+
+        cut = text[: int(len(text) * 0.7)]
+        salvaged = parse_itinerary(cut, truncated=True, defaults={"destination": "Paris", "trip_title": "?"})
+        kept = len(salvaged.daily_plans) if salvaged is not None else 0
+        print(
+            f"{days:>4} {activities:>5} {len(text):>7}  {old * 1e6:>12.0f} µs  {new * 1e6:>11.0f} µs  "
+            f"{old / new:>6.2f}x  {kept}/{days} days"
+        )
+
+    ids = 10_000
+    uuid4 = min(timeit.repeat(lambda: str(uuid.uuid4()), number=ids, repeat=3)) / ids
+    pooled = min(timeit.repeat(new_id, number=ids, repeat=3)) / ids
+    print(f"ids: str(uuid.uuid4()) {uuid4 * 1e9:.0f} ns, pooled new_id() {pooled * 1e9:.0f} ns ({uuid4 / pooled:.1f}x)")
+
+
+def _without_ids(itinerary: Itinerary) -> dict:
+    dumped = itinerary.model_dump(exclude={"id"}, mode="json")
+    for day in dumped["daily_plans"]:
+        for activity in day["activities"]:
+            activity.pop("id")
+    return dumped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    main(args.repeat)
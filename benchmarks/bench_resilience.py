@@ -0,0 +1,110 @@
+# benchmarks/bench_resilience.py
+
+"""
+Measures OpenAIGateway's retries, circuit breaker and hedging against a misbehaving stub server.
+
+Runs offline. Three scenarios, each with the feature off and on:
+
+- flaky: a share of requests fail with 500; retries turn most failures into successes.
+- slow tail: a share of requests are very slow; hedging cuts the tail latency.
+- outage: every request fails; the circuit breaker makes later calls fail fast
+  instead of each waiting through its retries.
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_resilience.py [--calls 200] [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from stub_openai_server import StubOpenAIServer  # noqa: E402
+from wanderwise.adapters.gateways.openai_gateway import OpenAIGateway  # noqa: E402
+from wanderwise.config import Settings  # noqa: E402
+from wanderwise.domain.models.itinerary import ItineraryRequest  # noqa: E402
+from wanderwise.domain.ports.llm_port import LLMUnavailableError  # noqa: E402
+
+REQUEST = ItineraryRequest(destination="Paris", duration_days=3, travel_style="Cultural", budget="Mid-range")
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run(server_options: Dict[str, Any], settings_options: Dict[str, Any], calls: int, concurrency: int) -> str:
+    async with StubOpenAIServer(**server_options) as server:
+        settings = Settings(
+            OPENAI_API_KEY="stub",
+            OPENAI_BASE_URL=server.base_url,
+            LLM_REQUESTS_PER_MINUTE=None,  # admission budgets would throttle the burst; see bench_admission.py
+            LLM_TOKENS_PER_MINUTE=None,
+            LLM_RETRY_BASE_DELAY_SECONDS=0.01,
+            LLM_RETRY_MAX_DELAY_SECONDS=0.2,
+            **settings_options,
+        )
+        gateway = OpenAIGateway(settings)
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies: List[float] = []
+        outcomes = {"ok": 0, "failed": 0, "unavailable": 0}
+
+        async def one_call() -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    itinerary = await gateway.generate_itinerary(REQUEST)
+                    outcomes["ok" if itinerary is not None else "failed"] += 1
+                except LLMUnavailableError:
+                    outcomes["unavailable"] += 1
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(one_call() for _ in range(calls)))
+        stats = gateway.stats()["resilience"]
+        await gateway.aclose()
+
+    return (
+        f"ok={outcomes['ok']:<4} failed={outcomes['failed']:<4} unavailable={outcomes['unavailable']:<4} "
+        f"p50={statistics.median(latencies) * 1000:7.1f}ms p99={percentile(latencies, 0.99) * 1000:7.1f}ms "
+        f"upstream_requests={server.requests_served:<4} retries={stats['retries']:<4} "
+        f"hedges={stats['hedges_sent']}/{stats['hedges_won']} circuit_opened={stats['circuit']['times_opened']}"
+    )
+
+
+async def main(calls: int, concurrency: int) -> None:
+    scenarios = [
+        ("flaky (20% 500s)", {"latency_seconds": 0.02, "error_rate": 0.2}, [
+            ("no retries", {"LLM_RETRY_ATTEMPTS": 1}),
+            ("3 attempts", {"LLM_RETRY_ATTEMPTS": 3}),
+        ]),
+        ("slow tail (5% take 1s)", {"latency_seconds": 0.02, "slow_rate": 0.05, "slow_seconds": 1.0}, [
+            ("no hedging", {"LLM_HEDGE_ENABLED": False}),
+            ("hedging", {"LLM_HEDGE_ENABLED": True, "LLM_HEDGE_MIN_DELAY_SECONDS": 0.05, "LLM_HEDGE_MIN_SAMPLES": 20}),
+        ]),
+        ("outage (100% 500s)", {"latency_seconds": 0.02, "error_rate": 1.0}, [
+            ("no breaker", {"LLM_CIRCUIT_FAILURE_THRESHOLD": calls * 10}),
+            ("breaker", {"LLM_CIRCUIT_FAILURE_THRESHOLD": 5, "LLM_CIRCUIT_RESET_SECONDS": 60}),
+        ]),
+    ]
+    for title, server_options, variants in scenarios:
+        print(f"{title}, {calls} calls at concurrency {concurrency}:")
+        for name, settings_options in variants:
+            print(f"  {name:<12} {await run(server_options, settings_options, calls, concurrency)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(args.calls, args.concurrency))
@@ -0,0 +1,93 @@
+# benchmarks/bench_route_optimize.py
+
+"""
+Measures how much the route optimizer shortens days with many stops, and how long it takes.
+
+Builds itineraries whose activities sit at random points in a 10 km square
+around central Paris, in random order, with every tenth activity booked (and
+therefore anchored). For each size it prints the route length before and after
+optimizing every day in one call and the time per day. The nearest-neighbour
+tour alone is reported too, to show what 2-opt adds on top of it.
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_route_optimize.py [--days 3]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from wanderwise.application.services.route_optimizer import RouteOptimizer, route_length_km  # noqa: E402
+from wanderwise.domain.models.itinerary import Activity, DailyPlan, Itinerary  # noqa: E402
+
+CENTER = (48.8566, 2.3522)
+# Roughly 10 km across at the latitude of Paris.
+SPREAD_DEGREES = (0.09, 0.135)
+
+
+def build_itinerary(rng: random.Random, days: int, stops: int) -> Itinerary:
+    return Itinerary(
+        destination="Paris, France",
+        trip_title=f"{days} days, {stops} stops a day",
+        daily_plans=[
+            DailyPlan(
+                day=day,
+                theme="Everything",
+                activities=[
+                    Activity(
+                        time=f"stop {stop + 1}",
+                        description=f"Stop {stop + 1}",
+                        booking_link="https://example.com/book" if stop % 10 == 9 else None,
+                        latitude=CENTER[0] + rng.uniform(-0.5, 0.5) * SPREAD_DEGREES[0],
+                        longitude=CENTER[1] + rng.uniform(-0.5, 0.5) * SPREAD_DEGREES[1],
+                    )
+                    for stop in range(stops)
+                ],
+            )
+            for day in range(1, days + 1)
+        ],
+    )
+
+
+def total_km(itinerary: Itinerary, orders=None) -> float:
+    total = 0.0
+    for plan in itinerary.daily_plans:
+        activities = plan.activities
+        if orders and plan.day in orders:
+            by_id = {activity.id: activity for activity in activities}
+            activities = [by_id[activity_id] for activity_id in orders[plan.day]]
+        total += route_length_km(activities)
+    return total
+
+
+def main(days: int) -> None:
+    rng = random.Random(0)
+    optimizer = RouteOptimizer()
+    nearest_neighbour_only = RouteOptimizer(max_passes=0)
+    for stops in (10, 50, 100, 200, 400):
+        itinerary = build_itinerary(rng, days, stops)
+        before = total_km(itinerary)
+        greedy = total_km(itinerary, nearest_neighbour_only.optimize(itinerary))
+        started = time.perf_counter()
+        orders = optimizer.optimize(itinerary)
+        elapsed = time.perf_counter() - started
+        after = total_km(itinerary, orders)
+        print(
+            f"stops/day={stops:3d} before={before / days:7.1f}km nearest_neighbour={greedy / days:6.1f}km "
+            f"after={after / days:6.1f}km saved={1 - after / before:5.1%} per_day={elapsed / days * 1000:7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=3, help="Days per itinerary.")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    main(args.days)
@@ -0,0 +1,98 @@
+# benchmarks/bench_routing.py
+
+"""
+Shows how RoutingLLMGateway spreads load over backends with different latency and reliability.
+
+Runs offline with FakeLLMGateway backends: a slow but reliable one, a fast but
+flaky one, a fast and reliable one that is switched off halfway through the run,
+and a cheap one limited to short trips. Prints where the requests went and the
+end-to-end latency and success rate, next to a baseline that always uses the
+first backend.
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_routing.py [--requests 400] [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from wanderwise.adapters.gateways.fake_llm_gateway import FakeLLMGateway  # noqa: E402
+from wanderwise.adapters.gateways.routing_llm_gateway import LLMBackend, RoutingLLMGateway  # noqa: E402
+from wanderwise.domain.models.itinerary import ItineraryRequest  # noqa: E402
+from wanderwise.domain.ports.llm_port import LLMPort  # noqa: E402
+
+
+def build_backends() -> List[LLMBackend]:
+    return [
+        LLMBackend("slow", FakeLLMGateway(latency_median_seconds=0.20, latency_sigma=0.2, seed=1)),
+        LLMBackend("flaky", FakeLLMGateway(latency_median_seconds=0.05, latency_sigma=0.2, failure_rate=0.4, seed=2)),
+        LLMBackend("fast", FakeLLMGateway(latency_median_seconds=0.06, latency_sigma=0.2, seed=3)),
+        LLMBackend("mini", FakeLLMGateway(latency_median_seconds=0.05, latency_sigma=0.2, seed=4), max_days=3, cost=0.3),
+    ]
+
+
+async def run(port: LLMPort, backends: List[LLMBackend], requests: int, concurrency: int) -> str:
+    rng = random.Random(0)
+    trips = [
+        ItineraryRequest(destination=f"City {i}", duration_days=rng.randint(1, 10), travel_style="Cultural", budget="Mid-range")
+        for i in range(requests)
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    ok = 0
+    done = 0
+
+    async def one_call(request: ItineraryRequest) -> None:
+        nonlocal ok, done
+        async with semaphore:
+            start = time.perf_counter()
+            if await port.generate_itinerary(request) is not None:
+                ok += 1
+            latencies.append((time.perf_counter() - start) / request.duration_days)
+            done += 1
+            if done == requests // 2:
+                # Halfway through, the fast backend starts failing every call.
+                backends[2].port.failure_rate = 1.0
+
+    await asyncio.gather(*(one_call(request) for request in trips))
+    return (
+        f"ok={ok}/{requests}  latency per day: p50={statistics.median(latencies) * 1000:.1f}ms "
+        f"p95={sorted(latencies)[int(0.95 * len(latencies))] * 1000:.1f}ms"
+    )
+
+
+async def main(requests: int, concurrency: int) -> None:
+    backends = build_backends()
+    print(f"first backend only: {await run(backends[0].port, backends, requests, concurrency)}")
+
+    backends = build_backends()
+    router = RoutingLLMGateway(backends)
+    print(f"routed:             {await run(router, backends, requests, concurrency)}")
+    print(f"failovers: {router.failovers}")
+    for name, stats in router.stats()["router"]["backends"].items():
+        latency = stats["ewma_latency_per_day_seconds"]
+        print(
+            f"  {name:<6} calls={stats['calls']:<4} failures={stats['failures']:<4} "
+            f"ewma_latency_per_day={latency * 1000 if latency is not None else float('nan'):6.1f}ms "
+            f"ewma_error_rate={stats['ewma_error_rate']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(args.requests, args.concurrency))
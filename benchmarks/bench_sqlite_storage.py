@@ -0,0 +1,68 @@
+# benchmarks/bench_sqlite_storage.py
+
+"""
+Measures SQLiteStorage throughput for concurrent saves and gets.
+
+Saves N itineraries from C concurrent coroutines, reads them all back the same
+way, and reports operations per second and how writes were batched. The
+in-memory store is measured alongside as a baseline.
+
+Usage:
+    OPENAI_API_KEY=stub python benchmarks/bench_sqlite_storage.py [--itineraries 5000] [--concurrency 64]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from stub_openai_server import SAMPLE_ITINERARY  # noqa: E402
+from wanderwise.adapters.storage.in_memory_storage import InMemoryStorage  # noqa: E402
+from wanderwise.adapters.storage.sqlite_storage import SQLiteStorage  # noqa: E402
+from wanderwise.domain.models.itinerary import Itinerary  # noqa: E402
+from wanderwise.domain.ports.storage_port import StoragePort  # noqa: E402
+
+
+async def run_phase(name: str, operations, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(op):
+        async with semaphore:
+            return await op
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(bounded(op) for op in operations))
+    elapsed = time.perf_counter() - start
+    ok = sum(1 for result in results if result)
+    print(f"  {name:<5} {len(results):>7} ops  {len(results) / elapsed:>10.0f} ops/s  ok={ok}")
+
+
+async def bench(storage: StoragePort, itineraries: list, concurrency: int) -> None:
+    print(type(storage).__name__)
+    await run_phase("save", [storage.save_itinerary(it) for it in itineraries], concurrency)
+    await run_phase("get", [storage.get_itinerary(it.id) for it in itineraries], concurrency)
+    print(f"  stats: {json.dumps(storage.stats())}")
+    await storage.aclose()
+
+
+async def main(count: int, concurrency: int) -> None:
+    itineraries = [Itinerary.model_validate(SAMPLE_ITINERARY) for _ in range(count)]
+    await bench(InMemoryStorage(), itineraries, concurrency)
+    with tempfile.TemporaryDirectory() as directory:
+        await bench(SQLiteStorage(Path(directory) / "bench.db"), itineraries, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--itineraries", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(main(args.itineraries, args.concurrency))
@@ -0,0 +1,123 @@
+# benchmarks/bench_storage_memory.py
+
+"""
+Measures the memory taken per stored itinerary as Pydantic objects and as compact records.
+
+Serializes synthetic itineraries (3 to 10 days, 4 or 5 activities a day,
+descriptions of typical LLM length) to JSON up front. For each representation
+it then parses them back and keeps them, measuring the retained memory with
+tracemalloc. One representation keeps the Pydantic objects, as InMemoryStorage
+used to. The other keeps CompactItinerary records, which is what it holds now.
+It also measures a full InMemoryStorage with its bookkeeping, compares the
+records' own size estimate (`nbytes`, which the memory budget uses), and times
+packing a record on save and materializing an Itinerary on read.
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_storage_memory.py [--itineraries 20000]
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from wanderwise.adapters.storage.compact_itinerary import CompactItinerary  # noqa: E402
+from wanderwise.adapters.storage.in_memory_storage import InMemoryStorage  # noqa: E402
+from wanderwise.domain.models.itinerary import Activity, DailyPlan, Itinerary  # noqa: E402
+
+DESTINATIONS = ["Paris, France", "Rome", "Tokyo", "New York", "Lisbon", "Mexico City", "Bangkok", "Cape Town"]
+THEMES = ["Historic Heart", "Culinary Adventure", "Art and Museums", "Parks and Views", "Local Neighbourhoods"]
+TIMES = ["08:00", "09:00", "10:30", "12:30", "14:00", "16:00", "18:30", "20:00", "Morning", "Afternoon", "Evening"]
+WORDS = "visit explore the old town market museum gallery walk river lunch dinner local guided tour view park".split()
+
+
+def build_itinerary(rng: random.Random) -> Itinerary:
+    return Itinerary(
+        destination=rng.choice(DESTINATIONS),
+        trip_title=f"A {rng.choice(['week', 'long weekend', 'fortnight'])} of discovery",
+        total_estimated_cost_usd=round(rng.uniform(200, 3000), 2),
+        daily_plans=[
+            DailyPlan(
+                day=day,
+                theme=rng.choice(THEMES),
+                activities=[
+                    Activity(
+                        time=time,
+                        description=" ".join(rng.choice(WORDS) for _ in range(rng.randint(15, 30))).capitalize() + ".",
+                        estimated_cost_usd=None if rng.random() < 0.2 else round(rng.uniform(0, 80), 2),
+                        booking_link="https://example.com/book" if rng.random() < 0.1 else None,
+                    )
+                    for time in sorted(rng.sample(TIMES[:8], rng.randint(4, 5)))
+                ],
+            )
+            for day in range(1, rng.randint(3, 10) + 1)
+        ],
+    )
+
+
+def retained_bytes(build) -> int:
+    """Memory still allocated after `build()` returns, while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+async def fill_storage(documents) -> InMemoryStorage:
+    storage = InMemoryStorage()
+    await storage.save_many([Itinerary.model_validate_json(document) for document in documents])
+    return storage
+
+
+def main(count: int) -> None:
+    rng = random.Random(0)
+    documents = [build_itinerary(rng).model_dump_json() for _ in range(count)]
+    average_json = sum(map(len, documents)) / count
+    print(f"itineraries={count} average_json={average_json:.0f}B")
+
+    pydantic = retained_bytes(lambda: [Itinerary.model_validate_json(document) for document in documents])
+    compact = retained_bytes(lambda: [CompactItinerary(Itinerary.model_validate_json(document)) for document in documents])
+    storage = retained_bytes(lambda: asyncio.run(fill_storage(documents)))
+    print(f"pydantic objects   {pydantic / count:8.0f}B per itinerary")
+    print(f"compact records    {compact / count:8.0f}B per itinerary ({compact / pydantic:.0%})")
+    print(f"InMemoryStorage    {storage / count:8.0f}B per itinerary (records, index and sizes)")
+
+    itineraries = [Itinerary.model_validate_json(document) for document in documents[:2000]]
+    started = time.perf_counter()
+    records = [CompactItinerary(itinerary) for itinerary in itineraries]
+    packed = time.perf_counter() - started
+    estimated = sum(record.nbytes for record in records) / len(records)
+    print(f"record.nbytes      {estimated:8.0f}B per itinerary (the storage budget's estimate)")
+    started = time.perf_counter()
+    for record in records:
+        record.to_itinerary()
+    unpacked = time.perf_counter() - started
+    started = time.perf_counter()
+    for itinerary in itineraries:
+        itinerary.model_copy()
+    copied = time.perf_counter() - started
+    print(
+        f"pack={packed / len(records) * 1e6:.1f}us materialize={unpacked / len(records) * 1e6:.1f}us "
+        f"(shallow model_copy={copied / len(records) * 1e6:.1f}us)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--itineraries", type=int, default=20000, help="Number of itineraries.")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    main(args.itineraries)
@@ -0,0 +1,71 @@
+# benchmarks/bench_token_budget.py
+
+"""
+Compares fixed max_tokens=4096 against OpenAIGateway's adaptive token budget.
+
+Runs offline: simulated completions use a realistic, noisy number of tokens per
+trip day. For a mix of trip lengths it reports how many tokens each approach
+reserves from the tokens-per-minute budget and how many completions would have
+been truncated, plus the size of the prompt before and after compaction.
+
+Usage:
+    cd src && OPENAI_API_KEY=stub python ../benchmarks/bench_token_budget.py [--requests 1000] [--tokens-per-day 300]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+from wanderwise.adapters.gateways.openai_gateway import OpenAIGateway  # noqa: E402
+from wanderwise.config import Settings  # noqa: E402
+from wanderwise.domain.models.itinerary import Itinerary, ItineraryRequest  # noqa: E402
+
+FIXED_MAX_TOKENS = 4096
+
+
+def main(requests: int, tokens_per_day: int) -> None:
+    gateway = OpenAIGateway(Settings(OPENAI_API_KEY="stub"))
+    budget = gateway.token_budget
+    request = ItineraryRequest(destination="Paris", duration_days=5, travel_style="Cultural", budget="Mid-range")
+
+    full_prompt = json.dumps(Itinerary.model_json_schema()) + gateway.get_structured_prompt(request)
+    compact_prompt = "".join(message["content"] for message in gateway._build_messages(request))
+    print(f"prompt: {len(full_prompt)} chars with the full schema, {len(compact_prompt)} chars compacted")
+
+    rng = random.Random(0)
+    fixed = {"reserved": 0, "truncated": 0}
+    adaptive = {"reserved": 0, "truncated": 0}
+    for _ in range(requests):
+        days = rng.choice([1, 2, 3, 3, 4, 5, 5, 7, 10, 14])
+        needed = int(100 + sum(max(50.0, rng.gauss(tokens_per_day, tokens_per_day / 5)) for _ in range(days)))
+
+        fixed["reserved"] += FIXED_MAX_TOKENS
+        fixed["truncated"] += needed > FIXED_MAX_TOKENS
+
+        max_tokens = budget.max_tokens("itinerary", days)
+        adaptive["reserved"] += max_tokens
+        adaptive["truncated"] += needed > max_tokens
+        budget.record("itinerary", days, min(needed, max_tokens), truncated=needed > max_tokens)
+
+    for name, result in (("fixed 4096", fixed), ("adaptive", adaptive)):
+        print(
+            f"{name:<11} reserved={result['reserved'] / requests:7.0f} tokens/request  "
+            f"truncated={result['truncated']}/{requests}"
+        )
+    print(f"learned: {budget.stats()['itinerary']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--tokens-per-day", type=int, default=300)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    main(args.requests, args.tokens_per_day)
@@ -0,0 +1,274 @@
+# benchmarks/load_test.py
+
+"""
+End-to-end load test of the web app, offline, against the fake LLM.
+
+C concurrent clients send requests for a fixed duration (or request count) to
+the generate, streaming and edit endpoints, and the script reports p50/p95/p99
+latency, requests per second and error counts per scenario, plus the server's
+resident memory. By default the app runs in-process (over ASGI, no sockets)
+with LLM_PROVIDER=fake, so the numbers measure the FastAPI, Jinja and Pydantic
+layers plus the simulated LLM latency. With --url it drives a running server
+instead (start it with LLM_PROVIDER=fake to stay offline; pass --server-pid to
+report its memory).
+
+Results can be saved with --json and compared with a previous run via
+--baseline; the script exits with status 1 if p95 latency or throughput of any
+scenario regressed by more than --tolerance.
+
+Usage:
+    python benchmarks/load_test.py [--scenario mixed] [--concurrency 32] [--duration 10]
+        [--llm-latency 0.05] [--failure-rate 0.0] [--json results.json] [--baseline old.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import resource
+import statistics
+import sys
+import time
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import httpx  # noqa: E402
+
+SCENARIOS = {
+    "generate": {"generate": 1.0},
+    "stream": {"stream": 1.0},
+    "edit": {"edit": 1.0},
+    "mixed": {"generate": 0.3, "stream": 0.1, "edit": 0.6},
+}
+
+_ITINERARY_ID = re.compile(r'data-itinerary-id="([^"]+)"')
+_DAY_ID = re.compile(r'data-day-id="day-(\d+)"')
+_ACTIVITY_ID = re.compile(r'data-activity-id="([^"]+)"')
+
+
+def parse_itinerary(html: str) -> Optional[Tuple[str, Dict[int, List[str]]]]:
+    """Extracts the itinerary ID and each day's activity IDs from rendered itinerary HTML."""
+    match = _ITINERARY_ID.search(html)
+    if not match or not match.group(1):
+        return None
+    days: Dict[int, List[str]] = {}
+    parts = _DAY_ID.split(html)
+    for day, body in zip(parts[1::2], parts[2::2]):
+        days[int(day)] = _ACTIVITY_ID.findall(body)
+    return match.group(1), days
+
+
+def rss_bytes(pid: Optional[int] = None) -> Optional[int]:
+    """Current resident set size of a process (this one by default), if /proc is available."""
+    try:
+        with open(f"/proc/{pid or 'self'}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+class LoadTest:
+    def __init__(self, http: httpx.AsyncClient, seed: int, distinct: int, max_days: int):
+        self.http = http
+        self.rng = random.Random(seed)
+        self.distinct = distinct
+        self.max_days = max_days
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.conflicts = 0
+        self.itineraries: List[Tuple[str, Dict[int, List[str]]]] = []
+
+    def _form(self) -> Dict[str, str]:
+        city = self.rng.randrange(self.distinct)
+        return {
+            "destination": f"City {city}",
+            "duration_days": str(2 + city % (self.max_days - 1)),
+            "travel_style": self.rng.choice(["Cultural", "Adventure", "Relaxed", "Foodie"]),
+            "budget": self.rng.choice(["Budget-friendly", "Mid-range", "Luxury"]),
+        }
+
+    def _record(self, scenario: str, started: float, ok: bool) -> None:
+        if ok:
+            self.latencies.setdefault(scenario, []).append(time.perf_counter() - started)
+        else:
+            self.errors[scenario] = self.errors.get(scenario, 0) + 1
+
+    async def generate(self) -> None:
+        started = time.perf_counter()
+        response = await self.http.post("/generate-itinerary", data=self._form())
+        parsed = parse_itinerary(response.text) if response.status_code == 200 else None
+        self._record("generate", started, parsed is not None)
+        if parsed is not None:
+            self.itineraries.append(parsed)
+            del self.itineraries[:-1000]
+
+    async def stream(self) -> None:
+        started = time.perf_counter()
+        response = await self.http.get("/generate-itinerary/stream", params=self._form())
+        self._record("stream", started, response.status_code == 200 and "event: complete" in response.text)
+
+    async def edit(self) -> None:
+        if not self.itineraries:
+            await self.generate()
+            return
+        itinerary_id, days = self.rng.choice(self.itineraries)
+        day = self.rng.choice(sorted(days))
+        order = list(days[day])
+        self.rng.shuffle(order)
+        started = time.perf_counter()
+        response = await self.http.post("/api/itinerary/reorder-activities", json={
+            "itinerary_id": itinerary_id,
+            "operations": [{"op": "reorder", "day": day, "activity_order": order}],
+        })
+        if response.status_code == 409:
+            self.conflicts += 1
+        self._record("edit", started, response.status_code in (200, 409))
+
+    async def worker(self, weights: Dict[str, float], deadline: float, budget: List[int]) -> None:
+        names, probabilities = zip(*weights.items())
+        while time.perf_counter() < deadline and budget[0] != 0:
+            budget[0] -= 1
+            scenario = self.rng.choices(names, probabilities)[0]
+            try:
+                await getattr(self, scenario)()
+            except httpx.HTTPError as e:
+                self.errors[scenario] = self.errors.get(scenario, 0) + 1
+                print(f"  {scenario} request failed: {e!r}")
+
+
+def summarize(test: LoadTest, elapsed: float) -> Dict[str, Dict[str, Any]]:
+    summary: Dict[str, Dict[str, Any]] = {}
+    for scenario in sorted(set(test.latencies) | set(test.errors)):
+        latencies = sorted(test.latencies.get(scenario, []))
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+        summary[scenario] = {
+            "requests": len(latencies),
+            "errors": test.errors.get(scenario, 0),
+            "rps": len(latencies) / elapsed,
+            "p50_ms": quantiles[49] * 1000 if quantiles else None,
+            "p95_ms": quantiles[94] * 1000 if quantiles else None,
+            "p99_ms": quantiles[98] * 1000 if quantiles else None,
+        }
+    return summary
+
+
+def compare(summary: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], tolerance: float) -> bool:
+    ok = True
+    for scenario, current in summary.items():
+        previous = baseline.get(scenario)
+        if not previous or not previous.get("p95_ms") or not current.get("p95_ms"):
+            continue
+        p95_change = current["p95_ms"] / previous["p95_ms"] - 1
+        rps_change = current["rps"] / previous["rps"] - 1 if previous["rps"] else 0.0
+        regressed = p95_change > tolerance or rps_change < -tolerance
+        ok = ok and not regressed
+        print(f"  {scenario:<9} p95 {p95_change:+.0%}  rps {rps_change:+.0%}  {'REGRESSION' if regressed else 'ok'}")
+    return ok
+
+
+async def main(args: argparse.Namespace) -> int:
+    async with AsyncExitStack() as stack:
+        if args.url:
+            http = await stack.enter_async_context(httpx.AsyncClient(
+                base_url=args.url, timeout=120, limits=httpx.Limits(max_connections=args.concurrency)
+            ))
+            pid = args.server_pid
+        else:
+            from wanderwise.main import app, lifespan  # noqa: E402 - configured by the environment above
+
+            # Every simulated client shares one address; the per-IP rate limit would reject most requests.
+            app.state.limiter.enabled = False
+            await stack.enter_async_context(lifespan(app))
+            http = await stack.enter_async_context(httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://load-test", timeout=120
+            ))
+            pid = None
+
+        test = LoadTest(http, args.seed, args.distinct, args.max_days)
+        rss_before = rss_bytes(pid)
+        if SCENARIOS[args.scenario].get("edit"):
+            # Edits need stored itineraries to work on.
+            for _ in range(min(args.concurrency, args.distinct)):
+                await test.generate()
+            test.latencies.clear()
+            test.errors.clear()
+
+        budget = [args.requests if args.requests else -1]
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            test.worker(SCENARIOS[args.scenario], started + args.duration, budget)
+            for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+        rss_after = rss_bytes(pid)
+
+    summary = summarize(test, elapsed)
+    total = sum(result["requests"] for result in summary.values())
+    print(f"{args.scenario}: {args.concurrency} clients for {elapsed:.1f}s "
+          f"({'in-process' if not args.url else args.url})")
+    print(f"  {'scenario':<9} {'requests':>9} {'errors':>7} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for scenario, result in summary.items():
+        latency_columns = " ".join(
+            f"{result[key]:>8.1f}" if result[key] is not None else f"{'-':>8}" for key in ("p50_ms", "p95_ms", "p99_ms")
+        )
+        print(f"  {scenario:<9} {result['requests']:>9} {result['errors']:>7} {result['rps']:>8.1f} {latency_columns}")
+    print(f"  total     {total:>9} requests, {total / elapsed:.1f} rps, {test.conflicts} edit conflicts (409)")
+    if rss_after is not None:
+        peak = "" if pid else f", peak {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB"
+        print(f"  RSS: {rss_before / 2**20:.1f} MiB before, {rss_after / 2**20:.1f} MiB after{peak}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"scenario": args.scenario, "results": summary}, indent=2))
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["results"]
+        print(f"compared with {args.baseline} (tolerance {args.tolerance:.0%}):")
+        if not compare(summary, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--requests", type=int, default=0, help="stop after this many requests (0: no limit)")
+    parser.add_argument("--distinct", type=int, default=200, help="number of distinct itinerary requests")
+    parser.add_argument("--max-days", type=int, default=7, help="longest generated trip")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="fake LLM median latency (in-process)")
+    parser.add_argument("--llm-sigma", type=float, default=0.5, help="fake LLM latency spread (in-process)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fake LLM failure rate (in-process)")
+    parser.add_argument("--no-llm-cache", action="store_true", help="disable the LLM response cache (in-process)")
+    parser.add_argument("--app-logs", action="store_true", help="keep the app's INFO logging (in-process)")
+    parser.add_argument("--url", help="drive a running server instead of the in-process app")
+    parser.add_argument("--server-pid", type=int, help="PID of the --url server, to report its RSS")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="compare with results previously written by --json")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95/rps regression")
+    args = parser.parse_args()
+
+    if not args.url:
+        os.environ.setdefault("OPENAI_API_KEY", "stub")
+        os.environ["LLM_PROVIDER"] = "fake"
+        os.environ["FAKE_LLM_LATENCY_MEDIAN_SECONDS"] = str(args.llm_latency)
+        os.environ["FAKE_LLM_LATENCY_SIGMA"] = str(args.llm_sigma)
+        os.environ["FAKE_LLM_FAILURE_RATE"] = str(args.failure_rate)
+        os.environ["FAKE_LLM_SEED"] = str(args.seed)
+        if args.no_llm_cache:
+            os.environ["LLM_CACHE_ENABLED"] = "false"
+        if not args.app_logs:
+            import logging
+
+            # The app logs every request at INFO; thousands of lines would drown the report.
+            logging.disable(logging.INFO)
+    sys.exit(asyncio.run(main(args)))
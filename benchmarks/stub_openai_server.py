@@ -0,0 +1,184 @@
+# benchmarks/stub_openai_server.py
+
+"""
+A minimal local HTTP server that mimics the OpenAI chat-completions endpoint.
+
+It speaks just enough HTTP/1.1 (including keep-alive) to serve the official
+`openai` client, and it counts how many TCP connections were opened so that
+benchmarks can show whether connections are being reused.
+"""
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict, Optional
+
+SAMPLE_ITINERARY: Dict[str, Any] = {
+    "destination": "Paris",
+    "trip_title": "Three Days of Parisian Culture",
+    "total_estimated_cost_usd": 450.0,
+    "daily_plans": [
+        {
+            "day": day,
+            "theme": f"Day {day} highlights",
+            "activities": [
+                {"time": "09:00", "description": "Visit the Louvre Museum", "estimated_cost_usd": 22.0},
+                {"time": "13:00", "description": "Lunch in Le Marais", "estimated_cost_usd": 30.0},
+                {"time": "18:00", "description": "Seine river cruise", "estimated_cost_usd": 18.0},
+            ],
+        }
+        for day in range(1, 4)
+    ],
+}
+
+
+def chat_completion_body(content: str, model: str = "gpt-4o") -> bytes:
+    """Builds a chat-completions JSON response body wrapping `content`."""
+    return json.dumps({
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 200, "total_tokens": 300},
+    }).encode()
+
+
+def chat_completion_stream_body(content: str, model: str = "gpt-4o", chunk_size: int = 16) -> bytes:
+    """Builds a streamed (server-sent events) chat-completions body delivering `content`."""
+    events = []
+    for start in range(0, len(content), chunk_size):
+        events.append({
+            "id": "chatcmpl-stub",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "delta": {"content": content[start:start + chunk_size]},
+                "finish_reason": None,
+            }],
+        })
+    body = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+    return body.encode()
+
+
+class StubOpenAIServer:
+    """
+    An asyncio-based stub of the OpenAI API, usable as an async context manager.
+
+    With `max_in_flight` set, requests beyond that many concurrent ones are answered
+    with 429 and a Retry-After header, like the real API's rate limiting. With
+    `error_rate` a fraction of requests fail with 500, and with `slow_rate` a fraction
+    take `slow_seconds` instead of `latency_seconds`; both are drawn from a generator
+    seeded with `seed`, so runs are reproducible.
+
+    Attributes:
+        connections_opened: Number of TCP connections accepted so far.
+        requests_served: Number of HTTP requests answered so far.
+        rate_limited: Number of requests answered with 429.
+        errors_injected: Number of requests answered with 500.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        content: Optional[str] = None,
+        max_in_flight: Optional[int] = None,
+        error_rate: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_seconds: float = 2.0,
+        seed: int = 0,
+    ):
+        self.latency_seconds = latency_seconds
+        self.content = content if content is not None else json.dumps(SAMPLE_ITINERARY)
+        self.max_in_flight = max_in_flight
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_seconds = slow_seconds
+        self._rng = random.Random(seed)
+        self.connections_opened = 0
+        self.requests_served = 0
+        self.rate_limited = 0
+        self.errors_injected = 0
+        self._in_flight = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.port = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/v1"
+
+    async def __aenter__(self) -> "StubOpenAIServer":
+        self._server = await asyncio.start_server(self._handle_connection, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def respond(self, method: str, path: str, body: bytes) -> tuple[int, Dict[str, str], bytes]:
+        """Produces the (status, headers, body) for one request. Override to customise."""
+        if self.max_in_flight is not None and self._in_flight >= self.max_in_flight:
+            self.rate_limited += 1
+            error = {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}}
+            return 429, {"Retry-After": "1"}, json.dumps(error).encode()
+        latency = self.slow_seconds if self._rng.random() < self.slow_rate else self.latency_seconds
+        failed = self._rng.random() < self.error_rate
+        self._in_flight += 1
+        try:
+            if latency:
+                await asyncio.sleep(latency)
+        finally:
+            self._in_flight -= 1
+        if failed:
+            self.errors_injected += 1
+            error = {"error": {"message": "The server had an error", "type": "server_error", "code": None}}
+            return 500, {}, json.dumps(error).encode()
+        if body and json.loads(body).get("stream"):
+            return 200, {"Content-Type": "text/event-stream"}, chat_completion_stream_body(self.content)
+        return 200, {}, chat_completion_body(self.content)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections_opened += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+
+                status, extra_headers, payload = await self.respond(method, path, body)
+                self.requests_served += 1
+                response_headers = {
+                    "Content-Type": "application/json",
+                    "Content-Length": str(len(payload)),
+                    "Connection": "keep-alive",
+                    **extra_headers,
+                }
+                head = f"HTTP/1.1 {status} STUB\r\n" + "".join(
+                    f"{name}: {value}\r\n" for name, value in response_headers.items()
+                )
+                writer.write(head.encode("latin-1") + b"\r\n" + payload)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,209 @@
+# src/wanderwise/adapters/gateways/admission.py
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from ...domain.ports.llm_port import LLMUnavailableError
+
+log = logging.getLogger(__name__)
+
+
+class _Bucket:
+    """A token bucket holding up to `per_minute` units, refilled continuously."""
+
+    def __init__(self, per_minute: float, clock: Callable[[], float]):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = per_minute
+        self._clock = clock
+        self._updated = clock()
+
+    def refill(self) -> None:
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` units (capped at the capacity) are available."""
+        self.refill()
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+    def give_back(self, amount: float) -> None:
+        self.refill()
+        self.level = min(self.capacity, self.level + amount)
+
+
+class AdmissionPermit:
+    """Held while an admitted LLM call runs; reports the call's actual token usage."""
+
+    def __init__(self, controller: "AdmissionController", estimated_tokens: int):
+        self._controller = controller
+        self.estimated_tokens = estimated_tokens
+
+    def settle(self, actual_tokens: Optional[int]) -> None:
+        """Returns the unused part of the token estimate to the budget once usage is known."""
+        if actual_tokens is not None and self._controller._tokens is not None:
+            unused = self.estimated_tokens - actual_tokens
+            if unused > 0:
+                self._controller._tokens.give_back(unused)
+
+
+class AdmissionController:
+    """
+    Schedules outbound LLM calls so that bursts queue briefly instead of overloading the API.
+
+    A call is admitted once three budgets allow it, in arrival order:
+
+    - a concurrency limit on calls in flight;
+    - a requests-per-minute budget;
+    - a tokens-per-minute budget, charged with the call's estimated tokens (prompt
+      size plus `max_tokens`) and refunded with the unused part once usage is known.
+
+    At most `max_queue` calls wait at a time, each for at most `max_wait_seconds`.
+    A call that would wait longer than that, by the budgets' own estimate, fails
+    immediately. Either way it raises LLMUnavailableError with a Retry-After hint
+    instead of adding to the pile-up. A call that times out or is cancelled while
+    waiting gives back whatever it had already taken from the rate budgets.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_queue: int = 256,
+        max_wait_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_concurrency: Maximum number of LLM calls in flight.
+            requests_per_minute: Request budget, or None for no limit.
+            tokens_per_minute: Token budget, or None for no limit.
+            max_queue: Maximum number of calls waiting for admission.
+            max_wait_seconds: Longest a call may wait for admission.
+            clock: Monotonic time source, injectable for testing.
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._turnstile = asyncio.Lock()  # FIFO: waiters take their budgets in arrival order
+        self._requests = _Bucket(requests_per_minute, clock) if requests_per_minute else None
+        self._tokens = _Bucket(tokens_per_minute, clock) if tokens_per_minute else None
+        self._queued_tokens = 0
+        self._waits: "deque[float]" = deque(maxlen=1024)
+        self.waiting = 0
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def _predicted_wait(self, estimated_tokens: int) -> float:
+        """Seconds until the rate budgets cover this call and every call queued ahead of it."""
+        wait = 0.0
+        if self._requests is not None:
+            wait = max(wait, self._requests.time_until(self.waiting + 1))
+        if self._tokens is not None:
+            wait = max(wait, self._tokens.time_until(self._queued_tokens + estimated_tokens))
+        return wait
+
+    def _reject(self, reason: str, retry_after: float) -> LLMUnavailableError:
+        self.rejected += 1
+        retry_after = max(1, math.ceil(retry_after))
+        log.warning(f"LLM call rejected ({reason}); retry after {retry_after}s")
+        return LLMUnavailableError(f"The LLM is overloaded: {reason}", retry_after=retry_after)
+
+    @staticmethod
+    async def _take(bucket: Optional[_Bucket], amount: float) -> float:
+        """Waits until `amount` units are available and takes them; returns how many were taken."""
+        if bucket is None:
+            return 0.0
+        amount = min(amount, bucket.capacity)
+        while True:
+            wait = bucket.time_until(amount)
+            if wait <= 0:
+                bucket.level -= amount
+                return amount
+            await asyncio.sleep(wait)
+
+    def _give_back(self, requests: float, tokens: float) -> None:
+        """Returns budget taken by a call that was not admitted after all."""
+        if self._requests is not None and requests:
+            self._requests.give_back(requests)
+        if self._tokens is not None and tokens:
+            self._tokens.give_back(tokens)
+
+    @asynccontextmanager
+    async def admit(self, estimated_tokens: int) -> AsyncIterator[AdmissionPermit]:
+        """
+        Waits for admission and holds a concurrency slot for the duration of the block.
+
+        Args:
+            estimated_tokens: Estimated prompt plus completion tokens of the call.
+
+        Raises:
+            LLMUnavailableError: If the queue is full or the call cannot be admitted in time.
+        """
+        if self.waiting >= self.max_queue:
+            raise self._reject(f"{self.waiting} calls already queued", max(self._predicted_wait(estimated_tokens), self._mean_wait()))
+        predicted = self._predicted_wait(estimated_tokens)
+        if predicted > self.max_wait_seconds:
+            raise self._reject(f"rate budget exhausted for {predicted:.1f}s", predicted)
+
+        started = self._clock()
+        self.waiting += 1
+        self._queued_tokens += estimated_tokens
+        taken_requests = taken_tokens = 0.0
+        try:
+            async with asyncio.timeout(self.max_wait_seconds):
+                async with self._turnstile:
+                    taken_requests = await self._take(self._requests, 1)
+                    taken_tokens = await self._take(self._tokens, estimated_tokens)
+                    await self._semaphore.acquire()
+        except TimeoutError:
+            # Timed out waiting for a slot: the request and tokens were never used.
+            self._give_back(taken_requests, taken_tokens)
+            self.timed_out += 1
+            raise self._reject(f"no capacity within {self.max_wait_seconds:.0f}s", self._mean_wait()) from None
+        except asyncio.CancelledError:
+            self._give_back(taken_requests, taken_tokens)
+            raise
+        finally:
+            self.waiting -= 1
+            self._queued_tokens -= estimated_tokens
+
+        self._waits.append(self._clock() - started)
+        self.admitted += 1
+        self.in_flight += 1
+        try:
+            yield AdmissionPermit(self, estimated_tokens)
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def _mean_wait(self) -> float:
+        return sum(self._waits) / len(self._waits) if self._waits else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        waits = sorted(self._waits)
+        return {
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.waiting,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_mean_seconds": self._mean_wait(),
+            "wait_p95_seconds": waits[int(0.95 * (len(waits) - 1))] if waits else 0.0,
+            "wait_max_seconds": waits[-1] if waits else 0.0,
+            "requests_available": self._requests.level if self._requests is not None else None,
+            "tokens_available": self._tokens.level if self._tokens is not None else None,
+        }
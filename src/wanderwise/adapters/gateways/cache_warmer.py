@@ -0,0 +1,142 @@
+# src/wanderwise/adapters/gateways/cache_warmer.py
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ...domain.models.itinerary import ItineraryRequest
+from ...domain.ports.llm_port import LLMUnavailableError
+from .cached_llm_gateway import CachedLLMGateway
+
+log = logging.getLogger(__name__)
+
+
+class CacheWarmer:
+    """
+    A background scheduler that pre-generates popular itineraries into a CachedLLMGateway.
+
+    Every `interval_seconds` it takes the configured requests plus the
+    `popular_count` most requested ones observed by the cache, and generates each
+    one that is not cached or is due for a refresh. Generations are spaced out to
+    at most `max_per_minute`, and with `off_peak_hours` set the warmer only works
+    during those local hours, so warming never competes with peak traffic for the
+    LLM rate limits. A round stops early when the LLM reports it is overloaded.
+    """
+
+    def __init__(
+        self,
+        cache: CachedLLMGateway,
+        requests: Sequence[ItineraryRequest] = (),
+        popular_count: int = 20,
+        interval_seconds: float = 600.0,
+        max_per_minute: float = 6.0,
+        off_peak_hours: Optional[Tuple[int, int]] = None,
+        hour_of_day: Callable[[], int] = lambda: time.localtime().tm_hour,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+    ):
+        """
+        Args:
+            cache: The cache to warm.
+            requests: Requests to keep warm regardless of observed demand.
+            popular_count: How many of the most requested itineraries to keep warm.
+            interval_seconds: Time between warming rounds.
+            max_per_minute: Maximum number of itineraries generated per minute.
+            off_peak_hours: Local (start, end) hours during which to warm, e.g. (1, 6);
+                            the window may wrap past midnight. None to warm at any hour.
+            hour_of_day: Returns the current local hour, injectable for testing.
+            sleep: Awaitable sleep function, injectable for testing.
+        """
+        self.cache = cache
+        self.requests = list(requests)
+        self.popular_count = popular_count
+        self.interval_seconds = interval_seconds
+        self.max_per_minute = max_per_minute
+        self.off_peak_hours = off_peak_hours
+        self._hour_of_day = hour_of_day
+        self._sleep = sleep
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.rounds = 0
+        self.warmed = 0
+        self.failures = 0
+        self.overloaded = 0
+
+    def start(self) -> None:
+        """Starts the warming loop (called from the application lifespan)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="cache-warmer")
+            log.info(
+                f"CacheWarmer started ({len(self.requests)} configured, top {self.popular_count} popular, "
+                f"every {self.interval_seconds:.0f}s, at most {self.max_per_minute}/min)"
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            log.info("CacheWarmer stopped")
+
+    def is_off_peak(self) -> bool:
+        if self.off_peak_hours is None:
+            return True
+        start, end = self.off_peak_hours
+        hour = self._hour_of_day()
+        return start <= hour < end if start <= end else hour >= start or hour < end
+
+    def candidates(self) -> List[ItineraryRequest]:
+        """The configured requests followed by the most popular ones, without duplicates."""
+        seen = set()
+        unique: List[ItineraryRequest] = []
+        for request in [*self.requests, *self.cache.popular_requests(self.popular_count)]:
+            key = self.cache.request_key(request)
+            if key not in seen:
+                seen.add(key)
+                unique.append(request)
+        return unique
+
+    async def run_once(self) -> int:
+        """
+        Runs one warming round.
+
+        Returns:
+            The number of itineraries generated.
+        """
+        self.rounds += 1
+        warmed = 0
+        spacing = 60.0 / self.max_per_minute
+        for request in self.candidates():
+            try:
+                generated = await self.cache.warm(request)
+            except LLMUnavailableError as e:
+                self.overloaded += 1
+                log.info(f"CacheWarmer backing off for this round; LLM unavailable: {e}")
+                break
+            except Exception as e:
+                self.failures += 1
+                log.error(f"CacheWarmer failed to warm {request.destination}: {e}", exc_info=True)
+                continue
+            if generated:
+                warmed += 1
+                self.warmed += 1
+                await self._sleep(spacing)
+        if warmed:
+            log.info(f"CacheWarmer pre-generated {warmed} itineraries")
+        return warmed
+
+    async def _run(self) -> None:
+        while True:
+            if self.is_off_peak():
+                await self.run_once()
+            await self._sleep(self.interval_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None,
+            "configured_requests": len(self.requests),
+            "off_peak": self.is_off_peak(),
+            "rounds": self.rounds,
+            "warmed": self.warmed,
+            "failures": self.failures,
+            "overloaded": self.overloaded,
+        }
@@ -0,0 +1,255 @@
+# src/wanderwise/adapters/gateways/cached_llm_gateway.py
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from ...domain.models.itinerary import DailyPlan, Itinerary, ItineraryRequest
+from ...domain.ports.llm_port import LLMPort, LLMUnavailableError
+
+log = logging.getLogger(__name__)
+
+
+class CachedLLMGateway(LLMPort):
+    """
+    A caching decorator for any LLMPort implementation.
+
+    Generated itineraries are stored in a bounded in-process cache keyed on a hash of
+    the normalized request, the wrapped port's prompt template version and its model
+    name (see `LLMPort.request_key`). Entries are evicted least-recently-used once
+    `max_entries` is reached and expire after `ttl_seconds`. Every hit returns a deep copy with fresh IDs, so
+    itineraries served from the cache never share identity.
+
+    Entries within `refresh_ahead_seconds` of expiring are refreshed stale-while-
+    revalidate style: the hit is still served from the cache at once, and a single
+    background generation per key replaces the entry, so a popular request never
+    waits for the LLM. The cache also counts how often each request is asked for, so
+    a CacheWarmer can pre-generate the most popular ones (see `warm`).
+    """
+
+    def __init__(
+        self,
+        inner: LLMPort,
+        max_entries: int = 1024,
+        ttl_seconds: float = 6 * 60 * 60,
+        refresh_ahead_seconds: float = 0.0,
+        max_tracked_requests: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes the cache around another LLM port.
+
+        Args:
+            inner: The LLMPort that actually generates itineraries on a cache miss.
+            max_entries: Maximum number of itineraries kept in the cache.
+            ttl_seconds: Lifetime of a cached itinerary in seconds.
+            refresh_ahead_seconds: How long before expiry a hit triggers a background
+                                   refresh (0 to never refresh).
+            max_tracked_requests: Maximum number of distinct requests whose demand is counted.
+            clock: Monotonic time source, injectable for testing.
+        """
+        self.inner = inner
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.max_tracked_requests = max_tracked_requests
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Itinerary]]" = OrderedDict()
+        self._refreshing: Dict[str, "asyncio.Task[None]"] = {}
+        self._demand: Dict[str, Tuple[ItineraryRequest, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.warmed = 0
+        log.info(
+            f"CachedLLMGateway initialized around {type(inner).__name__} "
+            f"(max_entries={max_entries}, ttl={ttl_seconds}s)"
+        )
+
+    def request_key(self, request: ItineraryRequest) -> str:
+        """Returns the content address of a request for the wrapped port."""
+        return self.inner.request_key(request)
+
+    def _lookup(self, key: str) -> Optional[Itinerary]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, itinerary = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.evictions += 1
+            return None
+        self._entries.move_to_end(key)
+        return itinerary
+
+    def _store(self, key: str, itinerary: Itinerary) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, itinerary.model_copy(deep=True))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _count_demand(self, key: str, request: ItineraryRequest) -> None:
+        """Counts one request for `key`, halving every count when too many keys are tracked."""
+        _, count = self._demand.get(key, (request, 0))
+        self._demand[key] = (request, count + 1)
+        if len(self._demand) > self.max_tracked_requests:
+            # Decay: old demand fades and one-off requests drop out.
+            self._demand = {
+                tracked: (tracked_request, tracked_count // 2)
+                for tracked, (tracked_request, tracked_count) in self._demand.items()
+                if tracked_count > 1
+            }
+
+    def _is_stale(self, key: str) -> bool:
+        """Whether a cached entry is missing or due for a refresh."""
+        entry = self._entries.get(key)
+        return entry is None or entry[0] - self._clock() <= self.refresh_ahead_seconds
+
+    def _revalidate(self, key: str, request: ItineraryRequest) -> None:
+        """Starts a background refresh of a stale entry, unless one is already running."""
+        if not self.refresh_ahead_seconds or key in self._refreshing or not self._is_stale(key):
+            return
+        task = asyncio.ensure_future(self._refresh(key, request))
+        self._refreshing[key] = task
+
+        def forget(_: "asyncio.Task[None]") -> None:
+            self._refreshing.pop(key, None)
+
+        task.add_done_callback(forget)
+
+    async def _refresh(self, key: str, request: ItineraryRequest) -> None:
+        try:
+            itinerary = await self.inner.generate_itinerary(request)
+        except LLMUnavailableError as e:
+            itinerary = None
+            log.info(f"Skipped refreshing cached itinerary for {request.destination}: {e}")
+        except Exception as e:
+            itinerary = None
+            log.error(f"Failed to refresh cached itinerary for {request.destination}: {e}", exc_info=True)
+        if itinerary is None:
+            self.refresh_failures += 1
+            return
+        self.refreshes += 1
+        self._store(key, itinerary)
+        log.info(f"Refreshed cached itinerary for destination: {request.destination}")
+
+    def popular_requests(self, limit: int) -> List[ItineraryRequest]:
+        """Returns up to `limit` of the most requested itinerary requests, most popular first."""
+        ranked = sorted(self._demand.values(), key=lambda item: item[1], reverse=True)
+        return [request for request, _ in ranked[:limit]]
+
+    async def warm(self, request: ItineraryRequest) -> bool:
+        """
+        Generates and caches the itinerary for a request unless a fresh one is cached.
+
+        Warming does not count as demand or as a cache miss.
+
+        Returns:
+            True if an itinerary was generated and cached.
+
+        Raises:
+            LLMUnavailableError: If the LLM is overloaded.
+        """
+        key = self.request_key(request)
+        if key in self._refreshing or not self._is_stale(key):
+            return False
+        itinerary = await self.inner.generate_itinerary(request)
+        if itinerary is None:
+            return False
+        self._store(key, itinerary)
+        self.warmed += 1
+        return True
+
+    async def generate_itinerary(self, request: ItineraryRequest) -> Itinerary | None:
+        """
+        Returns a cached itinerary for the request, generating and caching it on a miss.
+        """
+        key = self.request_key(request)
+        self._count_demand(key, request)
+        cached = self._lookup(key)
+        if cached is not None:
+            self.hits += 1
+            log.info(f"LLM cache hit for destination: {request.destination}")
+            self._revalidate(key, request)
+            return cached.copy_with_new_ids()
+
+        self.misses += 1
+        itinerary = await self.inner.generate_itinerary(request)
+        if itinerary is not None:
+            self._store(key, itinerary)
+        return itinerary
+
+    async def stream_itinerary(
+        self, request: ItineraryRequest
+    ) -> AsyncIterator[DailyPlan | Itinerary]:
+        """
+        Replays a cached itinerary immediately, or streams from the wrapped port on a miss.
+        """
+        key = self.request_key(request)
+        self._count_demand(key, request)
+        cached = self._lookup(key)
+        if cached is not None:
+            self.hits += 1
+            log.info(f"LLM cache hit (stream) for destination: {request.destination}")
+            self._revalidate(key, request)
+            itinerary = cached.copy_with_new_ids()
+            for daily_plan in itinerary.daily_plans:
+                yield daily_plan
+            yield itinerary
+            return
+
+        self.misses += 1
+        async for item in self.inner.stream_itinerary(request):
+            if isinstance(item, Itinerary):
+                self._store(key, item)
+            yield item
+
+    async def regenerate_day(
+        self, request: ItineraryRequest, itinerary: Itinerary, day_number: int
+    ) -> DailyPlan | None:
+        """Always regenerates with the wrapped port: a replacement day is wanted precisely because it is new."""
+        return await self.inner.regenerate_day(request, itinerary, day_number)
+
+    def invalidate(self, request: Optional[ItineraryRequest] = None) -> None:
+        """Drops the cached entry for a request, or the whole cache if none is given."""
+        if request is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(self.request_key(request), None)
+
+    def get_structured_prompt(self, request: ItineraryRequest) -> str:
+        return self.inner.get_structured_prompt(request)
+
+    def get_response_schema(self) -> Dict[str, Any]:
+        return self.inner.get_response_schema()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            **self.inner.stats(),
+            "cache": {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "refreshing": len(self._refreshing),
+                "refreshes": self.refreshes,
+                "refresh_failures": self.refresh_failures,
+                "warmed": self.warmed,
+                "tracked_requests": len(self._demand),
+            },
+        }
+
+    async def aclose(self) -> None:
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self._refreshing.clear()
+        self._entries.clear()
+        await self.inner.aclose()
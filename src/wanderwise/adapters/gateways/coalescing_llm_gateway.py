@@ -0,0 +1,109 @@
+# src/wanderwise/adapters/gateways/coalescing_llm_gateway.py
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict
+
+from ...domain.models.itinerary import DailyPlan, Itinerary, ItineraryRequest
+from ...domain.ports.llm_port import LLMPort
+
+log = logging.getLogger(__name__)
+
+
+class CoalescingLLMGateway(LLMPort):
+    """
+    A single-flight decorator for any LLMPort implementation.
+
+    Concurrent callers asking for the same itinerary (same `request_key`) share one
+    in-flight generation instead of each starting their own LLM call. The shared call
+    runs as an independent task, so a caller that is cancelled (e.g. a client that
+    disconnected) stops waiting without cancelling the call for everyone else.
+    Each caller receives its own deep copy of the result with fresh IDs.
+    """
+
+    def __init__(self, inner: LLMPort):
+        """
+        Initializes the coalescing layer around another LLM port.
+
+        Args:
+            inner: The LLMPort that performs the actual generation.
+        """
+        self.inner = inner
+        self._in_flight: Dict[str, "asyncio.Task[Itinerary | None]"] = {}
+        self.started = 0
+        self.coalesced = 0
+        log.info(f"CoalescingLLMGateway initialized around {type(inner).__name__}")
+
+    def request_key(self, request: ItineraryRequest) -> str:
+        return self.inner.request_key(request)
+
+    def _on_done(self, key: str, task: "asyncio.Task[Itinerary | None]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieve the exception so it is not reported as unhandled when every
+        # waiter was cancelled before the call finished.
+        if not task.cancelled():
+            task.exception()
+
+    async def generate_itinerary(self, request: ItineraryRequest) -> Itinerary | None:
+        """
+        Joins an identical in-flight generation, or starts one if there is none.
+        """
+        key = self.request_key(request)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.inner.generate_itinerary(request))
+
+            def on_done(done: "asyncio.Task[Itinerary | None]") -> None:
+                self._on_done(key, done)
+
+            task.add_done_callback(on_done)
+            self._in_flight[key] = task
+            self.started += 1
+        else:
+            self.coalesced += 1
+            log.info(f"Joining in-flight generation for destination: {request.destination}")
+
+        itinerary = await asyncio.shield(task)
+        return itinerary.copy_with_new_ids() if itinerary is not None else None
+
+    async def stream_itinerary(
+        self, request: ItineraryRequest
+    ) -> AsyncIterator[DailyPlan | Itinerary]:
+        """
+        Streams from the wrapped port, or replays an identical generation already in flight.
+        """
+        if self.request_key(request) in self._in_flight:
+            async for item in super().stream_itinerary(request):
+                yield item
+            return
+        async for item in self.inner.stream_itinerary(request):
+            yield item
+
+    async def regenerate_day(
+        self, request: ItineraryRequest, itinerary: Itinerary, day_number: int
+    ) -> DailyPlan | None:
+        """Forwards to the wrapped port; each regeneration is meant to differ, so none are shared."""
+        return await self.inner.regenerate_day(request, itinerary, day_number)
+
+    def get_structured_prompt(self, request: ItineraryRequest) -> str:
+        return self.inner.get_structured_prompt(request)
+
+    def get_response_schema(self) -> Dict[str, Any]:
+        return self.inner.get_response_schema()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.inner.stats(),
+            "coalescing": {
+                "in_flight": len(self._in_flight),
+                "started": self.started,
+                "coalesced": self.coalesced,
+            },
+        }
+
+    async def aclose(self) -> None:
+        for task in list(self._in_flight.values()):
+            task.cancel()
+        self._in_flight.clear()
+        await self.inner.aclose()
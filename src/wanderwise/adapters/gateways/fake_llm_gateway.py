@@ -0,0 +1,178 @@
+# src/wanderwise/adapters/gateways/fake_llm_gateway.py
+
+import asyncio
+import logging
+import random
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from ...domain.models.itinerary import Activity, DailyPlan, Itinerary, ItineraryRequest
+from ...domain.ports.llm_port import LLMPort
+
+log = logging.getLogger(__name__)
+
+# Vocabulary for generated content. Descriptions are assembled from these so that
+# itineraries have roughly the size and shape of real model output.
+_THEMES = [
+    "Historic Heart of the City", "Markets and Street Food", "Museums and Galleries",
+    "Parks and Gardens", "Hidden Neighbourhoods", "Waterfront Walks", "Local Crafts and Design",
+    "Day Trip to the Countryside", "Architecture Tour", "Nightlife and Live Music",
+]
+_PLACES = [
+    "the old town square", "the central market", "the national museum", "a riverside promenade",
+    "the cathedral", "a family-run bakery", "the botanical garden", "a hilltop viewpoint",
+    "the contemporary art gallery", "a historic coffee house", "the harbour", "a craft brewery",
+]
+_ACTIONS = [
+    "Start the morning with a guided walk through", "Spend a relaxed hour exploring",
+    "Join a small-group tour of", "Stop for a leisurely meal near", "Browse the stalls around",
+    "Catch the sunset from", "Take a hands-on workshop close to", "Wander at your own pace through",
+]
+_DETAILS = [
+    "Arrive early to avoid the queues and ask the staff about seasonal exhibits.",
+    "Locals recommend trying the daily special and sitting on the terrace if the weather allows.",
+    "The area is easily walkable and has plenty of benches and shaded spots for a break.",
+    "Book ahead during weekends, as this is a favourite with residents as well as visitors.",
+    "Comfortable shoes are a good idea; some streets are cobbled and fairly steep.",
+]
+_TIMES = ["08:30", "10:00", "12:30", "14:30", "16:00", "18:30", "20:30"]
+_BUDGET_SCALE = {"budget": 0.5, "budget-friendly": 0.5, "mid-range": 1.0, "luxury": 2.5}
+
+
+class FakeLLMGateway(LLMPort):
+    """
+    A deterministic, offline LLMPort for load testing and local development.
+
+    Itineraries are built locally from the request: the same request always yields
+    the same content (seeded from its fingerprint), with realistic sizes (several
+    activities per day, multi-sentence descriptions). Each call waits for a latency
+    drawn from a log-normal distribution and fails (returns None, like the real
+    gateway after an API error) with the configured probability. Latencies and
+    failures come from one seeded generator, so a given sequence of calls is
+    reproducible.
+    """
+
+    def __init__(
+        self,
+        latency_median_seconds: float = 1.5,
+        latency_sigma: float = 0.5,
+        failure_rate: float = 0.0,
+        activities_per_day: int = 4,
+        seed: int = 0,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+    ):
+        """
+        Args:
+            latency_median_seconds: Median simulated LLM latency for a whole itinerary.
+            latency_sigma: Shape of the log-normal latency distribution (0 for a constant latency).
+            failure_rate: Probability in [0, 1] that a call fails.
+            activities_per_day: Number of activities generated for each day.
+            seed: Seed for content, latencies and failures.
+            sleep: Awaitable sleep function, injectable for testing.
+        """
+        self.latency_median_seconds = latency_median_seconds
+        self.latency_sigma = latency_sigma
+        self.failure_rate = failure_rate
+        self.activities_per_day = activities_per_day
+        self.seed = seed
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+        self.calls = 0
+        self.failures = 0
+        self.total_latency = 0.0
+        log.info(
+            f"FakeLLMGateway initialized (median latency {latency_median_seconds}s, "
+            f"failure rate {failure_rate:.0%})"
+        )
+
+    def request_key(self, request: ItineraryRequest) -> str:
+        return request.fingerprint(type(self).__name__, str(self.seed), str(self.activities_per_day))
+
+    def get_structured_prompt(self, request: ItineraryRequest) -> str:
+        return (
+            f"Create a {request.duration_days}-day {request.travel_style} itinerary "
+            f"for {request.destination} on a {request.budget} budget."
+        )
+
+    def get_response_schema(self) -> Dict[str, Any]:
+        return Itinerary.model_json_schema()
+
+    def _next_call(self) -> Tuple[float, bool]:
+        """Draws the latency and the failure decision for one call."""
+        latency = self.latency_median_seconds * self._rng.lognormvariate(0.0, self.latency_sigma)
+        failed = self._rng.random() < self.failure_rate
+        self.calls += 1
+        self.total_latency += latency
+        if failed:
+            self.failures += 1
+        return latency, failed
+
+    def _build_day(self, rng: random.Random, request: ItineraryRequest, day: int) -> DailyPlan:
+        scale = _BUDGET_SCALE.get(" ".join(request.budget.split()).casefold(), 1.0)
+        times = sorted(rng.sample(_TIMES, min(self.activities_per_day, len(_TIMES))))
+        activities = [
+            Activity(
+                time=times[index % len(times)],
+                description=(
+                    f"{rng.choice(_ACTIONS)} {rng.choice(_PLACES)} in {request.destination}. "
+                    f"{rng.choice(_DETAILS)}"
+                ),
+                estimated_cost_usd=round(rng.uniform(5, 60) * scale, 2),
+                booking_link=f"https://example.com/book/{rng.randrange(10**8)}" if rng.random() < 0.3 else None,
+            )
+            for index in range(self.activities_per_day)
+        ]
+        return DailyPlan(day=day, theme=rng.choice(_THEMES), activities=activities)
+
+    def _build_itinerary(self, request: ItineraryRequest) -> Itinerary:
+        rng = random.Random(self.request_key(request))
+        daily_plans = [self._build_day(rng, request, day) for day in range(1, request.duration_days + 1)]
+        return Itinerary(
+            destination=request.destination,
+            trip_title=f"{request.duration_days} Days of {request.travel_style.title()} in {request.destination}",
+            total_estimated_cost_usd=round(
+                sum(a.estimated_cost_usd or 0 for plan in daily_plans for a in plan.activities), 2
+            ),
+            daily_plans=daily_plans,
+        )
+
+    async def generate_itinerary(self, request: ItineraryRequest) -> Optional[Itinerary]:
+        latency, failed = self._next_call()
+        await self._sleep(latency)
+        if failed:
+            log.error(f"FakeLLMGateway injected a failure for {request.destination}")
+            return None
+        return self._build_itinerary(request)
+
+    async def stream_itinerary(self, request: ItineraryRequest) -> AsyncIterator[DailyPlan | Itinerary]:
+        """Spreads the call's latency over the days: a third before the first day, the rest evenly."""
+        latency, failed = self._next_call()
+        itinerary = self._build_itinerary(request)
+        await self._sleep(latency / 3)
+        per_day = (latency - latency / 3) / len(itinerary.daily_plans)
+        for index, daily_plan in enumerate(itinerary.daily_plans):
+            if failed and index == len(itinerary.daily_plans) // 2:
+                log.error(f"FakeLLMGateway injected a failure while streaming {request.destination}")
+                return
+            await self._sleep(per_day)
+            yield daily_plan
+        yield itinerary
+
+    async def regenerate_day(
+        self, request: ItineraryRequest, itinerary: Itinerary, day_number: int
+    ) -> DailyPlan | None:
+        """Builds a fresh random day, taking the per-day share of a whole itinerary's latency."""
+        latency, failed = self._next_call()
+        await self._sleep(latency / max(1, len(itinerary.daily_plans)))
+        if failed:
+            log.error(f"FakeLLMGateway injected a failure regenerating day {day_number} for {request.destination}")
+            return None
+        return self._build_day(random.Random(self._rng.random()), request, day_number)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "fake_llm": {
+                "calls": self.calls,
+                "failures": self.failures,
+                "mean_latency_seconds": self.total_latency / self.calls if self.calls else 0.0,
+            },
+        }
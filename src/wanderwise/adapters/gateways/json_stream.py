@@ -0,0 +1,105 @@
+# src/wanderwise/adapters/gateways/json_stream.py
+
+import json
+from typing import Any, Dict, List, Optional, cast
+
+
+class DailyPlanStreamParser:
+    """
+    An incremental parser that extracts daily plans from a streamed itinerary JSON document.
+
+    The LLM streams the itinerary as text fragments. This parser scans each fragment
+    exactly once, tracking string/escape state and container nesting, and returns
+    every element of the top-level "daily_plans" array as soon as its closing brace
+    arrives, without waiting for (or re-parsing) the rest of the document.
+    """
+
+    def __init__(self, array_key: str = "daily_plans"):
+        """
+        Args:
+            array_key: The top-level key whose array elements should be emitted.
+        """
+        self.array_key = array_key
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._string_start: Optional[int] = None
+        self._last_key: Optional[str] = None
+        self._array_depth: Optional[int] = None
+        self._array_start: Optional[int] = None
+        self._element_start: Optional[int] = None
+
+    @property
+    def text(self) -> str:
+        """The full document received so far."""
+        return self._text
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Consumes the next fragment of the document.
+
+        Args:
+            chunk: The next piece of streamed text.
+
+        Returns:
+            The daily plan objects (as dicts) completed by this fragment, in order.
+
+        Raises:
+            json.JSONDecodeError: If a completed daily plan is not valid JSON.
+        """
+        self._text += chunk
+        completed: List[Dict[str, Any]] = []
+        text = self._text
+        for index in range(self._pos, len(text)):
+            char = text[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._string_start is not None:
+                        self._last_key = json.loads(text[self._string_start:index + 1])
+                        self._string_start = None
+                continue
+
+            if char == '"':
+                self._in_string = True
+                # Only strings directly inside the root object can be the array's key.
+                if self._depth == 1:
+                    self._string_start = index
+            elif char in "{[":
+                self._depth += 1
+                if char == "[" and self._depth == 2 and self._last_key == self.array_key:
+                    self._array_depth = self._depth
+                    self._array_start = index
+                elif char == "{" and self._array_depth is not None and self._depth == self._array_depth + 1:
+                    self._element_start = index
+            elif char in "}]":
+                if self._array_depth is not None:
+                    if char == "}" and self._element_start is not None and self._depth == self._array_depth + 1:
+                        completed.append(json.loads(text[self._element_start:index + 1]))
+                        self._element_start = None
+                    elif char == "]" and self._depth == self._array_depth:
+                        self._array_depth = None
+                self._depth -= 1
+        self._pos = len(text)
+        return completed
+
+    def header(self) -> Dict[str, Any]:
+        """
+        Returns the root object's members that precede the array, with the array left empty.
+
+        Useful when the document is cut off (e.g. a truncated completion): the members
+        before the array and the elements already emitted by `feed` can still be used.
+        Returns an empty dict if the array has not opened yet.
+
+        Raises:
+            json.JSONDecodeError: If the members before the array are not valid JSON.
+        """
+        if self._array_start is None:
+            return {}
+        return cast(Dict[str, Any], json.loads(self._text[:self._array_start] + "[]}"))
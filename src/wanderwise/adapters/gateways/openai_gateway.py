@@ -1,19 +1,91 @@
 # src/wanderwise/adapters/gateways/openai_gateway.py
 
+import asyncio
 import json
 import logging
-from typing import Dict, Any
+import textwrap
+from contextlib import AsyncExitStack
+from functools import lru_cache
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple, Type
 
-from openai import AsyncOpenAI, RateLimitError, APIError
-from pydantic import ValidationError
+import httpx
+from openai import APIConnectionError, APIError, APITimeoutError, AsyncOpenAI, InternalServerError, RateLimitError
+from pydantic import BaseModel, ValidationError
 
 from ...config import Settings
-from ...domain.models.itinerary import Itinerary, ItineraryRequest
-from ...domain.ports.llm_port import LLMPort
+from ...domain.models.itinerary import DailyPlan, GenerationStrategy, Itinerary, ItineraryRequest
+from ...domain.ports.llm_port import LLMPort, LLMUnavailableError
+from .admission import AdmissionController, AdmissionPermit
+from .json_stream import DailyPlanStreamParser
+from .resilience import CircuitBreaker, ResiliencePolicy
+from .response_parser import parse_daily_plan, parse_itinerary
+from .token_budget import TokenBudget
 
 # Get a logger instance for this module.
 log = logging.getLogger(__name__)
 
+# The small JSON schema requested for the trip skeleton in per-day generation.
+_SKELETON_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "trip_title": {"type": "string"},
+        "total_estimated_cost_usd": {"type": ["number", "null"]},
+        "days": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"day": {"type": "integer"}, "theme": {"type": "string"}},
+                "required": ["day", "theme"],
+            },
+        },
+    },
+    "required": ["trip_title", "days"],
+}
+
+# Fields the server assigns (coordinates come from the geocoder); the model is not asked to produce them.
+_SERVER_FIELDS = frozenset({"id", "version", "latitude", "longitude"})
+
+
+def _compact_schema(node: Any) -> Any:
+    """Strips titles, descriptions and server-assigned fields from a JSON schema."""
+    if isinstance(node, list):
+        return [_compact_schema(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    compact: Dict[str, Any] = {}
+    for key, value in node.items():
+        if key in ("title", "description"):
+            continue
+        if key in ("properties", "$defs"):
+            # Mappings of names to schemas: keep every name (even "title"), compact the schemas.
+            compact[key] = {
+                name: _compact_schema(schema) for name, schema in value.items()
+                if not (key == "properties" and name in _SERVER_FIELDS)
+            }
+        elif key == "required":
+            compact[key] = [name for name in value if name not in _SERVER_FIELDS]
+        else:
+            compact[key] = _compact_schema(value)
+    return compact
+
+
+@lru_cache(maxsize=None)
+def _schema_json(model: Type[BaseModel]) -> str:
+    """The compact, minified JSON schema of a model, computed once per process."""
+    return json.dumps(_compact_schema(model.model_json_schema()), separators=(",", ":"))
+
+
+@lru_cache(maxsize=None)
+def _system_message(schema_json: str) -> str:
+    """The system prompt prefix asking for JSON that follows `schema_json`, built once per schema."""
+    return (
+        "You are a helpful travel planning assistant that only responds in JSON format. "
+        "Please format your response according to the following schema: " + schema_json
+    )
+
+
+_SKELETON_SCHEMA_JSON = json.dumps(_SKELETON_SCHEMA, separators=(",", ":"))
+
 
 class OpenAIGateway(LLMPort):
     """
@@ -23,32 +95,156 @@ class OpenAIGateway(LLMPort):
     client initialization, prompt construction, API calls, and response parsing.
     """
 
-    def __init__(self, settings: Settings):
+    # Bump this whenever the prompt or schema instructions change, so that cached
+    # responses produced by an older prompt are no longer reused.
+    prompt_version = "2"
+
+    # Completions per day in per-day generation: a day that comes back empty or fails to
+    # parse is asked for again, rather than losing every other (already paid for) day.
+    max_day_attempts = 2
+
+    def __init__(
+        self,
+        settings: Settings,
+        http_client: Optional[httpx.AsyncClient] = None,
+        admission: Optional[AdmissionController] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+        model: Optional[str] = None,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ):
         """
         Initializes the OpenAI gateway.
 
+        The underlying AsyncOpenAI client (and its httpx connection pool) is shared by
+        every call made through this gateway, so connections, TLS sessions and DNS
+        lookups are reused across itineraries. Call `aclose()` on shutdown to release it.
+
+        Every completion first passes an AdmissionController, which bounds the calls
+        in flight and keeps them within the account's request and token rate limits.
+        When it cannot admit a call in time the gateway raises LLMUnavailableError
+        rather than sending a request that would only be rate limited.
+
+        Transient failures (rate limits, timeouts, connection errors and 5xx responses)
+        are retried by a ResiliencePolicy, which also trips a circuit breaker when the
+        API keeps failing and can hedge slow calls. The OpenAI client's own retries are
+        turned off so that every retry goes through this policy.
+
         Args:
-            settings: The application settings object containing the API key.
+            settings: The application settings object containing the API key and
+                      HTTP client configuration.
+            http_client: Optional pre-configured httpx client to use instead of
+                         building one from the settings.
+            admission: Optional admission controller to use instead of building one
+                       from the settings.
+            resilience: Optional retry/circuit-breaker/hedging policy to use instead
+                        of building one from the settings.
+            model: Optional model name overriding OPENAI_MODEL.
+            base_url: Optional API base URL overriding OPENAI_BASE_URL.
+            api_key: Optional API key overriding OPENAI_API_KEY.
         """
-        # Store the API key instead of initializing the client
-        self.api_key = settings.OPENAI_API_KEY.get_secret_value()
-        self.model = "gpt-4o" # Using a powerful model capable of following JSON instructions
+        self.api_key = api_key or settings.OPENAI_API_KEY.get_secret_value()
+        self.model = model or settings.OPENAI_MODEL
+        self.base_url = base_url or settings.OPENAI_BASE_URL
+        self._limits = httpx.Limits(
+            max_connections=settings.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        self._timeout = httpx.Timeout(
+            settings.OPENAI_TIMEOUT_SECONDS,
+            connect=settings.OPENAI_CONNECT_TIMEOUT_SECONDS,
+        )
+        self._http_client = http_client
+        self._client: Optional[AsyncOpenAI] = None
+        self.per_day_min_days = settings.LLM_PER_DAY_MIN_DAYS
+        self.per_day_concurrency = settings.LLM_PER_DAY_CONCURRENCY
+        self.token_budget = TokenBudget(
+            priors={
+                "itinerary": settings.LLM_TOKENS_PER_DAY_PRIOR,
+                "day": settings.LLM_TOKENS_PER_DAY_PRIOR,
+                "skeleton": 25,
+            },
+            overheads={"itinerary": 100, "day": 30, "skeleton": 60},
+            max_tokens={
+                "itinerary": settings.LLM_MAX_COMPLETION_TOKENS,
+                "skeleton": settings.LLM_SKELETON_MAX_TOKENS,
+                "day": settings.LLM_DAY_MAX_TOKENS,
+            },
+        )
+        self.admission = admission or AdmissionController(
+            max_concurrency=settings.LLM_MAX_CONCURRENCY,
+            requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+            tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+            max_queue=settings.LLM_MAX_QUEUED,
+            max_wait_seconds=settings.LLM_MAX_QUEUE_WAIT_SECONDS,
+        )
+        self.resilience = resilience or ResiliencePolicy(
+            retryable=(RateLimitError, APITimeoutError, APIConnectionError, InternalServerError),
+            overload=(RateLimitError,),
+            attempts=settings.LLM_RETRY_ATTEMPTS,
+            base_delay=settings.LLM_RETRY_BASE_DELAY_SECONDS,
+            max_delay=settings.LLM_RETRY_MAX_DELAY_SECONDS,
+            breaker=CircuitBreaker(
+                failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+                reset_seconds=settings.LLM_CIRCUIT_RESET_SECONDS,
+            ),
+            hedge=settings.LLM_HEDGE_ENABLED,
+            hedge_min_delay=settings.LLM_HEDGE_MIN_DELAY_SECONDS,
+            hedge_min_samples=settings.LLM_HEDGE_MIN_SAMPLES,
+        )
         log.info(f"OpenAIGateway initialized with model: {self.model}")
-        
+
     def _get_client(self) -> AsyncOpenAI:
         """
-        Creates a new client instance when needed.
-        This prevents issues with deepcopy during FastAPI dependency injection.
+        Returns the shared client, creating it on first use or after it was closed.
         """
-        return AsyncOpenAI(api_key=self.api_key)
+        if self._client is None or self._client.is_closed():
+            http_client = self._http_client
+            if http_client is None or http_client.is_closed:
+                http_client = httpx.AsyncClient(limits=self._limits, timeout=self._timeout)
+                self._http_client = http_client
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                timeout=self._timeout,
+                max_retries=0,  # retries are handled by self.resilience
+                http_client=http_client,
+            )
+            log.info(
+                f"Created pooled OpenAI client (max_connections={self._limits.max_connections}, "
+                f"max_keepalive={self._limits.max_keepalive_connections})"
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Closes the shared client and its connection pool."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        if self._http_client is not None and not self._http_client.is_closed:
+            await self._http_client.aclose()
+        self._http_client = None
+        log.info("OpenAIGateway client closed.")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "admission": self.admission.stats(),
+            "resilience": self.resilience.stats(),
+            "token_budget": self.token_budget.stats(),
+        }
 
     def get_response_schema(self) -> Dict[str, Any]:
         """Returns the JSON schema for the Itinerary model."""
         return Itinerary.model_json_schema()
 
+    def request_key(self, request: ItineraryRequest) -> str:
+        """Keys requests on the normalized request, prompt version and model name."""
+        return request.fingerprint(self.prompt_version, self.model)
+
     def get_structured_prompt(self, request: ItineraryRequest) -> str:
         """Constructs a detailed, structured prompt for the LLM."""
-        prompt = f"""
+        prompt = textwrap.dedent(f"""
         You are an expert travel agent named "WanderWise". Your task is to create a personalized travel itinerary.
 
         **User Request:**
@@ -63,61 +259,444 @@ class OpenAIGateway(LLMPort):
         3. For each activity, provide a time, a description, and an optional estimated cost in USD.
         4. The entire response MUST be a single, valid JSON object that conforms to the provided schema.
         5. Do not include any introductory text, explanations, or markdown formatting outside of the JSON object.
-        """
+        """).strip()
         return prompt
 
-    async def generate_itinerary(self, request: ItineraryRequest) -> Itinerary | None:
+    def get_skeleton_prompt(self, request: ItineraryRequest) -> str:
+        """Constructs the prompt for a trip skeleton: a title and one theme per day."""
+        return textwrap.dedent(f"""
+        You are an expert travel agent named "WanderWise". Your task is to outline a personalized travel itinerary.
+
+        **User Request:**
+        - Destination: {request.destination}
+        - Duration: {request.duration_days} days
+        - Travel Style: {request.travel_style}
+        - Budget: {request.budget}
+
+        **Instructions:**
+        1. Provide a catchy "trip_title" and an optional "total_estimated_cost_usd" for the whole trip.
+        2. Provide a "days" list with exactly {request.duration_days} entries, each with a "day" number and a creative "theme".
+        3. Do not plan individual activities yet.
+        4. Respond with a single JSON object of the form:
+           {{"trip_title": "...", "total_estimated_cost_usd": 0, "days": [{{"day": 1, "theme": "..."}}]}}
+        """).strip()
+
+    def get_day_prompt(self, request: ItineraryRequest, trip_title: str, themes: List[str], day_number: int) -> str:
+        """Constructs the prompt for one day of an outlined itinerary."""
+        outline = "\n".join(f"        - Day {number}: {theme}" for number, theme in enumerate(themes, start=1))
+        return textwrap.dedent(f"""
+        You are an expert travel agent named "WanderWise". You are planning day {day_number} of the trip "{trip_title}".
+
+        **User Request:**
+        - Destination: {request.destination}
+        - Duration: {request.duration_days} days
+        - Travel Style: {request.travel_style}
+        - Budget: {request.budget}
+
+        **Trip Outline:**
+{outline}
+
+        **Instructions:**
+        1. Plan the activities for day {day_number} only, following its theme and avoiding repeats from other days.
+        2. For each activity, provide a time, a description, and an optional estimated cost in USD.
+        3. The entire response MUST be a single, valid JSON object that conforms to the provided schema.
+        """).strip()
+
+    def get_regenerate_day_prompt(self, request: ItineraryRequest, itinerary: Itinerary, day_number: int) -> str:
         """
-        Generates a travel itinerary by calling the OpenAI API.
+        Constructs the prompt for a replacement of one day of an existing itinerary.
 
-        This method builds the prompt, makes the API call with JSON mode enabled,
-        and parses the response into an Itinerary object.
+        Only the themes of the other days are sent as context, not their activities,
+        so the prompt stays small however long the trip is.
         """
-        prompt = self.get_structured_prompt(request)
-        schema = self.get_response_schema()
+        current = next(plan for plan in itinerary.daily_plans if plan.day == day_number)
+        outline = "\n".join(
+            f"        - Day {plan.day}: {plan.theme}" for plan in itinerary.daily_plans if plan.day != day_number
+        )
+        return textwrap.dedent(f"""
+        You are an expert travel agent named "WanderWise". The traveller wants a new plan for day {day_number} of the trip "{itinerary.trip_title}".
+
+        **User Request:**
+        - Destination: {itinerary.destination}
+        - Duration: {len(itinerary.daily_plans)} days
+        - Travel Style: {request.travel_style}
+        - Budget: {request.budget}
 
-        log.info(f"Sending request to OpenAI for destination: {request.destination}")
+        **Other Days:**
+{outline or "        - (none)"}
+
+        **Instructions:**
+        1. Plan day {day_number} only, with a new creative "theme" other than "{current.theme}" and different activities.
+        2. Avoid repeating the themes of the other days.
+        3. For each activity, provide a time, a description, and an optional estimated cost in USD.
+        4. The entire response MUST be a single, valid JSON object that conforms to the provided schema.
+        """).strip()
+
+    def resolve_strategy(self, request: ItineraryRequest) -> GenerationStrategy:
+        """Resolves AUTO to a concrete strategy based on the trip length."""
+        if request.strategy is not GenerationStrategy.AUTO:
+            return request.strategy
+        if request.duration_days >= self.per_day_min_days:
+            return GenerationStrategy.PER_DAY
+        return GenerationStrategy.SINGLE_SHOT
+
+    def _json_messages(self, schema_json: str, prompt: str) -> List[Dict[str, str]]:
+        """Builds chat messages asking for JSON that follows the (compact, minified) `schema_json`."""
+        return [
+            {"role": "system", "content": _system_message(schema_json)},
+            {"role": "user", "content": prompt},
+        ]
+
+    def _build_messages(self, request: ItineraryRequest) -> List[Dict[str, str]]:
+        """Builds the chat messages (schema instructions plus the user prompt) for a request."""
+        return self._json_messages(_schema_json(Itinerary), self.get_structured_prompt(request))
+
+    @staticmethod
+    def _estimate_tokens(messages: List[Dict[str, str]], max_tokens: int) -> int:
+        """Estimates a call's token cost: about four characters per prompt token, plus the completion limit."""
+        return sum(len(message["content"]) for message in messages) // 4 + max_tokens
+
+    @staticmethod
+    def _unavailable(error: RateLimitError) -> LLMUnavailableError:
+        """Converts the provider's own rate limiting into LLMUnavailableError, keeping its Retry-After."""
         try:
-            # Get a fresh client instance for this request
-            client = self._get_client()
-            # Update system message to include schema instructions
-            system_message = "You are a helpful travel planning assistant that only responds in JSON format. "
-            system_message += "Please format your response according to the following schema: "
-            system_message += json.dumps(schema)
-            
+            retry_after = max(1, int(float(error.response.headers.get("retry-after", "1"))))
+        except ValueError:
+            retry_after = 1
+        return LLMUnavailableError(f"OpenAI rate limited the request: {error}", retry_after=retry_after)
+
+    async def _complete(self, messages: List[Dict[str, str]], kind: str, days: int) -> Tuple[Optional[str], bool]:
+        """
+        Makes one admitted JSON-mode chat completion.
+
+        `max_tokens` comes from the token budget for this kind of call and number of
+        trip days, and the completion's actual usage is fed back into that budget.
+
+        Returns:
+            The completion's text (None if it was empty) and whether it was cut off
+            at `max_tokens`.
+
+        Raises:
+            LLMUnavailableError: If the call is not admitted.
+            The OpenAI client's errors.
+        """
+        client = self._get_client()
+        max_tokens = self.token_budget.max_tokens(kind, days)
+        async with self.admission.admit(self._estimate_tokens(messages, max_tokens)) as permit:
             response = await client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": prompt},
-                ],
+                messages=messages,
                 response_format={"type": "json_object"},  # Remove schema parameter, only specify json_object type
                 temperature=0.7,
-                max_tokens=4096,
+                max_tokens=max_tokens,
             )
+            permit.settle(response.usage.total_tokens if response.usage is not None else None)
+        truncated = response.choices[0].finish_reason == "length"
+        if response.usage is not None:
+            self.token_budget.record(kind, days, response.usage.completion_tokens, truncated=truncated)
+        message_content = response.choices[0].message.content
+        if not message_content:
+            log.error("OpenAI response content is empty.")
+            return None, truncated
+        return message_content, truncated
 
-            message_content = response.choices[0].message.content
-            if not message_content:
-                log.error("OpenAI response content is empty.")
-                return None
+    async def _request(self, messages: List[Dict[str, str]], kind: str, days: int) -> Tuple[Optional[str], bool]:
+        """
+        Makes a JSON-mode chat completion under the resilience policy (retries, circuit breaker, hedging).
 
-            # Parse the JSON string from the response
-            itinerary_data = json.loads(message_content)
+        Args:
+            messages: The chat messages to send.
+            kind: The kind of call ("itinerary", "skeleton" or "day"), which groups
+                  latencies for the hedging delay and token usage for the budget.
+            days: How many trip days the completion covers.
 
-            # Validate and create the Itinerary object using Pydantic
-            itinerary = Itinerary.model_validate(itinerary_data)
-            log.info(f"Successfully parsed and validated itinerary for '{itinerary.destination}'.")
-            return itinerary
+        Returns:
+            The completion's text (None if it was empty) and whether it was truncated.
 
+        Raises:
+            LLMUnavailableError: If the call is not admitted, the circuit is open, or
+                OpenAI still rate limits it after the retries.
+            The OpenAI client's other errors; callers handle them.
+        """
+        try:
+            return await self.resilience.call(lambda: self._complete(messages, kind, days), kind=kind)
         except RateLimitError as e:
-            log.error(f"OpenAI API rate limit exceeded: {e}")
+            raise self._unavailable(e) from e
+
+    async def _start_per_day_generation(
+        self, request: ItineraryRequest
+    ) -> Optional[Tuple[Dict[str, Any], List["asyncio.Task[DailyPlan]"]]]:
+        """
+        Requests the trip skeleton, then starts one bounded-concurrency task per day.
+
+        Each task requests its day again, up to `max_day_attempts` completions in all,
+        when the response is empty or fails to parse, so a single bad day does not
+        throw away the whole (paid for) itinerary.
+
+        Returns:
+            The skeleton and the per-day tasks (in day order), or None if the skeleton
+            could not be generated.
+        """
+        skeleton_text, _ = await self._request(
+            self._json_messages(_SKELETON_SCHEMA_JSON, self.get_skeleton_prompt(request)),
+            kind="skeleton",
+            days=request.duration_days,
+        )
+        if skeleton_text is None:
             return None
+        skeleton = json.loads(skeleton_text)
+
+        outlined = {day.get("day"): day.get("theme") for day in skeleton.get("days", []) if isinstance(day, dict)}
+        themes = [str(outlined.get(number) or f"Day {number}") for number in range(1, request.duration_days + 1)]
+        trip_title = str(skeleton.get("trip_title") or f"{request.duration_days} days in {request.destination}")
+        skeleton["trip_title"] = trip_title
+        day_schema = _schema_json(DailyPlan)
+        semaphore = asyncio.Semaphore(self.per_day_concurrency)
+
+        async def generate_day(day_number: int) -> DailyPlan:
+            messages = self._json_messages(day_schema, self.get_day_prompt(request, trip_title, themes, day_number))
+            for attempt in range(1, self.max_day_attempts + 1):
+                async with semaphore:
+                    day_text, _ = await self._request(messages, kind="day", days=1)
+                try:
+                    if day_text is None:
+                        raise ValueError(f"Empty response for day {day_number}")
+                    # The outline is authoritative for numbering and themes.
+                    return parse_daily_plan(day_text, day_number, themes[day_number - 1])
+                except (ValidationError, json.JSONDecodeError, ValueError) as e:
+                    if attempt == self.max_day_attempts:
+                        raise
+                    log.warning(f"Day {day_number} could not be parsed ({e}); requesting it again")
+            raise AssertionError("unreachable")
+
+        tasks = [asyncio.ensure_future(generate_day(number)) for number in range(1, request.duration_days + 1)]
+        return skeleton, tasks
+
+    @staticmethod
+    def _itinerary_defaults(request: ItineraryRequest) -> Dict[str, Any]:
+        """Itinerary fields to fall back on when a truncated response does not contain them."""
+        return {
+            "destination": request.destination,
+            "trip_title": f"{request.duration_days} days in {request.destination}",
+        }
+
+    def _assemble(self, request: ItineraryRequest, skeleton: Dict[str, Any], daily_plans: List[DailyPlan]) -> Itinerary:
+        return Itinerary(
+            destination=request.destination,
+            trip_title=skeleton["trip_title"],
+            total_estimated_cost_usd=skeleton.get("total_estimated_cost_usd"),
+            daily_plans=daily_plans,
+        )
+
+    async def _generate_per_day(self, request: ItineraryRequest) -> Itinerary | None:
+        """Generates the skeleton, then every day concurrently, and assembles the Itinerary."""
+        started = await self._start_per_day_generation(request)
+        if started is None:
+            return None
+        skeleton, tasks = started
+        try:
+            daily_plans = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return self._assemble(request, skeleton, list(daily_plans))
+
+    async def generate_itinerary(self, request: ItineraryRequest) -> Itinerary | None:
+        """
+        Generates a travel itinerary by calling the OpenAI API.
+
+        Short trips are generated in a single JSON-mode completion. Long trips (or
+        requests that ask for it) use per-day generation: a cheap skeleton with the
+        title and daily themes, then one concurrent completion per day, so wall-clock
+        time follows the slowest day rather than the sum of all days.
+        """
+        strategy = self.resolve_strategy(request)
+        log.info(f"Sending {strategy.value} request to OpenAI for destination: {request.destination}")
+        try:
+            if strategy is GenerationStrategy.PER_DAY:
+                itinerary = await self._generate_per_day(request)
+            else:
+                itinerary_text, truncated = await self._request(
+                    self._build_messages(request), kind="itinerary", days=request.duration_days
+                )
+                # Validate straight from the JSON text, keeping the complete days of a truncated response
+                itinerary = (
+                    parse_itinerary(itinerary_text, truncated, self._itinerary_defaults(request))
+                    if itinerary_text is not None else None
+                )
+
+            if itinerary is not None:
+                log.info(f"Successfully parsed and validated itinerary for '{itinerary.destination}'.")
+            return itinerary
+
+        except LLMUnavailableError:
+            raise
+        except RateLimitError as e:
+            raise self._unavailable(e) from e
         except APIError as e:
             log.error(f"OpenAI API error: {e}")
             return None
-        except (ValidationError, json.JSONDecodeError) as e:
+        except (ValidationError, json.JSONDecodeError, ValueError) as e:
             log.error(f"Failed to validate or parse OpenAI response: {e}")
             return None
         except Exception as e:
             log.error(f"An unexpected error occurred while calling OpenAI: {e}", exc_info=True)
             return None
+
+    async def regenerate_day(
+        self, request: ItineraryRequest, itinerary: Itinerary, day_number: int
+    ) -> DailyPlan | None:
+        """
+        Generates a replacement for one day in a single small completion.
+
+        The prompt carries the other days' themes rather than the whole itinerary, and
+        the token budget is that of one day, so the call costs about 1/N of
+        regenerating an N-day trip.
+        """
+        log.info(f"Regenerating day {day_number} of itinerary {itinerary.id} for destination: {itinerary.destination}")
+        try:
+            day_text, _ = await self._request(
+                self._json_messages(
+                    _schema_json(DailyPlan), self.get_regenerate_day_prompt(request, itinerary, day_number)
+                ),
+                kind="day",
+                days=1,
+            )
+            if day_text is None:
+                return None
+            return parse_daily_plan(day_text, day_number)
+
+        except LLMUnavailableError:
+            raise
+        except RateLimitError as e:
+            raise self._unavailable(e) from e
+        except APIError as e:
+            log.error(f"OpenAI API error while regenerating day {day_number}: {e}")
+            return None
+        except (ValidationError, json.JSONDecodeError, ValueError) as e:
+            log.error(f"Failed to validate or parse regenerated day {day_number}: {e}")
+            return None
+        except Exception as e:
+            log.error(f"An unexpected error occurred while regenerating day {day_number}: {e}", exc_info=True)
+            return None
+
+    async def _stream_per_day(self, request: ItineraryRequest) -> AsyncGenerator[DailyPlan | Itinerary, None]:
+        """Yields per-day results in day order as soon as each (and all before it) is done."""
+        started = await self._start_per_day_generation(request)
+        if started is None:
+            return
+        skeleton, tasks = started
+        daily_plans: List[DailyPlan] = []
+        try:
+            for task in tasks:
+                daily_plan = await task
+                daily_plans.append(daily_plan)
+                yield daily_plan
+        finally:
+            for task in tasks:
+                task.cancel()
+        yield self._assemble(request, skeleton, daily_plans)
+
+    async def _stream_single_shot(self, request: ItineraryRequest) -> AsyncGenerator[DailyPlan | Itinerary, None]:
+        """Streams one completion and yields each DailyPlan as soon as its JSON object closes."""
+        parser = DailyPlanStreamParser()
+        daily_plans: List[DailyPlan] = []
+        client = self._get_client()
+        messages = self._build_messages(request)
+        max_tokens = self.token_budget.max_tokens("itinerary", request.duration_days)
+
+        async def open_stream() -> Tuple[Any, AsyncExitStack, AdmissionPermit]:
+            # The admission slot is held until the stream is fully read, since the call
+            # is in flight until then; the returned stack releases it.
+            stack = AsyncExitStack()
+            permit = await stack.enter_async_context(self.admission.admit(self._estimate_tokens(messages, max_tokens)))
+            try:
+                stream = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=0.7,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    stream_options={"include_usage": True},  # usage arrives in a final chunk without choices
+                )
+            except BaseException:
+                await stack.aclose()
+                raise
+            return stream, stack, permit
+
+        # Opening the stream is retried like any call; once content flows it is not.
+        try:
+            stream, stack, permit = await self.resilience.call(open_stream, kind="stream", hedge=False)
+        except RateLimitError as e:
+            raise self._unavailable(e) from e
+        finish_reason = None
+        async with stack:
+            async for chunk in stream:
+                if chunk.usage is not None:
+                    permit.settle(chunk.usage.total_tokens)
+                    self.token_budget.record(
+                        "itinerary", request.duration_days, chunk.usage.completion_tokens,
+                        truncated=finish_reason == "length",
+                    )
+                if not chunk.choices:
+                    continue
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+                content = chunk.choices[0].delta.content
+                if not content:
+                    continue
+                for day_data in parser.feed(content):
+                    daily_plan = DailyPlan.model_validate(day_data)
+                    daily_plans.append(daily_plan)
+                    yield daily_plan
+
+        if finish_reason == "length":
+            # Cut off at max_tokens: finish with the days that did complete.
+            if not daily_plans:
+                raise ValueError("Streamed itinerary was truncated before its first day was complete")
+            log.warning(f"Streamed itinerary truncated; keeping {len(daily_plans)} complete day(s)")
+            itinerary_data = {**self._itinerary_defaults(request), **parser.header()}
+        else:
+            itinerary_data = json.loads(parser.text)
+        itinerary_data["daily_plans"] = daily_plans
+        yield Itinerary.model_validate(itinerary_data)
+
+    async def stream_itinerary(
+        self, request: ItineraryRequest
+    ) -> AsyncIterator[DailyPlan | Itinerary]:
+        """
+        Generates a travel itinerary incrementally.
+
+        With single-shot generation the completion is streamed and fed through an
+        incremental JSON parser, so each DailyPlan is validated and yielded as soon as
+        its object closes. With per-day generation each day is yielded as soon as it
+        and all earlier days are done. The complete Itinerary is assembled from those
+        same DailyPlan objects at the end.
+        """
+        strategy = self.resolve_strategy(request)
+        log.info(f"Streaming {strategy.value} request to OpenAI for destination: {request.destination}")
+        stream = (
+            self._stream_per_day(request)
+            if strategy is GenerationStrategy.PER_DAY
+            else self._stream_single_shot(request)
+        )
+        try:
+            async for item in stream:
+                if isinstance(item, Itinerary):
+                    log.info(f"Successfully streamed itinerary for '{item.destination}'.")
+                yield item
+
+        except LLMUnavailableError:
+            raise
+        except RateLimitError as e:
+            raise self._unavailable(e) from e
+        except APIError as e:
+            log.error(f"OpenAI API error while streaming: {e}")
+        except (ValidationError, json.JSONDecodeError, ValueError) as e:
+            log.error(f"Failed to validate or parse streamed OpenAI response: {e}")
+        except Exception as e:
+            log.error(f"An unexpected error occurred while streaming from OpenAI: {e}", exc_info=True)
+        finally:
+            await stream.aclose()
+
@@ -0,0 +1,297 @@
+# src/wanderwise/adapters/gateways/resilience.py
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Type, TypeVar
+
+from ...domain.ports.llm_port import LLMUnavailableError
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Returns the Retry-After of the HTTP response attached to an error, if it carries one."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after", "")))
+    except ValueError:
+        return None
+
+
+class CircuitBreaker:
+    """
+    Stops calling an upstream that keeps failing, and probes it again after a cool-down.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls are
+    refused for `reset_seconds`. The circuit then lets a single probe call through
+    (half-open): its success closes the circuit, its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.times_opened = 0
+        self.short_circuited = 0
+
+    def before_call(self) -> None:
+        """
+        Raises:
+            LLMUnavailableError: If the circuit is open (or already probing while half-open).
+        """
+        if self.state == self.OPEN:
+            remaining = self._opened_at + self.reset_seconds - self._clock()
+            if remaining > 0:
+                self.short_circuited += 1
+                raise LLMUnavailableError("The LLM upstream is failing; circuit open.", retry_after=max(1, round(remaining)))
+            self.state = self.HALF_OPEN
+            log.info("Circuit half-open: probing the LLM upstream")
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                self.short_circuited += 1
+                raise LLMUnavailableError("The LLM upstream is being probed after failures.", retry_after=1)
+            self._probing = True
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            log.info("Circuit closed: the LLM upstream recovered")
+        self.state = self.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probing = False
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+                log.warning(f"Circuit opened after {self._failures} consecutive LLM failures")
+            self.state = self.OPEN
+            self._opened_at = self._clock()
+
+    def release(self) -> None:
+        """Ends a call that neither succeeded nor failed upstream (e.g. it was cancelled or not admitted)."""
+        self._probing = False
+
+
+class _LatencyWindow:
+    """Recent successful-call latencies, for the hedging delay."""
+
+    def __init__(self, size: int = 200):
+        self._samples: "deque[float]" = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float) -> float:
+        ordered = sorted(self._samples)
+        return ordered[int(q * (len(ordered) - 1))]
+
+
+class ResiliencePolicy:
+    """
+    Wraps calls to an upstream with retries, a circuit breaker and optional hedging.
+
+    - Retries: errors of the `retryable` types are retried up to `attempts` times in
+      total, sleeping with decorrelated jitter (a random delay between `base_delay`
+      and three times the previous one, capped at `max_delay`). A Retry-After sent by
+      the upstream is honored; if it is longer than `max_delay` the call gives up at once.
+    - Circuit breaker: retryable errors other than the `overload` types (e.g. rate
+      limits, which mean "slow down" rather than "broken") count as failures. While
+      the circuit is open, calls raise LLMUnavailableError without being sent.
+    - Hedging: once `hedge_min_samples` latencies are known for a kind of call, a call
+      still running after its p95 latency (at least `hedge_min_delay`) gets a second,
+      identical attempt; whichever finishes first with a result wins and the other is
+      cancelled.
+
+    Errors that are not retryable, including LLMUnavailableError from admission
+    control, are raised straight away.
+    """
+
+    def __init__(
+        self,
+        retryable: Tuple[Type[BaseException], ...],
+        overload: Tuple[Type[BaseException], ...] = (),
+        attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        breaker: Optional[CircuitBreaker] = None,
+        hedge: bool = False,
+        hedge_min_delay: float = 1.0,
+        hedge_min_samples: int = 20,
+        rng: Optional[random.Random] = None,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            retryable: Exception types worth retrying (transient upstream errors).
+            overload: Retryable types that signal rate limiting and do not trip the breaker.
+            attempts: Maximum number of attempts per call, including the first.
+            base_delay: Smallest retry delay in seconds.
+            max_delay: Largest retry delay (and largest Retry-After honored) in seconds.
+            breaker: Circuit breaker to use, or None for no breaker.
+            hedge: Whether to send a hedged second attempt for slow calls.
+            hedge_min_delay: Shortest delay before a hedged attempt, in seconds.
+            hedge_min_samples: Latencies needed for a kind of call before it is hedged.
+            rng: Random generator for the jitter, injectable for testing.
+            sleep: Awaitable sleep function, injectable for testing.
+            clock: Monotonic time source, injectable for testing.
+        """
+        self.retryable = retryable
+        self.overload = overload
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker
+        self.hedge = hedge
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_min_samples = hedge_min_samples
+        self._rng = rng or random.Random()
+        self._sleep = sleep
+        self._clock = clock
+        self._latencies: Dict[Hashable, _LatencyWindow] = {}
+        self.calls = 0
+        self.retries = 0
+        self.gave_up = 0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    def hedge_delay(self, kind: Hashable) -> Optional[float]:
+        """Returns how long a call of this kind may run before it is hedged, or None to not hedge."""
+        window = self._latencies.get(kind)
+        if not self.hedge or window is None or len(window) < self.hedge_min_samples:
+            return None
+        return max(self.hedge_min_delay, window.quantile(0.95))
+
+    def _next_delay(self, previous: float, error: BaseException) -> Optional[float]:
+        """The decorrelated-jitter delay before the next attempt, or None if Retry-After is too long."""
+        delay = min(self.max_delay, self._rng.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            delay = max(delay, retry_after)
+        return delay
+
+    async def call(self, attempt: Callable[[], Awaitable[T]], kind: Hashable = None, hedge: bool = True) -> T:
+        """
+        Runs `attempt` (a factory making one upstream call) under the policy.
+
+        Args:
+            attempt: Called once per attempt (and per hedged attempt) to start a call.
+            kind: Groups calls with similar latency for the hedging delay.
+            hedge: Whether the call may be hedged; pass False when a losing attempt's
+                   result would need cleaning up (e.g. an opened stream).
+
+        Raises:
+            LLMUnavailableError: If the circuit is open.
+            The last attempt's error once retries are exhausted, or any non-retryable error.
+        """
+        self.calls += 1
+        delay = self.base_delay
+        for number in range(1, self.attempts + 1):
+            if self.breaker is not None:
+                self.breaker.before_call()
+            try:
+                result = await (self._hedged(attempt, kind) if hedge else attempt())
+            except self.retryable as e:
+                if self.breaker is not None:
+                    if isinstance(e, self.overload):
+                        self.breaker.release()
+                    else:
+                        self.breaker.record_failure()
+                next_delay = self._next_delay(delay, e) if number < self.attempts else None
+                if next_delay is None:
+                    self.gave_up += 1
+                    raise
+                delay = next_delay
+                self.retries += 1
+                log.warning(f"LLM call failed ({type(e).__name__}); retry {number}/{self.attempts - 1} in {delay:.2f}s")
+                await self._sleep(delay)
+            except BaseException:
+                if self.breaker is not None:
+                    self.breaker.release()
+                raise
+            else:
+                if self.breaker is not None:
+                    self.breaker.record_success()
+                return result
+        raise AssertionError("unreachable")
+
+    async def _timed(self, attempt: Callable[[], Awaitable[T]], kind: Hashable) -> T:
+        started = self._clock()
+        result = await attempt()
+        self._latencies.setdefault(kind, _LatencyWindow()).add(self._clock() - started)
+        return result
+
+    async def _hedged(self, attempt: Callable[[], Awaitable[T]], kind: Hashable) -> T:
+        delay = self.hedge_delay(kind)
+        if delay is None:
+            return await self._timed(attempt, kind)
+
+        primary = asyncio.ensure_future(self._timed(attempt, kind))
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            # asyncio.wait does not cancel what it waits for; don't leave the call running.
+            primary.cancel()
+            raise
+        if done:
+            return primary.result()
+
+        self.hedges_sent += 1
+        log.info(f"LLM call still running after {delay:.2f}s; sending a hedged request")
+        hedged = asyncio.ensure_future(self._timed(attempt, kind))
+        pending = {primary, hedged}
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedged:
+                            self.hedges_won += 1
+                        return task.result()
+                if not pending:
+                    # Both attempts failed: surface the primary's error.
+                    return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "calls": self.calls,
+            "retries": self.retries,
+            "gave_up": self.gave_up,
+            "hedging": self.hedge,
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won,
+            "hedge_delays_seconds": {str(kind): self.hedge_delay(kind) for kind in self._latencies},
+        }
+        if self.breaker is not None:
+            stats["circuit"] = {
+                "state": self.breaker.state,
+                "times_opened": self.breaker.times_opened,
+                "short_circuited": self.breaker.short_circuited,
+            }
+        return stats
@@ -0,0 +1,113 @@
+# src/wanderwise/adapters/gateways/response_parser.py
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from ...domain.models.itinerary import DailyPlan, Itinerary
+from .json_stream import DailyPlanStreamParser
+
+log = logging.getLogger(__name__)
+
+# These functions turn the raw JSON text of a completion into domain models.
+#
+# The text is validated directly with `model_validate_json`, whose Rust parser builds
+# the models without an intermediate Python dict from `json.loads`. A completion cut
+# off at `max_tokens` is not thrown away: the days it did complete are salvaged.
+
+
+def _is_malformed(error: ValidationError) -> bool:
+    """Whether validation failed because the text is not (complete) JSON, rather than on its content."""
+    return any(detail["type"] == "json_invalid" for detail in error.errors())
+
+
+def salvage_itinerary(text: str, defaults: Optional[Dict[str, Any]] = None) -> Optional[Itinerary]:
+    """
+    Builds an Itinerary from the complete days of a cut-off itinerary document.
+
+    Days are kept in order up to the first one that is incomplete or invalid.
+
+    Args:
+        text: The (possibly truncated) itinerary JSON.
+        defaults: Values for itinerary fields the text does not contain,
+                  e.g. the requested destination.
+
+    Returns:
+        The salvaged Itinerary, or None if not even one day is complete.
+    """
+    parser = DailyPlanStreamParser()
+    try:
+        day_data = parser.feed(text)
+        header = parser.header()
+    except json.JSONDecodeError:
+        return None
+    daily_plans: List[DailyPlan] = []
+    for data in day_data:
+        try:
+            daily_plans.append(DailyPlan.model_validate(data))
+        except ValidationError:
+            break
+    if not daily_plans:
+        return None
+    try:
+        itinerary = Itinerary.model_validate({**(defaults or {}), **header, "daily_plans": daily_plans})
+    except ValidationError:
+        return None
+    log.warning(f"Salvaged {len(daily_plans)} complete day(s) from a truncated itinerary")
+    return itinerary
+
+
+def parse_itinerary(text: str, truncated: bool = False, defaults: Optional[Dict[str, Any]] = None) -> Optional[Itinerary]:
+    """
+    Validates an itinerary completion, salvaging its complete days if it was cut off.
+
+    Args:
+        text: The completion's JSON text.
+        truncated: Whether the completion stopped at its token limit.
+        defaults: Values for itinerary fields a salvaged document does not contain.
+
+    Returns:
+        The Itinerary, or None if the text was cut off before its first day was complete.
+
+    Raises:
+        ValidationError: If the text is complete JSON that does not describe an itinerary,
+                         or is malformed and nothing can be salvaged from it.
+    """
+    try:
+        return Itinerary.model_validate_json(text)
+    except ValidationError as e:
+        if not (truncated or _is_malformed(e)):
+            raise
+        itinerary = salvage_itinerary(text, defaults)
+        if itinerary is None and not truncated:
+            raise
+        return itinerary
+
+
+def parse_daily_plan(text: str, day: int, theme: Optional[str] = None) -> DailyPlan:
+    """
+    Validates a single-day completion as the given day of the trip.
+
+    The day number (and the theme, when one is given) come from the trip outline and
+    replace whatever the completion says. When the completion leaves them out (or
+    gets them wrong) it is decoded to a dict, corrected and validated again.
+
+    Raises:
+        ValidationError, json.JSONDecodeError: If the text is not a valid daily plan.
+    """
+    try:
+        daily_plan = DailyPlan.model_validate_json(text)
+    except ValidationError:
+        data = json.loads(text)
+        if not isinstance(data, dict):
+            raise
+        data["day"] = day
+        if theme is not None:
+            data["theme"] = theme
+        return DailyPlan.model_validate(data)
+    daily_plan.day = day
+    if theme is not None:
+        daily_plan.theme = theme
+    return daily_plan
@@ -0,0 +1,258 @@
+# src/wanderwise/adapters/gateways/routing_llm_gateway.py
+
+import logging
+import random
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ...domain.models.itinerary import DailyPlan, Itinerary, ItineraryRequest
+from ...domain.ports.llm_port import LLMPort, LLMUnavailableError
+
+log = logging.getLogger(__name__)
+
+
+class LLMBackend:
+    """
+    One backend of a RoutingLLMGateway: an LLM port plus what the router knows about it.
+
+    Latency is tracked per trip day (seconds of generation divided by the trip's
+    length), so short and long trips can be compared on one scale.
+    """
+
+    def __init__(self, name: str, port: LLMPort, max_days: Optional[int] = None, cost: float = 1.0):
+        """
+        Args:
+            name: Label used in logs and stats.
+            port: The LLMPort that generates itineraries for this backend.
+            max_days: Longest trip this backend is used for, or None for any length
+                      (e.g. a small, cheap model only for short trips).
+            cost: Relative cost weight; cheaper backends win at equal latency.
+        """
+        self.name = name
+        self.port = port
+        self.max_days = max_days
+        self.cost = cost
+        self.latency_per_day: Optional[float] = None
+        self.error_rate = 0.0
+        self.calls = 0
+        self.failures = 0
+        self.unavailable = 0
+        self.total_seconds = 0.0
+
+    def accepts(self, request: ItineraryRequest) -> bool:
+        return self.max_days is None or request.duration_days <= self.max_days
+
+    def record(self, alpha: float, seconds: float, days: int, ok: bool) -> None:
+        """Folds one call's outcome into the backend's EWMA latency and error rate."""
+        self.calls += 1
+        self.total_seconds += seconds
+        self.error_rate = (1 - alpha) * self.error_rate + alpha * (0.0 if ok else 1.0)
+        if ok:
+            sample = seconds / days
+            self.latency_per_day = sample if self.latency_per_day is None else (1 - alpha) * self.latency_per_day + alpha * sample
+        else:
+            self.failures += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_days": self.max_days,
+            "cost": self.cost,
+            "ewma_latency_per_day_seconds": self.latency_per_day,
+            "ewma_error_rate": self.error_rate,
+            "calls": self.calls,
+            "failures": self.failures,
+            "unavailable": self.unavailable,
+            "total_seconds": self.total_seconds,
+            **self.port.stats(),
+        }
+
+
+class RoutingLLMGateway(LLMPort):
+    """
+    An LLMPort that spreads requests over several backends and fails over between them.
+
+    Backends can be different models, different base URLs or OpenAI-compatible local
+    servers. For each request the router ranks the backends that accept the trip's
+    length by
+
+        cost x EWMA latency per day x (1 + error_penalty x EWMA error rate)
+
+    and tries them in that order: a backend that fails (returns None, raises, or is
+    unavailable) is recorded and the next one is tried, so callers only see a failure
+    when every candidate failed. A backend with no latency samples yet is ranked as
+    if it were as fast as the fastest known one (and ahead of it on a tie), so new
+    backends get tried; and a small share of requests (`explore_rate`) go to a random
+    candidate first, so a backend that was slow or failing is noticed when it recovers.
+
+    Streams fail over only until their first item; after that, switching backends
+    would repeat days, so a mid-stream failure ends the stream as usual.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[LLMBackend],
+        ewma_alpha: float = 0.2,
+        error_penalty: float = 10.0,
+        explore_rate: float = 0.05,
+        rng: Optional[random.Random] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            backends: The backends to route between, in order of preference on ties.
+            ewma_alpha: Weight of the newest sample in the latency and error averages.
+            error_penalty: How strongly the error rate pushes a backend down the ranking.
+            explore_rate: Share of requests that try a random candidate first.
+            rng: Random generator for exploration, injectable for testing.
+            clock: Monotonic time source, injectable for testing.
+        """
+        if not backends:
+            raise ValueError("RoutingLLMGateway needs at least one backend")
+        self.backends: List[LLMBackend] = list(backends)
+        self.ewma_alpha = ewma_alpha
+        self.error_penalty = error_penalty
+        self.explore_rate = explore_rate
+        self._rng = rng or random.Random()
+        self._clock = clock
+        self.failovers = 0
+        log.info(f"RoutingLLMGateway initialized with backends: {', '.join(b.name for b in self.backends)}")
+
+    def request_key(self, request: ItineraryRequest) -> str:
+        return request.fingerprint(type(self).__name__, *(backend.port.request_key(request) for backend in self.backends))
+
+    def get_structured_prompt(self, request: ItineraryRequest) -> str:
+        return self.backends[0].port.get_structured_prompt(request)
+
+    def get_response_schema(self) -> Dict[str, Any]:
+        return self.backends[0].port.get_response_schema()
+
+    def rank(self, request: ItineraryRequest) -> List[LLMBackend]:
+        """Returns the backends that accept the request, best first (occasionally exploring)."""
+        candidates = [backend for backend in self.backends if backend.accepts(request)] or self.backends
+        known = [b.latency_per_day for b in candidates if b.latency_per_day is not None]
+        fastest = min(known) if known else 1.0
+
+        def score(backend: LLMBackend) -> Tuple[float, bool]:
+            latency = backend.latency_per_day if backend.latency_per_day is not None else fastest
+            return backend.cost * latency * (1 + self.error_penalty * backend.error_rate), backend.latency_per_day is not None
+
+        ranked = sorted(candidates, key=score)
+        if len(ranked) > 1 and self._rng.random() < self.explore_rate:
+            ranked.insert(0, ranked.pop(self._rng.randrange(1, len(ranked))))
+        return ranked
+
+    async def generate_itinerary(self, request: ItineraryRequest) -> Itinerary | None:
+        """
+        Generates with the best-ranked backend, failing over to the next ones.
+
+        Raises:
+            LLMUnavailableError: If every candidate backend was unavailable.
+        """
+        candidates = self.rank(request)
+        unavailable: List[LLMUnavailableError] = []
+        for attempt, backend in enumerate(candidates):
+            if attempt:
+                self.failovers += 1
+                log.warning(f"Failing over to backend '{backend.name}' for {request.destination}")
+            started = self._clock()
+            try:
+                itinerary = await backend.port.generate_itinerary(request)
+            except LLMUnavailableError as e:
+                backend.unavailable += 1
+                unavailable.append(e)
+                continue
+            except Exception as e:
+                log.error(f"Backend '{backend.name}' raised while generating: {e}", exc_info=True)
+                itinerary = None
+            backend.record(self.ewma_alpha, self._clock() - started, request.duration_days, itinerary is not None)
+            if itinerary is not None:
+                return itinerary
+        self._give_up(request, candidates, unavailable)
+        return None
+
+    async def stream_itinerary(
+        self, request: ItineraryRequest
+    ) -> AsyncIterator[DailyPlan | Itinerary]:
+        """
+        Streams from the best-ranked backend, failing over while nothing has been yielded yet.
+
+        Raises:
+            LLMUnavailableError: If every candidate backend was unavailable.
+        """
+        candidates = self.rank(request)
+        unavailable: List[LLMUnavailableError] = []
+        for attempt, backend in enumerate(candidates):
+            if attempt:
+                self.failovers += 1
+                log.warning(f"Failing over to backend '{backend.name}' for streamed {request.destination}")
+            started = self._clock()
+            yielded = False
+            completed = False
+            try:
+                async for item in backend.port.stream_itinerary(request):
+                    yielded = True
+                    completed = isinstance(item, Itinerary)
+                    yield item
+            except LLMUnavailableError as e:
+                if yielded:
+                    raise
+                backend.unavailable += 1
+                unavailable.append(e)
+                continue
+            backend.record(self.ewma_alpha, self._clock() - started, request.duration_days, completed)
+            if yielded:
+                return
+        self._give_up(request, candidates, unavailable)
+
+    async def regenerate_day(
+        self, request: ItineraryRequest, itinerary: Itinerary, day_number: int
+    ) -> DailyPlan | None:
+        """
+        Regenerates the day with the best-ranked backend, failing over to the next ones.
+
+        Raises:
+            LLMUnavailableError: If every candidate backend was unavailable.
+        """
+        candidates = self.rank(request)
+        unavailable: List[LLMUnavailableError] = []
+        for attempt, backend in enumerate(candidates):
+            if attempt:
+                self.failovers += 1
+                log.warning(f"Failing over to backend '{backend.name}' to regenerate day {day_number}")
+            started = self._clock()
+            try:
+                daily_plan = await backend.port.regenerate_day(request, itinerary, day_number)
+            except LLMUnavailableError as e:
+                backend.unavailable += 1
+                unavailable.append(e)
+                continue
+            except Exception as e:
+                log.error(f"Backend '{backend.name}' raised while regenerating a day: {e}", exc_info=True)
+                daily_plan = None
+            backend.record(self.ewma_alpha, self._clock() - started, 1, daily_plan is not None)
+            if daily_plan is not None:
+                return daily_plan
+        self._give_up(request, candidates, unavailable)
+        return None
+
+    def _give_up(
+        self, request: ItineraryRequest, candidates: List[LLMBackend], unavailable: List[LLMUnavailableError]
+    ) -> None:
+        """Handles a request that no backend served, raising LLMUnavailableError if all were unavailable."""
+        if unavailable and len(unavailable) == len(candidates):
+            raise LLMUnavailableError(
+                "Every LLM backend is unavailable.", retry_after=min(e.retry_after for e in unavailable)
+            )
+        log.error(f"No backend could generate an itinerary for {request.destination}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "router": {
+                "failovers": self.failovers,
+                "backends": {backend.name: backend.stats() for backend in self.backends},
+            },
+        }
+
+    async def aclose(self) -> None:
+        for backend in self.backends:
+            await backend.port.aclose()
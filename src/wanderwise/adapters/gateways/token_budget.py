@@ -0,0 +1,95 @@
+# src/wanderwise/adapters/gateways/token_budget.py
+
+import logging
+import math
+from typing import Any, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+
+class _KindEstimate:
+    """Running estimate of the completion tokens one kind of call needs per trip day."""
+
+    def __init__(self, per_day: float, overhead: int):
+        self.overhead = overhead
+        self.mean = per_day
+        self.deviation = per_day / 4
+        self.samples = 0
+        self.truncations = 0
+
+
+class TokenBudget:
+    """
+    Sizes `max_tokens` for each completion from the trip length and measured usage.
+
+    For every kind of call (a whole itinerary, a trip skeleton, a single day) it
+    keeps an exponentially weighted mean and mean deviation of the completion tokens
+    used per trip day, like TCP's round-trip-time estimator, and budgets
+
+        overhead + days x (mean + deviations x deviation)
+
+    clamped to `[min_tokens, max_tokens]`. A 1-day trip so reserves far less of the
+    rate-limit budget than a 14-day one, and a long trip is not cut off at a fixed
+    limit. Responses that were truncated (finish_reason "length") count as needing
+    more than they got, so the budget grows quickly after a truncation.
+    """
+
+    def __init__(
+        self,
+        priors: Dict[str, float],
+        overheads: Optional[Dict[str, int]] = None,
+        max_tokens: Optional[Dict[str, int]] = None,
+        min_tokens: int = 256,
+        deviations: float = 3.0,
+        alpha: float = 0.2,
+    ):
+        """
+        Args:
+            priors: Initial completion tokens per trip day for each kind of call.
+            overheads: Fixed completion tokens per call of each kind (title, JSON framing).
+            max_tokens: Upper bound on max_tokens for each kind of call.
+            min_tokens: Lower bound on max_tokens for any call.
+            deviations: How many mean deviations of headroom to add to the mean.
+            alpha: Weight of the newest sample in the running estimates.
+        """
+        overheads = overheads or {}
+        self._kinds = {kind: _KindEstimate(per_day, overheads.get(kind, 0)) for kind, per_day in priors.items()}
+        self._max_tokens = max_tokens or {}
+        self.min_tokens = min_tokens
+        self.deviations = deviations
+        self.alpha = alpha
+
+    def max_tokens(self, kind: str, days: int) -> int:
+        """Returns the max_tokens to request for a call of this kind covering `days` trip days."""
+        estimate = self._kinds[kind]
+        budget = math.ceil(estimate.overhead + days * (estimate.mean + self.deviations * estimate.deviation))
+        return max(self.min_tokens, min(budget, self._max_tokens.get(kind, budget)))
+
+    def record(self, kind: str, days: int, completion_tokens: Optional[int], truncated: bool = False) -> None:
+        """Folds one call's actual completion usage into the estimate for its kind."""
+        if completion_tokens is None:
+            return
+        estimate = self._kinds[kind]
+        per_day = max(0.0, completion_tokens - estimate.overhead) / days
+        if truncated:
+            # The call needed more than it was given; assume half as much again.
+            estimate.truncations += 1
+            per_day *= 1.5
+            log.warning(f"{kind} completion truncated at {completion_tokens} tokens for {days} day(s); raising its budget")
+        error = per_day - estimate.mean
+        estimate.mean += self.alpha * error
+        estimate.deviation += self.alpha * (abs(error) - estimate.deviation)
+        estimate.samples += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            kind: {
+                "tokens_per_day_mean": round(estimate.mean, 1),
+                "tokens_per_day_deviation": round(estimate.deviation, 1),
+                "samples": estimate.samples,
+                "truncations": estimate.truncations,
+                "max_tokens_1_day": self.max_tokens(kind, 1),
+                "max_tokens_7_days": self.max_tokens(kind, 7),
+            }
+            for kind, estimate in self._kinds.items()
+        }
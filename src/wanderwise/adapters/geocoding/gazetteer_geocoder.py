@@ -0,0 +1,198 @@
+# src/wanderwise/adapters/geocoding/gazetteer_geocoder.py
+
+import logging
+import re
+import string
+import unicodedata
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ...domain.ports.geocoding_port import GeocodingPort, LatLon
+
+log = logging.getLogger(__name__)
+
+# The gazetteer shipped with the package: popular destinations and well-known places in them.
+DEFAULT_GAZETTEER_PATH = Path(__file__).resolve().parent / "data" / "gazetteer.tsv"
+
+_NON_WORD = re.compile(r"[\W_]+")
+# Translating ASCII punctuation to spaces is a few times faster than the regular expression.
+_ASCII_PUNCTUATION = str.maketrans({char: " " for char in string.punctuation})
+
+
+def _words(value: str) -> List[str]:
+    """Case-folds a text, strips accents and splits it into words."""
+    value = value.casefold()
+    if value.isascii():
+        return value.translate(_ASCII_PUNCTUATION).split()
+    decomposed = unicodedata.normalize("NFKD", value)
+    unaccented = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_WORD.sub(" ", unaccented).split()
+
+
+def _normalize(value: str) -> str:
+    """Case-folds a name, strips accents and reduces it to words separated by single spaces."""
+    return " ".join(_words(value))
+
+
+def _trigrams(normalized: str) -> set:
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class GazetteerGeocoder(GeocodingPort):
+    """
+    An offline geocoder backed by a local gazetteer, loaded once into a compact index.
+
+    Coordinates live in two float64 arrays indexed by row, so the index holds no
+    per-place objects. On top of them:
+    - destinations are found by exact (normalized, accent-free) name or alias; a
+      "City, Country" destination by its city when the country is the city's own
+      ("Paris, France" but not "Paris, Texas"); anything else by trigram overlap
+      (Dice coefficient of at least `fuzzy_threshold`) of its city part with the
+      known destinations, subject to the same country check;
+    - places are found in activity descriptions by a single scan over their words:
+      each word is looked up in a table of the destination's place names by first
+      word (longest names first), so "the Louvre Museum" finds "Louvre Museum" and
+      "Louvre" with one dictionary lookup per word.
+
+    Locating a whole itinerary is a few dictionary lookups per activity and makes no
+    network calls, so it can run on every generated itinerary.
+    """
+
+    # How many resolved destination spellings are remembered before the memo is reset.
+    max_resolved = 4096
+
+    def __init__(self, path: Optional[Path] = None, fuzzy_threshold: float = 0.7):
+        """
+        Args:
+            path: Gazetteer file (see data/gazetteer.tsv for the format); the bundled one by default.
+            fuzzy_threshold: Minimum trigram Dice coefficient for a fuzzy destination match.
+        """
+        self.path = Path(path) if path is not None else DEFAULT_GAZETTEER_PATH
+        self.fuzzy_threshold = fuzzy_threshold
+        self.lookups = 0
+        self.located = 0
+        # Resolved destination rows, since every activity of a trip names the same destination.
+        self._resolved: Dict[str, Optional[int]] = {}
+
+        names: List[str] = []
+        latitudes: List[float] = []
+        longitudes: List[float] = []
+        self._cities: Dict[str, int] = {}
+        self._countries: Dict[int, set] = {}
+        # Per destination row: first word of a place name -> [(name words, row)], longest first.
+        self._places: Dict[int, Dict[str, List[Tuple[Tuple[str, ...], int]]]] = defaultdict(lambda: defaultdict(list))
+        # Trigram -> destination rows containing it, for fuzzy destination matching.
+        trigram_rows: Dict[str, List[int]] = defaultdict(list)
+        city_trigram_counts: Dict[int, int] = {}
+
+        with open(self.path, encoding="utf-8") as gazetteer:
+            for line in gazetteer:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                kind, name, parent, latitude, longitude, aliases = line.rstrip("\n").split("\t")
+                row = len(names)
+                names.append(name)
+                latitudes.append(float(latitude))
+                longitudes.append(float(longitude))
+                spellings = {_normalize(spelling) for spelling in [name, *aliases.split("|")] if spelling}
+                if kind == "city":
+                    for spelling in spellings:
+                        self._cities[spelling] = row
+                    self._countries[row] = {_normalize(country) for country in parent.split("|")}
+                    grams = _trigrams(_normalize(name))
+                    city_trigram_counts[row] = len(grams)
+                    for gram in grams:
+                        trigram_rows[gram].append(row)
+                else:
+                    places = self._places[self._cities[_normalize(parent)]]
+                    for spelling in spellings:
+                        words = tuple(spelling.split())
+                        places[words[0]].append((words, row))
+
+        for places in self._places.values():
+            for candidates in places.values():
+                candidates.sort(key=lambda candidate: -len(candidate[0]))
+        self._names = names
+        self._latitudes = np.array(latitudes, dtype=np.float64)
+        self._longitudes = np.array(longitudes, dtype=np.float64)
+        self._trigram_rows = {gram: np.array(rows, dtype=np.int32) for gram, rows in trigram_rows.items()}
+        self._trigram_counts = np.zeros(len(names), dtype=np.int32)
+        for row, count in city_trigram_counts.items():
+            self._trigram_counts[row] = count
+        log.info(
+            f"GazetteerGeocoder loaded {len(self._cities)} destination names and "
+            f"{len(names) - len(city_trigram_counts)} places from {self.path.name}"
+        )
+
+    def _city_row(self, destination: str) -> Optional[int]:
+        try:
+            return self._resolved[destination]
+        except KeyError:
+            pass
+        if len(self._resolved) >= self.max_resolved:
+            self._resolved.clear()
+        row = self._resolved[destination] = self._find_city_row(destination)
+        return row
+
+    def _find_city_row(self, destination: str) -> Optional[int]:
+        normalized = _normalize(destination)
+        row = self._cities.get(normalized)
+        if row is not None:
+            return row
+        qualifiers: set = set()
+        if "," in destination:
+            # "City, Country" (or "City, State, Country"), but not "Paris, Texas".
+            city, *rest = destination.split(",")
+            qualifiers = {_normalize(qualifier) for qualifier in rest} - {""}
+            normalized = _normalize(city)
+            row = self._cities.get(normalized)
+            if row is not None:
+                return row if qualifiers <= self._countries[row] else None
+        if normalized:
+            # Only the city part is matched fuzzily, and it must then pass the same country check.
+            grams = _trigrams(normalized)
+            hits = [self._trigram_rows[gram] for gram in grams if gram in self._trigram_rows]
+            if hits:
+                overlap = np.bincount(np.concatenate(hits), minlength=len(self._names))
+                dice = 2 * overlap / (self._trigram_counts + len(grams))
+                best = int(np.argmax(dice))
+                if dice[best] >= self.fuzzy_threshold and qualifiers <= self._countries[best]:
+                    row = best
+        return row
+
+    def _location(self, row: int) -> LatLon:
+        return float(self._latitudes[row]), float(self._longitudes[row])
+
+    def locate_destination(self, destination: str) -> Optional[LatLon]:
+        self.lookups += 1
+        row = self._city_row(destination)
+        if row is None:
+            return None
+        self.located += 1
+        return self._location(row)
+
+    def locate_activity(self, description: str, destination: str) -> Optional[LatLon]:
+        self.lookups += 1
+        city = self._city_row(destination)
+        places = self._places.get(city) if city is not None else None
+        if not places:
+            return None
+        words = _words(description)
+        for start, word in enumerate(words):
+            for name_words, row in places.get(word, ()):
+                if tuple(words[start:start + len(name_words)]) == name_words:
+                    self.located += 1
+                    return self._location(row)
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "places": len(self._names),
+            "lookups": self.lookups,
+            "located": self.located,
+            "hit_rate": self.located / self.lookups if self.lookups else 0.0,
+        }
@@ -0,0 +1,118 @@
+# src/wanderwise/adapters/notifiers/webhook_notifier.py
+
+import asyncio
+import ipaddress
+import logging
+import socket
+from typing import Optional, Sequence
+
+import httpx
+
+from ...domain.models.job import GenerationJob
+from ...domain.ports.job_notifier_port import JobNotifierPort
+
+log = logging.getLogger(__name__)
+
+
+class WebhookNotifier(JobNotifierPort):
+    """
+    Notifies a job's callback URL with an HTTP POST of the job as JSON.
+
+    Uses one pooled HTTP client for every notification. Failed deliveries
+    (connection errors and 5xx responses) are retried with exponential backoff.
+
+    Callback URLs come from clients, so the server must not be made to POST to
+    its own network. The host is resolved before delivery and the notification
+    is refused unless every address is public (not loopback, private,
+    link-local, ...). The request is then sent to the checked address, so a DNS
+    answer that changes in between cannot redirect it. With `allowed_hosts`,
+    only those host names are notified, and they may resolve to any address.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float = 10.0,
+        attempts: int = 3,
+        http_client: Optional[httpx.AsyncClient] = None,
+        allowed_hosts: Sequence[str] = (),
+    ):
+        """
+        Args:
+            timeout_seconds: Timeout for each delivery attempt.
+            attempts: Maximum number of delivery attempts per notification.
+            http_client: Optional client to use instead of creating one.
+            allowed_hosts: If given, the only host names callbacks may be sent to.
+        """
+        self.timeout_seconds = timeout_seconds
+        self.attempts = attempts
+        self._client = http_client
+        self.allowed_hosts = frozenset(host.lower().rstrip(".") for host in allowed_hosts)
+        self.delivered = 0
+        self.failed = 0
+        self.blocked = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout_seconds, follow_redirects=False)
+        return self._client
+
+    async def _resolve(self, url: httpx.URL) -> Optional[str]:
+        """Returns the address to deliver to, or None if the callback host is not allowed."""
+        host = url.host.lower().rstrip(".")
+        allowlisted = host in self.allowed_hosts
+        if self.allowed_hosts and not allowlisted:
+            log.error(f"Refusing webhook to {host}: not in WEBHOOK_ALLOWED_HOSTS")
+            return None
+        port = url.port or (443 if url.scheme == "https" else 80)
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            addresses = [ipaddress.ip_address(str(info[4][0]).split("%", 1)[0]) for info in infos]
+        except (OSError, ValueError) as e:
+            log.error(f"Refusing webhook to {host}: cannot resolve it ({e})")
+            return None
+        if not addresses:
+            return None
+        if not allowlisted:
+            for address in addresses:
+                mapped = address.ipv4_mapped if isinstance(address, ipaddress.IPv6Address) else None
+                if not (mapped or address).is_global:
+                    log.error(f"Refusing webhook to {host}: it resolves to the non-public address {address}")
+                    return None
+        return str(addresses[0])
+
+    async def notify(self, job: GenerationJob) -> bool:
+        if job.callback_url is None:
+            return False
+        url = httpx.URL(str(job.callback_url))
+        address = await self._resolve(url)
+        if address is None:
+            self.blocked += 1
+            return False
+        # Connect to the checked address; the Host header and TLS name stay the original host.
+        pinned_url = url.copy_with(host=address)
+        headers = {"Host": url.netloc.decode("ascii")}
+        extensions = {"sni_hostname": url.host} if url.scheme == "https" else {}
+        payload = job.model_dump(mode="json", exclude={"callback_url"})
+        for attempt in range(1, self.attempts + 1):
+            try:
+                response = await self._get_client().post(
+                    pinned_url, json=payload, headers=headers, extensions=extensions
+                )
+                if response.status_code < 500:
+                    if response.is_success:
+                        self.delivered += 1
+                        log.info(f"Notified {url} that job {job.id} is {job.status.value}")
+                        return True
+                    log.error(f"Webhook {url} rejected job {job.id} with status {response.status_code}")
+                    break
+                log.warning(f"Webhook {url} returned {response.status_code} (attempt {attempt}/{self.attempts})")
+            except httpx.HTTPError as e:
+                log.warning(f"Webhook {url} failed for job {job.id} (attempt {attempt}/{self.attempts}): {e}")
+            if attempt < self.attempts:
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+        self.failed += 1
+        return False
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
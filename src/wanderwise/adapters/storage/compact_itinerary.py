@@ -0,0 +1,171 @@
+# src/wanderwise/adapters/storage/compact_itinerary.py
+
+import math
+import sys
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from ...domain.models.itinerary import Itinerary
+
+# Identifiers are UUID4 strings (36 characters, about 85 bytes as a str object); the
+# canonical lowercase ones are kept as their 16 raw bytes. Any other ID is kept as is.
+PackedId = Union[bytes, str]
+
+
+def pack_id(value: str) -> PackedId:
+    """Returns the 16 bytes of a canonical lowercase UUID string, or the string itself."""
+    if len(value) == 36 and value[8] == value[13] == value[18] == value[23] == "-":
+        hex_digits = value[:8] + value[9:13] + value[14:18] + value[19:23] + value[24:]
+        try:
+            packed = bytes.fromhex(hex_digits)
+        except ValueError:
+            return value
+        # fromhex also accepts upper case and whitespace, which would not round-trip.
+        if packed.hex() == hex_digits:
+            return packed
+    return value
+
+
+def unpack_id(packed: PackedId) -> str:
+    """The inverse of `pack_id`."""
+    if isinstance(packed, str):
+        return packed
+    h = packed.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def _floats(values: Sequence[Optional[float]]) -> Optional[array]:
+    """Optional floats as one array of doubles with NaN for None, or None if they are all None."""
+    if all(value is None for value in values):
+        return None
+    return array("d", [math.nan if value is None else value for value in values])
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if value != value else value
+
+
+class CompactItinerary:
+    """
+    A stored itinerary in a compact form, materialized back into an Itinerary on read.
+
+    An Itinerary is a tree of Pydantic objects, each with its own instance dict,
+    and two 36-character UUID strings per activity. Here the whole itinerary is
+    one `__slots__` record holding parallel columns:
+    - activity IDs concatenated into one bytes object (16 bytes each);
+    - times, themes, booking links and the destination interned, so the few
+      distinct values ("09:00", "Afternoon", ...) are shared by all itineraries;
+    - costs and coordinates in arrays of doubles (NaN for missing), or no array
+      at all when none is set;
+    - day numbers and the number of activities per day in arrays of ints.
+
+    Records are immutable: an edited itinerary is packed into a new record. Each
+    record knows its own size in `nbytes`, for the store's memory budget.
+    """
+
+    __slots__ = (
+        "id", "destination", "trip_title", "total_estimated_cost_usd", "version", "latitude", "longitude",
+        "day_numbers", "themes", "day_sizes",
+        "activity_ids", "times", "descriptions", "costs", "booking_links", "latitudes", "longitudes",
+        "nbytes",
+    )
+
+    def __init__(self, itinerary: Itinerary):
+        plans = itinerary.daily_plans
+        activities = [activity for plan in plans for activity in plan.activities]
+        self.id = pack_id(itinerary.id)
+        self.destination: str = sys.intern(itinerary.destination)
+        self.trip_title = itinerary.trip_title
+        self.total_estimated_cost_usd = itinerary.total_estimated_cost_usd
+        self.version = itinerary.version
+        self.latitude = itinerary.latitude
+        self.longitude = itinerary.longitude
+        self.day_numbers = array("i", [plan.day for plan in plans])
+        self.themes = tuple(sys.intern(plan.theme) for plan in plans)
+        self.day_sizes = array("i", [len(plan.activities) for plan in plans])
+
+        ids = [pack_id(activity.id) for activity in activities]
+        packed: List[bytes] = [packed_id for packed_id in ids if isinstance(packed_id, bytes)]
+        self.activity_ids: Union[bytes, Tuple[PackedId, ...]] = (
+            b"".join(packed) if len(packed) == len(ids) else tuple(ids)
+        )
+        self.times = tuple(sys.intern(activity.time) for activity in activities)
+        self.descriptions = tuple(activity.description for activity in activities)
+        self.costs = _floats([activity.estimated_cost_usd for activity in activities])
+        links = [activity.booking_link for activity in activities]
+        self.booking_links = tuple(map(_intern, links)) if any(links) else None
+        self.latitudes = _floats([activity.latitude for activity in activities])
+        self.longitudes = _floats([activity.longitude for activity in activities])
+        self.nbytes = self._measure()
+
+    def _measure(self) -> int:
+        """
+        Approximate memory held by this record: the record itself, its containers,
+        arrays and unshared strings. Interned strings (destination, times, themes,
+        links) are shared by every record and not counted.
+        """
+        containers = (
+            self.id, self.trip_title, self.day_numbers, self.themes, self.day_sizes, self.activity_ids,
+            self.times, self.descriptions, self.costs, self.booking_links, self.latitudes, self.longitudes,
+        )
+        size = sys.getsizeof(self) + sum(sys.getsizeof(value) for value in containers if value is not None)
+        size += sum(map(sys.getsizeof, self.descriptions))
+        if isinstance(self.activity_ids, tuple):
+            size += sum(map(sys.getsizeof, self.activity_ids))
+        return size
+
+    @property
+    def itinerary_id(self) -> str:
+        return unpack_id(self.id)
+
+    def _activity_ids(self) -> List[str]:
+        if isinstance(self.activity_ids, bytes):
+            blob = self.activity_ids
+            return [unpack_id(blob[start:start + 16]) for start in range(0, len(blob), 16)]
+        return [unpack_id(packed) for packed in self.activity_ids]
+
+    def activity_days(self) -> List[int]:
+        """The position of each activity's day in the itinerary."""
+        return [position for position, size in enumerate(self.day_sizes) for _ in range(size)]
+
+    def to_itinerary(self) -> Itinerary:
+        """
+        Materializes a new, independent Itinerary.
+
+        The data was validated when it was stored; it is rebuilt as plain dicts and
+        validated in one call, which is faster than constructing each model.
+        """
+        count = len(self.times)
+        none = [None] * count
+        costs = [_optional(value) for value in self.costs] if self.costs is not None else none
+        latitudes = [_optional(value) for value in self.latitudes] if self.latitudes is not None else none
+        longitudes = [_optional(value) for value in self.longitudes] if self.longitudes is not None else none
+        links = self.booking_links if self.booking_links is not None else none
+        activities = [
+            {
+                "id": activity_id, "time": time, "description": description, "estimated_cost_usd": cost,
+                "booking_link": link, "latitude": latitude, "longitude": longitude,
+            }
+            for activity_id, time, description, cost, link, latitude, longitude in zip(
+                self._activity_ids(), self.times, self.descriptions, costs, links, latitudes, longitudes
+            )
+        ]
+        daily_plans: List[Dict[str, Any]] = []
+        start = 0
+        for day, theme, size in zip(self.day_numbers, self.themes, self.day_sizes):
+            daily_plans.append({"day": day, "theme": theme, "activities": activities[start:start + size]})
+            start += size
+        return Itinerary.model_validate({
+            "id": self.itinerary_id,
+            "destination": self.destination,
+            "trip_title": self.trip_title,
+            "total_estimated_cost_usd": self.total_estimated_cost_usd,
+            "daily_plans": daily_plans,
+            "version": self.version,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+        })
@@ -1,69 +1,297 @@
 # src/wanderwise/adapters/storage/in_memory_storage.py
 
+import bisect
+import itertools
 import logging
-from typing import Dict, Optional, List
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
 from uuid import uuid4
 from ...domain.models.itinerary import Itinerary
-from ...domain.ports.storage_port import StoragePort
+from ...domain.ports.storage_port import ItineraryCosts, ItineraryFilter, StoragePort, VersionConflictError
+from .compact_itinerary import CompactItinerary
 
 log = logging.getLogger(__name__)
 
+
+@dataclass(slots=True)
+class _Entry:
+    record: CompactItinerary
+    expires_at: Optional[float]
+    created_at: float
+
+
 class InMemoryStorage(StoragePort):
     """
-    An in-memory implementation of the StoragePort for development and testing.
-    
-    This implementation stores itineraries in a dictionary in memory and is not
-    persistent across application restarts. It's suitable for development and
-    testing purposes only.
+    An in-memory implementation of the StoragePort.
+
+    Itineraries are kept in an LRU-ordered dictionary that is shared by every request
+    in the worker process. The store is bounded by an item count and an approximate
+    memory budget (the size of each stored record); cold itineraries are
+    evicted least-recently-used first, and entries older than the optional TTL
+    expire on access. It is not persistent across application restarts.
+
+    Itineraries are not kept as Pydantic objects but packed into CompactItinerary
+    records (binary IDs, interned strings, numeric arrays, `__slots__`), which take
+    a fraction of the memory; a read materializes a new Itinerary from the record.
+    So a caller editing the returned itinerary never changes the stored one.
+
+    No operation awaits while it mutates the store, so each call (including
+    `compare_and_swap`) is atomic with respect to other coroutines on the event
+    loop.
     """
-    
-    def __init__(self):
-        self._storage: Dict[str, Itinerary] = {}
-        
+
+    def __init__(
+        self,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_items: Maximum number of stored itineraries, or None for no limit.
+            max_bytes: Approximate memory budget in bytes, or None for no limit.
+            ttl_seconds: How long an itinerary is kept after its last save, or None to keep it.
+            clock: Monotonic time source, injectable for testing.
+        """
+        self._storage: "OrderedDict[str, _Entry]" = OrderedDict()
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _remove(self, itinerary_id: str) -> Optional[_Entry]:
+        entry = self._storage.pop(itinerary_id, None)
+        if entry is not None:
+            self._total_bytes -= entry.record.nbytes
+        return entry
+
+    def _evict_over_budget(self) -> None:
+        while self._storage and (
+            (self.max_items is not None and len(self._storage) > self.max_items)
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            itinerary_id, entry = self._storage.popitem(last=False)
+            self._total_bytes -= entry.record.nbytes
+            self.evictions += 1
+            log.info(f"Evicted itinerary {itinerary_id} from in-memory storage")
+
+    def _live(self, itinerary_id: str) -> Optional[_Entry]:
+        """Returns the entry for an ID, expiring it first if it is stale."""
+        entry = self._storage.get(itinerary_id)
+        if entry is not None and entry.expires_at is not None and entry.expires_at <= self._clock():
+            self._remove(itinerary_id)
+            self.expirations += 1
+            return None
+        return entry
+
+    def _lookup(self, itinerary_id: str) -> Optional[_Entry]:
+        """Returns the live entry for an ID (expiring it if stale), counting the hit or miss."""
+        entry = self._live(itinerary_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._storage.move_to_end(itinerary_id)
+        self.hits += 1
+        return entry
+
+    def _store(self, itinerary: Itinerary) -> bool:
+        """Stores one itinerary without enforcing the budget; returns False if it can never fit."""
+        # If it's a new itinerary, generate an ID
+        if not hasattr(itinerary, 'id') or not itinerary.id:
+            itinerary.id = str(uuid4())
+
+        record = CompactItinerary(itinerary)
+        if self.max_bytes is not None and record.nbytes > self.max_bytes:
+            log.error(f"Itinerary {itinerary.id} ({record.nbytes} bytes) exceeds the storage budget")
+            return False
+
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds is not None else None
+        previous = self._remove(itinerary.id)
+        created_at = previous.created_at if previous is not None else time.time()
+        self._storage[itinerary.id] = _Entry(record, expires_at, created_at)
+        self._total_bytes += record.nbytes
+        return True
+
     async def get_itinerary(self, itinerary_id: str) -> Optional[Itinerary]:
         """
         Retrieve an itinerary by its ID from memory.
-        
+
         Args:
             itinerary_id: The unique identifier of the itinerary to retrieve.
-            
+
         Returns:
             The requested Itinerary if found, None otherwise.
         """
-        return self._storage.get(itinerary_id)
-        
+        entry = self._lookup(itinerary_id)
+        return entry.record.to_itinerary() if entry is not None else None
+
+    async def get_version(self, itinerary_id: str) -> Optional[int]:
+        """Returns the stored version without materializing the itinerary (counts as a read)."""
+        entry = self._lookup(itinerary_id)
+        return entry.record.version if entry is not None else None
+
     async def save_itinerary(self, itinerary: Itinerary) -> bool:
         """
         Save an itinerary to memory.
-        
-        If the itinerary doesn't have an ID, one will be generated.
-        
+
+        If the itinerary doesn't have an ID, one will be generated. Saving may evict
+        the least recently used itineraries to stay within the configured limits.
+
         Args:
             itinerary: The Itinerary object to save.
-            
+
         Returns:
-            Always returns True for this in-memory implementation.
+            True if the itinerary was stored, False if it alone exceeds the memory budget.
         """
-        # If it's a new itinerary, generate an ID
-        if not hasattr(itinerary, 'id') or not itinerary.id:
-            itinerary.id = str(uuid4())
-            
-        self._storage[itinerary.id] = itinerary
+        if not self._store(itinerary):
+            return False
+        self._evict_over_budget()
         log.info(f"Saved itinerary {itinerary.id} to in-memory storage")
         return True
-        
+
+    async def compare_and_swap(
+        self,
+        itinerary: Itinerary,
+        expected_version: int,
+        positions: Optional[Sequence[int]] = None,
+    ) -> bool:
+        """
+        Save an itinerary only if the stored copy is still at `expected_version`.
+
+        The check and the write happen without yielding to the event loop, so
+        concurrent edits cannot interleave between them.
+        """
+        entry = self._live(itinerary.id)
+        if entry is None or entry.record.version != expected_version:
+            raise VersionConflictError(itinerary.id, entry.record.version if entry is not None else None)
+
+        # The record is repacked whole either way, so `positions` needs no special handling.
+        if not self._store(itinerary):
+            return False
+        self._evict_over_budget()
+        log.info(f"Saved version {itinerary.version} of itinerary {itinerary.id} to in-memory storage")
+        return True
+
     async def delete_itinerary(self, itinerary_id: str) -> bool:
         """
         Delete an itinerary from memory.
-        
+
         Args:
             itinerary_id: The ID of the itinerary to delete.
-            
+
         Returns:
             True if the itinerary was found and deleted, False otherwise.
         """
-        if itinerary_id in self._storage:
-            del self._storage[itinerary_id]
+        if self._remove(itinerary_id) is not None:
             log.info(f"Deleted itinerary {itinerary_id} from in-memory storage")
             return True
         return False
+
+    async def get_many(self, itinerary_ids: Sequence[str]) -> Dict[str, Itinerary]:
+        """Retrieves several itineraries; missing or expired IDs are omitted."""
+        found: Dict[str, Itinerary] = {}
+        for itinerary_id in itinerary_ids:
+            entry = self._lookup(itinerary_id)
+            if entry is not None:
+                found[itinerary_id] = entry.record.to_itinerary()
+        return found
+
+    async def save_many(self, itineraries: Sequence[Itinerary]) -> int:
+        """Saves several itineraries, returning how many were stored."""
+        # The budget is enforced once for the whole batch rather than after every item.
+        saved = sum(1 for itinerary in itineraries if self._store(itinerary))
+        self._evict_over_budget()
+        log.info(f"Saved {saved} itineraries to in-memory storage")
+        return saved
+
+    async def delete_many(self, itinerary_ids: Sequence[str]) -> int:
+        """Deletes several itineraries, returning how many existed."""
+        deleted = sum(1 for itinerary_id in itinerary_ids if self._remove(itinerary_id) is not None)
+        log.info(f"Deleted {deleted} itineraries from in-memory storage")
+        return deleted
+
+    async def scan(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filter: Optional[ItineraryFilter] = None,
+    ) -> AsyncIterator[List[Itinerary]]:
+        """
+        Iterate over the stored itineraries in ID order, one page at a time.
+
+        The ID order is snapshotted when the scan starts; itineraries deleted or
+        evicted while the scan is running are skipped. Scanning does not change
+        the LRU order.
+        """
+        ids = sorted(self._storage)
+        position = bisect.bisect_right(ids, cursor) if cursor is not None else 0
+        now = self._clock()
+        page: List[Itinerary] = []
+        for itinerary_id in itertools.islice(ids, position, None):
+            entry = self._storage.get(itinerary_id)
+            if entry is None or (entry.expires_at is not None and entry.expires_at <= now):
+                continue
+            if filter is not None and not filter.accepts(entry.record.destination, entry.created_at):
+                continue
+            page.append(entry.record.to_itinerary())
+            if len(page) >= limit:
+                yield page
+                page = []
+                now = self._clock()
+        if page:
+            yield page
+
+    async def scan_costs(
+        self,
+        limit: int = 500,
+        filter: Optional[ItineraryFilter] = None,
+    ) -> AsyncIterator[List[ItineraryCosts]]:
+        """
+        Iterate over the cost fields of the stored itineraries, read from their records.
+
+        Unlike `scan`, nothing is sorted or materialized: the records already hold
+        the times and costs as columns, which are handed over as they are.
+        """
+        entries = list(self._storage.values())
+        now = self._clock()
+        page: List[ItineraryCosts] = []
+        for entry in entries:
+            if entry.expires_at is not None and entry.expires_at <= now:
+                continue
+            record = entry.record
+            if filter is not None and not filter.accepts(record.destination, entry.created_at):
+                continue
+            page.append(ItineraryCosts(
+                record.itinerary_id, record.destination, record.total_estimated_cost_usd, len(record.day_sizes),
+                record.activity_days(), record.times,
+                record.costs if record.costs is not None else [None] * len(record.times),
+            ))
+            if len(page) >= limit:
+                yield page
+                page = []
+                now = self._clock()
+        if page:
+            yield page
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "memory",
+            "items": len(self._storage),
+            "bytes": self._total_bytes,
+            "max_items": self.max_items,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,553 @@
+# src/wanderwise/adapters/storage/sqlite_storage.py
+
+import asyncio
+import json
+import logging
+import queue
+import sqlite3
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from ...domain.models.itinerary import Itinerary
+from ...domain.ports.storage_port import ItineraryCosts, ItineraryFilter, StoragePort, VersionConflictError
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Each itinerary is one row with its indexed columns and a compressed header blob
+# (everything except the days); each day is its own compressed blob so that a
+# single day can be rewritten without touching the rest of the itinerary.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS itineraries (
+    id TEXT PRIMARY KEY,
+    destination TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    header BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_itineraries_destination ON itineraries (destination COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_itineraries_created_at ON itineraries (created_at);
+CREATE TABLE IF NOT EXISTS daily_plans (
+    itinerary_id TEXT NOT NULL REFERENCES itineraries (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (itinerary_id, position)
+) WITHOUT ROWID;
+"""
+
+_SELECT_HEADER = "SELECT header FROM itineraries WHERE id = ?"
+_SELECT_DAYS = "SELECT body FROM daily_plans WHERE itinerary_id = ? ORDER BY position"
+_UPSERT_ITINERARY = """
+INSERT INTO itineraries (id, destination, created_at, updated_at, version, header) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    destination = excluded.destination, updated_at = excluded.updated_at,
+    version = excluded.version, header = excluded.header
+"""
+_UPDATE_ITINERARY = "UPDATE itineraries SET destination = ?, updated_at = ?, version = ?, header = ? WHERE id = ?"
+_SWAP_ITINERARY = _UPDATE_ITINERARY + " AND version = ?"
+_SELECT_VERSION = "SELECT version FROM itineraries WHERE id = ?"
+_UPSERT_DAY = "INSERT OR REPLACE INTO daily_plans (itinerary_id, position, body) VALUES (?, ?, ?)"
+_COUNT_DAYS = "SELECT COUNT(*) FROM daily_plans WHERE itinerary_id = ?"
+_TRIM_DAYS = "DELETE FROM daily_plans WHERE itinerary_id = ? AND position >= ?"
+_DELETE_ITINERARY = "DELETE FROM itineraries WHERE id = ?"
+
+# SQLite limits the number of bound parameters per statement; IN (...) lookups
+# are split into chunks of this size.
+_IN_CHUNK = 500
+
+
+def _pack(data: Any) -> bytes:
+    return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"), 1)
+
+
+def _unpack(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob))
+
+
+class SQLiteStorage(StoragePort):
+    """
+    A persistent StoragePort implementation on a local SQLite database in WAL mode.
+
+    Itineraries survive restarts and can be shared by several uvicorn workers on the
+    same host. SQLite calls never block the event loop:
+
+    - Reads run on a small pool of dedicated reader connections, each used by one
+      thread at a time. WAL mode lets them proceed while a write is in progress.
+    - Writes go through a single writer connection on its own thread. Writes issued
+      concurrently are batched and committed together in one transaction, with a
+      savepoint per operation so one failing write does not roll back the others.
+
+    All SQL is a fixed set of statements, so sqlite3's per-connection statement
+    cache keeps them prepared.
+    """
+
+    def __init__(self, path: str | Path, read_connections: int = 4, max_batch: int = 256):
+        """
+        Opens (and if needed creates) the database.
+
+        Args:
+            path: Path to the SQLite database file (every connection opens this file,
+                  so ":memory:" is not supported).
+            read_connections: Number of pooled reader connections (and reader threads).
+            max_batch: Maximum number of writes committed in one transaction.
+        """
+        self.path = str(path)
+        self.max_batch = max_batch
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._writer_conn = self._connect()
+        self._writer_conn.executescript(_SCHEMA)
+        self._migrate(self._writer_conn)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-writer")
+        self._readers = ThreadPoolExecutor(max_workers=read_connections, thread_name_prefix="sqlite-reader")
+        self._reader_conns: "queue.SimpleQueue[sqlite3.Connection]" = queue.SimpleQueue()
+        self._all_reader_conns = [self._connect() for _ in range(read_connections)]
+        for conn in self._all_reader_conns:
+            self._reader_conns.put(conn)
+
+        self._pending: List[Tuple[Callable[[sqlite3.Connection], Any], "asyncio.Future[Any]"]] = []
+        self._flush_task: Optional["asyncio.Task[None]"] = None
+        self.reads = 0
+        self.writes = 0
+        self.batches = 0
+        log.info(f"SQLiteStorage opened {self.path} with {read_connections} reader connections")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+            isolation_level=None,  # transactions are managed explicitly
+            cached_statements=64,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Brings databases created by older versions up to the current schema."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(itineraries)")}
+        if "version" not in columns:
+            conn.execute("ALTER TABLE itineraries ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+            log.info("Added the version column to the itineraries table")
+
+    # --- Execution helpers ---
+
+    async def _read(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Runs `fn` with a pooled reader connection on a reader thread."""
+
+        def run() -> T:
+            conn = self._reader_conns.get()
+            try:
+                return fn(conn)
+            finally:
+                self._reader_conns.put(conn)
+
+        self.reads += 1
+        return await asyncio.get_running_loop().run_in_executor(self._readers, run)
+
+    async def _write(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Queues `fn` for the writer thread and waits for its batch to commit."""
+        future: "asyncio.Future[T]" = asyncio.get_running_loop().create_future()
+        self._pending.append((fn, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+        return await future
+
+    async def _flush(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            # Yield once so writes issued by other coroutines in this tick join the batch.
+            await asyncio.sleep(0)
+            batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+            try:
+                outcomes = await loop.run_in_executor(
+                    self._writer, self._run_batch, [fn for fn, _ in batch]
+                )
+            except Exception as e:
+                log.error(f"SQLite write batch failed: {e}", exc_info=True)
+                outcomes = [(False, e)] * len(batch)
+            self.batches += 1
+            self.writes += len(batch)
+            for (_, future), (ok, value) in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+    def _run_batch(self, operations: List[Callable[[sqlite3.Connection], Any]]) -> List[Tuple[bool, Any]]:
+        conn = self._writer_conn
+        outcomes: List[Tuple[bool, Any]] = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for fn in operations:
+                conn.execute("SAVEPOINT op")
+                try:
+                    outcomes.append((True, fn(conn)))
+                    conn.execute("RELEASE op")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO op")
+                    conn.execute("RELEASE op")
+                    outcomes.append((False, e))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return outcomes
+
+    # --- Serialization ---
+
+    @staticmethod
+    def _decode(header_blob: bytes, day_blobs: List[bytes]) -> Itinerary:
+        data = _unpack(header_blob)
+        data["daily_plans"] = [_unpack(blob) for blob in day_blobs]
+        return Itinerary.model_validate(data)
+
+    # --- StoragePort ---
+
+    async def get_itinerary(self, itinerary_id: str) -> Optional[Itinerary]:
+        """
+        Retrieve an itinerary by its ID.
+
+        Args:
+            itinerary_id: The unique identifier of the itinerary to retrieve.
+
+        Returns:
+            The requested Itinerary if found, None otherwise.
+        """
+        def query(conn: sqlite3.Connection) -> Optional[Tuple[bytes, List[bytes]]]:
+            row = conn.execute(_SELECT_HEADER, (itinerary_id,)).fetchone()
+            if row is None:
+                return None
+            return row[0], [day_row[0] for day_row in conn.execute(_SELECT_DAYS, (itinerary_id,))]
+
+        try:
+            found = await self._read(query)
+        except sqlite3.Error as e:
+            log.error(f"Failed to read itinerary {itinerary_id}: {e}")
+            return None
+        return self._decode(*found) if found is not None else None
+
+    async def get_version(self, itinerary_id: str) -> Optional[int]:
+        """Reads only the version column of an itinerary."""
+        def query(conn: sqlite3.Connection) -> Optional[int]:
+            row = conn.execute(_SELECT_VERSION, (itinerary_id,)).fetchone()
+            return row[0] if row is not None else None
+
+        try:
+            return await self._read(query)
+        except sqlite3.Error as e:
+            log.error(f"Failed to read the version of itinerary {itinerary_id}: {e}")
+            return None
+
+    @staticmethod
+    def _encode(
+        itinerary: Itinerary, positions: Optional[Sequence[int]] = None
+    ) -> Tuple[bytes, List[Tuple[str, int, bytes]]]:
+        """Packs the header and the day rows (all days, or only `positions`) of an itinerary."""
+        header_blob = _pack(itinerary.model_dump(mode="json", exclude={"daily_plans"}))
+        if positions is None:
+            positions = range(len(itinerary.daily_plans))
+        day_rows = [
+            (itinerary.id, position, _pack(itinerary.daily_plans[position].model_dump(mode="json")))
+            for position in positions
+        ]
+        return header_blob, day_rows
+
+    @staticmethod
+    def _upsert(
+        conn: sqlite3.Connection, itinerary: Itinerary, header_blob: bytes,
+        day_rows: List[Tuple[str, int, bytes]], now: float,
+    ) -> None:
+        conn.execute(
+            _UPSERT_ITINERARY, (itinerary.id, itinerary.destination, now, now, itinerary.version, header_blob)
+        )
+        conn.execute(_TRIM_DAYS, (itinerary.id, len(day_rows)))
+        conn.executemany(_UPSERT_DAY, day_rows)
+
+    @staticmethod
+    def _fetch_days(conn: sqlite3.Connection, itinerary_ids: Sequence[str]) -> Dict[str, List[bytes]]:
+        days: Dict[str, List[bytes]] = {itinerary_id: [] for itinerary_id in itinerary_ids}
+        for start in range(0, len(itinerary_ids), _IN_CHUNK):
+            chunk = itinerary_ids[start:start + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT itinerary_id, body FROM daily_plans WHERE itinerary_id IN ({placeholders}) "
+                "ORDER BY itinerary_id, position",
+                chunk,
+            )
+            for itinerary_id, body in rows:
+                days[itinerary_id].append(body)
+        return days
+
+    async def save_itinerary(self, itinerary: Itinerary) -> bool:
+        """
+        Save (insert or replace) an itinerary.
+
+        Args:
+            itinerary: The Itinerary object to save.
+
+        Returns:
+            True if the save was committed, False otherwise.
+        """
+        header_blob, day_rows = self._encode(itinerary)
+        now = time.time()
+
+        def upsert(conn: sqlite3.Connection) -> bool:
+            self._upsert(conn, itinerary, header_blob, day_rows, now)
+            return True
+
+        try:
+            return await self._write(upsert)
+        except sqlite3.Error as e:
+            log.error(f"Failed to save itinerary {itinerary.id}: {e}")
+            return False
+
+    async def save_daily_plans(self, itinerary: Itinerary, positions: Sequence[int]) -> bool:
+        """
+        Rewrite only the header and the given day rows of a stored itinerary.
+
+        Falls back to a full save if the itinerary is not stored or its number of
+        days no longer matches.
+        """
+        header_blob, day_rows = self._encode(itinerary, positions)
+        now = time.time()
+        day_count = len(itinerary.daily_plans)
+
+        def update(conn: sqlite3.Connection) -> bool:
+            if conn.execute(_COUNT_DAYS, (itinerary.id,)).fetchone()[0] != day_count:
+                return False
+            updated = conn.execute(
+                _UPDATE_ITINERARY,
+                (itinerary.destination, now, itinerary.version, header_blob, itinerary.id),
+            ).rowcount
+            if not updated:
+                return False
+            conn.executemany(_UPSERT_DAY, day_rows)
+            return True
+
+        try:
+            if await self._write(update):
+                return True
+        except sqlite3.Error as e:
+            log.error(f"Failed to save days {list(positions)} of itinerary {itinerary.id}: {e}")
+            return False
+        return await self.save_itinerary(itinerary)
+
+    async def compare_and_swap(
+        self,
+        itinerary: Itinerary,
+        expected_version: int,
+        positions: Optional[Sequence[int]] = None,
+    ) -> bool:
+        """
+        Save an itinerary only if the stored row is still at `expected_version`.
+
+        The version check is a conditional UPDATE inside the writer transaction, so
+        it is atomic across coroutines and across worker processes. With `positions`,
+        only the header and those day rows are rewritten.
+        """
+        header_blob, day_rows = self._encode(itinerary, positions)
+        now = time.time()
+
+        def swap(conn: sqlite3.Connection) -> bool:
+            swapped = conn.execute(
+                _SWAP_ITINERARY,
+                (itinerary.destination, now, itinerary.version, header_blob, itinerary.id, expected_version),
+            ).rowcount
+            if not swapped:
+                row = conn.execute(_SELECT_VERSION, (itinerary.id,)).fetchone()
+                raise VersionConflictError(itinerary.id, row[0] if row is not None else None)
+            if positions is None:
+                conn.execute(_TRIM_DAYS, (itinerary.id, len(day_rows)))
+            conn.executemany(_UPSERT_DAY, day_rows)
+            return True
+
+        try:
+            return await self._write(swap)
+        except sqlite3.Error as e:
+            log.error(f"Failed to save version {itinerary.version} of itinerary {itinerary.id}: {e}")
+            return False
+
+    async def delete_itinerary(self, itinerary_id: str) -> bool:
+        """
+        Delete an itinerary and its days.
+
+        Args:
+            itinerary_id: The ID of the itinerary to delete.
+
+        Returns:
+            True if the itinerary existed and was deleted, False otherwise.
+        """
+        def delete(conn: sqlite3.Connection) -> bool:
+            return conn.execute(_DELETE_ITINERARY, (itinerary_id,)).rowcount > 0
+
+        try:
+            return await self._write(delete)
+        except sqlite3.Error as e:
+            log.error(f"Failed to delete itinerary {itinerary_id}: {e}")
+            return False
+
+    async def get_many(self, itinerary_ids: Sequence[str]) -> Dict[str, Itinerary]:
+        """Retrieves several itineraries with one query per chunk of IDs."""
+        ids = list(dict.fromkeys(itinerary_ids))
+
+        def query(conn: sqlite3.Connection) -> List[Tuple[str, bytes, List[bytes]]]:
+            headers: Dict[str, bytes] = {}
+            for start in range(0, len(ids), _IN_CHUNK):
+                chunk = ids[start:start + _IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                headers.update(conn.execute(
+                    f"SELECT id, header FROM itineraries WHERE id IN ({placeholders})", chunk
+                ).fetchall())
+            days = self._fetch_days(conn, list(headers))
+            return [(itinerary_id, header, days[itinerary_id]) for itinerary_id, header in headers.items()]
+
+        try:
+            rows = await self._read(query)
+        except sqlite3.Error as e:
+            log.error(f"Failed to read {len(ids)} itineraries: {e}")
+            return {}
+        return {itinerary_id: self._decode(header, days) for itinerary_id, header, days in rows}
+
+    async def save_many(self, itineraries: Sequence[Itinerary]) -> int:
+        """Saves several itineraries in a single write operation."""
+        encoded = [(itinerary, *self._encode(itinerary)) for itinerary in itineraries]
+        now = time.time()
+
+        def upsert_all(conn: sqlite3.Connection) -> int:
+            for itinerary, header_blob, day_rows in encoded:
+                self._upsert(conn, itinerary, header_blob, day_rows, now)
+            return len(encoded)
+
+        try:
+            return await self._write(upsert_all)
+        except sqlite3.Error as e:
+            log.error(f"Failed to save {len(encoded)} itineraries: {e}")
+            return 0
+
+    async def delete_many(self, itinerary_ids: Sequence[str]) -> int:
+        """Deletes several itineraries in a single write operation."""
+        ids = list(dict.fromkeys(itinerary_ids))
+
+        def delete_all(conn: sqlite3.Connection) -> int:
+            deleted = 0
+            for start in range(0, len(ids), _IN_CHUNK):
+                chunk = ids[start:start + _IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                deleted += conn.execute(f"DELETE FROM itineraries WHERE id IN ({placeholders})", chunk).rowcount
+            return deleted
+
+        try:
+            return await self._write(delete_all)
+        except sqlite3.Error as e:
+            log.error(f"Failed to delete {len(ids)} itineraries: {e}")
+            return 0
+
+    async def _scan_rows(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filter: Optional[ItineraryFilter],
+    ) -> AsyncIterator[List[Tuple[str, bytes, List[bytes]]]]:
+        """Yields pages of (id, header blob, day blobs) in ID order using keyset pagination."""
+        conditions = ["id > ?"]
+        filter_params: List[Any] = []
+        if filter is not None:
+            if filter.destination is not None:
+                conditions.append("destination = ? COLLATE NOCASE")
+                filter_params.append(filter.destination)
+            if filter.created_after is not None:
+                conditions.append("created_at >= ?")
+                filter_params.append(filter.created_after)
+            if filter.created_before is not None:
+                conditions.append("created_at < ?")
+                filter_params.append(filter.created_before)
+        sql = f"SELECT id, header FROM itineraries WHERE {' AND '.join(conditions)} ORDER BY id LIMIT ?"
+
+        last_id = cursor if cursor is not None else ""
+        while True:
+            def query(conn: sqlite3.Connection, after: str = last_id) -> List[Tuple[str, bytes, List[bytes]]]:
+                headers = conn.execute(sql, (after, *filter_params, limit)).fetchall()
+                days = self._fetch_days(conn, [itinerary_id for itinerary_id, _ in headers])
+                return [(itinerary_id, header, days[itinerary_id]) for itinerary_id, header in headers]
+
+            rows = await self._read(query)
+            if not rows:
+                return
+            yield rows
+            if len(rows) < limit:
+                return
+            last_id = rows[-1][0]
+
+    async def scan(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filter: Optional[ItineraryFilter] = None,
+    ) -> AsyncIterator[List[Itinerary]]:
+        """
+        Iterates over itineraries in ID order using keyset pagination.
+
+        Each page costs two indexed queries (headers, then their days), and the
+        filter is evaluated by SQLite.
+        """
+        async for rows in self._scan_rows(cursor, limit, filter):
+            yield [self._decode(header, days) for _, header, days in rows]
+
+    async def scan_costs(
+        self,
+        limit: int = 500,
+        filter: Optional[ItineraryFilter] = None,
+    ) -> AsyncIterator[List[ItineraryCosts]]:
+        """
+        Iterates over the cost fields of itineraries, read from the decoded JSON without model validation.
+        """
+        async for rows in self._scan_rows(None, limit, filter):
+            page = []
+            for itinerary_id, header_blob, day_blobs in rows:
+                header = _unpack(header_blob)
+                days: List[int] = []
+                times: List[str] = []
+                costs: List[Optional[float]] = []
+                for position, blob in enumerate(day_blobs):
+                    activities = _unpack(blob)["activities"]
+                    days += [position] * len(activities)
+                    times += [activity["time"] for activity in activities]
+                    costs += [activity.get("estimated_cost_usd") for activity in activities]
+                page.append(ItineraryCosts(
+                    itinerary_id, header["destination"], header.get("total_estimated_cost_usd"),
+                    len(day_blobs), days, times, costs,
+                ))
+            yield page
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "sqlite",
+            "path": self.path,
+            "reads": self.reads,
+            "writes": self.writes,
+            "write_batches": self.batches,
+            "avg_batch_size": self.writes / self.batches if self.batches else 0.0,
+            "pending_writes": len(self._pending),
+        }
+
+    async def aclose(self) -> None:
+        """Flushes pending writes and closes every connection."""
+        if self._flush_task is not None:
+            await self._flush_task
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        self._writer_conn.close()
+        for conn in self._all_reader_conns:
+            conn.close()
+        log.info(f"SQLiteStorage closed {self.path}")
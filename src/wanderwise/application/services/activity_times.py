@@ -0,0 +1,48 @@
+# src/wanderwise/application/services/activity_times.py
+
+import re
+from functools import lru_cache
+from typing import Optional
+
+# Activity times are free text written by the LLM: "09:00", "2:30 PM", "Afternoon",
+# "Dinner at 8pm". These helpers read the clock time and part of the day out of them;
+# they are memoized, since trips reuse the same few times.
+
+# Parts of the day; anything not recognized is "unspecified".
+TIME_SLOTS = ("morning", "afternoon", "evening", "unspecified")
+MORNING, AFTERNOON, EVENING, UNSPECIFIED = range(len(TIME_SLOTS))
+
+_CLOCK_12H = re.compile(r"\b(\d{1,2})(?:[:.h](\d{2}))?\s*([ap])\.?\s*m\b", re.IGNORECASE)
+_CLOCK_24H = re.compile(r"\b(\d{1,2})[:h](\d{2})\b")
+_SLOT_KEYWORDS = (
+    (MORNING, ("morning", "breakfast", "sunrise", "dawn", "early")),
+    (AFTERNOON, ("afternoon", "lunch", "midday", "noon", "brunch")),
+    (EVENING, ("evening", "dinner", "night", "sunset", "late", "dusk")),
+)
+
+
+@lru_cache(maxsize=4096)
+def clock_hour(time: str) -> Optional[int]:
+    """The hour (0-23) of an explicit clock time in an activity time, or None if it names none."""
+    match = _CLOCK_12H.search(time)
+    if match:
+        return int(match.group(1)) % 12 + (12 if match.group(3).lower() == "p" else 0)
+    match = _CLOCK_24H.search(time)
+    if match and int(match.group(1)) < 24:
+        return int(match.group(1))
+    return None
+
+
+@lru_cache(maxsize=4096)
+def slot_index(time: str) -> int:
+    """Maps an activity time to an index into TIME_SLOTS."""
+    hour = clock_hour(time)
+    if hour is not None:
+        if 5 <= hour < 12:
+            return MORNING
+        return AFTERNOON if 12 <= hour < 17 else EVENING
+    lowered = time.casefold()
+    for slot, keywords in _SLOT_KEYWORDS:
+        if any(keyword in lowered for keyword in keywords):
+            return slot
+    return UNSPECIFIED
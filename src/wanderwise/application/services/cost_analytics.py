@@ -0,0 +1,275 @@
+# src/wanderwise/application/services/cost_analytics.py
+
+import itertools
+import logging
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ...domain.models.itinerary import Itinerary
+from ...domain.ports.storage_port import ItineraryCosts, ItineraryFilter, StoragePort
+from .activity_times import TIME_SLOTS, slot_index
+
+log = logging.getLogger(__name__)
+
+# Highest average spend per day that still fits each budget tier of the request form, in
+# USD; None means no upper limit.
+DEFAULT_TIER_DAILY_LIMITS_USD: Dict[str, Optional[float]] = {
+    "Budget-friendly": 100.0,
+    "Mid-range": 250.0,
+    "Luxury": None,
+}
+
+
+def _usd(value: float) -> float:
+    return round(float(value), 2)
+
+
+def _summary(values: np.ndarray) -> Optional[Dict[str, float]]:
+    if not len(values):
+        return None
+    p50, p90 = np.percentile(values, [50, 90])
+    return {"mean": _usd(values.mean()), "p50": _usd(p50), "p90": _usd(p90), "max": _usd(values.max())}
+
+
+def _columns(records: Sequence[ItineraryCosts]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Turns itineraries into activity columns.
+
+    Returns:
+        The number of days of each itinerary; and per activity, the index of its day
+        among all the records' days, its time slot, its cost (0 if unpriced) and
+        whether it is priced.
+    """
+    day_counts = np.fromiter((record.day_count for record in records), dtype=np.intp, count=len(records))
+    activity_counts = np.fromiter(
+        (len(record.activity_days) for record in records), dtype=np.intp, count=len(records)
+    )
+    first_days = np.cumsum(day_counts) - day_counts
+    days = np.fromiter(
+        itertools.chain.from_iterable(record.activity_days for record in records),
+        dtype=np.intp, count=int(activity_counts.sum()),
+    ) + np.repeat(first_days, activity_counts)
+    times = itertools.chain.from_iterable(record.activity_times for record in records)
+    slots = np.array(list(map(slot_index, times)), dtype=np.intp)
+    # None becomes NaN.
+    costs = np.array(
+        list(itertools.chain.from_iterable(record.activity_costs for record in records)), dtype=np.float64
+    )
+    priced = ~np.isnan(costs)
+    return day_counts, days, slots, np.where(priced, costs, 0.0), priced
+
+
+class CostAnalytics:
+    """
+    Computes trip costs from the activities' estimated costs, instead of trusting the LLM's stated total.
+
+    For one itinerary it reports per-day and per-trip totals, a breakdown by part
+    of the day, how far the stated `total_estimated_cost_usd` is from the sum of
+    the activities, and whether every day fits a budget tier. Activities are
+    turned into three columns (day, time slot, cost; a missing cost is NaN). Each
+    total is then a single `np.bincount` over those columns.
+
+    The store-wide report reads `StoragePort.scan_costs` pages, so adapters can
+    hand over plain values without building Itinerary objects. Each page becomes
+    columns with a global day index and an itinerary index. Per-day and
+    per-itinerary totals come from bincounts over the page. Only the
+    per-itinerary and per-day totals are kept across pages.
+    """
+
+    def __init__(
+        self,
+        tier_daily_limits_usd: Optional[Mapping[str, Optional[float]]] = None,
+        discrepancy_tolerance: float = 0.1,
+    ):
+        """
+        Args:
+            tier_daily_limits_usd: Budget tier name -> highest average spend per day in USD (None for no limit).
+            discrepancy_tolerance: Relative difference up to which a stated total counts as consistent.
+        """
+        limits = dict(DEFAULT_TIER_DAILY_LIMITS_USD if tier_daily_limits_usd is None else tier_daily_limits_usd)
+
+        def ceiling(tier: str) -> float:
+            limit = limits[tier]
+            return np.inf if limit is None else limit
+
+        # Tiers from the cheapest up; the unlimited ones last.
+        self._tiers = sorted(limits, key=ceiling)
+        self._limits = np.array([ceiling(tier) for tier in self._tiers], dtype=np.float64)
+        self.discrepancy_tolerance = discrepancy_tolerance
+
+    def _tier_of(self, budget: str) -> Optional[int]:
+        """The index of the tier a budget names, matched case-insensitively (by prefix as a fallback)."""
+        wanted = " ".join(budget.split()).casefold()
+        names = [tier.casefold() for tier in self._tiers]
+        if wanted in names:
+            return names.index(wanted)
+        for index, name in enumerate(names):
+            if wanted and (name.startswith(wanted) or wanted.startswith(name.split("-")[0])):
+                return index
+        return None
+
+    def _tier_indexes(self, per_day: np.ndarray) -> np.ndarray:
+        """The cheapest tier each average daily spend fits in."""
+        indexes: np.ndarray = np.minimum(np.searchsorted(self._limits, per_day, side="left"), len(self._tiers) - 1)
+        return indexes
+
+    def _consistent(self, stated: ArrayLike, computed: ArrayLike) -> np.ndarray:
+        """Whether stated totals match computed ones, element-wise (for arrays or single totals)."""
+        # One dollar of absolute slack, so rounding never makes a zero-cost trip inconsistent.
+        return np.asarray(np.isclose(stated, computed, rtol=self.discrepancy_tolerance, atol=1.0))
+
+    def analyze(self, itinerary: Itinerary, budget: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Cost analysis of one itinerary.
+
+        Args:
+            itinerary: The itinerary to analyze.
+            budget: A budget tier (e.g. "Mid-range") to check every day against, if any.
+
+        Returns:
+            A JSON-serializable dict with the computed and stated totals, the per-day
+            totals, the breakdown by time slot and, with `budget`, the compliance check.
+        """
+        plans = itinerary.daily_plans
+        day_count = len(plans)
+        _, days, slots, values, priced = _columns([ItineraryCosts.of(itinerary)])
+
+        day_totals = np.bincount(days, weights=values, minlength=day_count)
+        day_activities = np.bincount(days, minlength=day_count)
+        day_unpriced = np.bincount(days[~priced], minlength=day_count)
+        slot_totals = np.bincount(slots, weights=values, minlength=len(TIME_SLOTS))
+        computed = float(day_totals.sum())
+        per_day = computed / day_count if day_count else 0.0
+        stated = itinerary.total_estimated_cost_usd
+
+        compliance = None
+        if budget is not None:
+            tier = self._tier_of(budget)
+            if tier is not None:
+                limit = self._limits[tier]
+                over = [plans[position].day for position in np.flatnonzero(day_totals > limit)]
+                compliance = {
+                    "tier": self._tiers[tier],
+                    "daily_limit_usd": None if np.isinf(limit) else _usd(limit),
+                    "within_budget": not over,
+                    "over_budget_days": over,
+                }
+
+        return {
+            "itinerary_id": itinerary.id,
+            "destination": itinerary.destination,
+            "computed_total_usd": _usd(computed),
+            "stated_total_usd": stated,
+            "discrepancy_usd": None if stated is None else _usd(stated - computed),
+            "stated_total_consistent": None if stated is None else bool(self._consistent(stated, computed)),
+            "average_per_day_usd": _usd(per_day),
+            "estimated_tier": self._tiers[int(self._tier_indexes(np.array([per_day]))[0])] if day_count else None,
+            "priced_activities": int(priced.sum()),
+            "unpriced_activities": int(len(priced) - priced.sum()),
+            "days": [
+                {
+                    "day": plan.day,
+                    "total_usd": _usd(day_totals[position]),
+                    "activities": int(day_activities[position]),
+                    "unpriced": int(day_unpriced[position]),
+                }
+                for position, plan in enumerate(plans)
+            ],
+            "by_time_slot": {slot: _usd(total) for slot, total in zip(TIME_SLOTS, slot_totals)},
+            "budget": compliance,
+        }
+
+    async def report(
+        self, storage: StoragePort, filter: Optional[ItineraryFilter] = None, page_size: int = 500
+    ) -> Dict[str, Any]:
+        """
+        Cost report over every stored itinerary (or those matching `filter`), for dashboards.
+
+        Raises:
+            NotImplementedError: If the storage adapter cannot scan.
+        """
+        trip_totals: List[np.ndarray] = []
+        trip_days: List[np.ndarray] = []
+        trip_stated: List[np.ndarray] = []
+        day_totals: List[np.ndarray] = []
+        destinations: List[str] = []
+        slot_totals = np.zeros(len(TIME_SLOTS))
+        activities = priced_count = 0
+
+        async for page in storage.scan_costs(limit=page_size, filter=filter):
+            totals, days, stated, daily, slots, counts = self._aggregate(page)
+            trip_totals.append(totals)
+            trip_days.append(days)
+            trip_stated.append(stated)
+            day_totals.append(daily)
+            slot_totals += slots
+            activities += counts[0]
+            priced_count += counts[1]
+            destinations.extend(record.destination for record in page)
+
+        if not trip_totals:
+            return {
+                "itineraries": 0, "activities": 0, "priced_share": None, "total_usd": 0.0,
+                "per_trip_usd": None, "per_day_usd": None,
+                "by_time_slot": {slot: 0.0 for slot in TIME_SLOTS},
+                "estimated_tiers": {tier: 0 for tier in self._tiers},
+                "stated_totals": {"reported": 0, "consistent": 0, "inconsistent": 0, "mean_abs_discrepancy_usd": None},
+                "by_destination": [],
+            }
+
+        totals = np.concatenate(trip_totals)
+        days = np.concatenate(trip_days)
+        stated = np.concatenate(trip_stated)
+        daily = np.concatenate(day_totals)
+        per_day = np.divide(totals, days, out=np.zeros_like(totals), where=days > 0)
+        tiers = np.bincount(self._tier_indexes(per_day[days > 0]), minlength=len(self._tiers))
+
+        reported = ~np.isnan(stated)
+        consistent = self._consistent(stated[reported], totals[reported])
+        discrepancy = np.abs(stated[reported] - totals[reported])
+
+        names, codes = np.unique(np.array([" ".join(d.split()).casefold() for d in destinations]), return_inverse=True)
+        destination_counts = np.bincount(codes, minlength=len(names))
+        sums = np.bincount(codes, weights=totals, minlength=len(names))
+        top = np.argsort(-destination_counts, kind="stable")[:10]
+
+        return {
+            "itineraries": int(len(totals)),
+            "activities": int(activities),
+            "priced_share": priced_count / activities if activities else None,
+            "total_usd": _usd(totals.sum()),
+            "per_trip_usd": _summary(totals),
+            "per_day_usd": _summary(daily),
+            "by_time_slot": {slot: _usd(total) for slot, total in zip(TIME_SLOTS, slot_totals)},
+            "estimated_tiers": {tier: int(count) for tier, count in zip(self._tiers, tiers)},
+            "stated_totals": {
+                "reported": int(reported.sum()),
+                "consistent": int(consistent.sum()),
+                "inconsistent": int(len(consistent) - consistent.sum()),
+                "mean_abs_discrepancy_usd": _usd(discrepancy.mean()) if len(discrepancy) else None,
+            },
+            "by_destination": [
+                {
+                    "destination": str(names[i]),
+                    "itineraries": int(destination_counts[i]),
+                    "average_total_usd": _usd(sums[i] / destination_counts[i]),
+                }
+                for i in top
+            ],
+        }
+
+    @staticmethod
+    def _aggregate(
+        page: Sequence[ItineraryCosts],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, Tuple[int, int]]:
+        """Reduces one page to per-itinerary and per-day totals."""
+        day_counts, days, slots, values, priced = _columns(page)
+        daily = np.bincount(days, weights=values, minlength=int(day_counts.sum()))
+        # Which itinerary each day belongs to, to sum days into trips.
+        owner = np.repeat(np.arange(len(page)), day_counts)
+        totals = np.bincount(owner, weights=daily, minlength=len(page))
+        stated = np.array([record.stated_total_usd for record in page], dtype=np.float64)
+        slot_totals = np.bincount(slots, weights=values, minlength=len(TIME_SLOTS))
+        return totals, day_counts, stated, daily, slot_totals, (len(priced), int(priced.sum()))
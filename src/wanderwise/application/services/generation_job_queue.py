@@ -0,0 +1,204 @@
+# src/wanderwise/application/services/generation_job_queue.py
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Set
+
+from pydantic import HttpUrl
+
+from ..use_cases.generate_itinerary import GenerateItineraryUseCase
+from ...domain.models.itinerary import Itinerary, ItineraryRequest
+from ...domain.models.job import GenerationJob, JobStatus
+from ...domain.ports.job_notifier_port import JobNotifierPort
+from ...domain.ports.llm_port import LLMUnavailableError
+from ...domain.ports.storage_port import StoragePort
+
+log = logging.getLogger(__name__)
+
+
+class GenerationJobQueue:
+    """
+    Runs itinerary generations in the background on a bounded in-process queue.
+
+    Submitting a job returns immediately; a fixed number of worker tasks take jobs
+    off the queue, generate the itinerary through the use case, save it to storage
+    and, if the job has a callback URL, notify it. When the queue is full new jobs
+    are refused instead of piling up, so a burst cannot exhaust memory.
+
+    Jobs are kept in this worker process only (the most recent `max_retained`
+    finished ones are remembered), so with several uvicorn workers a job's status
+    can only be read from the worker that accepted it.
+
+    When the LLM is overloaded a job is not failed straight away: its worker waits
+    for the suggested Retry-After and tries again, up to `max_generation_attempts`.
+    """
+
+    # How many times a job is attempted while the LLM reports it is overloaded.
+    max_generation_attempts = 3
+
+    def __init__(
+        self,
+        use_case: GenerateItineraryUseCase,
+        storage_port: StoragePort,
+        notifier: Optional[JobNotifierPort] = None,
+        workers: int = 4,
+        max_queued: int = 100,
+        max_retained: int = 1000,
+    ):
+        """
+        Args:
+            use_case: The use case that generates itineraries.
+            storage_port: Where finished itineraries are saved.
+            notifier: Sends callback notifications for jobs that have a callback URL.
+            workers: Number of jobs generated concurrently.
+            max_queued: Maximum number of jobs waiting to start.
+            max_retained: Number of finished jobs whose status is remembered.
+        """
+        self.use_case = use_case
+        self.storage_port = storage_port
+        self.notifier = notifier
+        self.worker_count = workers
+        self.max_queued = max_queued
+        self.max_retained = max_retained
+        self._queue: "asyncio.Queue[GenerationJob]" = asyncio.Queue(maxsize=max_queued)
+        self._workers: List["asyncio.Task[None]"] = []
+        self._notifications: Set["asyncio.Task[bool]"] = set()
+        self._jobs: Dict[str, GenerationJob] = {}
+        self._finished_ids: "deque[str]" = deque()
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def start(self) -> None:
+        """Starts the worker tasks (called from the application lifespan, or by the first submit)."""
+        if self._workers:
+            return
+        # A queue is bound to the event loop it first waits in; a restart may run in another.
+        self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"generation-worker-{index}")
+            for index in range(self.worker_count)
+        ]
+        log.info(f"GenerationJobQueue started {self.worker_count} workers (queue size {self.max_queued})")
+
+    async def stop(self) -> None:
+        """Stops the workers, fails jobs that never started, and waits for pending notifications."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        while not self._queue.empty():
+            self._finish(self._queue.get_nowait(), error="The server shut down before the job started.")
+        if self._notifications:
+            await asyncio.gather(*self._notifications, return_exceptions=True)
+        log.info("GenerationJobQueue stopped")
+
+    def submit(self, request: ItineraryRequest, callback_url: Optional[str] = None) -> Optional[GenerationJob]:
+        """
+        Enqueues a generation job.
+
+        Args:
+            request: The itinerary request to generate.
+            callback_url: Optional URL to notify when the job finishes.
+
+        Returns:
+            The queued GenerationJob, or None if the queue is full.
+
+        Raises:
+            pydantic.ValidationError: If `callback_url` is not an http(s) URL.
+        """
+        self.start()
+        job = GenerationJob(request=request, callback_url=HttpUrl(callback_url) if callback_url is not None else None)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            log.warning(f"Generation queue full ({self.max_queued} jobs); rejected request for {request.destination}")
+            return None
+        self._jobs[job.id] = job
+        log.info(f"Queued generation job {job.id} for {request.destination}")
+        return job
+
+    def get(self, job_id: str) -> Optional[GenerationJob]:
+        """Returns a job by its ID, or None if it is unknown (or has been forgotten)."""
+        return self._jobs.get(job_id)
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: GenerationJob) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        self.running += 1
+        try:
+            itinerary = await self._generate(job)
+            if itinerary is None:
+                self._finish(job, error="Failed to generate itinerary.")
+            elif not await self.storage_port.save_itinerary(itinerary):
+                self._finish(job, error="Failed to save the generated itinerary.")
+            else:
+                self._finish(job, itinerary_id=itinerary.id)
+        except asyncio.CancelledError:
+            self._finish(job, error="The server shut down while the job was running.")
+            raise
+        except LLMUnavailableError:
+            self._finish(job, error="The itinerary service is overloaded. Please try again later.")
+        except Exception as e:
+            log.error(f"Generation job {job.id} failed: {e}", exc_info=True)
+            self._finish(job, error="An unexpected error occurred.")
+        finally:
+            self.running -= 1
+
+    async def _generate(self, job: GenerationJob) -> Optional[Itinerary]:
+        """Runs the use case, waiting out LLM overload between attempts."""
+        for attempt in range(1, self.max_generation_attempts + 1):
+            try:
+                return await self.use_case.execute(job.request)
+            except LLMUnavailableError as e:
+                if attempt == self.max_generation_attempts:
+                    raise
+                log.info(f"Generation job {job.id} waiting {e.retry_after}s for the LLM (attempt {attempt}/{self.max_generation_attempts})")
+                await asyncio.sleep(e.retry_after)
+        return None
+
+    def _finish(self, job: GenerationJob, itinerary_id: Optional[str] = None, error: Optional[str] = None) -> None:
+        job.status = JobStatus.DONE if itinerary_id is not None else JobStatus.FAILED
+        job.itinerary_id = itinerary_id
+        job.error = error
+        job.finished_at = time.time()
+        if job.status is JobStatus.DONE:
+            self.completed += 1
+            log.info(f"Generation job {job.id} done: itinerary {itinerary_id}")
+        else:
+            self.failed += 1
+            log.warning(f"Generation job {job.id} failed: {error}")
+
+        if job.callback_url is not None and self.notifier is not None:
+            # Deliver in the background so webhook retries do not hold a worker.
+            task = asyncio.ensure_future(self.notifier.notify(job))
+            self._notifications.add(task)
+            task.add_done_callback(self._notifications.discard)
+
+        self._finished_ids.append(job.id)
+        while len(self._finished_ids) > self.max_retained:
+            self._jobs.pop(self._finished_ids.popleft(), None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._workers),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queued": self.max_queued,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "notifications_pending": len(self._notifications),
+        }
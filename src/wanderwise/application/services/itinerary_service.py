@@ -2,10 +2,14 @@
 
 import logging
 
-from typing import Optional, List
-from ...domain.models.itinerary import Itinerary, ItineraryRequest, DailyPlan
-from ...domain.ports.llm_port import LLMPort
-from ...domain.ports.storage_port import StoragePort
+from typing import Any, Collection, Dict, Optional, List, Sequence
+from ...domain.models.itinerary import (
+    Itinerary, ItineraryRequest, DailyPlan, ItineraryPatchOperation, ReorderActivities,
+)
+from ...domain.ports.llm_port import LLMPort, LLMUnavailableError
+from ...domain.ports.storage_port import ItineraryFilter, StoragePort, VersionConflictError
+from .cost_analytics import CostAnalytics
+from .route_optimizer import RouteOptimizer
 
 log = logging.getLogger(__name__)
 
@@ -19,7 +23,16 @@ class ItineraryService:
     domain ports (the external interfaces).
     """
 
-    def __init__(self, llm_port: LLMPort, storage_port: Optional[StoragePort] = None):
+    # How many times an edit without an expected version is retried after losing a race.
+    max_patch_attempts = 3
+
+    def __init__(
+        self,
+        llm_port: LLMPort,
+        storage_port: Optional[StoragePort] = None,
+        route_optimizer: Optional[RouteOptimizer] = None,
+        cost_analytics: Optional[CostAnalytics] = None,
+    ):
         """
         Initializes the ItineraryService with its dependencies.
 
@@ -27,9 +40,13 @@ class ItineraryService:
             llm_port: A concrete implementation of the LLMPort for interacting
                       with a language model.
             storage_port: Optional storage port for persisting itinerary data.
+            route_optimizer: Orders activities by distance; a default RouteOptimizer if omitted.
+            cost_analytics: Computes cost reports; a default CostAnalytics if omitted.
         """
         self.llm_port = llm_port
         self.storage_port = storage_port
+        self.route_optimizer = route_optimizer or RouteOptimizer()
+        self.cost_analytics = cost_analytics or CostAnalytics()
         log.info(f"ItineraryService initialized with {type(llm_port).__name__} and {type(storage_port).__name__ if storage_port else 'no'} storage")
 
     async def create_itinerary(self, request: ItineraryRequest) -> Itinerary | None:
@@ -41,6 +58,9 @@ class ItineraryService:
 
         Returns:
             An Itinerary object if generation is successful, otherwise None.
+
+        Raises:
+            LLMUnavailableError: If the LLM is overloaded.
         """
         log.info(f"Service creating itinerary for: {request.destination}")
         try:
@@ -53,55 +73,187 @@ class ItineraryService:
             else:
                 log.warning("LLM port returned no itinerary.")
                 return None
+        except LLMUnavailableError:
+            raise
         except Exception as e:
             log.error(f"Error in ItineraryService during creation: {e}", exc_info=True)
             return None
 
-    async def reorder_activities(self, itinerary_id: str, day_number: int, new_order: List[str]) -> Optional[Itinerary]:
+    async def apply_patch(
+        self,
+        itinerary_id: str,
+        operations: Sequence[ItineraryPatchOperation],
+        expected_version: Optional[int] = None,
+    ) -> Optional[Itinerary]:
         """
-        Reorder activities for a specific day in an itinerary.
-        
+        Apply a batch of edits (reorder, move between days, update time or cost) to a stored itinerary.
+
+        The operations are applied all or nothing, only the days they changed are
+        written back, and the save is a compare-and-swap on the itinerary version,
+        so concurrent edits never silently overwrite each other. With
+        `expected_version` the edit is rejected if anyone else has saved since the
+        caller read the itinerary; without it, the edit is re-applied to the latest
+        version if a concurrent edit wins the race.
+
         Args:
-            itinerary_id: The ID of the itinerary to update
-            day_number: The day number (1-based) to reorder activities for
-            new_order: List of activity IDs in the new order
-            
+            itinerary_id: The ID of the itinerary to update.
+            operations: The patch operations to apply, in order.
+            expected_version: The version the caller's edit is based on, if known.
+
         Returns:
-            Updated Itinerary if successful, None otherwise
+            The updated Itinerary, or None if it was not found or could not be saved.
+
+        Raises:
+            ValueError: If an operation is invalid for this itinerary.
+            VersionConflictError: If the itinerary is not at `expected_version`, or
+                                  kept changing for `max_patch_attempts` attempts.
         """
         if not self.storage_port:
-            log.error("Cannot reorder activities: No storage port configured")
+            log.error("Cannot patch itinerary: No storage port configured")
             return None
-            
-        try:
-            # 1. Retrieve the current itinerary
+
+        for attempt in range(1, self.max_patch_attempts + 1):
             itinerary = await self.storage_port.get_itinerary(itinerary_id)
             if not itinerary:
                 log.error(f"Itinerary not found: {itinerary_id}")
                 return None
-                
-            # 2. Find the day to update
-            day_to_update = next((day for day in itinerary.daily_plans if day.day == day_number), None)
-            if not day_to_update:
-                log.error(f"Day {day_number} not found in itinerary {itinerary_id}")
-                return None
-                
-            # 3. Reorder activities
+
+            base_version = itinerary.version
+            if expected_version is not None and base_version != expected_version:
+                raise VersionConflictError(itinerary_id, base_version)
+
+            changed = itinerary.apply_patch(operations)
+            if not changed:
+                return itinerary
+            itinerary.version = base_version + 1
+
             try:
-                day_to_update.reorder_activities(new_order)
-            except ValueError as e:
-                log.error(f"Invalid activity order: {e}")
-                return None
-                
-            # 4. Save the updated itinerary
-            updated = await self.storage_port.save_itinerary(itinerary)
-            if updated:
-                log.info(f"Successfully reordered activities for day {day_number} in itinerary {itinerary_id}")
+                saved = await self.storage_port.compare_and_swap(itinerary, base_version, changed)
+            except VersionConflictError as e:
+                if expected_version is not None or attempt == self.max_patch_attempts:
+                    raise
+                log.info(f"Retrying patch of itinerary {itinerary_id} after a concurrent edit: {e}")
+                continue
+
+            if saved:
+                log.info(f"Applied {len(operations)} patch operations to itinerary {itinerary_id} (version {itinerary.version})")
                 return itinerary
-            else:
-                log.error(f"Failed to save reordered activities for itinerary {itinerary_id}")
+            log.error(f"Failed to save patched days of itinerary {itinerary_id}")
+            return None
+        return None
+
+    async def optimize_routes(
+        self,
+        itinerary_id: str,
+        days: Optional[Collection[int]] = None,
+        anchored: Collection[str] = (),
+        expected_version: Optional[int] = None,
+    ) -> Optional[Itinerary]:
+        """
+        Reorder the activities of one, several or all days of a stored itinerary to shorten the walk between them.
+
+        Only activities with coordinates and without a fixed clock time are moved,
+        each within its part of the day; booked activities and the ones listed in
+        `anchored` keep their position. Activity times are never rewritten. All
+        days are optimized together and saved as one patch. If a concurrent edit
+        wins the race (and no `expected_version` was given), the routes are
+        recomputed from the latest version.
+
+        Args:
+            itinerary_id: The ID of the itinerary to optimize.
+            days: The day numbers to optimize; every day if None.
+            anchored: IDs of activities that must keep their position.
+            expected_version: The version the caller's request is based on, if known.
+
+        Returns:
+            The updated Itinerary (unchanged if no route got shorter), or None if it
+            was not found or could not be saved.
+
+        Raises:
+            VersionConflictError: If the itinerary is not at `expected_version`, or
+                                  kept changing for `max_patch_attempts` attempts.
+        """
+        if not self.storage_port:
+            log.error("Cannot optimize itinerary: No storage port configured")
+            return None
+
+        for attempt in range(1, self.max_patch_attempts + 1):
+            itinerary = await self.storage_port.get_itinerary(itinerary_id)
+            if not itinerary:
+                log.error(f"Itinerary not found: {itinerary_id}")
                 return None
-                
+            if expected_version is not None and itinerary.version != expected_version:
+                raise VersionConflictError(itinerary_id, itinerary.version)
+
+            orders = self.route_optimizer.optimize(itinerary, days=days, anchored=anchored)
+            if not orders:
+                return itinerary
+            operations = [
+                ReorderActivities(day=day, activity_order=order)
+                for day, order in orders.items()
+            ]
+            try:
+                return await self.apply_patch(itinerary_id, operations, expected_version=itinerary.version)
+            except VersionConflictError as e:
+                if expected_version is not None or attempt == self.max_patch_attempts:
+                    raise
+                log.info(f"Recomputing routes of itinerary {itinerary_id} after a concurrent edit: {e}")
+        return None
+
+    async def analyze_costs(self, itinerary_id: str, budget: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Compute the cost breakdown of a stored itinerary from its activities.
+
+        Args:
+            itinerary_id: The ID of the itinerary to analyze.
+            budget: A budget tier to check every day against, if any.
+
+        Returns:
+            The analysis (see CostAnalytics.analyze), or None if the itinerary was not found.
+        """
+        if not self.storage_port:
+            log.error("Cannot analyze itinerary costs: No storage port configured")
+            return None
+        itinerary = await self.storage_port.get_itinerary(itinerary_id)
+        if not itinerary:
+            log.error(f"Itinerary not found: {itinerary_id}")
+            return None
+        return self.cost_analytics.analyze(itinerary, budget)
+
+    async def cost_report(self, filter: Optional[ItineraryFilter] = None) -> Optional[Dict[str, Any]]:
+        """
+        Compute cost statistics over every stored itinerary matching `filter`.
+
+        Returns:
+            The report (see CostAnalytics.report), or None without a storage port.
+
+        Raises:
+            NotImplementedError: If the storage adapter cannot scan.
+        """
+        if not self.storage_port:
+            log.error("Cannot build cost report: No storage port configured")
+            return None
+        return await self.cost_analytics.report(self.storage_port, filter)
+
+    async def reorder_activities(self, itinerary_id: str, day_number: int, new_order: List[str]) -> Optional[Itinerary]:
+        """
+        Reorder activities for a specific day in an itinerary.
+        
+        Args:
+            itinerary_id: The ID of the itinerary to update
+            day_number: The day number (1-based) to reorder activities for
+            new_order: List of activity IDs in the new order
+            
+        Returns:
+            Updated Itinerary if successful, None otherwise
+        """
+        try:
+            return await self.apply_patch(
+                itinerary_id, [ReorderActivities(day=day_number, activity_order=new_order)]
+            )
+        except ValueError as e:
+            log.error(f"Invalid activity order: {e}")
+            return None
         except Exception as e:
             log.exception(f"Error reordering activities: {e}")
             return None
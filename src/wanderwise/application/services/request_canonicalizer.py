@@ -0,0 +1,340 @@
+# src/wanderwise/application/services/request_canonicalizer.py
+
+import logging
+import re
+import zlib
+from collections import deque
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from ...domain.models.itinerary import ItineraryRequest
+
+log = logging.getLogger(__name__)
+
+# Common alternative spellings and names of popular destinations, keyed on the
+# normalized form (see `_normalize`). Extended by the REQUEST_DESTINATION_ALIASES setting.
+DESTINATION_ALIASES: Dict[str, str] = {
+    "paris": "Paris",
+    "london": "London",
+    "new york": "New York", "new york city": "New York", "nyc": "New York", "new york ny": "New York",
+    "manhattan": "New York",
+    "los angeles": "Los Angeles", "la": "Los Angeles",
+    "san francisco": "San Francisco", "sf": "San Francisco",
+    "rome": "Rome", "roma": "Rome",
+    "florence": "Florence", "firenze": "Florence",
+    "venice": "Venice", "venezia": "Venice",
+    "milan": "Milan", "milano": "Milan",
+    "naples": "Naples", "napoli": "Naples",
+    "barcelona": "Barcelona",
+    "madrid": "Madrid",
+    "lisbon": "Lisbon", "lisboa": "Lisbon",
+    "porto": "Porto", "oporto": "Porto",
+    "munich": "Munich", "munchen": "Munich", "muenchen": "Munich",
+    "vienna": "Vienna", "wien": "Vienna",
+    "prague": "Prague", "praha": "Prague",
+    "copenhagen": "Copenhagen", "kobenhavn": "Copenhagen",
+    "amsterdam": "Amsterdam",
+    "berlin": "Berlin",
+    "athens": "Athens", "athina": "Athens",
+    "istanbul": "Istanbul", "constantinople": "Istanbul",
+    "tokyo": "Tokyo",
+    "kyoto": "Kyoto",
+    "seoul": "Seoul",
+    "beijing": "Beijing", "peking": "Beijing",
+    "bangkok": "Bangkok",
+    "mexico city": "Mexico City", "cdmx": "Mexico City", "ciudad de mexico": "Mexico City",
+    "rio": "Rio de Janeiro", "rio de janeiro": "Rio de Janeiro",
+    "buenos aires": "Buenos Aires",
+    "cape town": "Cape Town",
+    "dubai": "Dubai",
+    "sydney": "Sydney",
+}
+
+# The countries (and states) that may follow each aliased city, as in the gazetteer's
+# third column: "Paris, France" is reduced to "Paris", but "Paris, US" and "Paris, Texas"
+# are other places and stay as they are.
+_US = ("United States", "USA", "US")
+_ITALY = ("Italy",)
+DESTINATION_COUNTRIES: Dict[str, Tuple[str, ...]] = {
+    "Paris": ("France",),
+    "London": ("United Kingdom", "UK", "England"),
+    "New York": (*_US, "NY"),
+    "Los Angeles": (*_US, "CA", "California"),
+    "San Francisco": (*_US, "CA", "California"),
+    "Rome": _ITALY, "Florence": _ITALY, "Venice": _ITALY, "Milan": _ITALY, "Naples": _ITALY,
+    "Barcelona": ("Spain",), "Madrid": ("Spain",),
+    "Lisbon": ("Portugal",), "Porto": ("Portugal",),
+    "Munich": ("Germany",), "Berlin": ("Germany",),
+    "Vienna": ("Austria",),
+    "Prague": ("Czechia", "Czech Republic"),
+    "Copenhagen": ("Denmark",),
+    "Amsterdam": ("Netherlands", "The Netherlands", "Holland"),
+    "Athens": ("Greece",),
+    "Istanbul": ("Turkey", "Turkiye"),
+    "Tokyo": ("Japan",), "Kyoto": ("Japan",),
+    "Seoul": ("Korea", "South Korea"),
+    "Beijing": ("China",),
+    "Bangkok": ("Thailand",),
+    "Mexico City": ("Mexico",),
+    "Rio de Janeiro": ("Brazil",),
+    "Buenos Aires": ("Argentina",),
+    "Cape Town": ("South Africa",),
+    "Dubai": ("UAE", "United Arab Emirates"),
+    "Sydney": ("Australia",),
+}
+
+# Travel styles and budgets are bucketed onto the form's options only when the whole value
+# is an option or one of its unambiguous synonyms (see `_phrase`). Anything else, such as
+# "no budget limit" or "art and nightlife with kids", is kept as typed.
+_STYLE_SYNONYMS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("Family-friendly", ("family friendly", "family", "families", "kid friendly", "kids", "with kids", "children")),
+    ("Adventure", ("adventure", "adventurous", "outdoor", "outdoors", "hiking", "active", "outdoor adventure")),
+    ("Cultural", (
+        "cultural", "culture", "history", "historic", "historical", "museums", "history museums",
+        "art culture", "arts culture", "culture history",
+    )),
+    ("Relaxation", ("relaxation", "relax", "relaxing", "relaxed", "chill", "beach", "wellness", "spa", "slow travel")),
+    ("Foodie", ("foodie", "food", "culinary", "gastronomy", "gastronomic", "cuisine", "food wine", "food drink")),
+    ("Nightlife", ("nightlife", "night life", "party", "partying", "clubbing", "bars clubs")),
+]
+_BUDGET_SYNONYMS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("Budget-friendly", (
+        "budget friendly", "budget", "on a budget", "low budget", "cheap", "inexpensive", "affordable",
+        "economy", "backpacker", "backpacking", "shoestring",
+    )),
+    ("Mid-range", ("mid range", "midrange", "mid", "moderate", "medium", "standard", "average")),
+    ("Luxury", ("luxury", "luxurious", "high end", "premium", "lavish", "deluxe", "upscale", "expensive")),
+]
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def _normalize(value: str) -> str:
+    """Case-folds a value and reduces it to words separated by single spaces."""
+    return " ".join(_NON_WORD.sub(" ", value.casefold()).split())
+
+
+def _phrase(value: str) -> str:
+    """Normalizes a style or budget for synonym lookup: "History & Museums" -> "history museums"."""
+    return " ".join(word for word in _normalize(value).split() if word != "and")
+
+
+def _synonyms(buckets: List[Tuple[str, Tuple[str, ...]]]) -> Dict[str, str]:
+    return {_phrase(phrase): name for name, phrases in buckets for phrase in (name, *phrases)}
+
+
+_STYLES = _synonyms(_STYLE_SYNONYMS)
+_BUDGETS = _synonyms(_BUDGET_SYNONYMS)
+_CITY_COUNTRIES = {city: {_normalize(country) for country in countries} for city, countries in DESTINATION_COUNTRIES.items()}
+
+
+def _typo_of(query: str, candidate: str) -> bool:
+    """
+    Whether two normalized destinations differ only by typos: the same number of words,
+    short words identical and longer words starting alike. This keeps trigram
+    similarity from merging distinct places such as "Springfield IL" / "Springfield MA".
+    """
+    query_words, candidate_words = query.split(), candidate.split()
+    if len(query_words) != len(candidate_words):
+        return False
+    return all(
+        q == c if min(len(q), len(c)) <= 3 else q[0] == c[0]
+        for q, c in zip(query_words, candidate_words)
+    )
+
+
+class _NgramIndex:
+    """
+    An in-memory index of destinations as hashed character-trigram vectors.
+
+    Each destination is an L2-normalized row of a float32 matrix, so the cosine
+    similarity of a query to every indexed destination is one matrix-vector
+    product. Once `capacity` destinations are indexed the oldest rows are reused.
+    """
+
+    def __init__(self, dimensions: int = 2048, capacity: int = 10_000):
+        self.dimensions = dimensions
+        self.capacity = capacity
+        self._vectors = np.zeros((0, dimensions), dtype=np.float32)
+        self._names: List[str] = []
+        self._keys: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def vector(self, normalized: str) -> np.ndarray:
+        padded = f"  {normalized} "
+        buckets = [zlib.crc32(padded[i:i + 3].encode()) % self.dimensions for i in range(len(padded) - 2)]
+        vector = np.bincount(buckets, minlength=self.dimensions).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def add(self, normalized: str, name: str) -> None:
+        if normalized in self._positions:
+            return
+        if len(self._names) < self.capacity:
+            position = len(self._names)
+            if position == len(self._vectors):
+                # Grow in blocks so that adding destinations one by one stays cheap.
+                block = np.zeros((min(256, self.capacity - position), self.dimensions), dtype=np.float32)
+                self._vectors = np.concatenate([self._vectors, block])
+            self._names.append(name)
+            self._keys.append(normalized)
+        else:
+            position = self._next
+            self._next = (self._next + 1) % self.capacity
+            del self._positions[self._keys[position]]
+            self._names[position] = name
+            self._keys[position] = normalized
+        self._vectors[position] = self.vector(normalized)
+        self._positions[normalized] = position
+
+    def get(self, normalized: str) -> Optional[str]:
+        position = self._positions.get(normalized)
+        return self._names[position] if position is not None else None
+
+    def nearest(self, normalized: str) -> Optional[Tuple[str, str, float]]:
+        """Returns the most similar indexed destination, its normalized form and its cosine similarity."""
+        if not self._names:
+            return None
+        scores = self._vectors[:len(self._names)] @ self.vector(normalized)
+        best = int(np.argmax(scores))
+        return self._names[best], self._keys[best], float(scores[best])
+
+
+class RequestCanonicalizer:
+    """
+    Maps near-identical itinerary requests onto one canonical request, so they share a cached itinerary.
+
+    - Destinations are normalized (case, spacing, punctuation) and looked up in an
+      alias table ("NYC", "New York City" -> "New York"). A "City, Country"
+      destination is reduced to the city only when the country is that city's own
+      ("Paris, France" -> "Paris", but "Paris, Texas" and "Paris, US" stay as they are).
+    - Travel styles and budgets that are one of the form's options or an
+      unambiguous synonym of one are bucketed onto it ("cheap", "on a budget" ->
+      "Budget-friendly"; "food", "culinary" -> "Foodie"). Free text that merely
+      contains such a word ("not cheap") is kept as typed.
+    - Optionally, a destination that is neither an alias nor seen before is matched
+      to the most similar destination seen before, by cosine similarity of
+      character-trigram vectors, when the similarity is at least
+      `similarity_threshold` and the two differ only by typos ("Barcelonna").
+
+    Every alias, similarity and synonym match is recorded in a bounded audit log,
+    so false matches can be reviewed in the stats.
+    """
+
+    def __init__(
+        self,
+        aliases: Optional[Mapping[str, str]] = None,
+        similarity_threshold: Optional[float] = 0.75,
+        index_capacity: int = 10_000,
+        audit_size: int = 50,
+    ):
+        """
+        Args:
+            aliases: Extra destination aliases (any spelling -> canonical name),
+                     merged over the built-in table.
+            similarity_threshold: Minimum trigram cosine similarity for a fuzzy
+                                  destination match, or None to match only exactly.
+            index_capacity: Maximum number of destinations in the similarity index.
+            audit_size: Number of recent matches kept for review.
+        """
+        self.aliases = {**DESTINATION_ALIASES, **{_normalize(k): v for k, v in (aliases or {}).items()}}
+        self.similarity_threshold = similarity_threshold
+        self._index = _NgramIndex(capacity=index_capacity)
+        for name in set(self.aliases.values()):
+            self._index.add(_normalize(name), name)
+        self.audit: "deque[Dict[str, Any]]" = deque(maxlen=audit_size)
+        self.requests = 0
+        self.changed = 0
+        self.alias_matches = 0
+        self.similarity_matches = 0
+        self.bucket_matches = 0
+        log.info(
+            f"RequestCanonicalizer initialized with {len(self.aliases)} aliases "
+            f"(similarity threshold {similarity_threshold})"
+        )
+
+    def canonical_destination(self, destination: str) -> str:
+        normalized = _normalize(destination)
+        canonical = self.aliases.get(normalized)
+        if canonical is None and "," in destination:
+            city, _, country = destination.rpartition(",")
+            known = self.aliases.get(_normalize(city))
+            if known is not None and _normalize(country) in _CITY_COUNTRIES.get(known, ()):
+                canonical = known
+        if canonical is not None:
+            if _normalize(canonical) != normalized:
+                self.alias_matches += 1
+                self.audit.append({"input": destination, "canonical": canonical, "via": "alias"})
+            return canonical
+
+        indexed = self._index.get(normalized)
+        if indexed is not None:
+            return indexed
+        if self.similarity_threshold is not None:
+            nearest = self._index.nearest(normalized)
+            if nearest is not None:
+                name, key, score = nearest
+                if score >= self.similarity_threshold and _typo_of(normalized, key):
+                    self.similarity_matches += 1
+                    self.audit.append({"input": destination, "canonical": name, "via": "similarity", "score": round(score, 3)})
+                    return name
+
+        canonical = " ".join(destination.split())
+        self._index.add(normalized, canonical)
+        return canonical
+
+    def _bucket(self, field: str, value: str, synonyms: Dict[str, str]) -> str:
+        """Returns the form option a style or budget stands for, or the value as typed."""
+        phrase = _phrase(value)
+        option = synonyms.get(phrase)
+        if option is None:
+            return " ".join(value.split())
+        if _phrase(option) != phrase:
+            self.bucket_matches += 1
+            self.audit.append({"input": value, "canonical": option, "via": field})
+        return option
+
+    def canonicalize(self, request: ItineraryRequest) -> ItineraryRequest:
+        """Returns the canonical form of a request (the request itself if nothing changed)."""
+        self.requests += 1
+        update = {
+            "destination": self.canonical_destination(request.destination),
+            "travel_style": self._bucket("travel_style", request.travel_style, _STYLES),
+            "budget": self._bucket("budget", request.budget, _BUDGETS),
+        }
+        if all(getattr(request, field) == value for field, value in update.items()):
+            return request
+        self.changed += 1
+        canonical = request.model_copy(update=update)
+        log.info(
+            f"Canonicalized request ({request.destination!r}, {request.travel_style!r}, {request.budget!r}) -> "
+            f"({canonical.destination!r}, {canonical.travel_style!r}, {canonical.budget!r})"
+        )
+        return canonical
+
+    def stats(self, include_audit: bool = False) -> Dict[str, Any]:
+        """
+        Returns counts and the match rate.
+
+        Args:
+            include_audit: Also return the recent matches. They quote user input, so
+                           they are left out unless asked for.
+        """
+        stats: Dict[str, Any] = {
+            "requests": self.requests,
+            "changed": self.changed,
+            "match_rate": self.changed / self.requests if self.requests else 0.0,
+            "alias_matches": self.alias_matches,
+            "similarity_matches": self.similarity_matches,
+            "bucket_matches": self.bucket_matches,
+            "indexed_destinations": len(self._index),
+            "similarity_threshold": self.similarity_threshold,
+        }
+        if include_audit:
+            stats["audit"] = list(self.audit)
+        return stats
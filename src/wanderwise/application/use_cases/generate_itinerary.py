@@ -1,9 +1,12 @@
 # src/wanderwise/application/use_cases/generate_itinerary.py
 
 import logging
+from typing import AsyncIterator, Optional
 
-from ...domain.models.itinerary import Itinerary, ItineraryRequest
-from ...domain.ports.llm_port import LLMPort
+from ...domain.models.itinerary import DailyPlan, Itinerary, ItineraryRequest
+from ...domain.ports.geocoding_port import GeocodingPort
+from ...domain.ports.llm_port import LLMPort, LLMUnavailableError
+from ..services.request_canonicalizer import RequestCanonicalizer
 
 # Get a logger instance for this module.
 log = logging.getLogger(__name__)
@@ -17,7 +20,12 @@ class GenerateItineraryUseCase:
     the interaction between the domain models and the external services (via ports).
     """
 
-    def __init__(self, llm_port: LLMPort):
+    def __init__(
+        self,
+        llm_port: LLMPort,
+        canonicalizer: Optional[RequestCanonicalizer] = None,
+        geocoder: Optional[GeocodingPort] = None,
+    ):
         """
         Initializes the use case with a dependency on an LLM port.
 
@@ -28,28 +36,43 @@ class GenerateItineraryUseCase:
 
         Args:
             llm_port: An object that conforms to the LLMPort interface.
+            canonicalizer: Optional RequestCanonicalizer that maps near-identical
+                           requests ("paris" / "Paris, France") onto one canonical
+                           request before generation, so they share cached itineraries.
+            geocoder: Optional GeocodingPort that fills in the coordinates of the
+                      destination and activities of generated itineraries (for the map).
         """
         if not isinstance(llm_port, LLMPort):
             raise TypeError("llm_port must be an instance of LLMPort")
         self.llm_port = llm_port
+        self.canonicalizer = canonicalizer
+        self.geocoder = geocoder
         log.info(f"GenerateItineraryUseCase initialized with {type(llm_port).__name__}")
 
+    def _canonical(self, request: ItineraryRequest) -> ItineraryRequest:
+        return self.canonicalizer.canonicalize(request) if self.canonicalizer is not None else request
+
     async def execute(self, request: ItineraryRequest) -> Itinerary | None:
         """
         Executes the itinerary generation process.
 
         This method orchestrates the steps required to generate an itinerary:
-        1. Logs the incoming request.
+        1. Canonicalizes and logs the incoming request.
         2. Calls the injected LLM port to perform the generation.
-        3. Logs the outcome (success or failure).
-        4. Returns the generated itinerary or None.
+        3. Locates the destination and activities, if a geocoder is configured.
+        4. Logs the outcome (success or failure).
+        5. Returns the generated itinerary or None.
 
         Args:
             request: An ItineraryRequest object containing user preferences.
 
         Returns:
             An Itinerary object if successful, otherwise None.
+
+        Raises:
+            LLMUnavailableError: If the LLM is overloaded; callers should ask the client to retry later.
         """
+        request = self._canonical(request)
         log.info(
             f"Executing itinerary generation for destination: '{request.destination}' "
             f"for {request.duration_days} days."
@@ -58,12 +81,57 @@ class GenerateItineraryUseCase:
             itinerary = await self.llm_port.generate_itinerary(request)
             if itinerary:
                 log.info(f"Successfully generated itinerary: '{itinerary.trip_title}'")
+                if self.geocoder is not None:
+                    self.geocoder.annotate(itinerary)
                 return itinerary
             else:
                 log.warning("Itinerary generation returned None.")
                 return None
+        except LLMUnavailableError as e:
+            log.warning(f"LLM unavailable, retry after {e.retry_after}s: {e}")
+            raise
         except Exception as e:
             log.error(f"An unexpected error occurred during itinerary generation: {e}", exc_info=True)
             # In a real-world scenario, you might raise a custom application-specific exception here.
             return None
 
+    async def stream(self, request: ItineraryRequest) -> AsyncIterator[DailyPlan | Itinerary]:
+        """
+        Executes the itinerary generation process incrementally.
+
+        Yields each DailyPlan as soon as the LLM port produces it, followed by the
+        complete Itinerary. If generation fails, the iterator ends without yielding
+        an Itinerary, so callers can tell success from failure. LLMUnavailableError is
+        propagated so callers can tell the client to retry later.
+
+        Args:
+            request: An ItineraryRequest object containing user preferences.
+
+        Yields:
+            DailyPlan objects in day order, then the final Itinerary.
+        """
+        request = self._canonical(request)
+        log.info(
+            f"Streaming itinerary generation for destination: '{request.destination}' "
+            f"for {request.duration_days} days."
+        )
+        days_streamed = 0
+        try:
+            async for item in self.llm_port.stream_itinerary(request):
+                if isinstance(item, Itinerary):
+                    log.info(f"Successfully streamed itinerary: '{item.trip_title}'")
+                    if self.geocoder is not None:
+                        self.geocoder.annotate(item)
+                else:
+                    days_streamed += 1
+                    if self.geocoder is not None:
+                        self.geocoder.annotate_day(item, request.destination)
+                yield item
+        except LLMUnavailableError as e:
+            log.warning(f"LLM unavailable after streaming {days_streamed} day(s), retry after {e.retry_after}s: {e}")
+            raise
+        except Exception as e:
+            log.error(
+                f"An unexpected error occurred after streaming {days_streamed} day(s): {e}",
+                exc_info=True,
+            )
@@ -0,0 +1,125 @@
+# src/wanderwise/application/use_cases/regenerate_day.py
+
+import logging
+from typing import Optional
+
+from ...domain.models.itinerary import Itinerary, ItineraryRequest
+from ...domain.ports.geocoding_port import GeocodingPort
+from ...domain.ports.llm_port import LLMPort, LLMUnavailableError
+from ...domain.ports.storage_port import StoragePort, VersionConflictError
+
+# Get a logger instance for this module.
+log = logging.getLogger(__name__)
+
+
+class RegenerateDayUseCase:
+    """
+    Use case for replacing a single day of a stored itinerary with a newly generated one.
+
+    Only that day is generated (with the other days' themes as context), only that
+    day is written back to storage, and only that day needs to be re-rendered, so
+    the cost of the change does not grow with the length of the trip.
+    """
+
+    # How many times the new day is re-applied to the latest version after losing a race.
+    max_save_attempts = 3
+
+    def __init__(self, llm_port: LLMPort, storage_port: StoragePort, geocoder: Optional[GeocodingPort] = None):
+        """
+        Initializes the use case with its ports.
+
+        Args:
+            llm_port: An object that conforms to the LLMPort interface.
+            storage_port: The storage holding the itinerary to edit.
+            geocoder: Optional GeocodingPort that locates the new day's activities.
+        """
+        if not isinstance(llm_port, LLMPort):
+            raise TypeError("llm_port must be an instance of LLMPort")
+        self.llm_port = llm_port
+        self.storage_port = storage_port
+        self.geocoder = geocoder
+        log.info(f"RegenerateDayUseCase initialized with {type(llm_port).__name__}")
+
+    async def execute(
+        self,
+        itinerary_id: str,
+        day_number: int,
+        travel_style: str,
+        budget: str,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Itinerary]:
+        """
+        Regenerates day `day_number` of a stored itinerary and saves just that day.
+
+        The save is a compare-and-swap on the itinerary version. Generation takes a
+        while, so an edit to another day may be saved in the meantime; without
+        `expected_version` the new day is then applied to the latest version instead.
+
+        Args:
+            itinerary_id: The ID of the itinerary to edit.
+            day_number: The number of the day to regenerate.
+            travel_style: The traveller's style, for the prompt.
+            budget: The traveller's budget, for the prompt.
+            expected_version: The version the caller's view is based on, if known.
+
+        Returns:
+            The updated Itinerary, or None if the day could not be generated or saved.
+
+        Raises:
+            ValueError: If the itinerary does not exist or has no day `day_number`.
+            VersionConflictError: If the itinerary is not at `expected_version`, or
+                                  kept changing for `max_save_attempts` attempts.
+            LLMUnavailableError: If the LLM is overloaded; callers should ask the client to retry later.
+        """
+        itinerary = await self.storage_port.get_itinerary(itinerary_id)
+        if itinerary is None:
+            raise ValueError(f"Itinerary not found: {itinerary_id}")
+        if expected_version is not None and itinerary.version != expected_version:
+            raise VersionConflictError(itinerary_id, itinerary.version)
+        if not any(plan.day == day_number for plan in itinerary.daily_plans):
+            raise ValueError(f"Day {day_number} not found in itinerary {itinerary_id}")
+
+        request = ItineraryRequest(
+            destination=itinerary.destination,
+            duration_days=len(itinerary.daily_plans),
+            travel_style=travel_style,
+            budget=budget,
+        )
+        log.info(f"Regenerating day {day_number} of itinerary {itinerary_id}")
+        try:
+            daily_plan = await self.llm_port.regenerate_day(request, itinerary, day_number)
+        except LLMUnavailableError as e:
+            log.warning(f"LLM unavailable, retry after {e.retry_after}s: {e}")
+            raise
+        except Exception as e:
+            log.error(f"An unexpected error occurred while regenerating day {day_number}: {e}", exc_info=True)
+            return None
+        if daily_plan is None:
+            log.warning(f"Regenerating day {day_number} of itinerary {itinerary_id} returned None.")
+            return None
+        if self.geocoder is not None:
+            self.geocoder.annotate_day(daily_plan, itinerary.destination)
+
+        for attempt in range(1, self.max_save_attempts + 1):
+            if attempt > 1:
+                itinerary = await self.storage_port.get_itinerary(itinerary_id)
+                if itinerary is None:
+                    log.error(f"Itinerary {itinerary_id} was deleted while regenerating day {day_number}")
+                    return None
+            base_version = itinerary.version
+            position = itinerary.replace_day(daily_plan)
+            itinerary.version = base_version + 1
+            try:
+                saved = await self.storage_port.compare_and_swap(itinerary, base_version, [position])
+            except VersionConflictError as e:
+                if expected_version is not None or attempt == self.max_save_attempts:
+                    raise
+                log.info(f"Re-applying regenerated day {day_number} of itinerary {itinerary_id} after a concurrent edit: {e}")
+                continue
+
+            if saved:
+                log.info(f"Regenerated day {day_number} of itinerary {itinerary_id} (version {itinerary.version})")
+                return itinerary
+            log.error(f"Failed to save regenerated day {day_number} of itinerary {itinerary_id}")
+            return None
+        return None
@@ -4,7 +4,8 @@ import logging
 import os
 from functools import lru_cache
 from pathlib import Path
-from pydantic import Field, SecretStr
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
@@ -35,6 +36,41 @@ if os.environ.get('OPENAI_API_KEY'):
     log.info(f"OPENAI_API_KEY length: {len(os.environ.get('OPENAI_API_KEY'))}")
 
 
+class LLMBackendSettings(BaseModel):
+    """
+    One backend for the LLM router, as listed in the LLM_BACKENDS setting.
+
+    Unset fields fall back to the global settings, so a backend entry only needs to
+    say what differs: a cheaper model, another base URL, an OpenAI-compatible local
+    server with its own API key variable, and so on.
+    """
+
+    name: str = Field(..., description="Label used in logs and stats.")
+    provider: Literal["openai", "fake"] = Field(default="openai", description="Which gateway serves this backend.")
+    model: Optional[str] = Field(default=None, description="Model name (defaults to OPENAI_MODEL).")
+    base_url: Optional[str] = Field(default=None, description="API base URL (defaults to OPENAI_BASE_URL).")
+    api_key_env: Optional[str] = Field(
+        default=None,
+        description=(
+            "Environment variable holding this backend's API key (must be set). Defaults to OPENAI_API_KEY,"
+            " which is only allowed for backends without their own base_url."
+        ),
+    )
+    max_days: Optional[int] = Field(default=None, gt=0, description="Only use this backend for trips up to this long.")
+    cost: float = Field(default=1.0, gt=0, description="Relative cost weight; cheaper backends win at equal latency.")
+
+
+class CacheWarmRequestSettings(BaseModel):
+    """
+    One itinerary request to keep warm in the cache, as listed in the CACHE_WARM_REQUESTS setting.
+    """
+
+    destination: str = Field(..., description="The city or region of the trip.")
+    duration_days: int = Field(default=3, gt=0, description="Trip length in days.")
+    travel_style: str = Field(default="Cultural", description="Travel style, as chosen in the form.")
+    budget: str = Field(default="Mid-range", description="Budget, as chosen in the form.")
+
+
 class Settings(BaseSettings):
     """
     Application settings class.
@@ -75,11 +111,290 @@ class Settings(BaseSettings):
         description="Mapbox access token for interactive maps. Get one at https://account.mapbox.com/access-tokens/"
     )
 
+    # Offline geocoding
+    # Destinations and the places activities visit are located in a local gazetteer
+    # (no network calls), so the map can show them. See adapters/geocoding/data/gazetteer.tsv
+    # for the file format.
+    GEOCODING_ENABLED: bool = Field(default=True, description="Add coordinates to generated itineraries.")
+    GAZETTEER_PATH: Optional[str] = Field(
+        default=None, description="Gazetteer file to load instead of the bundled one."
+    )
+
     # OpenAI API configuration
     # The API key is loaded from the OPENAI_API_KEY environment variable.
     # It is stored as a SecretStr to prevent accidental exposure in logs or exceptions.
     OPENAI_API_KEY: SecretStr = Field(..., description="Your secret API key for OpenAI.")
 
+    # LLM provider
+    # "openai" calls the OpenAI API. "fake" generates itineraries locally with simulated
+    # latency and failures, for offline development and load testing (see benchmarks/).
+    LLM_PROVIDER: Literal["openai", "fake"] = Field(
+        default="openai", description="Which LLM backend generates itineraries."
+    )
+    FAKE_LLM_LATENCY_MEDIAN_SECONDS: float = Field(
+        default=1.5, ge=0, description="Median simulated latency of the fake LLM."
+    )
+    FAKE_LLM_LATENCY_SIGMA: float = Field(
+        default=0.5, ge=0, description="Spread of the fake LLM's log-normal latency (0 for constant)."
+    )
+    FAKE_LLM_FAILURE_RATE: float = Field(
+        default=0.0, ge=0, le=1, description="Probability that a fake LLM call fails."
+    )
+    FAKE_LLM_ACTIVITIES_PER_DAY: int = Field(
+        default=4, gt=0, description="Number of activities per day in fake itineraries."
+    )
+    FAKE_LLM_SEED: int = Field(default=0, description="Seed for fake itinerary content, latencies and failures.")
+
+    # LLM routing
+    # With LLM_BACKENDS set (a JSON list of LLMBackendSettings), requests are routed between
+    # several backends by live latency and error rates, with failover. For example:
+    # [{"name": "mini", "model": "gpt-4o-mini", "max_days": 3, "cost": 0.2}, {"name": "4o"}]
+    OPENAI_MODEL: str = Field(
+        default="gpt-4o", description="OpenAI model; it must be able to follow JSON instructions."
+    )
+    LLM_BACKENDS: List[LLMBackendSettings] = Field(
+        default_factory=list, description="Backends for the LLM router (empty for a single OpenAI backend)."
+    )
+    LLM_ROUTER_EWMA_ALPHA: float = Field(
+        default=0.2, gt=0, le=1, description="Weight of the newest call in each backend's latency and error averages."
+    )
+
+    # OpenAI HTTP client configuration
+    # A single pooled client is created per worker process in the application lifespan.
+    # These values tune its connection pool, keep-alive behaviour and timeouts.
+    OPENAI_BASE_URL: Optional[str] = Field(
+        default=None,
+        description="Override the OpenAI API base URL (e.g. a proxy or a local stub server)."
+    )
+    OPENAI_MAX_CONNECTIONS: int = Field(
+        default=100, gt=0, description="Maximum number of concurrent connections in the pool."
+    )
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=20, ge=0, description="Maximum number of idle connections kept alive for reuse."
+    )
+    OPENAI_KEEPALIVE_EXPIRY_SECONDS: float = Field(
+        default=30.0, ge=0, description="How long an idle keep-alive connection is retained."
+    )
+    OPENAI_CONNECT_TIMEOUT_SECONDS: float = Field(
+        default=5.0, gt=0, description="Timeout for establishing a new connection."
+    )
+    OPENAI_TIMEOUT_SECONDS: float = Field(
+        default=60.0, gt=0, description="Timeout for reading, writing and acquiring a pooled connection."
+    )
+
+    # Itinerary storage
+    # "memory" keeps itineraries in a per-worker store that evicts cold itineraries
+    # (least recently used first) to stay within the limits below. "sqlite" persists
+    # them to a local database file shared by all workers on the host.
+    STORAGE_BACKEND: Literal["memory", "sqlite"] = Field(
+        default="memory", description="Which itinerary storage backend to use."
+    )
+    SQLITE_PATH: str = Field(
+        default=str(project_root / "data" / "wanderwise.db"), description="Path of the SQLite database file."
+    )
+    SQLITE_READ_CONNECTIONS: int = Field(
+        default=4, gt=0, description="Number of pooled SQLite reader connections."
+    )
+    SQLITE_MAX_WRITE_BATCH: int = Field(
+        default=256, gt=0, description="Maximum number of writes committed in one SQLite transaction."
+    )
+    STORAGE_MAX_ITEMS: int = Field(
+        default=10_000, gt=0, description="Maximum number of itineraries kept in memory."
+    )
+    STORAGE_MAX_BYTES: int = Field(
+        default=256 * 1024 * 1024, gt=0, description="Approximate memory budget for the compact records of stored itineraries."
+    )
+    STORAGE_TTL_SECONDS: Optional[float] = Field(
+        default=7 * 24 * 60 * 60, description="How long an itinerary is kept after its last save (empty for no expiry)."
+    )
+
+    # Templates and rendered fragments
+    # Templates are compiled once at startup; with the bytecode cache the compiled code is
+    # also kept on disk (in the system temp directory unless set) for other workers and
+    # restarts. Rendered itinerary fragments are cached per itinerary version, so repeat
+    # views of a stored itinerary skip rendering.
+    TEMPLATE_BYTECODE_CACHE_ENABLED: bool = Field(
+        default=True, description="Keep compiled templates on disk."
+    )
+    TEMPLATE_BYTECODE_CACHE_DIR: Optional[str] = Field(
+        default=None, description="Directory for compiled templates (the system temp directory if unset)."
+    )
+    FRAGMENT_CACHE_ENABLED: bool = Field(default=True, description="Cache rendered itinerary fragments.")
+    FRAGMENT_CACHE_MAX_ENTRIES: int = Field(
+        default=1024, gt=0, description="Maximum number of itineraries with cached fragments per worker."
+    )
+    FRAGMENT_CACHE_MAX_BYTES: int = Field(
+        default=64 * 1024 * 1024, gt=0, description="Approximate memory budget for cached fragments."
+    )
+
+    # Itinerary generation strategy
+    # Long trips are generated as a skeleton plus one concurrent completion per day,
+    # so wall-clock time tracks the slowest day and no single response is truncated.
+    LLM_PER_DAY_MIN_DAYS: int = Field(
+        default=7, gt=0, description="Trips at least this long use per-day generation when the strategy is 'auto'."
+    )
+    LLM_PER_DAY_CONCURRENCY: int = Field(
+        default=4, gt=0, description="Maximum number of days generated concurrently for one itinerary."
+    )
+
+    # Completion token budgets
+    # max_tokens is sized per call from the trip length and the completion tokens per
+    # day measured so far, so short trips reserve less rate-limit budget and long ones
+    # are not truncated. These values bound the budget for each kind of call.
+    LLM_TOKENS_PER_DAY_PRIOR: int = Field(
+        default=400, gt=0, description="Initial estimate of completion tokens per itinerary day."
+    )
+    LLM_MAX_COMPLETION_TOKENS: int = Field(
+        default=16384, gt=0, description="Upper bound on max_tokens for a whole itinerary."
+    )
+    LLM_SKELETON_MAX_TOKENS: int = Field(
+        default=1024, gt=0, description="Upper bound on max_tokens for the trip skeleton (title and per-day themes)."
+    )
+    LLM_DAY_MAX_TOKENS: int = Field(
+        default=1200, gt=0, description="Upper bound on max_tokens for a single day's activities."
+    )
+
+    # LLM admission control
+    # Every outbound completion waits for a slot under these limits (per worker process),
+    # so bursts queue briefly instead of tripping the provider's rate limits. Calls that
+    # would wait longer than the deadline fail fast with 503 and a Retry-After header.
+    LLM_MAX_CONCURRENCY: int = Field(default=32, gt=0, description="Maximum number of LLM calls in flight.")
+    LLM_REQUESTS_PER_MINUTE: Optional[float] = Field(
+        default=500, gt=0, description="Requests-per-minute budget for LLM calls (empty for no limit)."
+    )
+    LLM_TOKENS_PER_MINUTE: Optional[float] = Field(
+        default=300_000, gt=0,
+        description="Tokens-per-minute budget, charged with each call's prompt size plus max_tokens (empty for no limit).",
+    )
+    LLM_MAX_QUEUED: int = Field(default=256, ge=0, description="Maximum number of LLM calls waiting for admission.")
+    LLM_MAX_QUEUE_WAIT_SECONDS: float = Field(
+        default=10.0, gt=0, description="Longest an LLM call may wait for admission before failing with 503."
+    )
+
+    # LLM call resilience
+    # Transient failures (rate limits, timeouts, connection errors, 5xx) are retried with
+    # decorrelated jitter, honoring Retry-After. After repeated failures a circuit breaker
+    # refuses calls (503) until a probe succeeds. Hedging sends a second request when a
+    # call runs past the recent p95 latency for its kind and keeps whichever finishes first.
+    LLM_RETRY_ATTEMPTS: int = Field(default=3, gt=0, description="Maximum attempts per LLM call, including the first.")
+    LLM_RETRY_BASE_DELAY_SECONDS: float = Field(default=0.5, gt=0, description="Smallest delay between retries.")
+    LLM_RETRY_MAX_DELAY_SECONDS: float = Field(
+        default=20.0, gt=0, description="Largest delay between retries; a longer Retry-After is not waited for."
+    )
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = Field(
+        default=5, gt=0, description="Consecutive LLM failures that open the circuit."
+    )
+    LLM_CIRCUIT_RESET_SECONDS: float = Field(
+        default=30.0, gt=0, description="How long the circuit stays open before a probe call is allowed."
+    )
+    LLM_HEDGE_ENABLED: bool = Field(default=False, description="Send a hedged second request for slow LLM calls.")
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = Field(
+        default=1.0, gt=0, description="Shortest time a call runs before it is hedged."
+    )
+    LLM_HEDGE_MIN_SAMPLES: int = Field(
+        default=20, gt=0, description="Latency samples needed for a kind of call before it is hedged."
+    )
+
+    # Request coalescing
+    # Identical itinerary requests that arrive while one is already being generated
+    # wait for that generation instead of starting their own LLM call.
+    LLM_COALESCE_ENABLED: bool = Field(default=True, description="Share identical in-flight generations.")
+
+    # LLM response cache
+    # Identical (normalized) itinerary requests are served from an in-process LRU cache.
+    LLM_CACHE_ENABLED: bool = Field(default=True, description="Cache generated itineraries per request.")
+    LLM_CACHE_MAX_ENTRIES: int = Field(
+        default=1024, gt=0, description="Maximum number of cached itineraries per worker."
+    )
+    LLM_CACHE_TTL_SECONDS: float = Field(
+        default=6 * 60 * 60, gt=0, description="How long a cached itinerary stays valid."
+    )
+    LLM_CACHE_REFRESH_AHEAD_SECONDS: float = Field(
+        default=30 * 60, ge=0,
+        description="A hit this close to expiry is served and refreshed in the background (0 to disable).",
+    )
+
+    # Request canonicalization
+    # Near-identical requests ("paris" / "Paris, France", "budget" / "Budget-friendly") are
+    # mapped onto one canonical request before generation, so they share cached itineraries.
+    # Destinations go through an alias table (extendable with a JSON object such as
+    # {"Big Apple": "New York"}) and, optionally, a character-trigram similarity match
+    # against destinations seen before; travel styles and budgets are bucketed by synonym.
+    # Recent matches quote what users typed, so /api/stats only reports them when
+    # REQUEST_CANONICALIZE_AUDIT_IN_STATS is set.
+    REQUEST_CANONICALIZE_ENABLED: bool = Field(
+        default=True, description="Canonicalize itinerary requests before generation."
+    )
+    REQUEST_SIMILARITY_THRESHOLD: Optional[float] = Field(
+        default=0.75, gt=0, le=1,
+        description="Minimum trigram cosine similarity for a fuzzy destination match (unset to disable).",
+    )
+    REQUEST_DESTINATION_ALIASES: Dict[str, str] = Field(
+        default_factory=dict, description="Extra destination aliases, merged over the built-in table."
+    )
+    REQUEST_CANONICALIZE_AUDIT_IN_STATS: bool = Field(
+        default=False,
+        description="Include recent canonicalization matches (raw user input) in /api/stats; counts are always included.",
+    )
+
+    # Cost analytics
+    # Trip costs are recomputed from the activities' estimated costs. A day fits a budget
+    # tier if it costs at most the tier's limit; a JSON object such as
+    # {"Budget-friendly": 80, "Mid-range": 200, "Luxury": null} overrides the limits.
+    COST_TIER_DAILY_LIMITS_USD: Dict[str, Optional[float]] = Field(
+        default_factory=lambda: {"Budget-friendly": 100.0, "Mid-range": 250.0, "Luxury": None},
+        description="Highest spend per day of each budget tier in USD (null for no limit).",
+    )
+    COST_DISCREPANCY_TOLERANCE: float = Field(
+        default=0.1, ge=0,
+        description="Relative difference up to which the LLM's stated total counts as consistent.",
+    )
+
+    # Cache warming
+    # A background task pre-generates the configured requests (a JSON list of
+    # CacheWarmRequestSettings) and the most requested ones into the response cache,
+    # at a bounded rate and optionally only during off-peak local hours. For example:
+    # [{"destination": "Paris", "duration_days": 3}, {"destination": "Tokyo", "duration_days": 5}]
+    CACHE_WARM_ENABLED: bool = Field(default=False, description="Pre-generate popular itineraries into the cache.")
+    CACHE_WARM_REQUESTS: List[CacheWarmRequestSettings] = Field(
+        default_factory=list, description="Requests to keep warm regardless of observed demand."
+    )
+    CACHE_WARM_POPULAR_COUNT: int = Field(
+        default=20, ge=0, description="How many of the most requested itineraries to keep warm."
+    )
+    CACHE_WARM_INTERVAL_SECONDS: float = Field(default=600.0, gt=0, description="Time between warming rounds.")
+    CACHE_WARM_MAX_PER_MINUTE: float = Field(
+        default=6.0, gt=0, description="Maximum number of itineraries pre-generated per minute."
+    )
+    CACHE_WARM_OFF_PEAK_START_HOUR: Optional[int] = Field(
+        default=None, ge=0, le=23, description="Local hour warming starts (unset to warm at any hour)."
+    )
+    CACHE_WARM_OFF_PEAK_END_HOUR: Optional[int] = Field(
+        default=None, ge=0, le=23, description="Local hour warming stops; the window may wrap past midnight."
+    )
+
+    # Background generation jobs
+    # POST /generate-itinerary with job=true (or "Prefer: respond-async") returns 202 and a
+    # job ID right away; a fixed pool of in-process workers generates queued itineraries.
+    JOB_WORKERS: int = Field(default=4, gt=0, description="Number of itineraries generated concurrently as jobs.")
+    JOB_QUEUE_MAX_SIZE: int = Field(
+        default=100, gt=0, description="Maximum number of queued jobs; further jobs are refused with 503."
+    )
+    JOB_RETENTION: int = Field(
+        default=1000, gt=0, description="Number of finished jobs whose status can still be read."
+    )
+    WEBHOOK_TIMEOUT_SECONDS: float = Field(
+        default=10.0, gt=0, description="Timeout for each job callback notification."
+    )
+    WEBHOOK_ATTEMPTS: int = Field(
+        default=3, gt=0, description="Maximum delivery attempts for a job callback notification."
+    )
+    # Callbacks to loopback, private and link-local addresses are always refused, unless the
+    # host is listed here (a JSON list). When set, no other hosts are notified at all.
+    WEBHOOK_ALLOWED_HOSTS: List[str] = Field(
+        default_factory=list, description="If set, the only host names job callbacks may be sent to."
+    )
+
     # Model configuration for the Pydantic BaseSettings class.
     model_config = SettingsConfigDict(
         env_file=str(env_path),    # Use the absolute path to the .env file
@@ -1,23 +1,61 @@
 # src/wanderwise/domain/models/itinerary.py
 
-import uuid
+import hashlib
+import os
+from enum import Enum
 from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Any
+from typing import Annotated, List, Literal, Optional, Dict, Any, Sequence, Union
 
 # This module defines the core data structures (entities) of the WanderWise application.
 # These models are pure data containers and have no dependencies on any other part of the
 # application, adhering to the principles of Clean Architecture. They represent the
 # fundamental concepts of our domain.
 
+# Identifiers are random (version 4) UUID strings. They are drawn from a pool that is
+# refilled in batches from one os.urandom call, since a large itinerary creates dozens
+# of activities at once and uuid.uuid4() costs a system call and a UUID object each.
+_ID_BATCH_SIZE = 512
+_id_pool: List[str] = []
+
+def _uuid4_batch(count: int) -> List[str]:
+    hex_digits = os.urandom(16 * count).hex()
+    ids = []
+    for start in range(0, 32 * count, 32):
+        h = hex_digits[start:start + 32]
+        # Set the version nibble to 4 and the variant bits to 10xx, as uuid.uuid4() does.
+        ids.append(f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}")
+    return ids
+
+def new_id() -> str:
+    """Returns a new random UUID4 string for an itinerary or activity."""
+    try:
+        return _id_pool.pop()
+    except IndexError:
+        _id_pool.extend(_uuid4_batch(_ID_BATCH_SIZE))
+        return _id_pool.pop()
+
+# A forked worker must not hand out the same pooled IDs as its parent.
+os.register_at_fork(after_in_child=_id_pool.clear)
+
+def _coordinates(latitude: Optional[float], longitude: Optional[float]) -> Optional[List[float]]:
+    return [longitude, latitude] if latitude is not None and longitude is not None else None
+
 class Activity(BaseModel):
     """
     Represents a single activity within a day of the itinerary.
     """
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="A unique identifier for the activity.")
+    id: str = Field(default_factory=new_id, description="A unique identifier for the activity.")
     time: str = Field(..., description="The suggested time for the activity (e.g., '09:00', 'Afternoon').")
     description: str = Field(..., description="A detailed description of the activity.")
     estimated_cost_usd: Optional[float] = Field(None, description="An optional estimated cost for the activity in USD.")
     booking_link: Optional[str] = Field(None, description="An optional link for booking the activity.")
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="Latitude of the place visited, if known.")
+    longitude: Optional[float] = Field(None, ge=-180, le=180, description="Longitude of the place visited, if known.")
+
+    @property
+    def coordinates(self) -> Optional[List[float]]:
+        """The activity's location as [longitude, latitude] (the GeoJSON/Mapbox order), or None if unknown."""
+        return _coordinates(self.latitude, self.longitude)
 
 class DailyPlan(BaseModel):
     """
@@ -27,12 +65,14 @@ class DailyPlan(BaseModel):
     theme: str = Field(..., description="A theme for the day (e.g., 'Historical Exploration', 'Culinary Adventure').")
     activities: List[Activity] = Field(..., description="A list of activities planned for the day.")
     
-    def reorder_activities(self, new_order: List[str]) -> None:
+    def reorder_activities(self, new_order: List[str], keep_times: bool = False) -> None:
         """
         Reorder activities based on the provided list of activity IDs.
         
         Args:
             new_order: List of activity IDs in the desired order
+            keep_times: If True, the times stay with their positions in the day (the
+                        activity now first gets the first time slot, and so on)
             
         Raises:
             ValueError: If the new order doesn't match the current activities
@@ -44,18 +84,178 @@ class DailyPlan(BaseModel):
         activity_map = {activity.id: activity for activity in self.activities}
         
         # Rebuild activities list in the new order
+        times = [activity.time for activity in self.activities]
         self.activities = [activity_map[activity_id] for activity_id in new_order]
+        if keep_times:
+            for activity, time in zip(self.activities, times):
+                activity.time = time
+
+class ReorderActivities(BaseModel):
+    """
+    Patch operation: put the activities of one day in a new order.
+    """
+    op: Literal["reorder"] = "reorder"
+    day: int = Field(..., gt=0, description="The day number whose activities are reordered.")
+    activity_order: List[str] = Field(..., description="Every activity ID of that day, in the new order.")
+    keep_times: bool = Field(False, description="Keep the day's time slots in place instead of moving them with their activities.")
+
+class MoveActivity(BaseModel):
+    """
+    Patch operation: move an activity to another day (or another position in the same day).
+    """
+    op: Literal["move"] = "move"
+    activity_id: str = Field(..., description="The ID of the activity to move.")
+    to_day: int = Field(..., gt=0, description="The day number the activity is moved to.")
+    position: Optional[int] = Field(None, ge=0, description="Index in the target day; appended if omitted.")
+
+class UpdateActivity(BaseModel):
+    """
+    Patch operation: change the time and/or estimated cost of an activity. Unset fields are left as they are.
+    """
+    op: Literal["update"] = "update"
+    activity_id: str = Field(..., description="The ID of the activity to update.")
+    time: Optional[str] = Field(None, description="The new time for the activity.")
+    estimated_cost_usd: Optional[float] = Field(None, ge=0, description="The new estimated cost in USD.")
+
+# A single itinerary edit, discriminated by its `op` field.
+ItineraryPatchOperation = Annotated[
+    Union[ReorderActivities, MoveActivity, UpdateActivity],
+    Field(discriminator="op"),
+]
 
 class Itinerary(BaseModel):
     """
     Represents the complete travel itinerary for a destination.
     This is the main aggregate root of our domain model.
     """
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="A unique identifier for the itinerary.")
+    id: str = Field(default_factory=new_id, description="A unique identifier for the itinerary.")
     destination: str = Field(..., description="The city or region for the trip.")
     trip_title: str = Field(..., description="A catchy and descriptive title for the itinerary.")
     total_estimated_cost_usd: Optional[float] = Field(None, description="An optional overall estimated cost for the trip in USD.")
     daily_plans: List[DailyPlan] = Field(..., description="A list of daily plans that make up the itinerary.")
+    version: int = Field(0, ge=0, description="Incremented on every stored edit; used for optimistic concurrency control.")
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="Latitude of the destination, if known.")
+    longitude: Optional[float] = Field(None, ge=-180, le=180, description="Longitude of the destination, if known.")
+
+    @property
+    def coordinates(self) -> Optional[List[float]]:
+        """The destination's location as [longitude, latitude] (the GeoJSON/Mapbox order), or None if unknown."""
+        return _coordinates(self.latitude, self.longitude)
+
+    def copy_with_new_ids(self) -> "Itinerary":
+        """
+        Return a deep copy of this itinerary with a fresh itinerary ID and fresh activity IDs.
+
+        Used whenever one generated itinerary is handed out more than once (e.g. from a
+        cache), so that separately stored or edited copies never share identity.
+        """
+        clone = self.model_copy(deep=True)
+        clone.id = new_id()
+        clone.version = 0
+        for day in clone.daily_plans:
+            for activity in day.activities:
+                activity.id = new_id()
+        return clone
+
+    def apply_patch(self, operations: Sequence[ItineraryPatchOperation]) -> List[int]:
+        """
+        Apply a batch of patch operations, all or nothing.
+
+        Only the days an operation touches are copied and edited. Once every
+        operation has succeeded they are swapped into a new `daily_plans` list, so a
+        failing batch leaves the itinerary unchanged and the previous list (which a
+        storage adapter may still hold) is never modified. The version is not changed.
+
+        Args:
+            operations: The operations to apply, in order.
+
+        Returns:
+            The positions in `daily_plans` of the days that changed, in ascending order.
+
+        Raises:
+            ValueError: If an operation refers to a missing day or activity, or a
+                        reorder does not list exactly the day's activities.
+        """
+        position_by_day = {plan.day: position for position, plan in enumerate(self.daily_plans)}
+        position_by_activity = {
+            activity.id: position
+            for position, plan in enumerate(self.daily_plans)
+            for activity in plan.activities
+        }
+        edited: Dict[int, DailyPlan] = {}
+
+        def day_at(position: int) -> DailyPlan:
+            if position not in edited:
+                edited[position] = self.daily_plans[position].model_copy(deep=True)
+            return edited[position]
+
+        def position_of_day(day: int) -> int:
+            if day not in position_by_day:
+                raise ValueError(f"Day {day} not found in itinerary {self.id}")
+            return position_by_day[day]
+
+        def position_of_activity(activity_id: str) -> int:
+            if activity_id not in position_by_activity:
+                raise ValueError(f"Activity {activity_id} not found in itinerary {self.id}")
+            return position_by_activity[activity_id]
+
+        for operation in operations:
+            if isinstance(operation, ReorderActivities):
+                day_at(position_of_day(operation.day)).reorder_activities(
+                    operation.activity_order, keep_times=operation.keep_times
+                )
+            elif isinstance(operation, MoveActivity):
+                source = day_at(position_of_activity(operation.activity_id))
+                target_position = position_of_day(operation.to_day)
+                target = day_at(target_position)
+                index = next(i for i, a in enumerate(source.activities) if a.id == operation.activity_id)
+                activity = source.activities.pop(index)
+                if operation.position is None:
+                    target.activities.append(activity)
+                else:
+                    target.activities.insert(operation.position, activity)
+                position_by_activity[activity.id] = target_position
+            elif isinstance(operation, UpdateActivity):
+                plan = day_at(position_of_activity(operation.activity_id))
+                activity = next(a for a in plan.activities if a.id == operation.activity_id)
+                if operation.time is not None:
+                    activity.time = operation.time
+                if operation.estimated_cost_usd is not None:
+                    activity.estimated_cost_usd = operation.estimated_cost_usd
+
+        self.daily_plans = [edited.get(position, plan) for position, plan in enumerate(self.daily_plans)]
+        return sorted(edited)
+
+    def replace_day(self, daily_plan: DailyPlan) -> int:
+        """
+        Replace the day with the same day number by `daily_plan`.
+
+        Like `apply_patch`, this swaps in a new `daily_plans` list rather than editing
+        the current one. The version is not changed.
+
+        Returns:
+            The position in `daily_plans` of the replaced day.
+
+        Raises:
+            ValueError: If the itinerary has no day with that number.
+        """
+        for position, plan in enumerate(self.daily_plans):
+            if plan.day == daily_plan.day:
+                self.daily_plans = [*self.daily_plans[:position], daily_plan, *self.daily_plans[position + 1:]]
+                return position
+        raise ValueError(f"Day {daily_plan.day} not found in itinerary {self.id}")
+
+class GenerationStrategy(str, Enum):
+    """
+    How an itinerary should be generated by the LLM.
+
+    - SINGLE_SHOT: the whole itinerary in one completion.
+    - PER_DAY: a cheap trip skeleton first, then every day generated concurrently.
+    - AUTO: let the LLM adapter choose based on the trip length.
+    """
+    AUTO = "auto"
+    SINGLE_SHOT = "single_shot"
+    PER_DAY = "per_day"
 
 class ItineraryRequest(BaseModel):
     """
@@ -66,3 +266,30 @@ class ItineraryRequest(BaseModel):
     duration_days: int = Field(..., gt=0)
     travel_style: str
     budget: str # e.g., "Budget-friendly", "Mid-range", "Luxury"
+    strategy: GenerationStrategy = GenerationStrategy.AUTO
+
+    def normalized(self) -> "ItineraryRequest":
+        """
+        Return a copy with free-text fields trimmed, whitespace-collapsed and case-folded.
+
+        Two requests that differ only in spacing or capitalisation normalize to the same value.
+        """
+        def _normalize(value: str) -> str:
+            return " ".join(value.split()).casefold()
+
+        return self.model_copy(update={
+            "destination": _normalize(self.destination),
+            "travel_style": _normalize(self.travel_style),
+            "budget": _normalize(self.budget),
+        })
+
+    def fingerprint(self, *context: str) -> str:
+        """
+        Return a stable SHA-256 hex digest of the normalized request.
+
+        Args:
+            context: Extra values that must also match for two requests to be
+                     considered identical (e.g. prompt template version, model name).
+        """
+        payload = "\x1f".join([self.normalized().model_dump_json(), *context])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
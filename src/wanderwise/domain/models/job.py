@@ -0,0 +1,42 @@
+# src/wanderwise/domain/models/job.py
+
+import time
+import uuid
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field, HttpUrl
+
+from .itinerary import ItineraryRequest
+
+# Background generation jobs. A job wraps an ItineraryRequest while it waits in the
+# queue and while it is generated, and records where the finished itinerary was stored.
+
+
+class JobStatus(str, Enum):
+    """
+    The lifecycle of a generation job: QUEUED -> RUNNING -> DONE or FAILED.
+    """
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class GenerationJob(BaseModel):
+    """
+    An itinerary generation that runs in the background.
+    """
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="A unique identifier for the job.")
+    request: ItineraryRequest = Field(..., description="The itinerary request being generated.")
+    status: JobStatus = Field(JobStatus.QUEUED, description="The current state of the job.")
+    callback_url: Optional[HttpUrl] = Field(None, description="A URL notified with the job when it finishes.")
+    itinerary_id: Optional[str] = Field(None, description="The ID of the stored itinerary once the job is done.")
+    error: Optional[str] = Field(None, description="Why the job failed, if it did.")
+    created_at: float = Field(default_factory=time.time, description="When the job was submitted (UNIX time).")
+    started_at: Optional[float] = Field(None, description="When generation started (UNIX time).")
+    finished_at: Optional[float] = Field(None, description="When the job finished (UNIX time).")
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.DONE, JobStatus.FAILED)
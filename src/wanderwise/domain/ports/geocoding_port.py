@@ -0,0 +1,80 @@
+# src/wanderwise/domain/ports/geocoding_port.py
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+from ..models.itinerary import DailyPlan, Itinerary
+
+# A (latitude, longitude) pair in degrees.
+LatLon = Tuple[float, float]
+
+
+class GeocodingPort(ABC):
+    """
+    Interface for resolving the coordinates of destinations and of the places activities visit.
+    """
+
+    @abstractmethod
+    def locate_destination(self, destination: str) -> Optional[LatLon]:
+        """
+        Find the coordinates of a trip destination.
+
+        Args:
+            destination: The destination as the user or the LLM wrote it, e.g. "Paris, France".
+
+        Returns:
+            The (latitude, longitude) of the destination, or None if it is unknown.
+        """
+        pass
+
+    @abstractmethod
+    def locate_activity(self, description: str, destination: str) -> Optional[LatLon]:
+        """
+        Find the coordinates of the place an activity visits.
+
+        Args:
+            description: The activity description, e.g. "Sunrise visit to the Eiffel Tower".
+            destination: The trip destination, to tell apart places with the same name.
+
+        Returns:
+            The (latitude, longitude) of the first known place the description mentions, or None.
+        """
+        pass
+
+    def annotate_day(self, daily_plan: DailyPlan, destination: str) -> int:
+        """
+        Fill in the coordinates of the activities of a day that have none.
+
+        Returns:
+            The number of activities located.
+        """
+        located = 0
+        for activity in daily_plan.activities:
+            if activity.latitude is not None:
+                continue
+            coordinates = self.locate_activity(activity.description, destination)
+            if coordinates is not None:
+                activity.latitude, activity.longitude = coordinates
+                located += 1
+        return located
+
+    def annotate(self, itinerary: Itinerary) -> int:
+        """
+        Fill in the coordinates of an itinerary's destination and activities that have none.
+
+        Returns:
+            The number of activities located.
+        """
+        if itinerary.latitude is None:
+            coordinates = self.locate_destination(itinerary.destination)
+            if coordinates is not None:
+                itinerary.latitude, itinerary.longitude = coordinates
+        return sum(self.annotate_day(daily_plan, itinerary.destination) for daily_plan in itinerary.daily_plans)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return runtime statistics (index size, lookups, hit rate, ...) for monitoring.
+
+        The default implementation reports nothing.
+        """
+        return {}
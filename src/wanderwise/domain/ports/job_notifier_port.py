@@ -0,0 +1,32 @@
+# src/wanderwise/domain/ports/job_notifier_port.py
+
+from abc import ABC, abstractmethod
+
+from ..models.job import GenerationJob
+
+
+class JobNotifierPort(ABC):
+    """
+    Interface for telling an external system that a background generation job has finished.
+    """
+
+    @abstractmethod
+    async def notify(self, job: GenerationJob) -> bool:
+        """
+        Deliver a notification about a finished job to its `callback_url`.
+
+        Args:
+            job: The finished GenerationJob.
+
+        Returns:
+            True if the notification was delivered, False otherwise.
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """
+        Release any resources held by the notifier, such as open connections.
+
+        The default implementation does nothing.
+        """
+        return None
@@ -1,9 +1,27 @@
 # src/wanderwise/domain/ports/llm_port.py
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Any, AsyncIterator, Dict
 
-from ..models.itinerary import Itinerary, ItineraryRequest
+from ..models.itinerary import DailyPlan, GenerationStrategy, Itinerary, ItineraryRequest
+
+
+class LLMUnavailableError(Exception):
+    """
+    Raised when the LLM cannot take a request right now and the caller should retry later.
+
+    Unlike an ordinary generation failure (which ports report by returning None),
+    this signals overload: the port's admission queue is full, the request could not
+    be admitted in time, or the provider itself rate limited the call. Callers should
+    surface it as "try again later" (HTTP 503 with a Retry-After header).
+
+    Attributes:
+        retry_after: Suggested number of seconds to wait before retrying.
+    """
+
+    def __init__(self, message: str = "The LLM is temporarily unavailable.", retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class LLMPort(ABC):
@@ -36,6 +54,9 @@ class LLMPort(ABC):
             An Itinerary object if the generation is successful and the response can be
             parsed correctly. Returns None if the generation fails or the response is
             invalid.
+
+        Raises:
+            LLMUnavailableError: If the LLM is overloaded and the request should be retried later.
         """
         raise NotImplementedError
 
@@ -70,3 +91,94 @@ class LLMPort(ABC):
             A dictionary representing the JSON schema of the Itinerary model.
         """
         raise NotImplementedError
+
+    async def stream_itinerary(
+        self, request: ItineraryRequest
+    ) -> AsyncIterator[DailyPlan | Itinerary]:
+        """
+        Generates an itinerary incrementally, yielding each day as soon as it is ready.
+
+        Implementations yield every DailyPlan as it is produced and finish by yielding
+        the complete Itinerary, whose `daily_plans` are the same objects that were
+        yielded before. If generation fails the iterator simply ends without an
+        Itinerary; if the LLM is overloaded it raises LLMUnavailableError instead. The
+        default implementation generates the whole itinerary first and then replays it,
+        so every port supports streaming even without native support.
+
+        Args:
+            request: An ItineraryRequest object containing the user's travel preferences.
+
+        Yields:
+            DailyPlan objects in day order, then the final Itinerary.
+        """
+        itinerary = await self.generate_itinerary(request)
+        if itinerary is None:
+            return
+        for daily_plan in itinerary.daily_plans:
+            yield daily_plan
+        yield itinerary
+
+    async def regenerate_day(
+        self, request: ItineraryRequest, itinerary: Itinerary, day_number: int
+    ) -> DailyPlan | None:
+        """
+        Generates a replacement for one day of an existing itinerary.
+
+        Only the new day is generated; adapters send the other days' themes as
+        context so the new plan fits the trip without repeating it. The default
+        implementation generates a one-day itinerary for the request and renumbers
+        its day, so every port supports regeneration even without a dedicated prompt.
+
+        Args:
+            request: The user's travel preferences (destination, style and budget).
+            itinerary: The itinerary the day belongs to.
+            day_number: The number of the day to replace.
+
+        Returns:
+            The new DailyPlan, numbered `day_number`, or None if generation fails.
+
+        Raises:
+            LLMUnavailableError: If the LLM is overloaded and the request should be retried later.
+        """
+        one_day = request.model_copy(update={"duration_days": 1, "strategy": GenerationStrategy.SINGLE_SHOT})
+        generated = await self.generate_itinerary(one_day)
+        if generated is None or not generated.daily_plans:
+            return None
+        daily_plan = generated.daily_plans[0]
+        daily_plan.day = day_number
+        return daily_plan
+
+    def request_key(self, request: ItineraryRequest) -> str:
+        """
+        Returns a content address identifying what this port would generate for a request.
+
+        Two requests with the same key are expected to produce equivalent itineraries,
+        which lets caching and request-coalescing layers share a single generation.
+        Adapters should include anything that changes the output, such as the model
+        name and prompt template version; decorators forward to the port they wrap.
+
+        Args:
+            request: An ItineraryRequest object.
+
+        Returns:
+            A stable hex digest string.
+        """
+        return request.fingerprint(type(self).__name__)
+
+    async def aclose(self) -> None:
+        """
+        Releases any resources held by the port, such as pooled HTTP connections.
+
+        This is called once from the application lifespan on shutdown. The default
+        implementation does nothing; adapters that own network clients override it.
+        """
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns runtime statistics about the port (e.g. cache hit rates) for monitoring.
+
+        Decorating ports merge their own figures with those of the port they wrap.
+        The default implementation reports nothing.
+        """
+        return {}
@@ -1,9 +1,75 @@
 # src/wanderwise/domain/ports/storage_port.py
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Any, AsyncIterator, Dict, NamedTuple, Optional, List, Sequence
+from pydantic import BaseModel, Field
 from ...domain.models.itinerary import Itinerary
 
+class ItineraryFilter(BaseModel):
+    """
+    Criteria for selecting stored itineraries in a scan. Unset fields match everything.
+    """
+    destination: Optional[str] = Field(None, description="Destination to match (case-insensitive).")
+    created_after: Optional[float] = Field(None, description="Only itineraries first saved at or after this UNIX time.")
+    created_before: Optional[float] = Field(None, description="Only itineraries first saved before this UNIX time.")
+
+    def matches(self, itinerary: Itinerary, created_at: float) -> bool:
+        """Returns True if an itinerary first saved at `created_at` satisfies the filter."""
+        return self.accepts(itinerary.destination, created_at)
+
+    def accepts(self, destination: str, created_at: float) -> bool:
+        """Like `matches`, for a storage adapter that has the fields but no Itinerary object."""
+        if self.destination is not None and destination.casefold() != self.destination.casefold():
+            return False
+        if self.created_after is not None and created_at < self.created_after:
+            return False
+        if self.created_before is not None and created_at >= self.created_before:
+            return False
+        return True
+
+class ItineraryCosts(NamedTuple):
+    """
+    The cost-related fields of a stored itinerary, as plain columns for bulk analytics.
+
+    The three activity sequences are parallel: one entry per activity, in order.
+    """
+    itinerary_id: str
+    destination: str
+    stated_total_usd: Optional[float]
+    day_count: int
+    activity_days: Sequence[int]  # Position of the activity's day in `daily_plans`.
+    activity_times: Sequence[str]
+    activity_costs: Sequence[Optional[float]]  # None (or NaN) if the activity has no estimate.
+
+    @classmethod
+    def of(cls, itinerary: Itinerary) -> "ItineraryCosts":
+        """Extracts the cost-related fields of an itinerary."""
+        plans = itinerary.daily_plans
+        activities = [activity for plan in plans for activity in plan.activities]
+        days = [position for position, plan in enumerate(plans) for _ in plan.activities]
+        times = [activity.time for activity in activities]
+        costs = [activity.estimated_cost_usd for activity in activities]
+        return cls(
+            itinerary.id, itinerary.destination, itinerary.total_estimated_cost_usd,
+            len(itinerary.daily_plans), days, times, costs,
+        )
+
+class VersionConflictError(Exception):
+    """
+    Raised by a compare-and-swap save when the stored itinerary is no longer at the expected version.
+
+    Attributes:
+        itinerary_id: The ID of the itinerary that was being saved.
+        current_version: The version currently stored, or None if the itinerary no longer exists.
+    """
+
+    def __init__(self, itinerary_id: str, current_version: Optional[int]):
+        super().__init__(
+            f"Itinerary {itinerary_id} is at version {current_version}, not the expected version"
+        )
+        self.itinerary_id = itinerary_id
+        self.current_version = current_version
+
 class StoragePort(ABC):
     """
     Interface for storage operations related to itineraries.
@@ -51,3 +117,186 @@ class StoragePort(ABC):
             True if the deletion was successful, False otherwise.
         """
         pass
+
+    async def get_version(self, itinerary_id: str) -> Optional[int]:
+        """
+        Return the stored version of an itinerary, e.g. to validate a cached rendering.
+
+        The default implementation reads the whole itinerary; adapters should
+        override it with a cheaper lookup.
+
+        Args:
+            itinerary_id: The ID of the itinerary.
+
+        Returns:
+            The itinerary's version, or None if it is not stored.
+        """
+        itinerary = await self.get_itinerary(itinerary_id)
+        return itinerary.version if itinerary is not None else None
+
+    async def save_daily_plans(self, itinerary: Itinerary, positions: Sequence[int]) -> bool:
+        """
+        Persist an edit that changed only some days of an already stored itinerary.
+
+        The default implementation saves the whole itinerary; adapters that store
+        days separately should override it to write only the given days.
+
+        Args:
+            itinerary: The edited Itinerary object.
+            positions: Positions in `itinerary.daily_plans` of the days that changed.
+
+        Returns:
+            True if the save was successful, False otherwise.
+        """
+        return await self.save_itinerary(itinerary)
+
+    async def compare_and_swap(
+        self,
+        itinerary: Itinerary,
+        expected_version: int,
+        positions: Optional[Sequence[int]] = None,
+    ) -> bool:
+        """
+        Save an itinerary only if the stored copy is still at `expected_version`.
+
+        The caller sets `itinerary.version` (normally to `expected_version + 1`).
+        The default implementation reads the stored version and then saves, which
+        is not atomic; adapters should override it with a real compare-and-swap.
+
+        Args:
+            itinerary: The edited Itinerary object.
+            expected_version: The version the stored itinerary must have.
+            positions: If given, only these days changed (see `save_daily_plans`).
+
+        Returns:
+            True if the save was successful, False otherwise.
+
+        Raises:
+            VersionConflictError: If the stored version differs or the itinerary no longer exists.
+        """
+        current = await self.get_itinerary(itinerary.id)
+        if current is None or current.version != expected_version:
+            raise VersionConflictError(itinerary.id, current.version if current is not None else None)
+        if positions is None:
+            return await self.save_itinerary(itinerary)
+        return await self.save_daily_plans(itinerary, positions)
+
+    async def get_many(self, itinerary_ids: Sequence[str]) -> Dict[str, Itinerary]:
+        """
+        Retrieve several itineraries at once.
+
+        The default implementation calls `get_itinerary` for each ID; adapters
+        should override it with a batched lookup.
+
+        Args:
+            itinerary_ids: The IDs of the itineraries to retrieve.
+
+        Returns:
+            A mapping of ID to Itinerary for the IDs that were found.
+        """
+        found: Dict[str, Itinerary] = {}
+        for itinerary_id in itinerary_ids:
+            itinerary = await self.get_itinerary(itinerary_id)
+            if itinerary is not None:
+                found[itinerary_id] = itinerary
+        return found
+
+    async def save_many(self, itineraries: Sequence[Itinerary]) -> int:
+        """
+        Save several itineraries at once.
+
+        The default implementation calls `save_itinerary` for each itinerary;
+        adapters should override it with a batched write.
+
+        Args:
+            itineraries: The Itinerary objects to save.
+
+        Returns:
+            The number of itineraries saved successfully.
+        """
+        saved = 0
+        for itinerary in itineraries:
+            if await self.save_itinerary(itinerary):
+                saved += 1
+        return saved
+
+    async def delete_many(self, itinerary_ids: Sequence[str]) -> int:
+        """
+        Delete several itineraries at once.
+
+        The default implementation calls `delete_itinerary` for each ID;
+        adapters should override it with a batched delete.
+
+        Args:
+            itinerary_ids: The IDs of the itineraries to delete.
+
+        Returns:
+            The number of itineraries that existed and were deleted.
+        """
+        deleted = 0
+        for itinerary_id in itinerary_ids:
+            if await self.delete_itinerary(itinerary_id):
+                deleted += 1
+        return deleted
+
+    async def scan(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filter: Optional[ItineraryFilter] = None,
+    ) -> AsyncIterator[List[Itinerary]]:
+        """
+        Iterate over stored itineraries in pages, ordered by ID.
+
+        Only one page is held in memory at a time, so a batch job over the whole
+        store needs one round trip per page. To resume an interrupted scan, pass
+        the ID of the last itinerary processed as `cursor`.
+
+        Args:
+            cursor: Start after this itinerary ID (exclusive), or from the beginning if None.
+            limit: Maximum number of itineraries per page.
+            filter: Optional criteria the returned itineraries must match.
+
+        Yields:
+            Non-empty lists of at most `limit` itineraries.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support scanning")
+        yield []  # pragma: no cover - makes this an async generator
+
+    async def scan_costs(
+        self,
+        limit: int = 500,
+        filter: Optional[ItineraryFilter] = None,
+    ) -> AsyncIterator[List[ItineraryCosts]]:
+        """
+        Iterate over the cost-related fields of stored itineraries in pages, for reports.
+
+        The default implementation extracts them from `scan`; adapters should
+        override it to read the fields without building Itinerary objects.
+
+        Args:
+            limit: Maximum number of itineraries per page.
+            filter: Optional criteria the itineraries must match.
+
+        Yields:
+            Non-empty lists of at most `limit` ItineraryCosts, in no particular order.
+        """
+        async for page in self.scan(limit=limit, filter=filter):
+            yield [ItineraryCosts.of(itinerary) for itinerary in page]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return runtime statistics (size, evictions, hit rate, ...) for monitoring.
+
+        The default implementation reports nothing.
+        """
+        return {}
+
+    async def aclose(self) -> None:
+        """
+        Release any resources held by the storage, such as open connections.
+
+        Called once from the application lifespan on shutdown. The default
+        implementation does nothing.
+        """
+        return None
@@ -1,7 +1,9 @@
 # src/wanderwise/main.py
 
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
 from fastapi import FastAPI, Request
 from slowapi.middleware import SlowAPIMiddleware
@@ -10,18 +12,74 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
 from starlette.exceptions import HTTPException
 
 from .config import get_settings
-from .presentation.routers import itinerary_router
+from .presentation.dependencies import (
+    get_cache_warmer,
+    get_cost_analytics,
+    get_fragment_cache,
+    get_geocoder,
+    get_job_queue,
+    get_llm_port,
+    get_request_canonicalizer,
+    get_storage_port,
+)
+from .presentation.routers import itinerary_api_router, itinerary_router, job_router, stats_router
+from .presentation.templating import precompile_templates, templates
 from .infrastructure.logging import configure_logging
 
 # Configure logging for the application
 configure_logging()
 log = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Manages per-worker resources for the lifetime of the application.
+
+    The LLM port (and its pooled HTTP client) and the shared itinerary storage are
+    created once on startup so every request reuses them, and they are closed on
+    shutdown so no sockets or file handles are leaked. The background job workers
+    are started here too, and stopped before the ports they use are closed, as is
+    the cache warmer when it is enabled. Templates are compiled up front so the
+    first request for each page does not pay for it.
+    """
+    precompile_templates()
+    llm_port = get_llm_port()
+    storage_port = get_storage_port()
+    job_queue = get_job_queue()
+    job_queue.start()
+    cache_warmer = get_cache_warmer()
+    if cache_warmer is not None:
+        cache_warmer.start()
+    log.info(
+        f"Application startup: {type(llm_port).__name__} and "
+        f"{type(storage_port).__name__} ready"
+    )
+    try:
+        yield
+    finally:
+        if cache_warmer is not None:
+            await cache_warmer.stop()
+        await job_queue.stop()
+        if job_queue.notifier is not None:
+            await job_queue.notifier.aclose()
+        await llm_port.aclose()
+        await storage_port.aclose()
+        get_cache_warmer.cache_clear()
+        get_cost_analytics.cache_clear()
+        get_fragment_cache.cache_clear()
+        get_geocoder.cache_clear()
+        get_job_queue.cache_clear()
+        get_llm_port.cache_clear()
+        get_request_canonicalizer.cache_clear()
+        get_storage_port.cache_clear()
+        log.info("Application shutdown: cache warmer, job queue, LLM port and storage closed")
+
+
 # Create the FastAPI application
 settings = get_settings()
 app = FastAPI(
@@ -32,6 +90,7 @@ app = FastAPI(
     openapi_url="/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Rate limiting configuration
@@ -56,17 +115,15 @@ app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 # Include routers
 app.include_router(itinerary_router.router)
+app.include_router(itinerary_api_router.router)
+app.include_router(job_router.router)
+app.include_router(stats_router.router)
 
 # Apply rate limiting to all routes (default limits already set)
 # No per‑route decorator needed unless you want custom limits.
 # The limiter will automatically enforce the default limit.
 
 
-# Setup templates
-templates_dir = Path(__file__).parent / "presentation" / "templates"
-templates = Jinja2Templates(directory=templates_dir)
-
-
 # Error handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException) -> HTMLResponse:
@@ -1,55 +1,223 @@
 # src/wanderwise/presentation/dependencies.py
 
+import os
 from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 from fastapi import Depends
 
-from ..config import get_settings, Settings
+from ..config import LLMBackendSettings, Settings, get_settings
+from ..adapters.gateways.cache_warmer import CacheWarmer
+from ..adapters.gateways.cached_llm_gateway import CachedLLMGateway
+from ..adapters.gateways.coalescing_llm_gateway import CoalescingLLMGateway
+from ..adapters.gateways.fake_llm_gateway import FakeLLMGateway
 from ..adapters.gateways.openai_gateway import OpenAIGateway
+from ..adapters.gateways.routing_llm_gateway import LLMBackend, RoutingLLMGateway
+from ..adapters.geocoding.gazetteer_geocoder import GazetteerGeocoder
+from ..adapters.notifiers.webhook_notifier import WebhookNotifier
 from ..adapters.storage.in_memory_storage import InMemoryStorage
+from ..adapters.storage.sqlite_storage import SQLiteStorage
 from ..application.use_cases.generate_itinerary import GenerateItineraryUseCase
+from ..application.use_cases.regenerate_day import RegenerateDayUseCase
+from ..application.services.cost_analytics import CostAnalytics
+from ..application.services.generation_job_queue import GenerationJobQueue
 from ..application.services.itinerary_service import ItineraryService
+from ..application.services.request_canonicalizer import RequestCanonicalizer
+from ..domain.models.itinerary import ItineraryRequest
+from ..domain.ports.geocoding_port import GeocodingPort
 from ..domain.ports.llm_port import LLMPort
 from ..domain.ports.storage_port import StoragePort
+from .templating import FragmentCache
 
 # This module is responsible for dependency injection. It decouples the web framework
 # (FastAPI) from the application's core logic by providing functions that instantiate
 # and return the necessary services and use cases.
 
+def _build_backend_port(settings: Settings, backend: Optional[LLMBackendSettings] = None) -> LLMPort:
+    """Builds the gateway for one LLM backend (the global settings when `backend` is None)."""
+    provider = backend.provider if backend is not None else settings.LLM_PROVIDER
+    if provider == "fake":
+        return FakeLLMGateway(
+            latency_median_seconds=settings.FAKE_LLM_LATENCY_MEDIAN_SECONDS,
+            latency_sigma=settings.FAKE_LLM_LATENCY_SIGMA,
+            failure_rate=settings.FAKE_LLM_FAILURE_RATE,
+            activities_per_day=settings.FAKE_LLM_ACTIVITIES_PER_DAY,
+            seed=settings.FAKE_LLM_SEED,
+        )
+    if backend is None:
+        return OpenAIGateway(settings=settings)
+    return OpenAIGateway(
+        settings=settings,
+        model=backend.model,
+        base_url=backend.base_url,
+        api_key=_backend_api_key(backend),
+    )
+
+
+def _backend_api_key(backend: LLMBackendSettings) -> Optional[str]:
+    """
+    Reads a backend's own API key, or returns None to use OPENAI_API_KEY.
+
+    The global key is only used for backends that also use the global base URL,
+    so the OpenAI secret is never sent to another host.
+
+    Raises:
+        ValueError: If the backend has its own base URL but no `api_key_env`, or
+            if the variable named by `api_key_env` is not set.
+    """
+    if backend.api_key_env is None:
+        if backend.base_url is not None:
+            raise ValueError(
+                f"LLM backend {backend.name!r} has its own base_url, so it needs its own api_key_env"
+            )
+        return None
+    api_key = os.environ.get(backend.api_key_env)
+    if not api_key:
+        raise ValueError(
+            f"LLM backend {backend.name!r}: environment variable {backend.api_key_env} is not set"
+        )
+    return api_key
+
+
 @lru_cache(maxsize=1)
-def get_llm_port(settings: Settings = get_settings()):
+def get_llm_port() -> LLMPort:
     """
     Dependency provider for the LLM port.
 
     This function instantiates and returns a concrete implementation of the LLMPort.
     The @lru_cache decorator ensures that the OpenAIGateway is only created once
-    per application lifecycle, making it an efficient singleton.
-
-    Args:
-        settings: The application settings, injected automatically.
+    per worker process, so every request shares the same pooled HTTP client.
+    The application lifespan calls this on startup and closes the port on shutdown.
+    When enabled in the settings, the gateway is wrapped so that identical concurrent
+    requests share one LLM call, and behind a response cache. With LLM_PROVIDER set to
+    "fake", a local FakeLLMGateway stands in for OpenAI (offline development and load tests).
+    With LLM_BACKENDS set, a RoutingLLMGateway spreads requests over those backends.
 
     Returns:
         An instance of a class that implements the LLMPort interface.
     """
-    return OpenAIGateway(settings=settings)
+    settings = get_settings()
+    llm_port: LLMPort
+    if settings.LLM_BACKENDS:
+        llm_port = RoutingLLMGateway(
+            [
+                LLMBackend(
+                    name=backend.name,
+                    port=_build_backend_port(settings, backend),
+                    max_days=backend.max_days,
+                    cost=backend.cost,
+                )
+                for backend in settings.LLM_BACKENDS
+            ],
+            ewma_alpha=settings.LLM_ROUTER_EWMA_ALPHA,
+        )
+    else:
+        llm_port = _build_backend_port(settings)
+    if settings.LLM_COALESCE_ENABLED:
+        llm_port = CoalescingLLMGateway(llm_port)
+    if settings.LLM_CACHE_ENABLED:
+        llm_port = CachedLLMGateway(
+            llm_port,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+            refresh_ahead_seconds=settings.LLM_CACHE_REFRESH_AHEAD_SECONDS,
+        )
+    return llm_port
+
+
+@lru_cache(maxsize=1)
+def get_cache_warmer() -> Optional[CacheWarmer]:
+    """
+    Dependency provider for the cache warmer.
+
+    One warmer exists per worker process, warming that process's response cache.
+    It is started and stopped by the application lifespan.
+
+    Returns:
+        The CacheWarmer, or None if warming or the response cache is disabled.
+    """
+    settings = get_settings()
+    llm_port = get_llm_port()
+    if not settings.CACHE_WARM_ENABLED or not isinstance(llm_port, CachedLLMGateway):
+        return None
+    off_peak = None
+    if settings.CACHE_WARM_OFF_PEAK_START_HOUR is not None and settings.CACHE_WARM_OFF_PEAK_END_HOUR is not None:
+        off_peak = (settings.CACHE_WARM_OFF_PEAK_START_HOUR, settings.CACHE_WARM_OFF_PEAK_END_HOUR)
+    requests = [ItineraryRequest(**warm.model_dump()) for warm in settings.CACHE_WARM_REQUESTS]
+    # User requests are canonicalized before they reach the cache, so the configured
+    # ones must be too, or their warm entries would never be hit.
+    canonicalizer = get_request_canonicalizer()
+    if canonicalizer is not None:
+        requests = [canonicalizer.canonicalize(request) for request in requests]
+    return CacheWarmer(
+        llm_port,
+        requests=requests,
+        popular_count=settings.CACHE_WARM_POPULAR_COUNT,
+        interval_seconds=settings.CACHE_WARM_INTERVAL_SECONDS,
+        max_per_minute=settings.CACHE_WARM_MAX_PER_MINUTE,
+        off_peak_hours=off_peak,
+    )
 
 
+@lru_cache(maxsize=1)
 def get_storage_port() -> StoragePort:
     """
     Dependency provider for the StoragePort.
-    
+
+    The storage is created once per worker process and shared by every request, so
+    an itinerary saved by one request can be found (and edited) by the next. The
+    application lifespan closes it on shutdown.
+
     Returns:
         An instance of a class that implements the StoragePort interface.
     """
-    # For now, we'll use the in-memory storage
-    # In a production environment, you would use a real database implementation
-    return InMemoryStorage()
+    settings = get_settings()
+    if settings.STORAGE_BACKEND == "sqlite":
+        return SQLiteStorage(
+            settings.SQLITE_PATH,
+            read_connections=settings.SQLITE_READ_CONNECTIONS,
+            max_batch=settings.SQLITE_MAX_WRITE_BATCH,
+        )
+    return InMemoryStorage(
+        max_items=settings.STORAGE_MAX_ITEMS,
+        max_bytes=settings.STORAGE_MAX_BYTES,
+        ttl_seconds=settings.STORAGE_TTL_SECONDS,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_fragment_cache() -> Optional[FragmentCache]:
+    """
+    Dependency provider for the cache of rendered itinerary fragments (one per worker process).
+
+    Returns:
+        The FragmentCache, or None if fragment caching is disabled.
+    """
+    settings = get_settings()
+    if not settings.FRAGMENT_CACHE_ENABLED:
+        return None
+    return FragmentCache(
+        max_entries=settings.FRAGMENT_CACHE_MAX_ENTRIES, max_bytes=settings.FRAGMENT_CACHE_MAX_BYTES
+    )
+
+
+@lru_cache(maxsize=1)
+def get_cost_analytics() -> CostAnalytics:
+    """
+    Dependency provider for the cost analytics, configured from the settings.
+    """
+    settings = get_settings()
+    return CostAnalytics(
+        tier_daily_limits_usd=settings.COST_TIER_DAILY_LIMITS_USD,
+        discrepancy_tolerance=settings.COST_DISCREPANCY_TOLERANCE,
+    )
 
 
 def get_itinerary_service(
     llm_port: LLMPort = Depends(get_llm_port),
-    storage_port: StoragePort = Depends(get_storage_port)
+    storage_port: StoragePort = Depends(get_storage_port),
+    cost_analytics: CostAnalytics = Depends(get_cost_analytics),
 ) -> ItineraryService:
     """
     Dependency provider for the ItineraryService.
@@ -57,15 +225,54 @@ def get_itinerary_service(
     Args:
         llm_port: The LLM port implementation.
         storage_port: The storage port implementation.
+        cost_analytics: The cost analytics.
         
     Returns:
         An instance of ItineraryService.
     """
-    return ItineraryService(llm_port=llm_port, storage_port=storage_port)
+    return ItineraryService(llm_port=llm_port, storage_port=storage_port, cost_analytics=cost_analytics)
+
+
+@lru_cache(maxsize=1)
+def get_request_canonicalizer() -> Optional[RequestCanonicalizer]:
+    """
+    Dependency provider for the request canonicalizer.
+
+    One canonicalizer (and its index of seen destinations) exists per worker process,
+    shared by interactive and background generations.
+
+    Returns:
+        The RequestCanonicalizer, or None when canonicalization is disabled.
+    """
+    settings = get_settings()
+    if not settings.REQUEST_CANONICALIZE_ENABLED:
+        return None
+    return RequestCanonicalizer(
+        aliases=settings.REQUEST_DESTINATION_ALIASES,
+        similarity_threshold=settings.REQUEST_SIMILARITY_THRESHOLD,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_geocoder() -> Optional[GeocodingPort]:
+    """
+    Dependency provider for the geocoder.
+
+    The gazetteer is loaded once per worker process.
+
+    Returns:
+        The GeocodingPort, or None when geocoding is disabled.
+    """
+    settings = get_settings()
+    if not settings.GEOCODING_ENABLED:
+        return None
+    return GazetteerGeocoder(path=Path(settings.GAZETTEER_PATH) if settings.GAZETTEER_PATH else None)
 
 
 def get_generate_itinerary_use_case(
-    llm_port: LLMPort = Depends(get_llm_port)
+    llm_port: LLMPort = Depends(get_llm_port),
+    canonicalizer: Optional[RequestCanonicalizer] = Depends(get_request_canonicalizer),
+    geocoder: Optional[GeocodingPort] = Depends(get_geocoder),
 ) -> GenerateItineraryUseCase:
     """
     Dependency provider for the GenerateItineraryUseCase.
@@ -75,8 +282,58 @@ def get_generate_itinerary_use_case(
 
     Args:
         llm_port: The LLM port implementation, injected by FastAPI.
+        canonicalizer: The request canonicalizer, if enabled.
+        geocoder: The geocoder, if enabled.
 
     Returns:
         An instance of the GenerateItineraryUseCase.
     """
-    return GenerateItineraryUseCase(llm_port=llm_port)
+    return GenerateItineraryUseCase(llm_port=llm_port, canonicalizer=canonicalizer, geocoder=geocoder)
+
+
+def get_regenerate_day_use_case(
+    llm_port: LLMPort = Depends(get_llm_port),
+    storage_port: StoragePort = Depends(get_storage_port),
+    geocoder: Optional[GeocodingPort] = Depends(get_geocoder),
+) -> RegenerateDayUseCase:
+    """
+    Dependency provider for the RegenerateDayUseCase.
+
+    Args:
+        llm_port: The LLM port implementation, injected by FastAPI.
+        storage_port: The storage port implementation, injected by FastAPI.
+        geocoder: The geocoder, if enabled.
+
+    Returns:
+        An instance of the RegenerateDayUseCase.
+    """
+    return RegenerateDayUseCase(llm_port=llm_port, storage_port=storage_port, geocoder=geocoder)
+
+
+@lru_cache(maxsize=1)
+def get_job_queue() -> GenerationJobQueue:
+    """
+    Dependency provider for the background generation job queue.
+
+    One queue (and its worker tasks) exists per worker process. It is started and
+    stopped by the application lifespan, and saves finished itineraries to the
+    shared storage port.
+
+    Returns:
+        The GenerationJobQueue for this process.
+    """
+    settings = get_settings()
+    return GenerationJobQueue(
+        use_case=GenerateItineraryUseCase(
+            llm_port=get_llm_port(), canonicalizer=get_request_canonicalizer(), geocoder=get_geocoder()
+        ),
+        storage_port=get_storage_port(),
+        notifier=WebhookNotifier(
+            timeout_seconds=settings.WEBHOOK_TIMEOUT_SECONDS,
+            attempts=settings.WEBHOOK_ATTEMPTS,
+            allowed_hosts=settings.WEBHOOK_ALLOWED_HOSTS,
+        ),
+        workers=settings.JOB_WORKERS,
+        max_queued=settings.JOB_QUEUE_MAX_SIZE,
+        max_retained=settings.JOB_RETENTION,
+    )
@@ -0,0 +1,200 @@
+# src/wanderwise/presentation/routers/itinerary_api_router.py
+
+import logging
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+from ...application.services.itinerary_service import ItineraryService
+from ...application.services.route_optimizer import route_length_km
+from ...domain.models.itinerary import ItineraryPatchOperation, ReorderActivities
+from ...domain.ports.storage_port import ItineraryFilter, VersionConflictError
+from ..dependencies import get_fragment_cache, get_itinerary_service
+from ..templating import FragmentCache
+
+# --- Router Setup ---
+log = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/itinerary", tags=["itinerary"])
+
+
+class ItineraryPatchRequest(BaseModel):
+    """
+    A batch of edits to one itinerary.
+
+    The legacy single-reorder body (`day_number` + `activity_order`) is still
+    accepted and is applied before any `operations`.
+    """
+    itinerary_id: str = Field(..., description="The ID of the itinerary to edit.")
+    version: Optional[int] = Field(
+        None, ge=0, description="The version the edit is based on; rejected with 409 if the itinerary has changed since."
+    )
+    day_number: Optional[int] = Field(None, gt=0, description="Legacy: the day whose activities are reordered.")
+    activity_order: Optional[List[str]] = Field(None, description="Legacy: the day's activity IDs in the new order.")
+    operations: List[ItineraryPatchOperation] = Field(default_factory=list, description="Patch operations, applied in order.")
+
+    def all_operations(self) -> List[ItineraryPatchOperation]:
+        operations: List[ItineraryPatchOperation] = []
+        if self.day_number is not None and self.activity_order is not None:
+            operations.append(ReorderActivities(day=self.day_number, activity_order=self.activity_order))
+        return operations + list(self.operations)
+
+
+class OptimizeRoutesRequest(BaseModel):
+    """
+    Reorders the activities of some or all days of an itinerary to shorten the walk between them.
+    """
+    itinerary_id: str = Field(..., description="The ID of the itinerary to optimize.")
+    version: Optional[int] = Field(
+        None, ge=0, description="The version the request is based on; rejected with 409 if the itinerary has changed since."
+    )
+    days: Optional[List[int]] = Field(None, description="The day numbers to optimize; every day if omitted.")
+    anchored: List[str] = Field(default_factory=list, description="IDs of activities that must keep their position.")
+
+
+@router.post("/reorder-activities")
+async def patch_itinerary(
+    body: ItineraryPatchRequest,
+    itinerary_service: ItineraryService = Depends(get_itinerary_service),
+    fragment_cache: Optional[FragmentCache] = Depends(get_fragment_cache),
+) -> JSONResponse:
+    """
+    Applies a batch of edits (reorder, move between days, update time or cost) in one request.
+
+    Called by drag-and-drop.js. The batch is applied all or nothing and only the
+    changed days are persisted. If `version` is given and another edit has been
+    saved since, nothing is applied and a 409 response carries the current version.
+    """
+    operations = body.all_operations()
+    if not operations:
+        return JSONResponse({"detail": "No operations given."}, status_code=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        itinerary = await itinerary_service.apply_patch(body.itinerary_id, operations, body.version)
+    except VersionConflictError as e:
+        log.info(f"Version conflict patching itinerary {body.itinerary_id}: {e}")
+        return JSONResponse(
+            {"detail": "The itinerary was changed by another edit.", "current_version": e.current_version},
+            status_code=status.HTTP_409_CONFLICT,
+        )
+    except ValueError as e:
+        log.warning(f"Rejected patch for itinerary {body.itinerary_id}: {e}")
+        return JSONResponse({"detail": str(e)}, status_code=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        log.error(f"Error patching itinerary {body.itinerary_id}: {e}", exc_info=True)
+        return JSONResponse(
+            {"detail": "Failed to update the itinerary."}, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    if itinerary is None:
+        return JSONResponse({"detail": "Itinerary not found."}, status_code=status.HTTP_404_NOT_FOUND)
+    if fragment_cache is not None:
+        fragment_cache.invalidate(itinerary.id)
+
+    return JSONResponse({
+        "itinerary_id": itinerary.id,
+        "version": itinerary.version,
+        "applied": len(operations),
+        "daily_plans": [
+            {"day": plan.day, "activity_order": [activity.id for activity in plan.activities]}
+            for plan in itinerary.daily_plans
+        ],
+    })
+
+
+@router.post("/optimize-routes")
+async def optimize_routes(
+    body: OptimizeRoutesRequest,
+    itinerary_service: ItineraryService = Depends(get_itinerary_service),
+    fragment_cache: Optional[FragmentCache] = Depends(get_fragment_cache),
+) -> JSONResponse:
+    """
+    Reorders the located activities of the requested days by walking distance, in one request.
+
+    Booked activities, activities listed in `anchored` and activities without
+    coordinates keep their position, as do activities with a clock time; others
+    move only within their part of the day, and no time is rewritten. The
+    response has the same shape as a patch response, plus each day's route length.
+    """
+    try:
+        itinerary = await itinerary_service.optimize_routes(
+            body.itinerary_id, body.days, body.anchored, body.version
+        )
+    except VersionConflictError as e:
+        log.info(f"Version conflict optimizing itinerary {body.itinerary_id}: {e}")
+        return JSONResponse(
+            {"detail": "The itinerary was changed by another edit.", "current_version": e.current_version},
+            status_code=status.HTTP_409_CONFLICT,
+        )
+    except Exception as e:
+        log.error(f"Error optimizing itinerary {body.itinerary_id}: {e}", exc_info=True)
+        return JSONResponse(
+            {"detail": "Failed to optimize the itinerary."}, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    if itinerary is None:
+        return JSONResponse({"detail": "Itinerary not found."}, status_code=status.HTTP_404_NOT_FOUND)
+    if fragment_cache is not None:
+        fragment_cache.invalidate(itinerary.id)
+
+    return JSONResponse({
+        "itinerary_id": itinerary.id,
+        "version": itinerary.version,
+        "daily_plans": [
+            {
+                "day": plan.day,
+                "activity_order": [activity.id for activity in plan.activities],
+                "route_km": round(route_length_km(plan.activities), 3),
+            }
+            for plan in itinerary.daily_plans
+        ],
+    })
+
+
+@router.get("/cost-report")
+async def get_cost_report(
+    destination: Optional[str] = Query(None, description="Only itineraries for this destination."),
+    created_after: Optional[float] = Query(None, description="Only itineraries first saved at or after this UNIX time."),
+    created_before: Optional[float] = Query(None, description="Only itineraries first saved before this UNIX time."),
+    itinerary_service: ItineraryService = Depends(get_itinerary_service),
+) -> JSONResponse:
+    """
+    Returns cost statistics over all stored itineraries, for dashboards.
+
+    Totals are recomputed from the activities' estimated costs. The report covers
+    the spread of trip and day totals, spend by part of the day, the budget tier
+    each trip fits, how often the LLM's stated total disagrees with its
+    activities, and the most common destinations.
+    """
+    filter = ItineraryFilter(destination=destination, created_after=created_after, created_before=created_before)
+    try:
+        report = await itinerary_service.cost_report(filter)
+    except NotImplementedError as e:
+        return JSONResponse({"detail": str(e)}, status_code=status.HTTP_501_NOT_IMPLEMENTED)
+    except Exception as e:
+        log.error(f"Error building the cost report: {e}", exc_info=True)
+        return JSONResponse(
+            {"detail": "Failed to build the cost report."}, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+    if report is None:
+        return JSONResponse({"detail": "No itinerary storage configured."}, status_code=status.HTTP_501_NOT_IMPLEMENTED)
+    return JSONResponse(report)
+
+
+@router.get("/{itinerary_id}/costs")
+async def get_itinerary_costs(
+    itinerary_id: str,
+    budget: Optional[str] = Query(None, description="Budget tier to check every day against, e.g. Mid-range."),
+    itinerary_service: ItineraryService = Depends(get_itinerary_service),
+) -> JSONResponse:
+    """
+    Returns the cost breakdown of one itinerary, computed from its activities.
+
+    Includes per-day totals, spend by part of the day, how far the LLM's stated
+    total is from the computed one and, with `budget`, the days over that tier's limit.
+    """
+    analysis = await itinerary_service.analyze_costs(itinerary_id, budget)
+    if analysis is None:
+        return JSONResponse({"detail": "Itinerary not found."}, status_code=status.HTTP_404_NOT_FOUND)
+    return JSONResponse(analysis)
@@ -1,31 +1,36 @@
 # src/wanderwise/presentation/routers/itinerary_router.py
 
+import json
 import logging
-from pathlib import Path
 
-from fastapi import APIRouter, Request, Depends, Form, HTTPException, status
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
-from typing import List, Optional
+from fastapi import APIRouter, Request, Depends, Form, HTTPException, Query, status
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from pydantic import ValidationError
+from typing import AsyncIterator, List, Optional
 
 from ...application.use_cases.generate_itinerary import GenerateItineraryUseCase
+from ...application.use_cases.regenerate_day import RegenerateDayUseCase
+from ...application.services.generation_job_queue import GenerationJobQueue
 from ...application.services.itinerary_service import ItineraryService
-from ...domain.models.itinerary import ItineraryRequest
+from ...domain.models.itinerary import DailyPlan, GenerationStrategy, Itinerary, ItineraryRequest
+from ...domain.ports.llm_port import LLMUnavailableError
+from ...domain.ports.storage_port import StoragePort, VersionConflictError
 from ...config import get_settings
 from ..dependencies import (
+    get_fragment_cache,
     get_generate_itinerary_use_case, 
+    get_job_queue,
     get_llm_port,
-    get_itinerary_service
+    get_itinerary_service,
+    get_regenerate_day_use_case,
+    get_storage_port,
 )
+from ..templating import FragmentCache, render_itinerary, templates
 
 # --- Router Setup ---
 log = logging.getLogger(__name__)
 router = APIRouter()
 
-# Setup for templates
-BASE_DIR = Path(__file__).resolve().parent.parent
-templates = Jinja2Templates(directory=BASE_DIR / "templates")
-
 
 # --- HTML Serving Endpoints ---
 
@@ -52,8 +57,13 @@ async def generate_itinerary(
     duration_days: int = Form(...),
     travel_style: str = Form(...),
     budget: str = Form(...),
+    strategy: GenerationStrategy = Form(GenerationStrategy.AUTO),
+    job: bool = Form(False),
+    callback_url: Optional[str] = Form(None),
     use_case: GenerateItineraryUseCase = Depends(get_generate_itinerary_use_case),
     itinerary_service: ItineraryService = Depends(get_itinerary_service),
+    job_queue: GenerationJobQueue = Depends(get_job_queue),
+    fragment_cache: Optional[FragmentCache] = Depends(get_fragment_cache),
 ):
     """
     Handles the form submission to generate a new itinerary.
@@ -61,6 +71,11 @@ async def generate_itinerary(
     This endpoint is called by HTMX from the frontend. It receives the form data,
     invokes the appropriate use case, and returns an HTML fragment containing
     either the generated itinerary or an error message.
+
+    In job mode (`job=true`, or a `Prefer: respond-async` header) the request is
+    queued instead and answered immediately with 202 Accepted and the job's status
+    URL; see `_submit_job`. When the LLM is overloaded the request fails fast with
+    503 and a Retry-After header instead of waiting in line.
     """
     log.info(f"Received itinerary request for destination: {destination}")
     try:
@@ -69,36 +84,35 @@ async def generate_itinerary(
             duration_days=duration_days,
             travel_style=travel_style,
             budget=budget,
+            strategy=strategy,
         )
 
+        if job or "respond-async" in request.headers.get("prefer", ""):
+            return _submit_job(request, itinerary_request, callback_url or None, job_queue)
+
         itinerary = await use_case.execute(itinerary_request)
 
         if not itinerary:
             log.error("Itinerary generation failed. Use case returned None.")
             return templates.TemplateResponse(
-                "partials/error.html",
-                {"request": request, "error": "Failed to generate itinerary. Please try again."},
+                "partials/error_display.html",
+                {"request": request, "error_message": "Failed to generate itinerary. Please try again."},
                 status_code=500,
             )
             
         log.info("Successfully generated itinerary. Rendering partial template.")
-        settings = get_settings()
         # Save the itinerary to our storage
         await itinerary_service.storage_port.save_itinerary(itinerary)
-        
-        # Add the itinerary ID to the context for client-side use
-        return templates.TemplateResponse(
-            "partials/itinerary_display.html",
-            {
-                "request": request,
-                "itinerary": itinerary,
-                "config": {
-                    "MAPBOX_ACCESS_TOKEN": get_settings().MAPBOX_ACCESS_TOKEN,
-                    "ITINERARY_ID": getattr(itinerary, 'id', 'current')
-                }
-            },
+
+        # Rendered through the fragment cache, so reopening the itinerary is served from it
+        return HTMLResponse(render_itinerary(itinerary, fragment_cache))
+
+    except LLMUnavailableError as e:
+        log.warning(f"LLM unavailable for {destination}; asking the client to retry after {e.retry_after}s")
+        return _unavailable_response(
+            request, "We are planning a lot of trips right now. Please try again in a moment.", e.retry_after
         )
-        
+
     except Exception as e:
         log.critical(f"An unexpected server error occurred: {e}", exc_info=True)
         # In case of an unexpected error, return a generic error message
@@ -108,3 +122,303 @@ async def generate_itinerary(
             {"request": request, "error_message": "An unexpected server error occurred. Please contact support."},
         )
 
+
+def _submit_job(
+    request: Request,
+    itinerary_request: ItineraryRequest,
+    callback_url: Optional[str],
+    job_queue: GenerationJobQueue,
+) -> Response:
+    """
+    Queues a background generation job and answers with 202 Accepted.
+
+    HTMX requests get a fragment that polls the job's status URL until the itinerary
+    is ready; other clients get JSON with the job ID and status URL (also sent in the
+    Location header). A full queue is answered with 503 and a Retry-After header.
+    """
+    is_htmx = request.headers.get("hx-request") == "true"
+    try:
+        generation_job = job_queue.submit(itinerary_request, callback_url)
+    except ValidationError:
+        return JSONResponse({"detail": "callback_url must be an http(s) URL."}, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+    if generation_job is None:
+        return _unavailable_response(
+            request, "We are planning a lot of trips right now. Please try again in a minute.", retry_after=30
+        )
+
+    status_url = str(request.url_for("get_job_status", job_id=generation_job.id))
+    headers = {"Location": status_url}
+    if is_htmx:
+        return templates.TemplateResponse(
+            "partials/job_status.html",
+            {"request": request, "job": generation_job, "status_url": status_url},
+            status_code=status.HTTP_202_ACCEPTED,
+            headers=headers,
+        )
+    return JSONResponse(
+        {"job_id": generation_job.id, "status": generation_job.status.value, "status_url": status_url},
+        status_code=status.HTTP_202_ACCEPTED,
+        headers=headers,
+    )
+
+
+def _unavailable_response(request: Request, message: str, retry_after: int) -> Response:
+    """Answers an overloaded request with 503 and a Retry-After header (an error fragment for HTMX)."""
+    headers = {"Retry-After": str(retry_after)}
+    if request.headers.get("hx-request") == "true":
+        # HTMX only swaps successful responses, so the error fragment is sent with 200.
+        return templates.TemplateResponse(
+            "partials/error_display.html", {"request": request, "error_message": message}, headers=headers
+        )
+    return JSONResponse({"detail": message}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE, headers=headers)
+
+
+@router.get("/itinerary/{itinerary_id}", response_class=HTMLResponse, response_model=None)
+async def get_itinerary_page(
+    request: Request,
+    itinerary_id: str,
+    storage_port: StoragePort = Depends(get_storage_port),
+    fragment_cache: Optional[FragmentCache] = Depends(get_fragment_cache),
+) -> Response:
+    """
+    Shows a stored itinerary: its fragment for HTMX, otherwise the index page with it filled in.
+
+    Only the itinerary's version is read first. The fragment of that version is
+    served from the fragment cache when it is there, so the itinerary is loaded
+    and rendered only on a miss. The ETag names the version, so a browser
+    revalidating an itinerary that has not changed gets 304 Not Modified.
+    """
+    is_htmx = request.headers.get("hx-request") == "true"
+    version = await storage_port.get_version(itinerary_id)
+    if version is not None:
+        headers = _itinerary_headers(itinerary_id, version, is_htmx)
+        if_none_match = [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]
+        if headers["ETag"] in if_none_match or "*" in if_none_match:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    html = fragment_cache.get(itinerary_id, version) if fragment_cache is not None and version is not None else None
+    if version is not None and html is None:
+        itinerary = await storage_port.get_itinerary(itinerary_id)
+        if itinerary is not None:
+            # Saved in between: serve (and label) the version that was read.
+            headers = _itinerary_headers(itinerary_id, itinerary.version, is_htmx)
+            html = render_itinerary(itinerary)
+            if fragment_cache is not None:
+                fragment_cache.put(itinerary_id, itinerary.version, html)
+    if html is None:
+        if is_htmx:
+            # HTMX only swaps successful responses, so the error fragment is sent with 200.
+            return templates.TemplateResponse(
+                "partials/error_display.html",
+                {"request": request, "error_message": "That itinerary no longer exists."},
+            )
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Itinerary not found.")
+
+    if is_htmx:
+        return HTMLResponse(html, headers=headers)
+    return templates.TemplateResponse(
+        "index.html",
+        {
+            "request": request,
+            "itinerary_html": html,
+            "config": {"MAPBOX_ACCESS_TOKEN": get_settings().MAPBOX_ACCESS_TOKEN, "ITINERARY_ID": itinerary_id},
+        },
+        headers=headers,
+    )
+
+
+def _itinerary_headers(itinerary_id: str, version: int, is_htmx: bool) -> dict:
+    """Caching headers of a stored itinerary: browsers revalidate it against an ETag naming its version."""
+    etag = f'W/"{itinerary_id}-{version}-{"fragment" if is_htmx else "page"}"'
+    return {"ETag": etag, "Cache-Control": "no-cache", "Vary": "HX-Request"}
+
+
+@router.post("/itinerary/{itinerary_id}/days/{day_number}/regenerate", response_class=HTMLResponse, response_model=None)
+async def regenerate_day(
+    request: Request,
+    itinerary_id: str,
+    day_number: int,
+    travel_style: str = Form("Any"),
+    budget: str = Form("Mid-range"),
+    version: Optional[int] = Form(None),
+    use_case: RegenerateDayUseCase = Depends(get_regenerate_day_use_case),
+    fragment_cache: Optional[FragmentCache] = Depends(get_fragment_cache),
+):
+    """
+    Regenerates one day of a stored itinerary and returns just that day's fragment.
+
+    Called by the "New plan for this day" button, which swaps the returned
+    `partials/day_plan.html` in place of the old day and sends the itinerary version
+    it shows. Only that day is generated, saved and rendered. Errors leave the old
+    day in place: HTMX gets the error fragment inserted above it, other clients a
+    JSON error with a matching status.
+    """
+    log.info(f"Received request to regenerate day {day_number} of itinerary {itinerary_id}")
+    try:
+        itinerary = await use_case.execute(itinerary_id, day_number, travel_style, budget, version)
+    except LLMUnavailableError as e:
+        return _day_error_response(
+            request,
+            f"We are planning a lot of trips right now. Please try again in {e.retry_after} seconds.",
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            {"Retry-After": str(e.retry_after)},
+        )
+    except VersionConflictError:
+        return _day_error_response(
+            request, "The itinerary was changed by another edit. Please reload it.", status.HTTP_409_CONFLICT
+        )
+    except ValueError as e:
+        log.warning(f"Rejected regeneration of day {day_number} of itinerary {itinerary_id}: {e}")
+        return _day_error_response(request, "That itinerary or day no longer exists.", status.HTTP_404_NOT_FOUND)
+
+    if itinerary is None:
+        return _day_error_response(
+            request, "Failed to plan a new day. Please try again.", status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+    if fragment_cache is not None:
+        fragment_cache.invalidate(itinerary_id)
+    day = next(plan for plan in itinerary.daily_plans if plan.day == day_number)
+    return _day_response(request, itinerary, day)
+
+
+@router.post("/itinerary/{itinerary_id}/days/{day_number}/optimize", response_class=HTMLResponse, response_model=None)
+async def optimize_day_route(
+    request: Request,
+    itinerary_id: str,
+    day_number: int,
+    version: Optional[int] = Form(None),
+    itinerary_service: ItineraryService = Depends(get_itinerary_service),
+    fragment_cache: Optional[FragmentCache] = Depends(get_fragment_cache),
+):
+    """
+    Reorders one day's activities to shorten the walk between them and returns that day's fragment.
+
+    Called by the "Shorten route" button, which sends the itinerary version it
+    shows. Booked activities and activities without coordinates stay where they
+    are, as do activities with a clock time. The response and errors are like a
+    day regeneration's.
+    """
+    log.info(f"Received request to optimize the route of day {day_number} of itinerary {itinerary_id}")
+    try:
+        itinerary = await itinerary_service.optimize_routes(itinerary_id, [day_number], expected_version=version)
+    except VersionConflictError:
+        return _day_error_response(
+            request, "The itinerary was changed by another edit. Please reload it.", status.HTTP_409_CONFLICT
+        )
+
+    day = next((plan for plan in itinerary.daily_plans if plan.day == day_number), None) if itinerary else None
+    if day is None:
+        return _day_error_response(request, "That itinerary or day no longer exists.", status.HTTP_404_NOT_FOUND)
+    if fragment_cache is not None:
+        fragment_cache.invalidate(itinerary_id)
+    return _day_response(request, itinerary, day)
+
+
+def _day_response(request: Request, itinerary: Itinerary, day: DailyPlan) -> Response:
+    """
+    Answers an edited day with its fragment.
+
+    Only the day is swapped, so the itinerary's new version is sent as an
+    `itineraryVersion` HX-Trigger event, which drag-and-drop.js stores on the page
+    for the next edit.
+    """
+    trigger = {"itineraryVersion": {"itineraryId": itinerary.id, "version": itinerary.version}}
+    return templates.TemplateResponse(
+        "partials/day_plan.html",
+        {"request": request, "day": day, "itinerary": itinerary},
+        headers={"HX-Trigger": json.dumps(trigger)},
+    )
+
+
+def _day_error_response(request: Request, message: str, status_code: int, headers: Optional[dict] = None) -> Response:
+    """Answers a failed day regeneration or route optimization without replacing the day (above it, for HTMX)."""
+    headers = dict(headers or {})
+    if request.headers.get("hx-request") == "true":
+        # HTMX only swaps successful responses; keep the day and show the error above it.
+        headers["HX-Reswap"] = "beforebegin"
+        return templates.TemplateResponse(
+            "partials/error_display.html", {"request": request, "error_message": message}, headers=headers
+        )
+    return JSONResponse({"detail": message}, status_code=status_code, headers=headers)
+
+
+def _sse_event(event: str, data: str) -> str:
+    """Formats one server-sent event, splitting multi-line data across `data:` fields."""
+    data_lines = "".join(f"data: {line}\n" for line in (data.splitlines() or [""]))
+    return f"event: {event}\n{data_lines}\n"
+
+
+@router.get("/generate-itinerary/stream")
+async def stream_itinerary(
+    request: Request,
+    destination: str = Query(...),
+    duration_days: int = Query(..., gt=0),
+    travel_style: str = Query(...),
+    budget: str = Query(...),
+    strategy: GenerationStrategy = Query(GenerationStrategy.AUTO),
+    use_case: GenerateItineraryUseCase = Depends(get_generate_itinerary_use_case),
+    itinerary_service: ItineraryService = Depends(get_itinerary_service),
+) -> StreamingResponse:
+    """
+    Generates an itinerary and streams it to the browser as server-sent events.
+
+    Events, in order:
+    - `start`: the itinerary shell (header and an empty list of days).
+    - `day`: one rendered day fragment, sent as soon as that day has been generated.
+    - `complete`: JSON with the saved itinerary's id and title, or
+    - `failed`: a rendered error fragment if generation did not succeed (including
+      when the LLM is overloaded, since the 200 response has already started).
+    """
+    log.info(f"Received streaming itinerary request for destination: {destination}")
+    itinerary_request = ItineraryRequest(
+        destination=destination,
+        duration_days=duration_days,
+        travel_style=travel_style,
+        budget=budget,
+        strategy=strategy,
+    )
+    day_template = templates.get_template("partials/day_plan.html")
+
+    async def event_stream() -> AsyncIterator[str]:
+        yield _sse_event(
+            "start",
+            templates.get_template("partials/itinerary_stream.html").render(
+                itinerary_request=itinerary_request
+            ),
+        )
+        itinerary: Optional[Itinerary] = None
+        error_message = "Failed to generate itinerary. Please try again."
+        try:
+            async for item in use_case.stream(itinerary_request):
+                if await request.is_disconnected():
+                    log.info("Client disconnected from itinerary stream.")
+                    return
+                if isinstance(item, Itinerary):
+                    itinerary = item
+                else:
+                    yield _sse_event("day", day_template.render(day=item))
+        except LLMUnavailableError as e:
+            error_message = f"We are planning a lot of trips right now. Please try again in {e.retry_after} seconds."
+
+        if itinerary is None:
+            log.error("Streaming itinerary generation failed.")
+            yield _sse_event(
+                "failed",
+                templates.get_template("partials/error_display.html").render(error_message=error_message),
+            )
+            return
+
+        await itinerary_service.storage_port.save_itinerary(itinerary)
+        yield _sse_event("complete", json.dumps({
+            "itinerary_id": itinerary.id,
+            "version": itinerary.version,
+            "trip_title": itinerary.trip_title,
+            "total_estimated_cost_usd": itinerary.total_estimated_cost_usd,
+        }))
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,62 @@
+# src/wanderwise/presentation/routers/job_router.py
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+
+from ...application.services.generation_job_queue import GenerationJobQueue
+from ...domain.models.job import JobStatus
+from ...domain.ports.storage_port import StoragePort
+from ..dependencies import get_fragment_cache, get_job_queue, get_storage_port
+from ..templating import FragmentCache, render_itinerary, templates
+
+# --- Router Setup ---
+log = logging.getLogger(__name__)
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("/{job_id}", name="get_job_status", response_model=None)
+async def get_job_status(
+    request: Request,
+    job_id: str,
+    job_queue: GenerationJobQueue = Depends(get_job_queue),
+    storage_port: StoragePort = Depends(get_storage_port),
+    fragment_cache: Optional[FragmentCache] = Depends(get_fragment_cache),
+) -> Response:
+    """
+    Reports the state of a background generation job (queued, running, done or failed).
+
+    HTMX polls this endpoint from the job status fragment: while the job is pending
+    the fragment is returned again (so polling continues), and once it has finished
+    it is replaced by the itinerary or an error message. Other clients get the job
+    as JSON, including the stored itinerary's ID when it is done.
+    """
+    job = job_queue.get(job_id)
+    if request.headers.get("hx-request") != "true":
+        if job is None:
+            return JSONResponse({"detail": "Job not found."}, status_code=status.HTTP_404_NOT_FOUND)
+        return JSONResponse(job.model_dump(mode="json", exclude={"callback_url"}))
+
+    # HTMX only swaps successful responses, so every outcome is rendered with 200.
+    if job is None:
+        return templates.TemplateResponse(
+            "partials/error_display.html",
+            {"request": request, "error_message": "We could not find this itinerary job. Please try again."},
+        )
+    if not job.finished:
+        return templates.TemplateResponse(
+            "partials/job_status.html",
+            {"request": request, "job": job, "status_url": str(request.url)},
+        )
+
+    itinerary = None
+    if job.status is JobStatus.DONE and job.itinerary_id is not None:
+        itinerary = await storage_port.get_itinerary(job.itinerary_id)
+    if itinerary is None:
+        return templates.TemplateResponse(
+            "partials/error_display.html",
+            {"request": request, "error_message": job.error or "Failed to generate itinerary. Please try again."},
+        )
+    return HTMLResponse(render_itinerary(itinerary, fragment_cache))
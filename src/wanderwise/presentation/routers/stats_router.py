@@ -0,0 +1,61 @@
+# src/wanderwise/presentation/routers/stats_router.py
+
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends
+
+from ...adapters.gateways.cache_warmer import CacheWarmer
+from ...application.services.generation_job_queue import GenerationJobQueue
+from ...application.services.request_canonicalizer import RequestCanonicalizer
+from ...config import get_settings
+from ...domain.ports.geocoding_port import GeocodingPort
+from ...domain.ports.llm_port import LLMPort
+from ...domain.ports.storage_port import StoragePort
+from ..dependencies import (
+    get_cache_warmer,
+    get_fragment_cache,
+    get_geocoder,
+    get_job_queue,
+    get_llm_port,
+    get_request_canonicalizer,
+    get_storage_port,
+)
+from ..templating import FragmentCache
+
+# --- Router Setup ---
+log = logging.getLogger(__name__)
+router = APIRouter(prefix="/api", tags=["monitoring"])
+
+
+@router.get("/stats")
+async def get_stats(
+    llm_port: LLMPort = Depends(get_llm_port),
+    storage_port: StoragePort = Depends(get_storage_port),
+    job_queue: GenerationJobQueue = Depends(get_job_queue),
+    cache_warmer: Optional[CacheWarmer] = Depends(get_cache_warmer),
+    canonicalizer: Optional[RequestCanonicalizer] = Depends(get_request_canonicalizer),
+    geocoder: Optional[GeocodingPort] = Depends(get_geocoder),
+    fragment_cache: Optional[FragmentCache] = Depends(get_fragment_cache),
+) -> Dict[str, Any]:
+    """
+    Returns runtime statistics for this worker process.
+
+    Includes the LLM layers (cache hit rate, coalesced requests, ...) and the
+    itinerary storage (size, evictions, hit rate), the background job queue, the
+    cache warmer, the request canonicalizer (match rate, plus the recent matches
+    when REQUEST_CANONICALIZE_AUDIT_IN_STATS is set), the geocoder and the
+    rendered fragment cache (the last four null when disabled).
+    """
+    return {
+        "llm": llm_port.stats(),
+        "storage": storage_port.stats(),
+        "jobs": job_queue.stats(),
+        "cache_warmer": cache_warmer.stats() if cache_warmer is not None else None,
+        "canonicalizer": (
+            canonicalizer.stats(include_audit=get_settings().REQUEST_CANONICALIZE_AUDIT_IN_STATS)
+            if canonicalizer is not None else None
+        ),
+        "geocoder": geocoder.stats() if geocoder is not None else None,
+        "fragment_cache": fragment_cache.stats() if fragment_cache is not None else None,
+    }
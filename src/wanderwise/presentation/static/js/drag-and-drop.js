@@ -1,8 +1,9 @@
 /**
  * Drag and Drop functionality for WanderWise itinerary activities
  * 
- * This script enables users to reorder activities within their daily plans
- * using a drag-and-drop interface.
+ * This script enables users to reorder activities within their daily plans, or
+ * move them to another day, using a drag-and-drop interface. Each drop is sent
+ * to the server as a batch of patch operations.
  */
 
 document.addEventListener('DOMContentLoaded', function() {
@@ -13,6 +14,23 @@ document.addEventListener('DOMContentLoaded', function() {
     document.body.addEventListener('htmx:afterSwap', function() {
         initDragAndDrop();
     });
+    
+    // Day edits (regenerate, shorten route) send the version shown on the page...
+    document.body.addEventListener('htmx:configRequest', function(event) {
+        const container = event.detail.elt.closest('[data-itinerary-version]');
+        if (container && container.dataset.itineraryVersion && event.detail.elt.hasAttribute('data-sends-version')) {
+            event.detail.parameters.version = container.dataset.itineraryVersion;
+        }
+    });
+    
+    // ...and only swap the day, so the new version comes back as an HX-Trigger event
+    document.body.addEventListener('itineraryVersion', function(event) {
+        document.querySelectorAll('[data-itinerary-version]').forEach(container => {
+            if (container.dataset.itineraryId === event.detail.itineraryId) {
+                container.dataset.itineraryVersion = event.detail.version;
+            }
+        });
+    });
 });
 
 /**
@@ -57,9 +75,11 @@ function initDragAndDrop() {
 // Global variables to track drag state
 let draggedItem = null;
 let dragOverItem = null;
+let dragSourceList = null;
 
 function handleDragStart(e) {
     draggedItem = this;
+    dragSourceList = this.closest('.activity-list');
     this.classList.add('dragging');
     e.dataTransfer.effectAllowed = 'move';
     e.dataTransfer.setData('text/html', this.innerHTML);
@@ -115,7 +135,9 @@ function handleDrop(e) {
     e.stopPropagation();
     e.preventDefault();
     
-    if (dragOverItem && dragOverItem !== draggedItem) {
+    if (!draggedItem) return false;
+    
+    if (dragOverItem && dragOverItem !== draggedItem && this.contains(dragOverItem)) {
         const rect = dragOverItem.getBoundingClientRect();
         const midpoint = rect.top + (rect.height / 2);
         
@@ -126,6 +148,14 @@ function handleDrop(e) {
             // Insert before
             dragOverItem.parentNode.insertBefore(draggedItem, dragOverItem);
         }
+    } else if (this !== dragSourceList) {
+        // Dropped on another day's list but not onto an activity: append it
+        const activities = this.querySelectorAll('.activity-item');
+        if (activities.length) {
+            activities[activities.length - 1].after(draggedItem);
+        } else {
+            this.prepend(draggedItem);
+        }
     }
     
     // Clean up
@@ -136,7 +166,7 @@ function handleDrop(e) {
     });
     
     // Update the order in the backend
-    updateActivityOrder(this);
+    updateActivityOrder(this, dragSourceList, draggedItem);
     
     return false;
 }
@@ -145,23 +175,53 @@ function handleDragEnd() {
     this.classList.remove('dragging');
     draggedItem = null;
     dragOverItem = null;
+    dragSourceList = null;
 }
 
 /**
- * Update the activity order in the backend
+ * Get the day number of an activity list
  * @param {HTMLElement} listElement - The activity list element
  */
-function updateActivityOrder(listElement) {
-    const dayPlanElement = listElement.closest('.day-plan');
-    const dayNumber = dayPlanElement ? parseInt(dayPlanElement.dataset.dayId?.replace('day-', '')) : 1;
-    const itineraryId = document.documentElement.dataset.itineraryId || 'current';
+function getDayNumber(listElement) {
+    return parseInt(listElement.dataset.dayId?.replace('day-', '')) || 1;
+}
+
+/**
+ * Update the activity order in the backend
+ * @param {HTMLElement} listElement - The activity list the item was dropped on
+ * @param {HTMLElement} sourceList - The activity list the item was dragged from
+ * @param {HTMLElement} activityElement - The dragged activity item
+ */
+function updateActivityOrder(listElement, sourceList, activityElement) {
+    const container = listElement.closest('[data-itinerary-id]');
+    const itineraryId = container ? container.dataset.itineraryId : '';
+    if (!itineraryId) {
+        showNotification('Your itinerary is still being saved, please try again in a moment', 'info');
+        return;
+    }
     
-    const activityItems = listElement.querySelectorAll('.activity-item');
-    const order = Array.from(activityItems).map(item => item.dataset.activityId);
+    const activityItems = Array.from(listElement.querySelectorAll('.activity-item'));
+    const order = activityItems.map(item => item.dataset.activityId);
     
     if (order.length === 0) return;
     
-    // Send the new order to the server
+    const operations = [];
+    if (sourceList && sourceList !== listElement && activityElement) {
+        operations.push({
+            op: 'move',
+            activity_id: activityElement.dataset.activityId,
+            to_day: getDayNumber(listElement),
+            position: activityItems.indexOf(activityElement)
+        });
+    } else {
+        operations.push({
+            op: 'reorder',
+            day: getDayNumber(listElement),
+            activity_order: order
+        });
+    }
+    
+    // Send the operations to the server in one request
     fetch('/api/itinerary/reorder-activities', {
         method: 'POST',
         headers: {
@@ -171,11 +231,15 @@ function updateActivityOrder(listElement) {
         },
         body: JSON.stringify({
             itinerary_id: itineraryId,
-            day_number: dayNumber,
-            activity_order: order
+            version: container.dataset.itineraryVersion ? parseInt(container.dataset.itineraryVersion) : null,
+            operations: operations
         })
     })
     .then(response => {
+        if (response.status === 409) {
+            showNotification('This itinerary was changed in another tab. Reload to see the latest version.', 'error');
+            throw new Error('Itinerary version conflict');
+        }
         if (!response.ok) {
             throw new Error('Failed to update activity order');
         }
@@ -183,13 +247,16 @@ function updateActivityOrder(listElement) {
     })
     .then(data => {
         console.log('Activity order updated:', data);
+        container.dataset.itineraryVersion = data.version;
         // Optionally show a success message
         showNotification('Itinerary updated successfully', 'success');
     })
     .catch(error => {
         console.error('Error updating activity order:', error);
         // Optionally show an error message
-        showNotification('Failed to update activity order', 'error');
+        if (error.message !== 'Itinerary version conflict') {
+            showNotification('Failed to update activity order', 'error');
+        }
     });
 }
 
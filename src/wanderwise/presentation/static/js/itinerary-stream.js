@@ -0,0 +1,70 @@
+/**
+ * Streaming itinerary rendering for WanderWise
+ *
+ * When a form declares a `data-stream-url`, its HTMX submission is replaced by a
+ * server-sent events request, and each day of the itinerary is rendered as soon
+ * as the server has generated it. Browsers without EventSource fall back to the
+ * regular HTMX request, and so do background (job mode) submissions.
+ */
+
+document.addEventListener('htmx:confirm', function(e) {
+    const form = e.detail.elt;
+    if (!form.dataset || !form.dataset.streamUrl || !window.EventSource) return;
+    if (form.elements.job && form.elements.job.checked) return;
+
+    e.preventDefault();
+    streamItinerary(form);
+});
+
+/**
+ * Open the event stream for a form and render its events into the form's target
+ * @param {HTMLFormElement} form - The itinerary request form
+ */
+function streamItinerary(form) {
+    const target = document.querySelector(form.getAttribute('hx-target') || '#itinerary-container');
+    const indicator = document.querySelector(form.getAttribute('hx-indicator'));
+    const params = new URLSearchParams(new FormData(form));
+    const source = new EventSource(`${form.dataset.streamUrl}?${params.toString()}`);
+
+    if (indicator) indicator.classList.add('htmx-request');
+
+    const finish = () => {
+        source.close();
+        if (indicator) indicator.classList.remove('htmx-request');
+        const progress = document.getElementById('itinerary-stream-progress');
+        if (progress) progress.remove();
+    };
+
+    source.addEventListener('start', function(event) {
+        target.innerHTML = event.data;
+    });
+
+    source.addEventListener('day', function(event) {
+        const days = document.getElementById('itinerary-stream-days');
+        if (!days) return;
+        days.insertAdjacentHTML('beforeend', event.data);
+        htmx.process(days.lastElementChild);
+        if (typeof initDragAndDrop === 'function') initDragAndDrop();
+    });
+
+    source.addEventListener('complete', function(event) {
+        const result = JSON.parse(event.data);
+        const title = document.getElementById('itinerary-stream-title');
+        if (title) title.textContent = result.trip_title;
+        const stream = document.getElementById('itinerary-stream');
+        if (stream) {
+            stream.dataset.itineraryId = result.itinerary_id;
+            stream.dataset.itineraryVersion = result.version;
+        }
+        document.documentElement.dataset.itineraryId = result.itinerary_id;
+        finish();
+    });
+
+    source.addEventListener('failed', function(event) {
+        target.innerHTML = event.data;
+        finish();
+    });
+
+    // Network errors: EventSource would otherwise reconnect and start a new generation
+    source.onerror = finish;
+}
@@ -9,6 +9,7 @@ const ASSETS_TO_CACHE = [
   '/static/js/htmx.min.js',
   '/static/js/map.js',
   '/static/js/drag-and-drop.js',
+  '/static/js/itinerary-stream.js',
   '/static/images/logo.png',
   '/static/icons/icon-192x192.png',
   '/static/icons/icon-512x512.png',
@@ -45,8 +46,9 @@ self.addEventListener('activate', (event) => {
 
 // Fetch event - serve from cache, falling back to network
 self.addEventListener('fetch', (event) => {
-  // Skip non-GET requests and chrome-extension requests
+  // Skip non-GET requests, server-sent event streams and chrome-extension requests
   if (event.request.method !== 'GET' || 
+      (event.request.headers.get('accept') || '').includes('text/event-stream') ||
       event.request.url.startsWith('chrome-extension://') ||
       event.request.url.includes('sockjs') ||
       event.request.url.includes('hot-update')) {
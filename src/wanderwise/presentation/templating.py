@@ -0,0 +1,166 @@
+# src/wanderwise/presentation/templating.py
+
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import jinja2
+from fastapi.templating import Jinja2Templates
+
+from ..config import Settings, get_settings
+from ..domain.models.itinerary import Itinerary
+
+log = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+ITINERARY_TEMPLATE = "partials/itinerary_display.html"
+
+
+def _create_environment(settings: Settings) -> jinja2.Environment:
+    """
+    The Jinja environment shared by every router and error handler.
+
+    Compiled templates are kept in memory without a size limit, since there are
+    only a few dozen. Outside debug mode the template files are not checked for
+    changes on every use. With the bytecode cache, the compiled code is also
+    written to disk, so other workers and restarts load it instead of compiling
+    the templates again.
+    """
+    bytecode_cache = None
+    if settings.TEMPLATE_BYTECODE_CACHE_ENABLED:
+        bytecode_cache = jinja2.FileSystemBytecodeCache(settings.TEMPLATE_BYTECODE_CACHE_DIR)
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
+        autoescape=True,
+        auto_reload=settings.DEBUG,
+        cache_size=-1,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+# The one template environment of the application; import this instead of creating Jinja2Templates.
+templates = Jinja2Templates(env=_create_environment(get_settings()))
+
+
+def precompile_templates() -> int:
+    """
+    Loads (compiles, or reads from the bytecode cache) every template up front.
+
+    Called once at startup, so the first request for each page does not pay for it.
+
+    Returns:
+        The number of templates loaded.
+    """
+    names = templates.env.list_templates(extensions=["html"])
+    for name in names:
+        templates.env.get_template(name)
+    log.info(f"Precompiled {len(names)} templates")
+    return len(names)
+
+
+class FragmentCache:
+    """
+    An LRU cache of rendered HTML fragments of stored itineraries.
+
+    Fragments are keyed by itinerary ID, itinerary version and template. Each
+    stored edit increments the version, so a fragment of an older version is
+    never served: a lookup for a newer version misses, and storing the newer
+    version replaces all of the itinerary's older fragments. Endpoints that edit
+    an itinerary also call `invalidate` to drop its fragments right away.
+
+    The cache is bounded by a number of itineraries and a total size of HTML.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = None):
+        """
+        Args:
+            max_entries: Maximum number of itineraries with cached fragments.
+            max_bytes: Approximate budget for the cached HTML in bytes (characters), or None.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Itinerary ID -> (version, {template: html}).
+        self._entries: "OrderedDict[str, Tuple[int, Dict[str, str]]]" = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def _drop(self, itinerary_id: str) -> bool:
+        entry = self._entries.pop(itinerary_id, None)
+        if entry is None:
+            return False
+        self._total_bytes -= sum(len(html) for html in entry[1].values())
+        return True
+
+    def get(self, itinerary_id: str, version: int, template: str = ITINERARY_TEMPLATE) -> Optional[str]:
+        """Returns the cached fragment of this version of the itinerary, or None."""
+        entry = self._entries.get(itinerary_id)
+        html = entry[1].get(template) if entry is not None and entry[0] == version else None
+        if html is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(itinerary_id)
+        self.hits += 1
+        return html
+
+    def put(self, itinerary_id: str, version: int, html: str, template: str = ITINERARY_TEMPLATE) -> None:
+        """Caches a fragment, replacing the fragments of any other version of the itinerary."""
+        entry = self._entries.get(itinerary_id)
+        if entry is not None and entry[0] > version:
+            return
+        if entry is None or entry[0] != version:
+            self._drop(itinerary_id)
+            entry = self._entries[itinerary_id] = (version, {})
+        previous = entry[1].get(template)
+        entry[1][template] = html
+        self._total_bytes += len(html) - (len(previous) if previous is not None else 0)
+        self._entries.move_to_end(itinerary_id)
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._total_bytes > self.max_bytes and len(self._entries) > 1
+        ):
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, itinerary_id: str) -> bool:
+        """Drops every cached fragment of an itinerary; returns True if there were any."""
+        dropped = self._drop(itinerary_id)
+        if dropped:
+            self.invalidations += 1
+        return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "itineraries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def render_itinerary(itinerary: Itinerary, fragment_cache: Optional[FragmentCache] = None) -> str:
+    """
+    Renders `partials/itinerary_display.html` for an itinerary, through the fragment cache if given.
+
+    Only stored itineraries should go through the cache: the fragment is keyed by
+    ID and version, which only identify the content once the itinerary is saved.
+    """
+    if fragment_cache is not None:
+        html = fragment_cache.get(itinerary.id, itinerary.version)
+        if html is not None:
+            return html
+    html = templates.get_template(ITINERARY_TEMPLATE).render(
+        itinerary=itinerary,
+        config={"MAPBOX_ACCESS_TOKEN": get_settings().MAPBOX_ACCESS_TOKEN, "ITINERARY_ID": itinerary.id},
+    )
+    if fragment_cache is not None:
+        fragment_cache.put(itinerary.id, itinerary.version, html)
+    return html
@@ -0,0 +1,53 @@
+# tests/conftest.py
+
+import os
+from typing import AsyncIterator, Optional
+
+import pytest
+
+# The settings are read on import and require a key; no test talks to OpenAI.
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from wanderwise.adapters.storage.in_memory_storage import InMemoryStorage
+from wanderwise.adapters.storage.sqlite_storage import SQLiteStorage
+from wanderwise.domain.models.itinerary import Activity, DailyPlan, Itinerary
+from wanderwise.domain.ports.storage_port import StoragePort
+
+
+def make_itinerary(destination: str = "Paris", days: int = 2, activities_per_day: int = 3, **fields) -> Itinerary:
+    """A small itinerary with priced, located activities."""
+    return Itinerary(
+        destination=destination,
+        trip_title=f"{days} days in {destination}",
+        total_estimated_cost_usd=25.0 * days * activities_per_day,
+        daily_plans=[
+            DailyPlan(
+                day=day,
+                theme=f"Day {day}",
+                activities=[
+                    Activity(
+                        time=f"{9 + 2 * position:02d}:00",
+                        description=f"Activity {position + 1} of day {day}",
+                        estimated_cost_usd=25.0,
+                        latitude=48.85 + 0.01 * position,
+                        longitude=2.35 + 0.01 * day,
+                    )
+                    for position in range(activities_per_day)
+                ],
+            )
+            for day in range(1, days + 1)
+        ],
+        **fields,
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+async def storage(request, tmp_path) -> AsyncIterator[StoragePort]:
+    """Every StoragePort adapter, so contract tests run against each of them."""
+    adapter: Optional[StoragePort] = None
+    if request.param == "memory":
+        adapter = InMemoryStorage()
+    else:
+        adapter = SQLiteStorage(tmp_path / "itineraries.db", read_connections=2)
+    yield adapter
+    await adapter.aclose()
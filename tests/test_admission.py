@@ -0,0 +1,123 @@
+# tests/test_admission.py
+
+import asyncio
+from typing import List
+
+import pytest
+
+from wanderwise.adapters.gateways.admission import AdmissionController
+from wanderwise.domain.ports.llm_port import LLMUnavailableError
+
+
+def frozen_clock() -> float:
+    """Budgets never refill, so every change in them comes from the controller."""
+    return 0.0
+
+
+async def hold(controller: AdmissionController, release: asyncio.Event, estimated_tokens: int = 0) -> None:
+    async with controller.admit(estimated_tokens):
+        await release.wait()
+
+
+async def test_waiters_are_admitted_in_arrival_order():
+    controller = AdmissionController(max_concurrency=1)
+    release = asyncio.Event()
+    holder = asyncio.ensure_future(hold(controller, release))
+    await asyncio.sleep(0)
+    admitted: List[int] = []
+
+    async def call(number: int) -> None:
+        async with controller.admit(0):
+            admitted.append(number)
+            await asyncio.sleep(0)
+
+    calls = []
+    for number in range(5):
+        calls.append(asyncio.ensure_future(call(number)))
+        await asyncio.sleep(0)
+    assert controller.waiting == 5
+
+    release.set()
+    await asyncio.gather(holder, *calls)
+    assert admitted == [0, 1, 2, 3, 4]
+    assert controller.stats()["admitted"] == 6
+
+
+async def test_timed_out_waiter_gives_back_its_budget():
+    controller = AdmissionController(
+        max_concurrency=1, requests_per_minute=10, tokens_per_minute=1000, max_wait_seconds=0.05, clock=frozen_clock
+    )
+    release = asyncio.Event()
+    holder = asyncio.ensure_future(hold(controller, release, estimated_tokens=400))
+    await asyncio.sleep(0)
+
+    # Takes its request and tokens, then times out waiting for the only slot.
+    with pytest.raises(LLMUnavailableError) as raised:
+        await hold(controller, release, estimated_tokens=400)
+
+    assert raised.value.retry_after == 1
+    stats = controller.stats()
+    assert (stats["requests_available"], stats["tokens_available"]) == (9, 600)
+    assert (stats["timed_out"], stats["rejected"], stats["queue_depth"]) == (1, 1, 0)
+    release.set()
+    await holder
+
+
+async def test_cancelled_waiter_gives_back_its_budget():
+    controller = AdmissionController(
+        max_concurrency=1, requests_per_minute=10, tokens_per_minute=1000, clock=frozen_clock
+    )
+    release = asyncio.Event()
+    holder = asyncio.ensure_future(hold(controller, release, estimated_tokens=400))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(hold(controller, release, estimated_tokens=400))
+    await asyncio.sleep(0)
+    assert controller.stats()["tokens_available"] == 200
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    stats = controller.stats()
+    assert (stats["requests_available"], stats["tokens_available"]) == (9, 600)
+    assert stats["queue_depth"] == 0
+    release.set()
+    await holder
+
+
+async def test_settle_refunds_unused_tokens():
+    controller = AdmissionController(max_concurrency=1, tokens_per_minute=1000, clock=frozen_clock)
+    async with controller.admit(400) as permit:
+        permit.settle(150)
+    assert controller.stats()["tokens_available"] == 850
+
+
+async def test_exhausted_budget_rejects_at_once_with_the_predicted_wait():
+    # 600 tokens a minute refill at 10 a second; 300 more tokens are 30 seconds away.
+    controller = AdmissionController(max_concurrency=4, tokens_per_minute=600, clock=frozen_clock)
+    async with controller.admit(600):
+        pass
+
+    with pytest.raises(LLMUnavailableError) as raised:
+        async with controller.admit(300):
+            pass
+
+    assert raised.value.retry_after == 30
+    assert controller.stats()["queue_depth"] == 0
+
+
+async def test_full_queue_rejects_with_a_retry_after():
+    controller = AdmissionController(max_concurrency=1, max_queue=1)
+    release = asyncio.Event()
+    holder = asyncio.ensure_future(hold(controller, release))
+    await asyncio.sleep(0)
+    queued = asyncio.ensure_future(hold(controller, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(LLMUnavailableError) as raised:
+        await hold(controller, release)
+
+    assert raised.value.retry_after >= 1
+    assert "queued" in str(raised.value)
+    release.set()
+    await asyncio.gather(holder, queued)
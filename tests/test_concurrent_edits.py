@@ -0,0 +1,120 @@
+# tests/test_concurrent_edits.py
+
+"""
+Optimistic concurrency of itinerary edits under concurrent `ItineraryService.apply_patch` calls.
+
+Many clients edit the same itinerary at once. Every edit shuffles day 1 and adds 1
+to the cost of one activity, based on the state the client read, so a lost update
+shows up as a cost (and version) that grew by less than the number of edits.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from wanderwise.adapters.gateways.fake_llm_gateway import FakeLLMGateway
+from wanderwise.application.services.itinerary_service import ItineraryService
+from wanderwise.domain.models.itinerary import ReorderActivities, UpdateActivity
+from wanderwise.domain.ports.storage_port import VersionConflictError
+
+from .conftest import make_itinerary
+
+WORKERS = 20
+EDITS = 5
+
+
+def edit(itinerary, counter_id: str, rng: random.Random):
+    """A reorder of day 1 plus an increment of the counter activity's cost, based on `itinerary`."""
+    day = itinerary.daily_plans[0]
+    order = [activity.id for activity in day.activities]
+    rng.shuffle(order)
+    cost = next(activity.estimated_cost_usd for activity in day.activities if activity.id == counter_id)
+    return [
+        ReorderActivities(day=day.day, activity_order=order),
+        UpdateActivity(activity_id=counter_id, estimated_cost_usd=cost + 1),
+    ]
+
+
+async def run_clients(service: ItineraryService, itinerary, versioned: bool) -> int:
+    """Runs WORKERS clients making EDITS edits each, retrying on conflicts; returns the number of conflicts."""
+    counter_id = itinerary.daily_plans[0].activities[0].id
+    conflicts = 0
+
+    async def client(client_id: int) -> None:
+        nonlocal conflicts
+        rng = random.Random(client_id)
+        for _ in range(EDITS):
+            while True:
+                current = await service.storage_port.get_itinerary(itinerary.id)
+                # Let the other clients read the same version before this one writes.
+                await asyncio.sleep(0)
+                try:
+                    await service.apply_patch(
+                        itinerary.id,
+                        edit(current, counter_id, rng),
+                        expected_version=current.version if versioned else None,
+                    )
+                    break
+                except VersionConflictError as e:
+                    assert e.current_version is not None and e.current_version > current.version
+                    conflicts += 1
+
+    await asyncio.gather(*(client(client_id) for client_id in range(WORKERS)))
+    return conflicts
+
+
+@pytest.fixture
+def service(storage) -> ItineraryService:
+    return ItineraryService(FakeLLMGateway(latency_median_seconds=0), storage)
+
+
+async def test_concurrent_versioned_edits_lose_no_update(service):
+    itinerary = make_itinerary(days=2, activities_per_day=5)
+    await service.storage_port.save_itinerary(itinerary)
+
+    conflicts = await run_clients(service, itinerary, versioned=True)
+
+    final = await service.storage_port.get_itinerary(itinerary.id)
+    initial_counter = itinerary.daily_plans[0].activities[0]
+    counter = next(a for a in final.daily_plans[0].activities if a.id == initial_counter.id)
+    assert conflicts > 0
+    assert final.version == WORKERS * EDITS
+    assert counter.estimated_cost_usd == initial_counter.estimated_cost_usd + WORKERS * EDITS
+    assert sorted(a.id for a in final.daily_plans[0].activities) == sorted(a.id for a in itinerary.daily_plans[0].activities)
+    assert final.daily_plans[1].model_dump() == itinerary.daily_plans[1].model_dump()
+
+
+async def test_concurrent_unversioned_edits_are_serialized(service):
+    itinerary = make_itinerary(days=1, activities_per_day=4)
+    await service.storage_port.save_itinerary(itinerary)
+
+    await run_clients(service, itinerary, versioned=False)
+
+    # Without a version, each edit is re-applied to the latest state when it loses a race:
+    # every edit is stored exactly once, even though some were computed from stale reads.
+    final = await service.storage_port.get_itinerary(itinerary.id)
+    assert final.version == WORKERS * EDITS
+    assert sorted(a.id for a in final.daily_plans[0].activities) == sorted(a.id for a in itinerary.daily_plans[0].activities)
+
+
+async def test_stale_expected_version_is_rejected(service):
+    itinerary = make_itinerary()
+    await service.storage_port.save_itinerary(itinerary)
+    counter_id = itinerary.daily_plans[0].activities[0].id
+
+    updated = await service.apply_patch(
+        itinerary.id, [UpdateActivity(activity_id=counter_id, estimated_cost_usd=99.0)], expected_version=0
+    )
+    assert updated.version == 1
+
+    with pytest.raises(VersionConflictError) as conflict:
+        await service.apply_patch(
+            itinerary.id, [UpdateActivity(activity_id=counter_id, estimated_cost_usd=1.0)], expected_version=0
+        )
+    assert conflict.value.itinerary_id == itinerary.id
+    assert conflict.value.current_version == 1
+
+    stored = await service.storage_port.get_itinerary(itinerary.id)
+    assert stored.version == 1
+    assert stored.daily_plans[0].activities[0].estimated_cost_usd == 99.0
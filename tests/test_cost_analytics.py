@@ -0,0 +1,102 @@
+# tests/test_cost_analytics.py
+
+from typing import List, Optional, Tuple
+
+import pytest
+
+from wanderwise.application.services.cost_analytics import CostAnalytics
+from wanderwise.domain.models.itinerary import Activity, DailyPlan, Itinerary
+
+
+def itinerary(
+    days: List[List[Tuple[str, Optional[float]]]], stated: Optional[float], destination: str = "Lisbon"
+) -> Itinerary:
+    return Itinerary(
+        destination=destination,
+        trip_title="Costs",
+        total_estimated_cost_usd=stated,
+        daily_plans=[
+            DailyPlan(
+                day=number,
+                theme=f"Day {number}",
+                activities=[
+                    Activity(time=time, description=f"{time} on day {number}", estimated_cost_usd=cost)
+                    for time, cost in activities
+                ],
+            )
+            for number, activities in enumerate(days, start=1)
+        ],
+    )
+
+
+# Day 1: morning 10, afternoon 20, an unpriced evening = 30
+# Day 2: morning 30, evening 50, unspecified 5          = 85
+# Day 3: afternoon 150                                   = 150
+# Trip: 265 over 3 days, 88.33 a day (within Budget-friendly's 100 on average).
+TRIP = [
+    [("09:00", 10.0), ("14:00", 20.0), ("20:00", None)],
+    [("Morning", 30.0), ("Dinner", 50.0), ("Anytime", 5.0)],
+    [("1 PM", 150.0)],
+]
+
+
+def test_per_day_and_slot_totals():
+    analysis = CostAnalytics().analyze(itinerary(TRIP, stated=300.0))
+
+    assert analysis["computed_total_usd"] == 265.0
+    assert analysis["average_per_day_usd"] == 88.33
+    assert [(day["day"], day["total_usd"], day["activities"], day["unpriced"]) for day in analysis["days"]] == [
+        (1, 30.0, 3, 1), (2, 85.0, 3, 0), (3, 150.0, 1, 0),
+    ]
+    assert analysis["by_time_slot"] == {"morning": 40.0, "afternoon": 170.0, "evening": 50.0, "unspecified": 5.0}
+    assert (analysis["priced_activities"], analysis["unpriced_activities"]) == (6, 1)
+    assert analysis["estimated_tier"] == "Budget-friendly"
+
+
+@pytest.mark.parametrize("stated, consistent", [(300.0, False), (280.0, True), (None, None)])
+def test_stated_total_check(stated, consistent):
+    # Consistent within 10% of the computed total plus one dollar: |stated - 265| <= 27.5.
+    analysis = CostAnalytics().analyze(itinerary(TRIP, stated=stated))
+    assert analysis["stated_total_consistent"] is consistent
+    assert analysis["discrepancy_usd"] == (None if stated is None else stated - 265.0)
+
+
+@pytest.mark.parametrize(
+    "budget, tier, over",
+    [("Budget-friendly", "Budget-friendly", [3]), ("mid-range", "Mid-range", []), ("Luxury", "Luxury", [])],
+)
+def test_budget_tier_compliance(budget, tier, over):
+    compliance = CostAnalytics().analyze(itinerary(TRIP, stated=None), budget=budget)["budget"]
+    assert compliance["tier"] == tier
+    assert compliance["over_budget_days"] == over
+    assert compliance["within_budget"] is (not over)
+
+
+def test_custom_tier_limits():
+    analytics = CostAnalytics(tier_daily_limits_usd={"Splurge": None, "Tight": 50.0, "Comfortable": 120.0})
+    analysis = analytics.analyze(itinerary(TRIP, stated=None), budget="Tight")
+    assert analysis["estimated_tier"] == "Comfortable"
+    assert analysis["budget"]["over_budget_days"] == [2, 3]
+
+
+async def test_report_over_stored_itineraries(storage):
+    await storage.save_many([
+        itinerary(TRIP, stated=300.0),
+        itinerary([[("Morning", 400.0)], [("Evening", 200.0)]], stated=600.0, destination="lisbon "),
+        itinerary([[("Lunch", 20.0)]], stated=None, destination="Porto"),
+    ])
+
+    report = await CostAnalytics().report(storage, page_size=2)
+
+    assert report["itineraries"] == 3
+    assert report["activities"] == 10
+    assert report["priced_share"] == pytest.approx(9 / 10)
+    assert report["total_usd"] == 265.0 + 600.0 + 20.0
+    assert report["by_time_slot"] == {"morning": 440.0, "afternoon": 190.0, "evening": 250.0, "unspecified": 5.0}
+    # 88.33, 300 and 20 a day.
+    assert report["estimated_tiers"] == {"Budget-friendly": 2, "Mid-range": 0, "Luxury": 1}
+    assert report["stated_totals"]["reported"] == 2
+    assert report["stated_totals"]["consistent"] == 1
+    assert report["stated_totals"]["mean_abs_discrepancy_usd"] == 17.5
+    assert report["per_day_usd"]["max"] == 400.0
+    assert report["by_destination"][0] == {"destination": "lisbon", "itineraries": 2, "average_total_usd": 432.5}
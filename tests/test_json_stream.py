@@ -0,0 +1,74 @@
+# tests/test_json_stream.py
+
+import json
+
+import pytest
+
+from wanderwise.adapters.gateways.json_stream import DailyPlanStreamParser
+
+TRICKY_DAY = {
+    "day": 1,
+    "theme": 'Braces {like} these, [brackets], "quotes" and a \\ backslash',
+    "activities": [
+        {"time": "09:00", "description": 'Say "hi" to {everyone} at the \\"market\\" ]}', "estimated_cost_usd": 0},
+        {"time": "12:00", "description": "Unicode éè and a \n newline", "nested": {"daily_plans": [{"x": 1}]}},
+    ],
+}
+DOCUMENT = {
+    "destination": "Lisbon",
+    "trip_title": 'A "daily_plans" title with {braces}',
+    "meta": {"daily_plans": [{"not": "a day"}]},
+    "daily_plans": [TRICKY_DAY, {"day": 2, "theme": "Plain", "activities": []}],
+    "total_estimated_cost_usd": 120,
+}
+
+
+def feed_in_chunks(text: str, size: int):
+    parser = DailyPlanStreamParser()
+    completed = []
+    for start in range(0, len(text), size):
+        completed.extend(parser.feed(text[start:start + size]))
+    return parser, completed
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+def test_emits_every_day_whatever_the_chunking(size):
+    text = json.dumps(DOCUMENT, indent=2)
+    parser, completed = feed_in_chunks(text, size)
+    assert completed == DOCUMENT["daily_plans"]
+    assert parser.text == text
+
+
+def test_escapes_and_braces_inside_strings_are_not_structure():
+    # Without whitespace, escaped quotes and backslashes sit right next to real structure.
+    text = json.dumps(DOCUMENT, separators=(",", ":"))
+    assert feed_in_chunks(text, 5)[1] == DOCUMENT["daily_plans"]
+
+
+def test_nested_daily_plans_keys_are_ignored():
+    parser, completed = feed_in_chunks(json.dumps(DOCUMENT), 11)
+    assert {"not": "a day"} not in completed
+    assert {"x": 1} not in completed
+
+
+def test_a_day_is_emitted_as_soon_as_it_closes():
+    text = json.dumps({"trip_title": "T", "daily_plans": [{"day": 1}, {"day": 2}]})
+    end_of_first = text.index("}") + 1
+    parser = DailyPlanStreamParser()
+    assert parser.feed(text[:end_of_first - 1]) == []
+    assert parser.feed(text[end_of_first - 1:end_of_first]) == [{"day": 1}]
+    assert parser.feed(text[end_of_first:]) == [{"day": 2}]
+
+
+def test_header_of_a_truncated_document():
+    text = json.dumps(DOCUMENT)
+    parser = DailyPlanStreamParser()
+    assert parser.header() == {}
+    completed = parser.feed(text[:text.index('"day": 2')])
+    assert completed == [TRICKY_DAY]
+    assert parser.header() == {
+        "destination": "Lisbon",
+        "trip_title": DOCUMENT["trip_title"],
+        "meta": DOCUMENT["meta"],
+        "daily_plans": [],
+    }
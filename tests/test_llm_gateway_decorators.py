@@ -0,0 +1,151 @@
+# tests/test_llm_gateway_decorators.py
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from wanderwise.adapters.gateways.cached_llm_gateway import CachedLLMGateway
+from wanderwise.adapters.gateways.coalescing_llm_gateway import CoalescingLLMGateway
+from wanderwise.domain.models.itinerary import Itinerary, ItineraryRequest
+from wanderwise.domain.ports.llm_port import LLMPort
+
+from .conftest import make_itinerary
+
+REQUEST = ItineraryRequest(destination="Lisbon", duration_days=2, travel_style="Cultural", budget="Mid-range")
+
+
+class CountingLLM(LLMPort):
+    """Generates a fresh itinerary per call, optionally waiting for `release` first."""
+
+    def __init__(self, gated: bool = False):
+        self.calls = 0
+        self.release = asyncio.Event()
+        if not gated:
+            self.release.set()
+
+    async def generate_itinerary(self, request: ItineraryRequest) -> Itinerary | None:
+        self.calls += 1
+        await self.release.wait()
+        return make_itinerary(request.destination, days=request.duration_days)
+
+    def get_structured_prompt(self, request: ItineraryRequest) -> str:
+        return ""
+
+    def get_response_schema(self) -> Dict[str, Any]:
+        return {}
+
+
+def ids(itinerary: Itinerary) -> List[str]:
+    return [itinerary.id] + [activity.id for day in itinerary.daily_plans for activity in day.activities]
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_cache_hits_get_fresh_ids():
+    inner = CountingLLM()
+    cache = CachedLLMGateway(inner)
+
+    first = await cache.generate_itinerary(REQUEST)
+    second = await cache.generate_itinerary(REQUEST)
+    third = await cache.generate_itinerary(REQUEST)
+
+    assert inner.calls == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert second.trip_title == first.trip_title
+    assert not set(ids(first)) & set(ids(second))
+    assert not set(ids(second)) & set(ids(third))
+
+
+async def test_editing_a_hit_does_not_change_the_cache():
+    cache = CachedLLMGateway(CountingLLM())
+    (await cache.generate_itinerary(REQUEST)).daily_plans[0].theme = "Edited"
+    assert (await cache.generate_itinerary(REQUEST)).daily_plans[0].theme == "Day 1"
+
+
+async def test_cache_entries_expire_after_their_ttl():
+    inner = CountingLLM()
+    clock = Clock()
+    cache = CachedLLMGateway(inner, ttl_seconds=60, clock=clock)
+
+    await cache.generate_itinerary(REQUEST)
+    clock.now = 59.9
+    await cache.generate_itinerary(REQUEST)
+    assert inner.calls == 1
+
+    clock.now = 60.0
+    await cache.generate_itinerary(REQUEST)
+    assert inner.calls == 2
+    assert cache.evictions == 1
+
+
+async def test_stale_hit_is_served_and_refreshed_once():
+    inner = CountingLLM()
+    clock = Clock()
+    cache = CachedLLMGateway(inner, ttl_seconds=60, refresh_ahead_seconds=10, clock=clock)
+    await cache.generate_itinerary(REQUEST)
+
+    clock.now = 55.0
+    inner.release.clear()
+    served = await asyncio.gather(*(cache.generate_itinerary(REQUEST) for _ in range(3)))
+    assert all(itinerary is not None for itinerary in served)
+    await asyncio.sleep(0)
+    assert inner.calls == 2
+
+    inner.release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert cache.refreshes == 1
+    assert cache.stats()["cache"]["refreshing"] == 0
+
+
+async def test_concurrent_requests_share_one_generation():
+    inner = CountingLLM(gated=True)
+    coalescer = CoalescingLLMGateway(inner)
+
+    waiters = [asyncio.ensure_future(coalescer.generate_itinerary(REQUEST)) for _ in range(3)]
+    await asyncio.sleep(0)
+    inner.release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert inner.calls == 1
+    assert (coalescer.started, coalescer.coalesced) == (1, 2)
+    assert len({result.id for result in results}) == 3
+
+
+async def test_cancelled_waiter_does_not_cancel_the_shared_generation():
+    inner = CountingLLM(gated=True)
+    coalescer = CoalescingLLMGateway(inner)
+
+    cancelled = asyncio.ensure_future(coalescer.generate_itinerary(REQUEST))
+    remaining = asyncio.ensure_future(coalescer.generate_itinerary(REQUEST))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    inner.release.set()
+    assert await remaining is not None
+    assert inner.calls == 1
+
+
+async def test_generation_outlives_all_its_waiters_and_is_forgotten():
+    inner = CountingLLM(gated=True)
+    coalescer = CoalescingLLMGateway(inner)
+
+    waiter = asyncio.ensure_future(coalescer.generate_itinerary(REQUEST))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    inner.release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert coalescer._in_flight == {}
+    assert await coalescer.generate_itinerary(REQUEST) is not None
+    assert inner.calls == 2
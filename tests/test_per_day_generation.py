@@ -0,0 +1,73 @@
+# tests/test_per_day_generation.py
+
+import json
+import re
+from typing import Dict, List
+
+import pytest
+
+from wanderwise.adapters.gateways.openai_gateway import OpenAIGateway
+from wanderwise.config import Settings
+from wanderwise.domain.models.itinerary import GenerationStrategy, Itinerary, ItineraryRequest
+
+REQUEST = ItineraryRequest(
+    destination="Lisbon", duration_days=3, travel_style="Cultural", budget="Mid-range", strategy=GenerationStrategy.PER_DAY
+)
+SKELETON = json.dumps({
+    "trip_title": "Three days in Lisbon",
+    "days": [{"day": day, "theme": f"Theme {day}"} for day in (1, 2, 3)],
+})
+
+
+def day_json(day: int) -> str:
+    return json.dumps({
+        "day": day,
+        "theme": "ignored",
+        "activities": [{"time": "10:00", "description": f"Something on day {day}", "estimated_cost_usd": 10}],
+    })
+
+
+def scripted_gateway(day_responses: Dict[int, List[str]]) -> OpenAIGateway:
+    """A gateway whose completions are scripted: the skeleton, then each day's responses in turn."""
+    gateway = OpenAIGateway(Settings())
+    gateway.requests = []
+
+    async def request(messages, kind, days):
+        if kind == "skeleton":
+            return SKELETON, False
+        day = int(re.search(r"planning day (\d+)", messages[-1]["content"]).group(1))
+        gateway.requests.append(day)
+        responses = day_responses.get(day, [])
+        return (responses.pop(0) if responses else day_json(day)), False
+
+    gateway._request = request
+    return gateway
+
+
+@pytest.mark.parametrize("bad", ["not json", '{"day": 2, "activities": "none"}', None])
+async def test_a_day_that_fails_to_parse_is_requested_again(bad):
+    gateway = scripted_gateway({2: [bad]})
+
+    itinerary = await gateway.generate_itinerary(REQUEST)
+
+    assert itinerary is not None
+    assert [plan.day for plan in itinerary.daily_plans] == [1, 2, 3]
+    assert [plan.theme for plan in itinerary.daily_plans] == ["Theme 1", "Theme 2", "Theme 3"]
+    assert sorted(gateway.requests) == [1, 2, 2, 3]
+
+
+async def test_a_day_that_keeps_failing_fails_the_itinerary():
+    gateway = scripted_gateway({2: ["not json"] * OpenAIGateway.max_day_attempts})
+
+    assert await gateway.generate_itinerary(REQUEST) is None
+    assert gateway.requests.count(2) == OpenAIGateway.max_day_attempts
+
+
+async def test_streamed_day_that_fails_to_parse_is_requested_again():
+    gateway = scripted_gateway({1: ["not json"]})
+
+    items = [item async for item in gateway.stream_itinerary(REQUEST)]
+
+    assert [item.day for item in items[:-1]] == [1, 2, 3]
+    assert isinstance(items[-1], Itinerary)
+    assert gateway.requests.count(1) == 2
@@ -0,0 +1,32 @@
+# tests/test_request_canonicalizer.py
+
+import pytest
+
+from wanderwise.application.services.request_canonicalizer import RequestCanonicalizer
+
+
+@pytest.mark.parametrize(
+    "destination, canonical",
+    [
+        ("Paris, France", "Paris"),
+        ("paris ,  FRANCE", "Paris"),
+        ("Roma, Italy", "Rome"),
+        ("New York, NY", "New York"),
+        ("NYC, USA", "New York"),
+        # Namesakes in another country are other places.
+        ("Paris, Texas", "Paris, Texas"),
+        ("Paris, US", "Paris, US"),
+        ("Naples, USA", "Naples, USA"),
+        ("Athens, US", "Athens, US"),
+        ("Berlin, US", "Berlin, US"),
+    ],
+)
+def test_city_country_is_reduced_only_for_the_citys_own_country(destination, canonical):
+    assert RequestCanonicalizer().canonical_destination(destination) == canonical
+
+
+def test_namesakes_do_not_share_a_canonical_request():
+    canonicalizer = RequestCanonicalizer()
+    destinations = {canonicalizer.canonical_destination(d) for d in ("Paris, Texas", "Paris, US", "Paris, France")}
+    assert destinations == {"Paris, Texas", "Paris, US", "Paris"}
+    assert [entry["input"] for entry in canonicalizer.audit] == ["Paris, France"]
@@ -0,0 +1,40 @@
+# tests/test_resilience.py
+
+import asyncio
+
+import pytest
+
+from wanderwise.adapters.gateways.resilience import ResiliencePolicy
+
+
+async def hedging_policy() -> ResiliencePolicy:
+    """A policy that hedges calls of kind "plan" still running after 0.05s."""
+    policy = ResiliencePolicy(retryable=(ConnectionError,), hedge=True, hedge_min_delay=0.05, hedge_min_samples=1)
+
+    async def fast() -> str:
+        return "fast"
+
+    await policy.call(fast, kind="plan")
+    assert policy.hedge_delay("plan") == 0.05
+    return policy
+
+
+@pytest.mark.parametrize("cancel_after", [0.01, 0.1], ids=["before hedging", "after hedging"])
+async def test_cancelled_caller_cancels_its_attempts(cancel_after):
+    policy = await hedging_policy()
+    running = []
+
+    async def slow() -> str:
+        running.append(asyncio.current_task())
+        await asyncio.sleep(10)
+        return "slow"
+
+    call = asyncio.ensure_future(policy.call(slow, kind="plan"))
+    await asyncio.sleep(cancel_after)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    await asyncio.sleep(0)
+
+    assert len(running) == (1 if cancel_after < 0.05 else 2)
+    assert all(task.cancelled() for task in running)
@@ -0,0 +1,120 @@
+# tests/test_route_optimizer.py
+
+import random
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from wanderwise.application.services.route_optimizer import RouteOptimizer, haversine_matrix, route_length_km
+from wanderwise.domain.models.itinerary import Activity, DailyPlan
+
+
+def activity(
+    name: str, latitude: Optional[float], longitude: Optional[float], time: str = "Anytime", **fields
+) -> Activity:
+    return Activity(id=name, time=time, description=name, latitude=latitude, longitude=longitude, **fields)
+
+
+def random_day(rng: random.Random, count: int) -> DailyPlan:
+    return DailyPlan(
+        day=1,
+        theme="Random",
+        activities=[
+            activity(f"a{i}", 38.70 + rng.uniform(0, 0.05), -9.16 + rng.uniform(0, 0.05)) for i in range(count)
+        ],
+    )
+
+
+def reordered(day: DailyPlan, order: List[str]) -> List[Activity]:
+    by_id = {a.id: a for a in day.activities}
+    return [by_id[activity_id] for activity_id in order]
+
+
+def test_haversine_matrix():
+    # One degree of latitude is about 111.2 km.
+    distances = haversine_matrix([0.0, 1.0, 0.0], [0.0, 0.0, 0.0])
+    assert distances.shape == (3, 3)
+    assert np.allclose(distances, distances.T)
+    assert np.allclose(np.diag(distances), 0)
+    assert distances[0, 1] == pytest.approx(111.19, abs=0.01)
+
+
+def test_shortens_a_zigzag():
+    # Points on a line, visited out of order.
+    day = DailyPlan(day=1, theme="Line", activities=[
+        activity(name, 38.70, -9.16 + 0.01 * x) for name, x in [("a", 0), ("c", 2), ("b", 1), ("e", 4), ("d", 3)]
+    ])
+    order = RouteOptimizer().optimize_day(day)
+    assert order in (["a", "b", "c", "d", "e"], ["e", "d", "c", "b", "a"])
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_never_lengthens_a_day(seed):
+    rng = random.Random(seed)
+    day = random_day(rng, rng.randint(3, 40))
+    order = RouteOptimizer().optimize_day(day)
+    assert sorted(order) == sorted(a.id for a in day.activities)
+    assert route_length_km(reordered(day, order)) <= route_length_km(day.activities) + 1e-9
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_two_opt_never_lengthens_a_path(seed):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(0, 0.05, size=(30, 2))
+    local = haversine_matrix(points[:, 0], points[:, 1])
+    path = np.concatenate([[0], rng.permutation(np.arange(1, 29)), [29]])
+    optimizer = RouteOptimizer()
+    before = optimizer._length(local, path)
+    improved = optimizer._two_opt(local, path.copy())
+    assert improved[0] == 0 and improved[-1] == 29
+    assert sorted(improved) == list(range(30))
+    assert optimizer._length(local, improved) <= before + 1e-9
+
+
+def test_anchored_activities_keep_their_positions():
+    rng = random.Random(7)
+    day = random_day(rng, 12)
+    day.activities[2].booking_link = "https://example.com/tickets"
+    day.activities[5].time = "13:30"
+    day.activities[8].latitude = day.activities[8].longitude = None
+    named = day.activities[10].id
+
+    order = RouteOptimizer().optimize_day(day, anchored={named})
+
+    for position in (2, 5, 8, 10):
+        assert order[position] == day.activities[position].id
+
+
+def test_activities_stay_in_their_part_of_the_day():
+    rng = random.Random(3)
+    times = ["Morning"] * 4 + ["Afternoon"] * 4 + ["Evening"] * 4
+    day = DailyPlan(day=1, theme="Slots", activities=[
+        activity(f"a{i}", 38.70 + rng.uniform(0, 0.05), -9.16 + rng.uniform(0, 0.05), time)
+        for i, time in enumerate(times)
+    ])
+
+    order = RouteOptimizer().optimize_day(day)
+
+    for start in (0, 4, 8):
+        assert sorted(order[start:start + 4]) == sorted(a.id for a in day.activities[start:start + 4])
+
+
+def test_stretch_ends_at_the_anchor_after_it():
+    # The stretch before the anchor must finish next to it, not just be short on its own.
+    day = DailyPlan(day=1, theme="Ends", activities=[
+        activity("far", 38.70, -9.16 + 0.04),
+        activity("near", 38.70, -9.16 + 0.01),
+        activity("middle", 38.70, -9.16 + 0.02),
+        activity("anchor", 38.70, -9.16, time="12:00"),
+    ])
+    assert RouteOptimizer().optimize_day(day) == ["far", "middle", "near", "anchor"]
+
+
+def test_too_few_movable_activities_keep_the_day():
+    day = DailyPlan(day=1, theme="Timed", activities=[
+        activity("a", 38.70, -9.16, time="09:00"),
+        activity("b", 38.71, -9.15),
+        activity("c", 38.72, -9.14, time="11:00"),
+    ])
+    assert RouteOptimizer().optimize_day(day) == ["a", "b", "c"]
@@ -0,0 +1,215 @@
+# tests/test_storage_contract.py
+
+"""
+The StoragePort contract: every storage adapter must pass these tests (see the `storage` fixture).
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from wanderwise.domain.ports.storage_port import ItineraryCosts, ItineraryFilter, VersionConflictError
+
+from .conftest import make_itinerary
+
+
+async def scan_ids(storage, **kwargs):
+    return [[itinerary.id for itinerary in page] async for page in storage.scan(**kwargs)]
+
+
+async def test_round_trip(storage):
+    itinerary = make_itinerary()
+    assert await storage.save_itinerary(itinerary)
+
+    stored = await storage.get_itinerary(itinerary.id)
+    assert stored is not None
+    assert stored.model_dump() == itinerary.model_dump()
+
+
+async def test_get_returns_an_independent_copy(storage):
+    itinerary = make_itinerary()
+    await storage.save_itinerary(itinerary)
+
+    stored = await storage.get_itinerary(itinerary.id)
+    stored.trip_title = "Changed without saving"
+    stored.daily_plans[0].activities.pop()
+
+    again = await storage.get_itinerary(itinerary.id)
+    assert again.trip_title == itinerary.trip_title
+    assert len(again.daily_plans[0].activities) == len(itinerary.daily_plans[0].activities)
+
+
+async def test_missing_itinerary(storage):
+    assert await storage.get_itinerary("missing") is None
+    assert await storage.get_version("missing") is None
+    assert await storage.delete_itinerary("missing") is False
+
+
+async def test_get_version(storage):
+    itinerary = make_itinerary(version=3)
+    await storage.save_itinerary(itinerary)
+    assert await storage.get_version(itinerary.id) == 3
+
+
+async def test_overwrite(storage):
+    itinerary = make_itinerary()
+    await storage.save_itinerary(itinerary)
+    itinerary.trip_title = "A new title"
+    itinerary.daily_plans = itinerary.daily_plans[:1]
+    assert await storage.save_itinerary(itinerary)
+
+    stored = await storage.get_itinerary(itinerary.id)
+    assert stored.trip_title == "A new title"
+    assert len(stored.daily_plans) == 1
+    assert await scan_ids(storage) == [[itinerary.id]]
+
+
+async def test_delete(storage):
+    kept, deleted = make_itinerary(), make_itinerary()
+    await storage.save_many([kept, deleted])
+
+    assert await storage.delete_itinerary(deleted.id) is True
+    assert await storage.get_itinerary(deleted.id) is None
+    assert await storage.delete_itinerary(deleted.id) is False
+    assert await storage.get_itinerary(kept.id) is not None
+
+
+async def test_save_daily_plans(storage):
+    itinerary = make_itinerary(days=3)
+    await storage.save_itinerary(itinerary)
+    itinerary.daily_plans[1].theme = "Edited"
+    itinerary.daily_plans[1].activities.reverse()
+    assert await storage.save_daily_plans(itinerary, [1])
+
+    stored = await storage.get_itinerary(itinerary.id)
+    assert stored.model_dump() == itinerary.model_dump()
+
+
+async def test_batch_operations(storage):
+    itineraries = [make_itinerary(destination=f"City {index}") for index in range(5)]
+    assert await storage.save_many(itineraries) == 5
+
+    found = await storage.get_many([itineraries[0].id, itineraries[3].id, "missing"])
+    assert set(found) == {itineraries[0].id, itineraries[3].id}
+    assert found[itineraries[3].id].model_dump() == itineraries[3].model_dump()
+
+    assert await storage.delete_many([itineraries[1].id, itineraries[2].id, "missing"]) == 2
+    remaining = await storage.get_many([itinerary.id for itinerary in itineraries])
+    assert set(remaining) == {itineraries[0].id, itineraries[3].id, itineraries[4].id}
+
+
+async def test_batch_operations_on_nothing(storage):
+    assert await storage.save_many([]) == 0
+    assert await storage.get_many([]) == {}
+    assert await storage.delete_many([]) == 0
+
+
+async def test_scan_pages_in_id_order(storage):
+    itineraries = [make_itinerary() for _ in range(7)]
+    await storage.save_many(itineraries)
+    ids = sorted(itinerary.id for itinerary in itineraries)
+
+    pages = await scan_ids(storage, limit=3)
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [itinerary_id for page in pages for itinerary_id in page] == ids
+
+
+async def test_scan_resumes_after_cursor(storage):
+    itineraries = [make_itinerary() for _ in range(5)]
+    await storage.save_many(itineraries)
+    ids = sorted(itinerary.id for itinerary in itineraries)
+
+    pages = await scan_ids(storage, cursor=ids[1], limit=2)
+    assert [itinerary_id for page in pages for itinerary_id in page] == ids[2:]
+
+
+async def test_scan_of_empty_store(storage):
+    assert await scan_ids(storage) == []
+
+
+async def test_scan_filters_by_destination(storage):
+    paris = [make_itinerary(destination="Paris") for _ in range(3)]
+    await storage.save_many([*paris, make_itinerary(destination="Rome")])
+
+    pages = await scan_ids(storage, limit=2, filter=ItineraryFilter(destination="PARIS"))
+    assert sorted(itinerary_id for page in pages for itinerary_id in page) == sorted(i.id for i in paris)
+    assert all(pages)
+
+
+async def test_scan_filters_by_first_save_time(storage):
+    early, late = make_itinerary(), make_itinerary()
+    await storage.save_itinerary(early)
+    await asyncio.sleep(0.01)
+    boundary = time.time()
+    await asyncio.sleep(0.01)
+    await storage.save_itinerary(late)
+    # Saving again does not change when an itinerary was first saved.
+    early.trip_title = "Saved again"
+    await storage.save_itinerary(early)
+
+    assert await scan_ids(storage, filter=ItineraryFilter(created_after=boundary)) == [[late.id]]
+    assert await scan_ids(storage, filter=ItineraryFilter(created_before=boundary)) == [[early.id]]
+
+
+async def test_scan_costs(storage):
+    itineraries = [make_itinerary(days=days) for days in (1, 2, 3)]
+    itineraries[0].daily_plans[0].activities[0].estimated_cost_usd = None
+    await storage.save_many([*itineraries, make_itinerary(destination="Rome")])
+
+    pages = [page async for page in storage.scan_costs(limit=2, filter=ItineraryFilter(destination="Paris"))]
+    records = {record.itinerary_id: record for page in pages for record in page}
+    assert set(records) == {itinerary.id for itinerary in itineraries}
+    for itinerary in itineraries:
+        record, expected = records[itinerary.id], ItineraryCosts.of(itinerary)
+        assert (record.destination, record.stated_total_usd, record.day_count) == (
+            expected.destination, expected.stated_total_usd, expected.day_count,
+        )
+        assert list(record.activity_days) == list(expected.activity_days)
+        assert list(record.activity_times) == list(expected.activity_times)
+        costs = [None if cost is None or cost != cost else cost for cost in record.activity_costs]
+        assert costs == list(expected.activity_costs)
+
+
+async def test_compare_and_swap(storage):
+    itinerary = make_itinerary()
+    await storage.save_itinerary(itinerary)
+
+    itinerary.trip_title = "Edited"
+    itinerary.version = 1
+    assert await storage.compare_and_swap(itinerary, expected_version=0)
+
+    stored = await storage.get_itinerary(itinerary.id)
+    assert (stored.version, stored.trip_title) == (1, "Edited")
+    assert await storage.get_version(itinerary.id) == 1
+
+
+async def test_compare_and_swap_of_some_days(storage):
+    itinerary = make_itinerary(days=3)
+    await storage.save_itinerary(itinerary)
+
+    itinerary.daily_plans[2].activities.reverse()
+    itinerary.version = 1
+    assert await storage.compare_and_swap(itinerary, expected_version=0, positions=[2])
+    assert (await storage.get_itinerary(itinerary.id)).model_dump() == itinerary.model_dump()
+
+
+async def test_compare_and_swap_rejects_a_stale_version(storage):
+    itinerary = make_itinerary(version=2)
+    await storage.save_itinerary(itinerary)
+
+    stale = itinerary.model_copy(deep=True)
+    stale.trip_title = "Based on an old version"
+    stale.version = 2
+    with pytest.raises(VersionConflictError) as conflict:
+        await storage.compare_and_swap(stale, expected_version=1)
+    assert conflict.value.current_version == 2
+    assert (await storage.get_itinerary(itinerary.id)).trip_title == itinerary.trip_title
+
+
+async def test_compare_and_swap_of_a_missing_itinerary(storage):
+    itinerary = make_itinerary(version=1)
+    with pytest.raises(VersionConflictError) as conflict:
+        await storage.compare_and_swap(itinerary, expected_version=0)
+    assert conflict.value.current_version is None
+    assert await storage.get_itinerary(itinerary.id) is None
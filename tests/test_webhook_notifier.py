@@ -0,0 +1,101 @@
+# tests/test_webhook_notifier.py
+
+import asyncio
+import socket
+from typing import List
+
+import httpx
+import pytest
+from pydantic import HttpUrl
+
+from wanderwise.adapters.notifiers.webhook_notifier import WebhookNotifier
+from wanderwise.domain.models.itinerary import ItineraryRequest
+from wanderwise.domain.models.job import GenerationJob
+
+REQUEST = ItineraryRequest(destination="Lisbon", duration_days=2, travel_style="Cultural", budget="Mid-range")
+
+
+def job(callback_url: str) -> GenerationJob:
+    return GenerationJob(request=REQUEST, callback_url=HttpUrl(callback_url))
+
+
+def notifier(sent: List[httpx.Request], **kwargs) -> WebhookNotifier:
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200)
+
+    return WebhookNotifier(attempts=1, http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), **kwargs)
+
+
+def resolve_to(monkeypatch, *addresses: str) -> None:
+    """Makes every host name resolve to `addresses`."""
+    async def getaddrinfo(host, port, **kwargs):
+        return [(socket.AF_INET6 if ":" in a else socket.AF_INET, socket.SOCK_STREAM, 6, "", (a, port)) for a in addresses]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://127.0.0.1/hook",
+        "http://localhost:8000/hook",
+        "http://[::1]/hook",
+        "http://[::ffff:127.0.0.1]/hook",
+        "http://10.1.2.3/hook",
+        "http://192.168.0.10/hook",
+        "http://172.16.5.4/hook",
+        "http://169.254.169.254/latest/meta-data",
+        "http://[fe80::1]/hook",
+        "http://0.0.0.0/hook",
+    ],
+)
+async def test_refuses_non_public_targets(url):
+    sent: List[httpx.Request] = []
+    webhook = notifier(sent)
+
+    assert await webhook.notify(job(url)) is False
+    assert sent == []
+    assert webhook.blocked == 1
+
+
+async def test_refuses_a_host_with_any_non_public_address(monkeypatch):
+    resolve_to(monkeypatch, "93.184.216.34", "10.0.0.1")
+    sent: List[httpx.Request] = []
+    webhook = notifier(sent)
+
+    assert await webhook.notify(job("https://hooks.example.com/done")) is False
+    assert sent == []
+
+
+async def test_delivers_to_the_checked_address(monkeypatch):
+    resolve_to(monkeypatch, "93.184.216.34")
+    sent: List[httpx.Request] = []
+    webhook = notifier(sent)
+
+    assert await webhook.notify(job("https://hooks.example.com:8443/done?x=1")) is True
+    request = sent[0]
+    assert request.url == httpx.URL("https://93.184.216.34:8443/done?x=1")
+    assert request.headers["host"] == "hooks.example.com:8443"
+    assert request.extensions["sni_hostname"] == "hooks.example.com"
+    assert webhook.delivered == 1
+
+
+async def test_allowlisted_hosts_may_be_private(monkeypatch):
+    resolve_to(monkeypatch, "10.0.0.7")
+    sent: List[httpx.Request] = []
+    webhook = notifier(sent, allowed_hosts=["Internal.Example.com."])
+
+    assert await webhook.notify(job("http://internal.example.com/done")) is True
+    assert sent[0].url.host == "10.0.0.7"
+    assert sent[0].headers["host"] == "internal.example.com"
+
+
+async def test_allowlist_refuses_every_other_host(monkeypatch):
+    resolve_to(monkeypatch, "93.184.216.34")
+    sent: List[httpx.Request] = []
+    webhook = notifier(sent, allowed_hosts=["internal.example.com"])
+
+    assert await webhook.notify(job("https://hooks.example.com/done")) is False
+    assert sent == []
+    assert webhook.blocked == 1